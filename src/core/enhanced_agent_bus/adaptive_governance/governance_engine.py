@@ -22,6 +22,7 @@ Key Features:
 
 import asyncio
 import logging
+import math
 import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
@@ -68,6 +69,7 @@ except ImportError:
 try:
     from ..drift_monitoring import (
         DRIFT_CHECK_INTERVAL_HOURS,
+        DRIFT_STREAMING_ENABLED,
         DriftDetector,
         DriftReport,
         DriftSeverity,
@@ -80,6 +82,7 @@ except ImportError:
     try:
         from drift_monitoring import (
             DRIFT_CHECK_INTERVAL_HOURS,
+            DRIFT_STREAMING_ENABLED,
             DriftDetector,
             DriftReport,
             DriftSeverity,
@@ -91,6 +94,7 @@ except ImportError:
     except ImportError:
         DRIFT_MONITORING_AVAILABLE = False
         DRIFT_CHECK_INTERVAL_HOURS = 6
+        DRIFT_STREAMING_ENABLED = False
         DriftDetector = None
         DriftReport = None
         DriftSeverity = None
@@ -222,6 +226,7 @@ class AdaptiveGovernanceEngine:
         self._last_drift_check: float = 0.0
         self._drift_check_interval: int = DRIFT_CHECK_INTERVAL_HOURS * 3600  # Convert to seconds
         self._latest_drift_report: Optional[DriftReport] = None
+        self._drift_streaming: bool = DRIFT_STREAMING_ENABLED
         if DRIFT_MONITORING_AVAILABLE:
             try:
                 self._drift_detector = get_drift_detector()
@@ -383,6 +388,7 @@ class AdaptiveGovernanceEngine:
 
             # Record decision for learning
             self.decision_history.append(decision)
+            self._observe_drift(impact_features)
 
             # Update performance metrics
             self._update_metrics(decision, time.time() - start_time)
@@ -765,16 +771,22 @@ class AdaptiveGovernanceEngine:
         )
 
         try:
-            # Collect recent decision data for drift analysis
-            recent_data = self._collect_drift_data()
+            if self._drift_streaming:
+                # Sketches are updated per decision; PSI comes straight from them
+                drift_report = self._drift_detector.detect_drift_streaming()
+            else:
+                # Collect recent decision data for drift analysis
+                recent_data = self._collect_drift_data()
 
-            if recent_data is None or len(recent_data) == 0:
-                logger.info("drift_check_interval: Insufficient data for drift detection, skipping")
-                self._last_drift_check = current_time
-                return
+                if recent_data is None or len(recent_data) == 0:
+                    logger.info(
+                        "drift_check_interval: Insufficient data for drift detection, skipping"
+                    )
+                    self._last_drift_check = current_time
+                    return
 
-            # Run drift detection
-            drift_report = self._drift_detector.detect_drift(recent_data)
+                # Run drift detection
+                drift_report = self._drift_detector.detect_drift(recent_data)
             self._latest_drift_report = drift_report
             self._last_drift_check = current_time
 
@@ -813,6 +825,39 @@ class AdaptiveGovernanceEngine:
             # Still update last check time to prevent retry flood
             self._last_drift_check = current_time
 
+    @staticmethod
+    def _drift_record(features: ImpactFeatures) -> Dict[str, float]:
+        """Flatten impact features into the record monitored for drift."""
+        # Plain-Python mean/std: this runs once per decision for streaming drift
+        patterns = features.temporal_patterns
+        temporal_mean = temporal_std = 0.0
+        if patterns:
+            temporal_mean = sum(patterns) / len(patterns)
+            variance = sum((p - temporal_mean) ** 2 for p in patterns) / len(patterns)
+            temporal_std = math.sqrt(variance)
+        return {
+            "message_length": features.message_length,
+            "agent_count": features.agent_count,
+            "tenant_complexity": features.tenant_complexity,
+            "temporal_mean": temporal_mean,
+            "temporal_std": temporal_std,
+            "semantic_similarity": features.semantic_similarity,
+            "historical_precedence": features.historical_precedence,
+            "resource_utilization": features.resource_utilization,
+            "network_isolation": features.network_isolation,
+            "risk_score": features.risk_score,
+            "confidence_level": features.confidence_level,
+        }
+
+    def _observe_drift(self, features: ImpactFeatures) -> None:
+        """Add a decision's features to the streaming drift sketches."""
+        if not self._drift_streaming or self._drift_detector is None:
+            return
+        try:
+            self._drift_detector.observe(self._drift_record(features))
+        except Exception as e:
+            logger.debug(f"Drift observation skipped: {e}")
+
     def _collect_drift_data(self):
         """Collect recent decision data for drift analysis."""
         try:
@@ -828,27 +873,9 @@ class AdaptiveGovernanceEngine:
                 return None
 
             # Extract feature data from decision history
-            feature_records = []
-            for decision in self.decision_history:
-                features = decision.features_used
-                record = {
-                    "message_length": features.message_length,
-                    "agent_count": features.agent_count,
-                    "tenant_complexity": features.tenant_complexity,
-                    "temporal_mean": (
-                        np.mean(features.temporal_patterns) if features.temporal_patterns else 0.0
-                    ),
-                    "temporal_std": (
-                        np.std(features.temporal_patterns) if features.temporal_patterns else 0.0
-                    ),
-                    "semantic_similarity": features.semantic_similarity,
-                    "historical_precedence": features.historical_precedence,
-                    "resource_utilization": features.resource_utilization,
-                    "network_isolation": features.network_isolation,
-                    "risk_score": features.risk_score,
-                    "confidence_level": features.confidence_level,
-                }
-                feature_records.append(record)
+            feature_records = [
+                self._drift_record(decision.features_used) for decision in self.decision_history
+            ]
 
             if not feature_records:
                 return None
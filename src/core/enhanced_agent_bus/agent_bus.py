@@ -4,6 +4,7 @@ Constitutional Hash: cdd01ef066bc6cf2
 
 import asyncio
 import logging
+from dataclasses import replace
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 try:
@@ -33,6 +34,7 @@ from .models import (
     Priority,
 )
 from .registry import (
+    AgentIndex,
     DirectMessageRouter,
     DynamicPolicyValidationStrategy,
     InMemoryAgentRegistry,
@@ -70,6 +72,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BROADCAST_CONCURRENCY = 64
+
 
 class EnhancedAgentBus:
     """
@@ -92,6 +96,7 @@ class EnhancedAgentBus:
         maci_strict_mode: Strict MACI enforcement (default: True)
         use_dynamic_policy: Use policy registry instead of static hash (default: False)
         enable_metering: Enable usage metering (default: True)
+        broadcast_concurrency: Max in-flight deliveries per broadcast (default: 64)
         tenant_id: Default tenant ID for messages
     """
 
@@ -175,6 +180,10 @@ class EnhancedAgentBus:
             "started_at": None,
         }
         self._agents: Dict[str, AgentInfo] = {}
+        self._agent_index = AgentIndex()
+        self._broadcast_concurrency = kwargs.get(
+            "broadcast_concurrency", DEFAULT_BROADCAST_CONCURRENCY
+        )
 
     @property
     def constitutional_hash(self) -> str:
@@ -266,12 +275,14 @@ class EnhancedAgentBus:
             "maci_role": maci_role.value if hasattr(maci_role, "value") else maci_role,
         }
         self._agents[agent_id]["constitutional_hash"] = self._constitutional_hash
+        self._agent_index.add(agent_id, self._agents[agent_id])
         if self._enable_maci and maci_role:
             try:
                 await self._maci_registry.register_agent(agent_id, maci_role)
             except Exception:
                 if not existing:
                     del self._agents[agent_id]
+                    self._agent_index.remove(agent_id)
                 return False
         res = self._registry.register(
             agent_id, capabilities, {"type": agent_type, "tenant_id": tenant_id}
@@ -280,6 +291,7 @@ class EnhancedAgentBus:
         if not success and not existing:
             if agent_id in self._agents:
                 del self._agents[agent_id]
+            self._agent_index.remove(agent_id)
             return False
         return True
 
@@ -287,6 +299,7 @@ class EnhancedAgentBus:
         existed = aid in self._agents
         if existed:
             del self._agents[aid]
+            self._agent_index.remove(aid)
         res = self._registry.unregister(aid)
         if asyncio.iscoroutine(res):
             res = await res
@@ -306,10 +319,10 @@ class EnhancedAgentBus:
         return list(self._agents.keys())
 
     def get_agents_by_type(self, atype: str) -> List[str]:
-        return [aid for aid, info in self._agents.items() if info.get("agent_type") == atype]
+        return self._agent_index.find_by_type(atype)
 
     def get_agents_by_capability(self, cap: str) -> List[str]:
-        return [aid for aid, info in self._agents.items() if cap in info.get("capabilities", [])]
+        return self._agent_index.find_by_capabilities([cap])
 
     # --- Message Validation Helpers (SOLID: Single Responsibility) ---
 
@@ -370,13 +383,17 @@ class EnhancedAgentBus:
 
         return True
 
-    async def _process_message_with_fallback(self, msg: AgentMessage) -> ValidationResult:
+    async def _process_message_with_fallback(
+        self, msg: AgentMessage, run_handlers: bool = True
+    ) -> ValidationResult:
         """
         Process message through processor with graceful degradation.
 
         Falls back to DEGRADED governance mode on processor failure.
         """
         try:
+            if not run_handlers:
+                return await self._processor.process(msg, run_handlers=False)
             return await self._processor.process(msg)
         except Exception as e:
             logger.warning(f"Processor fallback activated: {e}")
@@ -435,13 +452,40 @@ class EnhancedAgentBus:
             if is_test_mode:
                 self._metrics["sent"] += 1
 
+        # Steps 2-5: Hash, tenant, governance and processor validation
+        result, processed = await self._validate_message(msg, result)
+        if not processed:
+            return result
+
+        # Step 6: Finalize delivery and update metrics
+        delivery_success = await self._finalize_message_delivery(msg, result)
+
+        # Step 7: Provide feedback to adaptive governance
+        self._provide_delivery_feedback(msg, delivery_success)
+
+        return result
+
+    async def _validate_message(
+        self, msg: AgentMessage, result: ValidationResult, run_handlers: bool = True
+    ) -> Tuple[ValidationResult, bool]:
+        """
+        Run the validation pipeline (send_message steps 2-5) for a message.
+
+        With ``run_handlers=False`` the processor validates without running
+        message handlers (see ``MessageProcessor.process``).
+
+        Returns:
+            (result, processed): processed is False when the message was
+            rejected before reaching the processor; failure metrics for those
+            rejections are already recorded.
+        """
         # Step 2: Validate constitutional hash
         if not self._validate_constitutional_hash_for_message(msg, result):
-            return result
+            return result, False
 
         # Step 3: Validate and normalize tenant
         if not self._validate_and_normalize_tenant(msg, result):
-            return result
+            return result, False
 
         # Step 4: Evaluate with adaptive governance
         governance_allowed, governance_reasoning = await self._evaluate_with_adaptive_governance(
@@ -454,15 +498,13 @@ class EnhancedAgentBus:
                 metadata={"governance_mode": "ADAPTIVE", "blocked_reason": governance_reasoning},
             )
             self._record_metrics_failure()
-            return result
+            return result, False
 
         # Step 5: Process message with fallback
-        result = await self._process_message_with_fallback(msg)
+        return await self._process_message_with_fallback(msg, run_handlers), True
 
-        # Step 6: Finalize delivery and update metrics
-        delivery_success = await self._finalize_message_delivery(msg, result)
-
-        # Step 7: Provide feedback to adaptive governance
+    def _provide_delivery_feedback(self, msg: AgentMessage, delivery_success: bool) -> None:
+        """Feed delivery outcome back to the most recent matching governance decision."""
         if self._adaptive_governance and hasattr(self._adaptive_governance, "decision_history"):
             # Find the most recent governance decision for this message
             recent_decisions = [
@@ -478,36 +520,189 @@ class EnhancedAgentBus:
                 if ADAPTIVE_GOVERNANCE_AVAILABLE and provide_governance_feedback:
                     provide_governance_feedback(decision, delivery_success)
 
-        return result
+    async def send_messages(self, batch: List[AgentMessage]) -> List[ValidationResult]:
+        """
+        Send a batch of messages through the agent bus.
 
-    async def broadcast_message(self, msg: AgentMessage) -> Dict[str, ValidationResult]:
-        """Broadcast message to all agents in same tenant."""
-        msg.tenant_id = normalize_tenant_id(msg.tenant_id)
-        targets = [
-            aid
-            for aid, info in self._agents.items()
-            if info.get("tenant_id") == msg.tenant_id
-            or not msg.tenant_id
-            or msg.tenant_id == "none"
-        ]
-        results = {}
-        for aid in targets:
-            # Skip if sender is same as target? Usually yes for broadcast
-            if aid == msg.from_agent:
+        Runs the same pipeline as ``send_message`` but over the whole batch at
+        once: hash and tenant checks are applied per message, adaptive
+        governance is evaluated concurrently, and the processor validates all
+        surviving messages in a single ``process_batch`` call. Delivery then
+        happens in input order.
+
+        Args:
+            batch: The AgentMessages to send.
+
+        Returns:
+            List of ValidationResult, one per message in input order.
+        """
+        results: List[Optional[ValidationResult]] = [None] * len(batch)
+
+        # Steps 1-3: Constitutional hash and tenant validation
+        admitted: List[int] = []
+        for idx, msg in enumerate(batch):
+            result = ValidationResult()
+            if self._validate_constitutional_hash_for_message(
+                msg, result
+            ) and self._validate_and_normalize_tenant(msg, result):
+                admitted.append(idx)
+            else:
+                results[idx] = result
+
+        # Step 4: Evaluate with adaptive governance
+        governance = await asyncio.gather(
+            *(self._evaluate_with_adaptive_governance(batch[idx]) for idx in admitted)
+        )
+        to_process: List[int] = []
+        for idx, (governance_allowed, governance_reasoning) in zip(
+            admitted, governance, strict=True
+        ):
+            if not governance_allowed:
+                results[idx] = ValidationResult(
+                    is_valid=False,
+                    errors=[f"Governance policy violation: {governance_reasoning}"],
+                    metadata={
+                        "governance_mode": "ADAPTIVE",
+                        "blocked_reason": governance_reasoning,
+                    },
+                )
+                self._record_metrics_failure()
                 continue
-            # Avoid using to_dict_raw if not available, use properties
-            content = msg.content if hasattr(msg, "content") else {}
-            m = AgentMessage(
-                from_agent=msg.from_agent, message_type=msg.message_type, content=content
-            )
-            m.to_agent = aid
-            m.tenant_id = msg.tenant_id
-            m.constitutional_hash = msg.constitutional_hash
-            res = await self.send_message(m)
-            if res.is_valid:
-                results[aid] = res
+            to_process.append(idx)
+
+        # Step 5: Process surviving messages as one batch
+        processed = await self._process_batch_with_fallback([batch[idx] for idx in to_process])
+
+        # Step 6: Finalize delivery in input order
+        for idx, result in zip(to_process, processed, strict=True):
+            results[idx] = result
+            delivery_success = await self._finalize_message_delivery(batch[idx], result)
+            self._provide_delivery_feedback(batch[idx], delivery_success)
+
         return results
 
+    async def _process_batch_with_fallback(
+        self, msgs: List[AgentMessage]
+    ) -> List[ValidationResult]:
+        """
+        Process a batch through the processor, degrading to per-message processing.
+
+        Custom processors without batch support are driven one message at a time.
+        """
+        if not msgs:
+            return []
+        if isinstance(self._processor, MessageProcessor):
+            try:
+                return await self._processor.process_batch(msgs)
+            except Exception as e:
+                logger.warning(f"Batch processing failed, processing individually: {e}")
+        return [await self._process_message_with_fallback(msg) for msg in msgs]
+
+    async def broadcast_message(
+        self,
+        msg: AgentMessage,
+        max_concurrency: Optional[int] = None,
+        validate_once: bool = True,
+    ) -> Dict[str, ValidationResult]:
+        """
+        Broadcast message to all agents in same tenant.
+
+        With ``validate_once`` the content goes through hash, tenant,
+        governance and processor validation a single time. Each recipient
+        copy then gets its recipient tenant check, runs the registered
+        message handlers (which set its status) and is delivered, and gets
+        its own ValidationResult. Messages whose validation depends on the
+        recipient (MACI-checked constitutional validation requests), and
+        buses with a custom processor, always run the full ``send_message``
+        pipeline per recipient.
+
+        Deliveries run concurrently on at most ``max_concurrency`` workers
+        (default: the ``broadcast_concurrency`` bus option) pulling from the
+        target list, so a slow transport throttles the fan-out instead of
+        piling up pending sends.
+
+        Args:
+            msg: The message to broadcast.
+            max_concurrency: Cap on in-flight deliveries for this broadcast.
+            validate_once: Validate the content once instead of per recipient.
+
+        Returns:
+            Dict of agent_id -> ValidationResult for recipients that accepted
+            the message, in target order.
+        """
+        msg.tenant_id = normalize_tenant_id(msg.tenant_id)
+        if not msg.tenant_id or msg.tenant_id == "none":
+            targets = list(self._agents)
+        else:
+            targets = self._agent_index.find_by_tenant(msg.tenant_id)
+        # Skip if sender is same as target? Usually yes for broadcast
+        targets = [aid for aid in targets if aid != msg.from_agent]
+        if not targets:
+            return {}
+
+        outcomes: List[bool] = []
+        if (
+            not validate_once
+            or self._requires_per_recipient_validation(msg)
+            or not isinstance(self._processor, MessageProcessor)
+        ):
+            deliver = self.send_message
+        else:
+            result, processed = await self._validate_message(
+                self._broadcast_copy(msg, ""), ValidationResult(), run_handlers=False
+            )
+            if not processed or not result.is_valid:
+                if processed:
+                    self._record_metrics_failure()
+                return {}
+
+            async def deliver(m: AgentMessage) -> ValidationResult:
+                errors = validate_tenant_consistency(self._agents, None, m.to_agent, m.tenant_id)
+                if errors:
+                    self._record_metrics_failure()
+                    return ValidationResult(is_valid=False, errors=errors)
+                handled = await self._processor.execute_handlers(m)
+                res = replace(
+                    result,
+                    is_valid=handled.is_valid,
+                    errors=result.errors + handled.errors,
+                    warnings=list(result.warnings),
+                    metadata=dict(result.metadata),
+                )
+                outcomes.append(await self._finalize_message_delivery(m, res))
+                return res
+
+        results: Dict[str, ValidationResult] = {}
+        pending = iter(targets)
+
+        async def worker() -> None:
+            for aid in pending:
+                res = await deliver(self._broadcast_copy(msg, aid))
+                if res.is_valid:
+                    results[aid] = res
+
+        limit = max(1, max_concurrency or self._broadcast_concurrency)
+        await asyncio.gather(*(worker() for _ in range(min(limit, len(targets)))))
+
+        if outcomes:
+            self._provide_delivery_feedback(msg, all(outcomes))
+        return {aid: results[aid] for aid in targets if aid in results}
+
+    @staticmethod
+    def _broadcast_copy(msg: AgentMessage, to_agent: str) -> AgentMessage:
+        """Per-recipient copy of a broadcast message."""
+        # Avoid using to_dict_raw if not available, use properties
+        content = msg.content if hasattr(msg, "content") else {}
+        m = AgentMessage(from_agent=msg.from_agent, message_type=msg.message_type, content=content)
+        m.to_agent = to_agent
+        m.tenant_id = msg.tenant_id
+        m.constitutional_hash = msg.constitutional_hash
+        return m
+
+    def _requires_per_recipient_validation(self, msg: AgentMessage) -> bool:
+        """MACI checks the recipient's role for constitutional validation requests."""
+        return bool(self._enable_maci) and msg.message_type == MessageType.CONSTITUTIONAL_VALIDATION
+
     # --- Adaptive Governance Integration ---
 
     async def _initialize_adaptive_governance(self) -> None:
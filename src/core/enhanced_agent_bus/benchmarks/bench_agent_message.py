@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 AgentMessage Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures construction time, to_dict time and retained memory for N messages
+of the slotted AgentMessage against the previous dataclass definition
+(eager UUIDs, datetimes and empty dicts via default factories). The first
+to_dict of a slotted message pays for the IDs and datetimes it deferred.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_agent_message.py [--count N]
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.models import (  # noqa: E402
+    CONSTITUTIONAL_HASH,
+    AgentMessage,
+    MessageStatus,
+    MessageType,
+    Priority,
+    RoutingContext,
+)
+
+
+@dataclass
+class LegacyAgentMessage:
+    """The AgentMessage dataclass as previously defined."""
+
+    message_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    conversation_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    content: Dict[str, Any] = field(default_factory=dict)
+    payload: Dict[str, Any] = field(default_factory=dict)
+    from_agent: str = ""
+    to_agent: str = ""
+    sender_id: str = ""
+    message_type: MessageType = MessageType.COMMAND
+    routing: Optional[RoutingContext] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    tenant_id: str = ""
+    security_context: Dict[str, Any] = field(default_factory=dict)
+    priority: Priority = Priority.MEDIUM
+    status: MessageStatus = MessageStatus.PENDING
+    constitutional_hash: str = CONSTITUTIONAL_HASH
+    constitutional_validated: bool = False
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    pqc_signature: Optional[str] = None
+    pqc_public_key: Optional[str] = None
+    pqc_algorithm: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    expires_at: Optional[datetime] = None
+    impact_score: Optional[float] = None
+    performance_metrics: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if hasattr(self, "_skip_validation") and self._skip_validation:
+            return
+        self.constitutional_validated = True
+
+    to_dict = AgentMessage.to_dict
+
+
+def _build(cls: Callable[..., Any], count: int) -> List[Any]:
+    content = {"action": "status"}
+    return [
+        cls(content=content, from_agent="agent-a", to_agent="agent-b", tenant_id="tenant-1")
+        for _ in range(count)
+    ]
+
+
+def measure(cls: Callable[..., Any], count: int) -> Dict[str, float]:
+    gc.collect()
+    start = time.perf_counter()
+    messages = _build(cls, count)
+    construct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for msg in messages:
+        msg.to_dict()
+    to_dict = time.perf_counter() - start
+    del messages
+
+    gc.collect()
+    tracemalloc.start()
+    messages = _build(cls, count)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del messages
+
+    return {
+        "construct_us": construct / count * 1e6,
+        "to_dict_us": to_dict / count * 1e6,
+        "total_us": (construct + to_dict) / count * 1e6,
+        "bytes": retained / count,
+    }
+
+
+def run(count: int) -> None:
+    legacy = measure(LegacyAgentMessage, count)
+    slotted = measure(AgentMessage, count)
+    logger.info(f"messages={count}")
+    logger.info(f"{'':<20}{'dataclass':>12}{'slotted':>12}{'ratio':>9}")
+    for key, label in (
+        ("construct_us", "construct us/msg"),
+        ("to_dict_us", "to_dict us/msg"),
+        ("total_us", "both us/msg"),
+        ("bytes", "bytes/msg"),
+    ):
+        logger.info(
+            f"{label:<20}{legacy[key]:>12.2f}{slotted[key]:>12.2f}"
+            f"{legacy[key] / slotted[key]:>8.2f}x"
+        )
+    total_mb = (legacy["bytes"] - slotted["bytes"]) * count / 1e6
+    logger.info(f"memory saved: {total_mb:.1f} MB")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run(args.count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Batched Send Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Compares EnhancedAgentBus throughput for the single-message path
+(``send_message`` in a loop) against the batched path (``send_messages``).
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_batch_send.py [--messages N] [--batch-size B]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.agent_bus import EnhancedAgentBus  # noqa: E402
+from core.enhanced_agent_bus.message_processor import MessageProcessor  # noqa: E402
+from core.enhanced_agent_bus.models import AgentMessage  # noqa: E402
+
+
+def _make_messages(count: int) -> list:
+    return [
+        AgentMessage(
+            content={"action": "report_status", "sequence": i % 64, "payload": "x" * 256},
+            from_agent=f"agent-{i % 32}",
+            to_agent="governance-hub",
+            tenant_id="tenant-bench",
+        )
+        for i in range(count)
+    ]
+
+
+async def _new_bus() -> EnhancedAgentBus:
+    bus = EnhancedAgentBus(
+        enable_metering=False,
+        enable_adaptive_governance=False,
+        processor=MessageProcessor(isolated_mode=True),
+    )
+    await bus.start()
+    return bus
+
+
+async def _drain(bus: EnhancedAgentBus) -> None:
+    while not bus._message_queue.empty():
+        bus._message_queue.get_nowait()
+
+
+async def bench_single(count: int) -> float:
+    bus = await _new_bus()
+    msgs = _make_messages(count)
+    start = time.perf_counter()
+    for msg in msgs:
+        await bus.send_message(msg)
+    elapsed = time.perf_counter() - start
+    await _drain(bus)
+    await bus.stop()
+    return elapsed
+
+
+async def bench_batched(count: int, batch_size: int) -> float:
+    bus = await _new_bus()
+    msgs = _make_messages(count)
+    start = time.perf_counter()
+    for offset in range(0, count, batch_size):
+        await bus.send_messages(msgs[offset : offset + batch_size])
+    elapsed = time.perf_counter() - start
+    await _drain(bus)
+    await bus.stop()
+    return elapsed
+
+
+async def run(count: int, batch_size: int) -> None:
+    single = await bench_single(count)
+    batched = await bench_batched(count, batch_size)
+    logger.info(f"messages={count} batch_size={batch_size}")
+    logger.info(f"  send_message   : {count / single:10.0f} msg/s ({single * 1000:.1f} ms)")
+    logger.info(f"  send_messages  : {count / batched:10.0f} msg/s ({batched * 1000:.1f} ms)")
+    logger.info(f"  speedup        : {single / batched:.2f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+    asyncio.run(run(args.messages, args.batch_size))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Broadcast Fan-out Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures EnhancedAgentBus.broadcast_message latency to N agents in one
+tenant: the previous behaviour (full send_message pipeline per recipient,
+awaited sequentially) vs. validate-once with bounded-concurrency delivery.
+Delivery goes to a stub transport with a simulated per-send ack latency.
+The runtime scanner's per-sender rate limit is disabled so that the
+per-recipient baseline is not throttled after the first 100 sends.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_broadcast.py [--agents 1000,10000] [--ack-ms MS]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.agent_bus import EnhancedAgentBus  # noqa: E402
+from core.enhanced_agent_bus.models import (  # noqa: E402
+    CONSTITUTIONAL_HASH,
+    AgentMessage,
+    MessageType,
+)
+from core.enhanced_agent_bus.runtime_security import get_runtime_security_scanner  # noqa: E402
+
+logging.getLogger("core.enhanced_agent_bus").setLevel(logging.ERROR)
+
+
+class StubTransport:
+    """Kafka stand-in acknowledging each send after a fixed delay."""
+
+    def __init__(self, ack_seconds: float):
+        self.ack_seconds = ack_seconds
+        self.sent = 0
+
+    async def send_message(self, msg: AgentMessage) -> bool:
+        await asyncio.sleep(self.ack_seconds)
+        self.sent += 1
+        return True
+
+
+async def run(sizes: List[int], ack_ms: float, concurrency: int) -> None:
+    get_runtime_security_scanner().config.enable_rate_limit_check = False
+    for agents in sizes:
+        bus = EnhancedAgentBus(
+            enable_maci=False, enable_adaptive_governance=False, allow_unstarted=True
+        )
+        bus._kafka_bus = StubTransport(ack_ms / 1000)
+        for i in range(agents + 1):
+            await bus.register_agent(f"agent-{i}", "worker", tenant_id="tenant-acme")
+        msg = AgentMessage(
+            from_agent="agent-0",
+            message_type=MessageType.NOTIFICATION,
+            content={"event": "heartbeat"},
+            constitutional_hash=CONSTITUTIONAL_HASH,
+            tenant_id="tenant-acme",
+        )
+
+        start = time.perf_counter()
+        before = await bus.broadcast_message(msg, max_concurrency=1, validate_once=False)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        after = await bus.broadcast_message(msg, max_concurrency=concurrency)
+        fanout = time.perf_counter() - start
+
+        assert len(before) == len(after) == agents
+        logger.info(
+            f"[{agents:>6} agents] per-recipient sequential {sequential * 1e3:9.1f} ms -> "
+            f"validate-once x{concurrency} {fanout * 1e3:8.1f} ms ({sequential / fanout:.1f}x)"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", default="1000,10000")
+    parser.add_argument("--ack-ms", type=float, default=0.5)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.agents.split(",")]
+    asyncio.run(run(sizes, args.ack_ms, args.concurrency))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
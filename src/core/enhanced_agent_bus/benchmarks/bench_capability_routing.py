@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Capability Routing Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures CapabilityBasedRouter route/broadcast latency over N registered
+agents using the capability inverted index vs. the previous per-agent scan
+(list_agents + get for every agent). Runs against InMemoryAgentRegistry and,
+when a Redis server is reachable at --redis-url, RedisAgentRegistry.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_capability_routing.py [--agents N] [--redis-url URL]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.models import AgentMessage  # noqa: E402
+from core.enhanced_agent_bus.registry import (  # noqa: E402
+    CapabilityBasedRouter,
+    InMemoryAgentRegistry,
+    RedisAgentRegistry,
+)
+
+CAPABILITIES = ["read", "write", "audit", "deploy", "review", "approve", "analyze", "notify"]
+
+
+async def legacy_route(msg: AgentMessage, reg: Any) -> Optional[str]:
+    """The previous CapabilityBasedRouter.route scan."""
+    req = msg.content.get("required_capabilities", [])
+    for aid in await reg.list_agents():
+        info = await reg.get(aid)
+        if info and all(c in info.get("capabilities", {}) for c in req):
+            return aid
+    return None
+
+
+async def legacy_broadcast(msg: AgentMessage, reg: Any) -> List[str]:
+    """The previous CapabilityBasedRouter.broadcast scan."""
+    req = msg.content.get("required_capabilities", [])
+    res = []
+    for aid in await reg.list_agents():
+        if aid == msg.from_agent:
+            continue
+        info = await reg.get(aid)
+        if info and all(c in info.get("capabilities", {}) for c in req):
+            res.append(aid)
+    return res
+
+
+async def populate(reg: Any, agents: int) -> None:
+    for i in range(agents):
+        caps = [c for j, c in enumerate(CAPABILITIES) if (i >> j) & 1]
+        if i == agents - 1:
+            caps = ["rare"]
+        await reg.register(f"agent-{i}", caps, {"type": f"type-{i % 10}", "tenant_id": "acme"})
+
+
+async def timed(fn: Callable[[], Awaitable[Any]], rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+async def measure(name: str, reg: Any, rounds: int) -> None:
+    router = CapabilityBasedRouter()
+    route_msg = AgentMessage(content={"required_capabilities": ["rare"]})
+    bcast_msg = AgentMessage(
+        from_agent="agent-0", content={"required_capabilities": ["audit", "deploy", "approve"]}
+    )
+    cases = [
+        (
+            "route (worst case)",
+            lambda: legacy_route(route_msg, reg),
+            lambda: router.route(route_msg, reg),
+        ),
+        (
+            "broadcast (3 caps)",
+            lambda: legacy_broadcast(bcast_msg, reg),
+            lambda: router.broadcast(bcast_msg, reg),
+        ),
+    ]
+    for label, legacy, indexed in cases:
+        assert sorted(await legacy() or []) == sorted(await indexed() or [])
+        before = await timed(legacy, rounds)
+        after = await timed(indexed, rounds)
+        logger.info(
+            f"{name:<10} {label:<20} scan {before * 1e3:9.2f} ms -> "
+            f"index {after * 1e3:7.3f} ms ({before / after:,.0f}x)"
+        )
+
+
+async def run(agents: int, rounds: int, redis_url: Optional[str]) -> None:
+    reg = InMemoryAgentRegistry()
+    await populate(reg, agents)
+    await measure("in-memory", reg, rounds)
+
+    if not redis_url:
+        return
+    redis_reg = RedisAgentRegistry(
+        redis_url=redis_url, key_prefix=f"acgs2:bench:{uuid.uuid4().hex}"
+    )
+    try:
+        await redis_reg.list_agents()
+    except Exception as e:
+        logger.info(f"Redis not reachable at {redis_url} ({e}); skipping")
+        await redis_reg.close()
+        return
+    try:
+        await populate(redis_reg, agents)
+        await measure("redis", redis_reg, max(1, rounds // 10))
+    finally:
+        await redis_reg.clear()
+        await redis_reg.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--redis-url", default="redis://127.0.0.1:6379")
+    args = parser.parse_args()
+    asyncio.run(run(args.agents, args.rounds, args.redis_url or None))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
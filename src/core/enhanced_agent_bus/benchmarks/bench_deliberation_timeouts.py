@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Deliberation Timeout Scheduler Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures memory and event-loop load of N pending DeliberationQueue tasks:
+the previous per-task monitor coroutine (one asyncio task per item polling
+every timeout/10 s, capped at 1 s) vs. the shared TimerWheel runner. Reports
+enqueue time, asyncio task count, traced memory, and CPU burned by the
+event loop over an idle window while all tasks are pending.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_deliberation_timeouts.py [--tasks N] [--window S]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.deliberation_layer.deliberation_queue import (  # noqa: E402
+    DeliberationQueue,
+    DeliberationStatus,
+)
+from core.enhanced_agent_bus.models import AgentMessage, MessageType  # noqa: E402
+
+logging.getLogger("core.enhanced_agent_bus").setLevel(logging.ERROR)
+
+
+class LegacyMonitorQueue(DeliberationQueue):
+    """DeliberationQueue with the previous one-coroutine-per-task timeout monitor."""
+
+    def _schedule_timeout(self, task_id: str, timeout: float) -> None:
+        self.processing_tasks.append(asyncio.create_task(self._monitor_task(task_id)))
+
+    async def _monitor_task(self, task_id: str) -> None:
+        task = self.tasks.get(task_id)
+        elapsed = 0
+        check_interval = min(1.0, task.timeout_seconds / 10)
+        while elapsed < task.timeout_seconds:
+            if self._shutdown:
+                return
+            try:
+                await asyncio.wait_for(self._shutdown_event.wait(), timeout=check_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            elapsed += check_interval
+            if task.is_complete:
+                return
+        async with self._lock:
+            if not task.is_complete:
+                task.status = DeliberationStatus.TIMED_OUT
+                self.stats["timed_out"] += 1
+
+
+async def measure(name: str, queue_cls: type, tasks: int, window: float) -> None:
+    message = AgentMessage(
+        from_agent="agent-a", message_type=MessageType.GOVERNANCE_REQUEST, content={"a": 1}
+    )
+    tracemalloc.start()
+    queue = queue_cls(default_timeout=3600)
+    start = time.perf_counter()
+    for _ in range(tasks):
+        await queue.enqueue_for_deliberation(message)
+    enqueue = time.perf_counter() - start
+    await asyncio.sleep(0.5)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cpu = time.process_time()
+    await asyncio.sleep(window)
+    idle_cpu = (time.process_time() - cpu) / window
+
+    logger.info(
+        f"{name:<22} enqueue (traced) {enqueue:6.2f} s | tasks {len(asyncio.all_tasks()) - 1:>7} | "
+        f"traced memory {memory / 1e6:7.1f} MB | idle loop CPU {idle_cpu * 100:5.1f}%"
+    )
+    await queue.stop()
+
+
+async def run(tasks: int, window: float) -> None:
+    await measure("per-task monitors", LegacyMonitorQueue, tasks, window)
+    await measure("timer wheel", DeliberationQueue, tasks, window)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--window", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.tasks, args.window))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Streaming Drift Detection Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Compares the two drift paths of AdaptiveGovernanceEngine over the eleven
+features recorded per governance decision:
+
+- batch: DataFrame built from the decision history, then an Evidently PSI
+  report against the reference DataFrame (detect_drift)
+- streaming: per-decision observe() into histogram sketches, then PSI from
+  the sketches (detect_drift_streaming)
+
+Reports the time and peak traced memory of one drift check, the streaming
+per-decision cost (feature record plus sketch update) and the size of the
+sketches. Half of the features are shifted in the current window so both
+paths flag drift.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_drift_streaming.py [--reference N] [--decisions N ...]
+"""
+
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+from typing import List
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from core.enhanced_agent_bus.adaptive_governance import ImpactFeatures  # noqa: E402
+from core.enhanced_agent_bus.adaptive_governance.governance_engine import (  # noqa: E402
+    AdaptiveGovernanceEngine,
+)
+from core.enhanced_agent_bus.drift_monitoring import DriftDetector  # noqa: E402
+
+logging.getLogger("core.enhanced_agent_bus").setLevel(logging.ERROR)
+warnings.filterwarnings("ignore")
+
+
+def make_features(count: int, shift: float, seed: int) -> List[ImpactFeatures]:
+    rng = np.random.default_rng(seed)
+    return [
+        ImpactFeatures(
+            message_length=int(rng.integers(20, 2000) * (1 + shift)),
+            agent_count=int(rng.integers(1, 8)),
+            tenant_complexity=float(rng.beta(2, 5)),
+            temporal_patterns=rng.random(5).tolist(),
+            semantic_similarity=float(rng.beta(2, 2) * (1 - shift / 2)),
+            historical_precedence=int(rng.integers(0, 5)),
+            resource_utilization=float(rng.beta(2, 5) + shift / 4),
+            network_isolation=float(rng.random()),
+            risk_score=float(min(1.0, rng.beta(2, 5) + shift / 4)),
+            confidence_level=float(rng.beta(5, 2)),
+        )
+        for _ in range(count)
+    ]
+
+
+def traced(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def batch_check(reference: pd.DataFrame, history: List[ImpactFeatures]):
+    detector = DriftDetector(min_samples=100)
+    detector.load_reference_data(reference)
+
+    def check():
+        current = pd.DataFrame([AdaptiveGovernanceEngine._drift_record(f) for f in history])
+        return detector.detect_drift(current)
+
+    return traced(check)
+
+
+def observe_all(detector: DriftDetector, history: List[ImpactFeatures]) -> None:
+    for features in history:
+        detector.observe(AdaptiveGovernanceEngine._drift_record(features))
+
+
+def streaming_check(reference: pd.DataFrame, history: List[ImpactFeatures]):
+    timed = DriftDetector(min_samples=100)
+    timed.load_reference_data(reference)
+    timed._build_reference_sketches()
+    start = time.perf_counter()
+    observe_all(timed, history)
+    observe_s = (time.perf_counter() - start) / len(history)
+
+    detector = DriftDetector(min_samples=100)
+    detector.load_reference_data(reference)
+    tracemalloc.start()
+    detector._build_reference_sketches()
+    observe_all(detector, history)
+    resident, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    report, check_s, check_peak = traced(detector.detect_drift_streaming)
+    return report, observe_s, resident, check_s, check_peak
+
+
+def run(args: argparse.Namespace) -> None:
+    reference = pd.DataFrame(
+        [AdaptiveGovernanceEngine._drift_record(f) for f in make_features(args.reference, 0.0, 1)]
+    )
+    logger.info(f"reference: {len(reference)} decisions x {reference.shape[1]} features")
+    for count in args.decisions:
+        history = make_features(count, 0.5, 2)
+        report, batch_s, batch_peak = batch_check(reference, history)
+        logger.info(
+            f"{count:>8} decisions | batch:     check {batch_s * 1e3:9.1f} ms, "
+            f"peak {batch_peak / 2**20:8.1f} MiB, drift share {report.drift_share:.2f}"
+        )
+        report, observe_s, resident, check_s, check_peak = streaming_check(reference, history)
+        logger.info(
+            f"{count:>8} decisions | streaming: check {check_s * 1e3:9.3f} ms, "
+            f"peak {check_peak / 2**10:8.1f} KiB, drift share {report.drift_share:.2f}, "
+            f"observe {observe_s * 1e6:5.1f} us/decision, sketches {resident / 2**10:6.1f} KiB"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reference", type=int, default=10_000)
+    parser.add_argument("--decisions", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
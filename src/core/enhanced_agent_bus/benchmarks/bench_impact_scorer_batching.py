@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Impact Scorer Micro-batching Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures ImpactScorer.calculate_impact_score_async throughput (messages/s)
+and p99 latency on CPU-only ONNX Runtime with many concurrent callers:
+
+- per-message, padded to 512: one forward pass per message on the event
+  loop, padded like _onnx_inference used to
+- per-message, unpadded: one forward pass per message on the event loop
+- micro-batched: InferenceBatcher with length-bucketed dynamic padding on
+  a dedicated inference thread
+
+Uses optimized_models/distilbert_base_uncased.onnx when present; otherwise
+a randomly initialised model of the same architecture is exported to ONNX
+(latency does not depend on the weights). Message texts mix short alerts
+with long reports and are tokenized by a small word-level tokenizer.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_impact_scorer_batching.py [--messages N] [--concurrency C] [--rate R] [--max-batch B]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+os.environ.setdefault("HF_HUB_OFFLINE", "1")
+os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np  # noqa: E402
+import onnxruntime as ort  # noqa: E402
+
+from core.enhanced_agent_bus.deliberation_layer.impact_scorer import ImpactScorer  # noqa: E402
+
+logging.getLogger("core.enhanced_agent_bus").setLevel(logging.ERROR)
+
+WORDS = (
+    "critical security breach detected in payment transfer service agent requests "
+    "policy review audit compliance status update routine heartbeat metrics report "
+    "latency normal degraded user session token rotation scheduled maintenance window"
+).split()
+
+
+def build_tokenizer():
+    from tokenizers import Tokenizer, models, pre_tokenizers, processors
+    from transformers import PreTrainedTokenizerFast
+
+    vocab = {tok: i for i, tok in enumerate(["[PAD]", "[UNK]", "[CLS]", "[SEP]", *WORDS])}
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="[CLS] $A [SEP]", special_tokens=[("[CLS]", 2), ("[SEP]", 3)]
+    )
+    return PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        pad_token="[PAD]",
+        unk_token="[UNK]",
+        cls_token="[CLS]",
+        sep_token="[SEP]",
+        model_input_names=["input_ids", "attention_mask"],
+    )
+
+
+def onnx_model_path(workdir: str) -> str:
+    shipped = PROJECT_ROOT / "core/enhanced_agent_bus/deliberation_layer/optimized_models"
+    if (shipped / "distilbert_base_uncased.onnx").exists():
+        return str(shipped / "distilbert_base_uncased.onnx")
+
+    import torch
+    from transformers import DistilBertConfig, DistilBertModel
+
+    model = DistilBertModel(DistilBertConfig(vocab_size=30522)).eval()
+    path = os.path.join(workdir, "distilbert_random.onnx")
+    sample = torch.ones((2, 16), dtype=torch.int64)
+    torch.onnx.export(
+        model,
+        (sample, sample),
+        path,
+        input_names=["input_ids", "attention_mask"],
+        output_names=["last_hidden_state"],
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "last_hidden_state": {0: "batch", 1: "sequence"},
+        },
+        dynamo=False,
+    )
+    return path
+
+
+class PerMessageScorer(ImpactScorer):
+    """Previous async path: one forward pass per message on the event loop."""
+
+    pad_to_max_length = False
+
+    async def _calculate_semantic_score_async(self, message) -> float:
+        return self._calculate_semantic_score(message)
+
+    def _get_embeddings(self, text: str) -> np.ndarray:
+        if not self.pad_to_max_length:
+            return self._embed_batch([text])
+        inputs = self.tokenizer(
+            text, max_length=512, truncation=True, padding="max_length", return_tensors="np"
+        )
+        return self._forward(dict(inputs))
+
+
+class PaddedPerMessageScorer(PerMessageScorer):
+    pad_to_max_length = True
+
+
+def make_scorer(cls: type, session, tokenizer, **kwargs) -> ImpactScorer:
+    scorer = cls(use_onnx=True, **kwargs)
+    scorer.tokenizer = tokenizer
+    scorer.session = session
+    scorer._onnx_enabled = True
+    scorer._bert_enabled = True
+    scorer._model_loaded = True
+    scorer._get_keyword_embeddings()
+    return scorer
+
+
+def make_messages(count: int, long_fraction: float) -> List[dict]:
+    rng = random.Random(7)
+    messages = []
+    for i in range(count):
+        length = rng.randint(4, 16) if rng.random() >= long_fraction else rng.randint(120, 300)
+        text = " ".join(rng.choice(WORDS) for _ in range(length))
+        messages.append({"content": text, "from_agent": f"agent-{i % 50}"})
+    return messages
+
+
+async def throughput(scorer: ImpactScorer, messages: List[dict], concurrency: int) -> float:
+    """Messages/s with ``concurrency`` callers issuing requests back to back."""
+    pending = list(reversed(messages))
+
+    async def client() -> None:
+        while pending:
+            await scorer.calculate_impact_score_async(pending.pop())
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return len(messages) / (time.perf_counter() - start)
+
+
+async def latency(scorer: ImpactScorer, messages: List[dict], rate: float) -> List[float]:
+    """Latencies from scheduled arrival to completion under a fixed arrival rate."""
+    latencies: List[float] = []
+    start = time.perf_counter()
+
+    async def request(arrival: float, message: dict) -> None:
+        await asyncio.sleep(max(0.0, start + arrival - time.perf_counter()))
+        await scorer.calculate_impact_score_async(message)
+        latencies.append(time.perf_counter() - start - arrival)
+
+    await asyncio.gather(*(request(i / rate, m) for i, m in enumerate(messages)))
+    return sorted(latencies)
+
+
+async def measure(name: str, scorer: ImpactScorer, messages: List[dict], args) -> None:
+    rate = await throughput(scorer, messages, args.concurrency)
+    latencies = await latency(scorer, messages, args.rate)
+    batches = scorer._batcher.stats["batches"] if scorer._batcher else 2 * len(messages)
+    logger.info(
+        f"{name:<28} {rate:7.1f} msg/s | @{args.rate:g} msg/s: "
+        f"p50 {latencies[len(latencies) // 2] * 1e3:8.1f} ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:8.1f} ms | "
+        f"inference calls {batches}"
+    )
+    scorer.close()
+
+
+async def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        session = ort.InferenceSession(onnx_model_path(workdir), providers=["CPUExecutionProvider"])
+    tokenizer = build_tokenizer()
+    messages = make_messages(args.messages, args.long_fraction)
+    logger.info(
+        f"{args.messages} messages, {args.concurrency} concurrent callers for throughput, "
+        f"open-loop arrivals at {args.rate:g} msg/s for latency, CPU ONNX Runtime"
+    )
+
+    await measure(
+        "per-message, padded to 512",
+        make_scorer(PaddedPerMessageScorer, session, tokenizer),
+        messages[: args.legacy_messages],
+        args,
+    )
+    await measure(
+        "per-message, unpadded",
+        make_scorer(PerMessageScorer, session, tokenizer),
+        messages,
+        args,
+    )
+    await measure(
+        f"micro-batched (<= {args.max_batch})",
+        make_scorer(
+            ImpactScorer,
+            session,
+            tokenizer,
+            batch_max_size=args.max_batch,
+            batch_max_wait_ms=args.max_wait_ms,
+        ),
+        messages,
+        args,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=400)
+    parser.add_argument("--legacy-messages", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--rate", type=float, default=8.0)
+    parser.add_argument("--long-fraction", type=float, default=0.2)
+    parser.add_argument("--max-batch", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Impact Scorer Similarity and Embedding Cache Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures the ImpactScorer batch path on CPU-only ONNX Runtime:
+
+- keyword similarity: the previous per-message loop (sklearn per row, or
+  cosine_similarity_fallback per keyword without sklearn) vs. one product
+  of row-normalized matrices for the whole batch
+- repeated texts: score_messages_batch over a stream where most texts
+  recur, with and without the embedding cache
+- worker restart: the first batch of a fresh scorer with an empty cache
+  vs. one attached to the memory-mapped store a previous worker filled
+
+Uses optimized_models/distilbert_base_uncased.onnx when present; otherwise
+a randomly initialised model of the same architecture is exported to ONNX.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_impact_scorer_similarity.py [--messages N] [--distinct D] [--rows R]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+os.environ.setdefault("HF_HUB_OFFLINE", "1")
+os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np  # noqa: E402
+import onnxruntime as ort  # noqa: E402
+from sklearn.metrics.pairwise import cosine_similarity  # noqa: E402
+
+from core.enhanced_agent_bus.benchmarks.bench_impact_scorer_batching import (  # noqa: E402
+    WORDS,
+    build_tokenizer,
+    make_scorer,
+    onnx_model_path,
+)
+from core.enhanced_agent_bus.deliberation_layer.impact_scorer import (  # noqa: E402
+    ImpactScorer,
+    cosine_similarity_fallback,
+)
+
+logging.getLogger("core.enhanced_agent_bus").setLevel(logging.ERROR)
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def per_message_sklearn(embeddings: np.ndarray, kw_emb: np.ndarray) -> List[float]:
+    return [float(np.max(cosine_similarity(row[None, :], kw_emb))) for row in embeddings]
+
+
+def per_keyword_fallback(embeddings: np.ndarray, kw_emb: np.ndarray) -> List[float]:
+    return [max(cosine_similarity_fallback(e, kw) for kw in kw_emb) for e in embeddings]
+
+
+def similarity(rows: int) -> None:
+    rng = np.random.default_rng(7)
+    scorer = ImpactScorer(use_onnx=False)
+    kw_emb = rng.normal(size=(len(scorer.high_impact_keywords), 768)).astype(np.float32)
+    embeddings = rng.normal(size=(rows, 768)).astype(np.float32)
+    scorer._keyword_embeddings = kw_emb
+    scorer._max_keyword_similarity(embeddings[:1])
+
+    sklearn_s = timed(per_message_sklearn, embeddings, kw_emb)
+    fallback_s = timed(per_keyword_fallback, embeddings, kw_emb)
+    matrix_s = timed(scorer._max_keyword_similarity, embeddings)
+    logger.info(
+        f"keyword similarity, {rows} x {len(kw_emb)} keywords: "
+        f"per-message sklearn {sklearn_s * 1e3:8.1f} ms | per-keyword fallback "
+        f"{fallback_s * 1e3:8.1f} ms | one matrix product {matrix_s * 1e3:6.2f} ms"
+    )
+    scorer.close()
+
+
+def make_texts(count: int, distinct: int) -> List[dict]:
+    rng = random.Random(7)
+    pool = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 16))) for _ in range(distinct)]
+    return [{"content": rng.choice(pool)} for _ in range(count)]
+
+
+def score_in_batches(scorer: ImpactScorer, messages: List[dict], batch: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(messages), batch):
+        scorer.score_messages_batch(messages[i : i + batch])
+    return len(messages) / (time.perf_counter() - start)
+
+
+def repeated_texts(session, tokenizer, messages: List[dict], batch: int) -> None:
+    uncached = make_scorer(ImpactScorer, session, tokenizer, embedding_cache_size=0)
+    cached = make_scorer(ImpactScorer, session, tokenizer)
+    before = score_in_batches(uncached, messages, batch)
+    after = score_in_batches(cached, messages, batch)
+    cache = cached._embedding_cache
+    logger.info(
+        f"score_messages_batch, {len(messages)} messages: no cache {before:8.1f} msg/s | "
+        f"cached {after:8.1f} msg/s (hit rate {cache.hits / (cache.hits + cache.misses):.0%})"
+    )
+    uncached.close()
+    cached.close()
+
+
+def restart(session, tokenizer, messages: List[dict], batch: int, workdir: str) -> None:
+    path = os.path.join(workdir, "embeddings.bin")
+    first = make_scorer(ImpactScorer, session, tokenizer, embedding_cache_path=path)
+    score_in_batches(first, messages, batch)
+    first.close()
+
+    cold = make_scorer(ImpactScorer, session, tokenizer)
+    warm = make_scorer(ImpactScorer, session, tokenizer, embedding_cache_path=path)
+    cold_s = timed(cold.score_messages_batch, messages[:batch])
+    warm_s = timed(warm.score_messages_batch, messages[:batch])
+    logger.info(
+        f"first batch of {batch} after restart: cold {cold_s * 1e3:8.1f} ms | "
+        f"warm from shared store {warm_s * 1e3:6.1f} ms"
+    )
+    cold.close()
+    warm.close()
+
+
+def run(args: argparse.Namespace) -> None:
+    similarity(args.rows)
+    with tempfile.TemporaryDirectory() as workdir:
+        session = ort.InferenceSession(onnx_model_path(workdir), providers=["CPUExecutionProvider"])
+        tokenizer = build_tokenizer()
+        messages = make_texts(args.messages, args.distinct)
+        repeated_texts(session, tokenizer, messages, args.batch)
+        restart(session, tokenizer, messages, args.batch, workdir)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+    run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
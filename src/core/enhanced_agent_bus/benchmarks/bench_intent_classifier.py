@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Intent Classifier Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures IntentClassifier.classify_with_confidence per-message cost: the
+previous scans (content lower-cased, then one ``keyword in content`` pass
+per keyword of every intent) vs. the compiled KeywordMatcher (one
+Aho-Corasick pass for all intents, memoized by content digest). Payloads are
+1KB, 16KB and 256KB; keyword lists are the defaults (19 keywords) and a
+synthetic set of 1500. Distinct payloads measure the automaton alone,
+repeated payloads also hit the memo.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_intent_classifier.py [--iterations N] [--keywords K]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.deliberation_layer.intent_classifier import (  # noqa: E402
+    AHOCORASICK_AVAILABLE,
+    IntentClassifier,
+    IntentType,
+)
+
+logging.getLogger("core.enhanced_agent_bus").setLevel(logging.ERROR)
+
+SIZES = {"1KB": 1024, "16KB": 16 * 1024, "256KB": 256 * 1024}
+
+
+class LegacyIntentClassifier(IntentClassifier):
+    """classify_with_confidence as implemented before: one scan per keyword."""
+
+    def classify_with_confidence(self, content: str) -> Tuple[IntentType, float]:
+        content_lower = content.lower()
+        match_counts = [
+            (IntentType.REASONING, sum(1 for k in self.REASONING_KEYWORDS if k in content_lower)),
+            (IntentType.FACTUAL, sum(1 for k in self.FACTUAL_KEYWORDS if k in content_lower)),
+            (IntentType.CREATIVE, sum(1 for k in self.CREATIVE_KEYWORDS if k in content_lower)),
+        ]
+        best_intent, best_count = IntentType.GENERAL, 0
+        for intent_type, count in match_counts:
+            if count > best_count:
+                best_intent, best_count = intent_type, count
+        if best_count > 0:
+            return best_intent, self._calculate_confidence(best_count)
+        return IntentType.GENERAL, self._calculate_confidence(0, is_default=True)
+
+
+def with_keywords(cls: type, count: int) -> type:
+    """Subclass of ``cls`` with ``count`` synthetic keywords spread over the intents."""
+    rng = random.Random(7)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = ["".join(rng.choice(letters) for _ in range(8)) for _ in range(count)]
+    third = count // 3
+    return type(
+        f"{cls.__name__}{count}",
+        (cls,),
+        {
+            "REASONING_KEYWORDS": cls.REASONING_KEYWORDS + words[:third],
+            "FACTUAL_KEYWORDS": cls.FACTUAL_KEYWORDS + words[third : 2 * third],
+            "CREATIVE_KEYWORDS": cls.CREATIVE_KEYWORDS + words[2 * third :],
+        },
+    )
+
+
+def payloads(size: int, count: int) -> List[str]:
+    filler = "{'metric': 'latency_p99', 'value': 4.2, 'region': 'eu-west', 'ok': True}, "
+    body = (filler * (size // len(filler) + 1))[:size]
+    prompt = "Please analyze this report and tell me about it:"
+    return [f"{i:08d} {prompt} {body}" for i in range(count)]
+
+
+def per_message(fn: Callable[[str], object], contents: List[str]) -> float:
+    start = time.perf_counter()
+    for content in contents:
+        fn(content)
+    return (time.perf_counter() - start) / len(contents)
+
+
+def run(iterations: int, keywords: int) -> None:
+    backend = "pyahocorasick" if AHOCORASICK_AVAILABLE else "per-keyword fallback"
+    logger.info(f"automaton: {backend}")
+    logger.info(
+        f"{'keywords':<10}{'payload':<8}{'legacy us':>12}{'compiled us':>14}"
+        f"{'repeated us':>14}{'speedup':>10}"
+    )
+    for count in (0, keywords):
+        legacy_cls = with_keywords(LegacyIntentClassifier, count)
+        compiled_cls = with_keywords(IntentClassifier, count)
+        total = len(legacy_cls.REASONING_KEYWORDS + legacy_cls.FACTUAL_KEYWORDS)
+        total += len(legacy_cls.CREATIVE_KEYWORDS)
+        for label, size in SIZES.items():
+            n = max(10, iterations * 1024 // size)
+            contents = payloads(size, n)
+            legacy = per_message(legacy_cls().classify_with_confidence, contents)
+            compiled = per_message(compiled_cls().classify_with_confidence, contents)
+            repeated_classifier = compiled_cls()
+            repeated_classifier.classify_with_confidence(contents[0])
+            repeated = per_message(repeated_classifier.classify_with_confidence, [contents[0]] * n)
+            logger.info(
+                f"{total:<10}{label:<8}{legacy * 1e6:>12.1f}{compiled * 1e6:>14.1f}"
+                f"{repeated * 1e6:>14.2f}{legacy / compiled:>9.1f}x"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--keywords", type=int, default=1500)
+    args = parser.parse_args()
+    run(args.iterations, args.keywords)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
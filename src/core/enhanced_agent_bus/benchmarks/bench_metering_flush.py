@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Metering Queue Flush Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Drives AsyncMeteringQueue at a sustained event rate (default 20k events/s)
+from 50 tenants across the metered operations and compares the previous
+flush (up to ``batch_size`` events per interval, one ``record_event`` call
+each) with the bulk flush (whole queue drained on interval or high water,
+pre-aggregated per tenant, operation, tier, agent, metadata and second,
+written via ``record_events``). Reports events dropped, events and rows
+written, and flush latency.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_metering_flush.py [--rate R] [--seconds S]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.metering_integration import (  # noqa: E402
+    CONSTITUTIONAL_HASH,
+    AsyncMeteringQueue,
+    MeterableOperation,
+    MeteringConfig,
+    MeteringTier,
+    UsageMeteringService,
+)
+
+logging.getLogger("core.enhanced_agent_bus").setLevel(logging.ERROR)
+logging.getLogger("core.services").setLevel(logging.ERROR)
+
+OPERATIONS = [
+    (MeterableOperation.CONSTITUTIONAL_VALIDATION, MeteringTier.STANDARD),
+    (MeterableOperation.POLICY_EVALUATION, MeteringTier.STANDARD),
+    (MeterableOperation.DELIBERATION_REQUEST, MeteringTier.DELIBERATION),
+]
+TICK_SECONDS = 0.01
+
+
+class LegacyMeteringQueue(AsyncMeteringQueue):
+    """AsyncMeteringQueue flush as implemented before: batch_size events, one write each."""
+
+    async def _flush_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.config.flush_interval_seconds)
+                await self._flush_batch()
+            except asyncio.CancelledError:
+                break
+
+    async def _flush_batch(self) -> None:
+        if not self._metering_service or self._queue.empty():
+            return
+        batch = []
+        for _ in range(self.config.batch_size):
+            if self._queue.empty():
+                break
+            batch.append(self._queue.get_nowait())
+        for event_data in batch:
+            del event_data["timestamp"]
+            await self._metering_service.record_event(**event_data)
+            self._events_flushed += 1
+
+
+class TimedQueue:
+    """Records the wall time of every non-empty flush of ``queue``."""
+
+    def __init__(self, queue: AsyncMeteringQueue):
+        self.latencies_ms: List[float] = []
+        self.rows = 0
+        flush, service = queue._flush_batch, queue._metering_service
+
+        async def timed_flush() -> None:
+            if queue._queue.empty():
+                return
+            before = len(service._event_buffer)
+            start = time.perf_counter()
+            await flush()
+            self.latencies_ms.append((time.perf_counter() - start) * 1000)
+            self.rows += len(service._event_buffer) - before
+
+        queue._flush_batch = timed_flush
+
+
+async def drive(queue: AsyncMeteringQueue, rate: int, seconds: float) -> float:
+    """Enqueue ``rate`` events/s in 10ms ticks; returns the achieved rate."""
+    per_tick = int(rate * TICK_SECONDS)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    sent = 0
+    for tick in range(int(seconds / TICK_SECONDS)):
+        for i in range(per_tick):
+            n = sent + i
+            operation, tier = OPERATIONS[n % len(OPERATIONS)]
+            queue.enqueue_nowait(
+                tenant_id=f"tenant-{n % 50}",
+                operation=operation,
+                tier=tier,
+                agent_id=f"agent-{n % 500}",
+                tokens_processed=16,
+                latency_ms=0.8,
+            )
+        sent += per_tick
+        await asyncio.sleep(max(0.0, start + (tick + 1) * TICK_SECONDS - loop.time()))
+    return sent / (loop.time() - start)
+
+
+async def measure(label: str, cls: type, rate: int, seconds: float) -> None:
+    config = MeteringConfig(constitutional_hash=CONSTITUTIONAL_HASH)
+    service = UsageMeteringService(
+        aggregation_interval_seconds=3600, constitutional_hash=CONSTITUTIONAL_HASH
+    )
+    queue = cls(config, service)
+    timed = TimedQueue(queue)
+    await queue.start()
+    achieved = await drive(queue, rate, seconds)
+    metrics = queue.get_metrics()
+    await queue.stop()
+
+    latencies = sorted(timed.latencies_ms) or [0.0]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    dropped = metrics["events_dropped"]
+    offered = metrics["events_queued"] + dropped
+    logger.info(
+        f"{label:<9} offered {offered:>8} ({achieved:8.0f}/s) | "
+        f"dropped {dropped:>8} ({dropped / max(1, offered):6.1%}) | "
+        f"flushed {queue._events_flushed:>8} events in {timed.rows:>6} rows | "
+        f"{len(timed.latencies_ms):>4} flushes, latency p50 "
+        f"{statistics.median(latencies):7.2f} ms, p99 {p99:7.2f} ms, max {latencies[-1]:7.2f} ms"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    await measure("previous", LegacyMeteringQueue, args.rate, args.seconds)
+    await measure("bulk", AsyncMeteringQueue, args.rate, args.seconds)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rate", type=int, default=20_000)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 OPA Evaluation Batching Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Runs a local stub OPA server (single-input and batch data APIs, with a fixed
+per-request service delay) and measures evaluate_policy throughput and
+latency with and without PolicyEvaluationBatcher at several concurrencies.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_opa_batching.py [--requests N] [--delay-ms D]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.opa_client import OPAClient  # noqa: E402
+
+
+class StubOPAServer:
+    """Minimal keep-alive HTTP/1.1 server answering OPA data API requests."""
+
+    def __init__(self, delay_ms: float):
+        self.delay = delay_ms / 1000.0
+        self.requests = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                path = request_line.split()[1].decode()
+                length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                body = json.loads(await reader.readexactly(length))
+                self.requests += 1
+                await asyncio.sleep(self.delay)
+                if path.startswith("/v1/batch/data/"):
+                    payload = {
+                        "responses": {
+                            key: {"result": bool(value.get("allow"))}
+                            for key, value in body["inputs"].items()
+                        }
+                    }
+                else:
+                    payload = {"result": bool(body["input"].get("allow"))}
+                data = json.dumps(payload).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(data)}\r\n\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run_load(
+    url: str, batching: bool, concurrency: int, total: int
+) -> Tuple[float, List[float]]:
+    client = OPAClient(opa_url=url, mode="http", enable_cache=False, enable_batching=batching)
+    await client.initialize()
+    latencies: List[float] = []
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await client.evaluate_policy({"allow": True, "agent": f"a-{remaining}"})
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return elapsed, latencies
+
+
+async def run(total: int, delay_ms: float) -> None:
+    stub = StubOPAServer(delay_ms)
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}"
+
+    logger.info(f"stub OPA delay={delay_ms}ms requests/run={total}")
+    logger.info(
+        f"{'conc':>5}{'mode':>10}{'evals/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'http reqs':>11}"
+    )
+    for concurrency in (1, 16, 64, 256):
+        for batching in (False, True):
+            stub.requests = 0
+            elapsed, latencies = await run_load(url, batching, concurrency, total)
+            latencies.sort()
+            p50 = statistics.median(latencies) * 1000
+            p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+            label = "batched" if batching else "single"
+            logger.info(
+                f"{concurrency:>5}{label:>10}{total / elapsed:>10.0f}{p50:>9.2f}{p99:>9.2f}"
+                f"{stub.requests:>11}"
+            )
+
+    server.close()
+    await server.wait_closed()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--delay-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.delay_ms))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
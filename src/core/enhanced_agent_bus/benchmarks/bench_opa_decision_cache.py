@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 OPA Decision Cache Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures OPAClient.evaluate_policy hit-path cost, miss-path serialization
+cost, memory-cache size under a stream of distinct inputs, and OPA calls
+made for bursts of identical concurrent misses (single-flight), with a
+simulated OPA round trip.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_opa_decision_cache.py [--iterations N]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.opa_client import OPAClient  # noqa: E402
+
+INPUT = {
+    "agent_id": "policy-agent",
+    "tenant_id": "tenant-acme",
+    "action": "approve_budget",
+    "resource": {"type": "budget", "amount": 125000, "tags": ["finance", "q3"]},
+    "constitutional_hash": "cdd01ef066bc6cf2",
+}
+
+
+def legacy_miss_serialization(policy_path: str, input_data: Dict[str, Any]) -> int:
+    """Key derivation plus size validation as previously done on a miss."""
+    input_str = json.dumps(input_data, sort_keys=True)
+    key = f"opa:{policy_path}:{hashlib.sha256(input_str.encode()).hexdigest()[:16]}"
+    return len(key) + len(json.dumps(input_data))
+
+
+def current_miss_serialization(policy_path: str, input_data: Dict[str, Any]) -> int:
+    input_json = json.dumps(input_data, sort_keys=True)
+    key = OPAClient._cache_key_from_json(policy_path, input_json)
+    return len(key) + len(input_json)
+
+
+async def run(iterations: int) -> None:
+    n = iterations
+    start = time.perf_counter()
+    for _ in range(n):
+        legacy_miss_serialization("data.acgs.allow", INPUT)
+    legacy = (time.perf_counter() - start) / n
+    start = time.perf_counter()
+    for _ in range(n):
+        current_miss_serialization("data.acgs.allow", INPUT)
+    current = (time.perf_counter() - start) / n
+    logger.info(f"miss serialization: {legacy * 1e6:.2f} us -> {current * 1e6:.2f} us")
+
+    calls = 0
+
+    async def fake_opa(input_data: Dict[str, Any], policy_path: str) -> Dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.002)
+        return {"result": True, "allowed": True, "metadata": {"mode": "http"}}
+
+    client = OPAClient(mode="http", enable_cache=True, cache_maxsize=5000)
+    client._evaluate_http = fake_opa  # type: ignore[method-assign]
+
+    await client.evaluate_policy(INPUT)
+    start = time.perf_counter()
+    for _ in range(n):
+        await client.evaluate_policy(INPUT)
+    logger.info(f"cache hit: {(time.perf_counter() - start) / n * 1e6:.2f} us")
+
+    distinct = 20_000
+    await asyncio.gather(
+        *(client.evaluate_policy({**INPUT, "request": i}) for i in range(distinct))
+    )
+    logger.info(
+        f"memory cache after {distinct} distinct inputs: {len(client._memory_cache)} entries "
+        f"(bounded at {client._memory_cache.maxsize}; previously {distinct + 1})"
+    )
+
+    await client.clear_cache()
+    calls = 0
+    burst = 200
+    start = time.perf_counter()
+    await asyncio.gather(*(client.evaluate_policy({**INPUT, "burst": 1}) for _ in range(burst)))
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"{burst} concurrent identical misses: {calls} OPA call(s) in {elapsed * 1000:.1f} ms "
+        f"(previously {burst})"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
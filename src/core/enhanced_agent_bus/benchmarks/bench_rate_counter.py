@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Rate Counter Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Compares the per-check cost of the previous RuntimeSecurityScanner rate
+limiter (global asyncio.Lock plus a rebuilt timestamp list per key) against
+ShardedRateCounter, replaying a synthetic clock at a fixed message rate.
+
+Usage:
+    python src/core/enhanced_agent_bus/benchmarks/bench_rate_counter.py [--rate R] [--keys K] [--seconds S]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.enhanced_agent_bus.runtime_security import ShardedRateCounter  # noqa: E402
+
+
+class LegacyRateCounter:
+    """The list-of-timestamps limiter previously inlined in the scanner."""
+
+    def __init__(self) -> None:
+        self._rate_counters: Dict[str, List[float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def hit(self, key: str, now: float) -> int:
+        async with self._lock:
+            if key not in self._rate_counters:
+                self._rate_counters[key] = []
+            window_start = now - 1.0
+            self._rate_counters[key] = [t for t in self._rate_counters[key] if t > window_start]
+            current = len(self._rate_counters[key])
+            self._rate_counters[key].append(now)
+            return current
+
+    def __len__(self) -> int:
+        return len(self._rate_counters)
+
+
+def _workload(rate: int, keys: int, seconds: float) -> List[tuple]:
+    total = int(rate * seconds)
+    step = 1.0 / rate
+    return [(f"tenant-{i % 16}:agent-{i % keys}", 1000.0 + i * step) for i in range(total)]
+
+
+async def bench_legacy(workload: List[tuple]) -> float:
+    counter = LegacyRateCounter()
+    start = time.perf_counter()
+    for key, now in workload:
+        await counter.hit(key, now)
+    return time.perf_counter() - start
+
+
+async def bench_sharded(workload: List[tuple]) -> float:
+    counter = ShardedRateCounter()
+
+    async def check(key: str, now: float) -> int:
+        # Awaited like the scanner's _check_rate_limit, to keep the comparison fair
+        return counter.hit(key, now)
+
+    start = time.perf_counter()
+    for key, now in workload:
+        await check(key, now)
+    return time.perf_counter() - start
+
+
+async def run(rate: int, keys: int, seconds: float) -> None:
+    workload = _workload(rate, keys, seconds)
+    legacy = await bench_legacy(workload)
+    sharded = await bench_sharded(workload)
+    n = len(workload)
+    logger.info(f"checks={n} simulated_rate={rate}/s keys={keys}")
+    logger.info(f"  legacy list+lock : {legacy / n * 1e6:8.2f} us/check")
+    logger.info(f"  sharded ring     : {sharded / n * 1e6:8.2f} us/check")
+    logger.info(f"  speedup          : {legacy / sharded:.2f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rate", type=int, default=100_000)
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.rate, args.keys, args.seconds))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,10 +7,14 @@ Persistent queue for high-impact messages awaiting approval.
 import asyncio
 import json
 import logging
+import math
+import os
+import shutil
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, TextIO, Tuple, Union
 
 try:
     from core.shared.types import JSONDict, JSONValue
@@ -94,6 +98,259 @@ logger = logging.getLogger(__name__)
 _all_queue_instances: list = []
 
 
+class TimerWheel:
+    """
+    Hierarchical timing wheel keyed by an arbitrary hashable key.
+
+    Holds the timeouts of all pending deliberation tasks. Scheduling and
+    cancelling a deadline are O(1); ``advance()`` returns every key that
+    expired since the previous call as one batch.
+
+    Level 0 has ``slots`` buckets of one ``tick`` each; every further level
+    covers ``slots`` times the span of the one below. Deadlines beyond the
+    top level are parked in its last bucket and re-placed when it cascades.
+
+    Args:
+        tick: Resolution in seconds; deadlines fire at most one tick late
+        slots: Buckets per level
+        levels: Number of wheel levels
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self,
+        tick: float = 0.1,
+        slots: int = 256,
+        levels: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if tick <= 0 or slots < 2 or levels < 1:
+            raise ValueError("tick must be positive, slots >= 2 and levels >= 1")
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self._clock = clock
+        self._origin = clock()
+        self._current = 0
+        self._spans = [slots**level for level in range(levels)]
+        self._wheels: List[List[Dict[Hashable, int]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._where: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def _now_tick(self, now: Optional[float] = None) -> int:
+        return int(((self._clock() if now is None else now) - self._origin) / self.tick)
+
+    def _place(self, key: Hashable, deadline: int) -> None:
+        current = self._current
+        deadline = max(deadline, current)
+        for index, span in enumerate(self._spans):
+            if deadline // span - current // span < self.slots:
+                level, slot = index, (deadline // span) % self.slots
+                break
+        else:
+            # Beyond the wheel's range: park in the furthest top-level bucket
+            level = self.levels - 1
+            slot = (current // self._spans[level] + self.slots - 1) % self.slots
+        self._wheels[level][slot][key] = deadline
+        self._where[key] = (level, slot)
+
+    def schedule(self, key: Hashable, delay: float) -> None:
+        """Schedule (or reschedule) ``key`` to expire ``delay`` seconds from now."""
+        self.cancel(key)
+        deadline = math.ceil((self._clock() - self._origin + delay) / self.tick)
+        self._place(key, max(deadline, self._current + 1))
+
+    def cancel(self, key: Hashable) -> bool:
+        """Remove a pending deadline; returns False if the key was not scheduled."""
+        where = self._where.pop(key, None)
+        if where is None:
+            return False
+        del self._wheels[where[0]][where[1]][key]
+        return True
+
+    def advance(self, now: Optional[float] = None) -> List[Hashable]:
+        """Move the wheel up to ``now`` and return every key whose deadline passed."""
+        target = self._now_tick(now)
+        if not self._where:
+            self._current = max(self._current, target)
+            return []
+        expired: List[Hashable] = []
+        while self._current < target and self._where:
+            self._current += 1
+            current = self._current
+            for level in range(1, self.levels):
+                span = self._spans[level]
+                if current % span:
+                    break
+                index = (current // span) % self.slots
+                bucket = self._wheels[level][index]
+                if bucket:
+                    self._wheels[level][index] = {}
+                    for key, deadline in bucket.items():
+                        self._place(key, deadline)
+            slot = current % self.slots
+            bucket = self._wheels[0][slot]
+            if bucket:
+                self._wheels[0][slot] = {}
+                for key in bucket:
+                    del self._where[key]
+                expired.extend(bucket)
+        self._current = max(self._current, target)
+        return expired
+
+
+class WriteAheadLog:
+    """
+    Append-only JSON-lines log of deliberation task mutations.
+
+    Each mutation is written and flushed to the OS as one line, so a process
+    crash loses nothing; ``fsync`` is batched and issued once ``fsync_batch``
+    records are pending or ``fsync_interval`` seconds have passed since the
+    last sync. Compaction rotates the active segment to ``<path>.old`` while
+    a snapshot is written (after a failed snapshot, the next rotation appends
+    to it); recovery replays ``<path>.old`` and then ``path``, stopping at a
+    torn trailing line.
+
+    Args:
+        path: Active log segment
+        fsync_batch: Pending records that force an fsync
+        fsync_interval: Maximum seconds a record may stay unsynced
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fsync_batch: int = 256,
+        fsync_interval: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.path = path
+        self.rotated_path = f"{path}.old"
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self.records = 0  # Records in the active segment
+        self._clock = clock
+        self._file: Optional[TextIO] = None
+        self._unsynced = 0
+        self._last_sync = clock()
+        self._rotation_pending = False
+
+    def append(self, record: JSONDict) -> None:
+        """Append one mutation record; fsyncs when the current batch is due."""
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.records += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_batch:
+            self.sync()
+        else:
+            self.sync_if_due()
+
+    def sync_if_due(self) -> None:
+        """Fsync pending records whose batch interval has elapsed."""
+        if self._unsynced and self._clock() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Fsync all pending records."""
+        if self._unsynced and self._file is not None:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = self._clock()
+
+    def close(self) -> None:
+        """Sync and close the active segment."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def rotate(self) -> bool:
+        """Move the active segment aside ahead of a snapshot.
+
+        If an earlier snapshot failed, its rotated segment is kept and the
+        active segment is appended to it, so the next snapshot covers both.
+        Returns False while a previous rotation is still awaiting its snapshot.
+        """
+        if self._rotation_pending:
+            return False
+        self.close()
+        if os.path.exists(self.path):
+            if os.path.exists(self.rotated_path):
+                with open(self.rotated_path, "ab") as dst, open(self.path, "rb") as src:
+                    shutil.copyfileobj(src, dst)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.rotated_path)
+        self.records = 0
+        self._rotation_pending = True
+        return True
+
+    def finish_rotation(self, snapshot_written: bool) -> None:
+        """End a rotation: drop the rotated segment if its snapshot is durable, else keep it."""
+        self._rotation_pending = False
+        if snapshot_written:
+            self.drop_rotated()
+
+    def reset(self) -> None:
+        """Discard both segments once a snapshot covering them is durable."""
+        self.close()
+        self.drop_rotated()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self.records = 0
+
+    def drop_rotated(self) -> None:
+        """Discard the rotated segment once a snapshot covering it is durable."""
+        try:
+            os.remove(self.rotated_path)
+        except FileNotFoundError:
+            pass
+
+    def replay(self) -> Iterator[JSONDict]:
+        """Yield every record of the rotated and active segments in order.
+
+        A torn trailing line left by a crash is skipped, and cut from the
+        active segment so that later appends start on a clean line.
+        """
+        self.records = 0
+        for segment in (self.rotated_path, self.path):
+            try:
+                f = open(segment, "rb")
+            except FileNotFoundError:
+                continue
+            offset = 0
+            with f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated record")
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Ignoring torn record at end of {segment}")
+                        if segment == self.path:
+                            os.truncate(segment, offset)
+                        break
+                    offset += len(line)
+                    if segment == self.path:
+                        self.records += 1
+                    yield record
+
+
 class DeliberationQueue:
     """
     Queue for managing messages that require human-in-the-loop or
@@ -103,6 +360,13 @@ class DeliberationQueue:
     - Uses partitioned locks to reduce contention (4 partitions by default)
     - Partition selection based on task_id hash for consistent routing
     - Enables parallel processing of tasks in different partitions
+    - All timeouts live in one TimerWheel driven by a single background task;
+      resolving a task cancels its deadline in O(1) and expirations are
+      applied in batches
+    - With persistence enabled, mutations are appended to a write-ahead log
+      (``<persistence_path>.wal``) with batched fsync instead of rewriting
+      the whole JSON file; the snapshot is rewritten off the event loop only
+      when the log outgrows the queue (amortized O(1) per mutation)
     - Target: >6000 RPS throughput with P99 latency <1ms
     """
 
@@ -114,6 +378,9 @@ class DeliberationQueue:
         persistence_path: Optional[str] = None,
         consensus_threshold: float = 0.66,
         default_timeout: int = 300,
+        timeout_tick: float = 0.1,
+        wal_fsync_interval: float = 0.05,
+        compact_threshold: int = 10_000,
     ):
         self.queue: Dict[str, DeliberationTask] = {}  # Legacy name compatibility
         self.tasks = self.queue  # Preferred name
@@ -135,6 +402,18 @@ class DeliberationQueue:
         self._lock = asyncio.Lock()  # Global lock for stats and persistence only
         self._shutdown = False  # Shutdown flag for clean task termination
         self._shutdown_event = asyncio.Event()  # Event for immediate task wakeup on shutdown
+        # Deadlines of all pending tasks, expired by a single timeout runner
+        self._timeouts = TimerWheel(tick=timeout_tick)
+        self._timeout_runner: Optional[asyncio.Task] = None
+        self._timeouts_armed: Optional[asyncio.Event] = None
+        # Write-ahead log of task mutations, folded into the snapshot by compaction
+        self.compact_threshold = compact_threshold
+        self._wal: Optional[WriteAheadLog] = None
+        self._compaction: Optional[asyncio.Task] = None
+        if self.persistence_path:
+            self._wal = WriteAheadLog(
+                f"{self.persistence_path}.wal", fsync_interval=wal_fsync_interval
+            )
         # Register this instance for global cleanup
         _all_queue_instances.append(self)
         if self.persistence_path:
@@ -149,28 +428,62 @@ class DeliberationQueue:
         return self._partition_locks[partition_idx]
 
     def _load_tasks(self) -> None:
-        """Load tasks from persistent storage."""
+        """Load the snapshot from persistent storage, then replay the write-ahead log."""
         try:
             with open(self.persistence_path, "r") as f:
                 data = json.load(f)
                 for tid, tdata in data.items():
-                    # Simplified reconstruction
-                    msg = AgentMessage.from_dict(tdata["message"])
-                    task = DeliberationTask(
-                        task_id=tid,
-                        message=msg,
-                        status=DeliberationStatus(
-                            tdata["status"].lower()
-                            if isinstance(tdata["status"], str)
-                            else tdata["status"]
-                        ),
-                        metadata=tdata.get("metadata", {}),
-                        created_at=datetime.fromisoformat(tdata["created_at"]),
-                    )
-                    self.tasks[tid] = task
+                    self.tasks[tid] = self._task_from_entry(tid, tdata)
         except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
             pass
 
+        try:
+            for record in self._wal.replay():
+                self._apply_record(record)
+            if os.path.exists(self._wal.rotated_path):
+                # A compaction was interrupted: fold both segments into a new snapshot
+                if self._write_snapshot(list(self.tasks.items())):
+                    self._wal.reset()
+        except OSError as e:
+            logger.error(f"Failed to replay deliberation log: {e}")
+
+    @staticmethod
+    def _task_entry(task: DeliberationTask) -> JSONDict:
+        """Serialize a task to its snapshot/log entry."""
+        return {
+            "message": task.message.to_dict_raw() if task.message else {},
+            "status": get_enum_value(task.status),
+            "metadata": task.metadata,
+            "created_at": task.created_at.isoformat(),
+        }
+
+    @staticmethod
+    def _task_from_entry(task_id: str, tdata: JSONDict) -> DeliberationTask:
+        """Rebuild a task from its snapshot/log entry."""
+        # Simplified reconstruction
+        msg = AgentMessage.from_dict(tdata["message"])
+        return DeliberationTask(
+            task_id=task_id,
+            message=msg,
+            status=DeliberationStatus(
+                tdata["status"].lower() if isinstance(tdata["status"], str) else tdata["status"]
+            ),
+            metadata=tdata.get("metadata", {}),
+            created_at=datetime.fromisoformat(tdata["created_at"]),
+        )
+
+    def _apply_record(self, record: JSONDict) -> None:
+        """Apply one replayed log record to the in-memory tasks."""
+        try:
+            if record["op"] == "put":
+                self.tasks[record["id"]] = self._task_from_entry(record["id"], record["task"])
+            elif record["op"] == "status":
+                task = self.tasks.get(record["id"])
+                if task is not None:
+                    task.status = DeliberationStatus(record["status"])
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping unreadable deliberation log record: {e}")
+
     async def enqueue_for_deliberation(
         self,
         message: AgentMessage,
@@ -208,62 +521,82 @@ class DeliberationQueue:
         async with self._lock:
             self.stats["total_queued"] += 1
 
-        # Start background processing (e.g. timeout monitor) - non-blocking
-        proc_task = asyncio.create_task(self._monitor_task(task_id))
-        self.processing_tasks.append(proc_task)
+        # Register the timeout with the shared scheduler - non-blocking
+        self._schedule_timeout(task_id, timeout)
 
-        # Persist asynchronously if needed (non-blocking)
-        if self.persistence_path:
-            asyncio.create_task(self._async_save_tasks())
+        if self._wal is not None:
+            self._log_mutation({"op": "put", "id": task_id, "task": self._task_entry(task)})
 
         logger.info(f"Message {message.message_id} enqueued for deliberation (Task {task_id})")
         return task_id
 
-    async def _async_save_tasks(self) -> None:
-        """Asynchronously save tasks to persistent storage."""
-        await asyncio.to_thread(self._save_tasks)
+    def _log_mutation(self, record: JSONDict) -> None:
+        """Append a task mutation to the write-ahead log, compacting when it outgrows the queue."""
+        if self._wal is None:
+            return
+        try:
+            self._wal.append(record)
+        except OSError as e:
+            logger.error(f"Failed to persist deliberation task change: {e}")
+            return
+        if self._wal.records >= max(self.compact_threshold, len(self.tasks)) and (
+            self._compaction is None or self._compaction.done()
+        ):
+            self._compaction = asyncio.get_running_loop().create_task(self._compact())
+
+    def _log_status(self, task_id: str, status: Any) -> None:
+        """Record a task status change in the write-ahead log."""
+        self._log_mutation({"op": "status", "id": task_id, "status": get_enum_value(status)})
+
+    async def _compact(self) -> None:
+        """Fold the write-ahead log into a fresh snapshot written off the event loop."""
+        try:
+            if not self._wal.rotate():
+                return
+            items = list(self.tasks.items())
+            written = False
+            try:
+                written = await asyncio.to_thread(self._write_snapshot, items)
+            finally:
+                self._wal.finish_rotation(written)
+        except OSError as e:
+            logger.error(f"Failed to compact deliberation log: {e}")
 
     async def enqueue(self, *args, **kwargs) -> str:
         """Alias for enqueue_for_deliberation."""
         return await self.enqueue_for_deliberation(*args, **kwargs)
 
-    async def _monitor_task(self, task_id: str) -> None:
-        """Monitor task for timeout with proper shutdown handling."""
-        task = self.tasks.get(task_id)
-        if not task:
-            return
-
+    def _schedule_timeout(self, task_id: str, timeout: float) -> None:
+        """Add a task deadline to the timer wheel, starting the runner if needed."""
+        self._timeouts.schedule(task_id, timeout)
+        runner = self._timeout_runner
+        loop = asyncio.get_running_loop()
+        if runner is None or runner.done() or runner.get_loop() is not loop:
+            self._timeouts_armed = asyncio.Event()
+            self._timeout_runner = loop.create_task(self._run_timeouts())
+            self.processing_tasks.append(self._timeout_runner)
+        self._timeouts_armed.set()
+
+    def _cancel_timeout(self, task_id: str) -> None:
+        """Drop the deadline of a task that resolved before timing out."""
+        self._timeouts.cancel(task_id)
+
+    async def _run_timeouts(self) -> None:
+        """Advance the timer wheel once per tick and expire due tasks in batches."""
         current_task = asyncio.current_task()
+        armed = self._timeouts_armed
         try:
-            # Use smaller sleep intervals to respond to shutdown quickly
-            elapsed = 0
-            check_interval = min(1.0, task.timeout_seconds / 10)
-            while elapsed < task.timeout_seconds:
-                if self._shutdown:
-                    return  # Exit cleanly on shutdown
-                # Wait for either the check interval or shutdown event
-                try:
-                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=check_interval)
-                    # Shutdown event was set
-                    return
-                except asyncio.TimeoutError:
-                    # Normal timeout, continue monitoring
-                    pass
-                elapsed += check_interval
-                # Check if task was resolved externally
-                if task.is_complete:
-                    return
-
-            # Timeout reached
-            async with self._lock:
-                if task_id in self.tasks and not task.is_complete:
-                    task.status = DeliberationStatus.TIMED_OUT
-                    self.stats["timed_out"] += 1
-                    self._save_tasks()
-                    logger.warning(f"Task {task_id} timed out")
-        except asyncio.CancelledError:
-            # Propagate cancellation properly
-            raise
+            while not self._shutdown:
+                if not self._timeouts:
+                    armed.clear()
+                    await armed.wait()
+                    continue
+                await asyncio.sleep(self._timeouts.tick)
+                if self._wal is not None:
+                    self._wal.sync_if_due()
+                expired = self._timeouts.advance()
+                if expired and not self._shutdown:
+                    await self._expire_tasks(expired)
         finally:
             # Clean up task reference
             if current_task and current_task in self.processing_tasks:
@@ -272,6 +605,22 @@ class DeliberationQueue:
                 except ValueError:
                     pass  # Already removed
 
+    async def _expire_tasks(self, task_ids: List[str]) -> None:
+        """Mark a batch of tasks whose deadline passed as timed out."""
+        timed_out = 0
+        async with self._lock:
+            for task_id in task_ids:
+                task = self.tasks.get(task_id)
+                if task is not None and not task.is_complete:
+                    task.status = DeliberationStatus.TIMED_OUT
+                    self._log_status(task_id, task.status)
+                    timed_out += 1
+                    logger.debug(f"Task {task_id} timed out")
+            if timed_out:
+                self.stats["timed_out"] += timed_out
+        if timed_out:
+            logger.warning(f"{timed_out} deliberation task(s) timed out")
+
     async def stop(self) -> None:
         """Stop all background tasks cleanly."""
         self._shutdown = True  # Signal all monitor tasks to exit
@@ -289,6 +638,10 @@ class DeliberationQueue:
             except asyncio.TimeoutError:
                 logger.warning("Some deliberation tasks did not stop cleanly within timeout")
         self.processing_tasks.clear()
+        if self._compaction is not None:
+            await asyncio.gather(self._compaction, return_exceptions=True)
+        if self._wal is not None:
+            self._wal.close()
 
     async def __aenter__(self) -> "DeliberationQueue":
         """Async context manager entry."""
@@ -311,7 +664,9 @@ class DeliberationQueue:
                         pass
 
                 self.tasks[task_id].status = status
-                self._save_tasks()
+                if self.tasks[task_id].is_complete:
+                    self._cancel_timeout(task_id)
+                self._log_status(task_id, status)
 
     def get_pending_tasks(self) -> List[DeliberationItem]:
         """Get all tasks awaiting deliberation."""
@@ -342,9 +697,25 @@ class DeliberationQueue:
             "queue_size": len(self.tasks),
             "items": list(self.tasks.keys()),
             "stats": self.stats,
-            "processing_count": len(self.processing_tasks),
+            "processing_count": self._processing_count(),
         }
 
+    def _processing_count(self) -> int:
+        """
+        Open tasks whose timeout is still being watched.
+
+        Matches what the per-task timeout monitors used to count: a task
+        leaves the count once it completes (however its status was set),
+        times out, or the queue is stopped.
+        """
+        if self._shutdown:
+            return 0
+        return sum(
+            1
+            for task_id, task in self.tasks.items()
+            if not task.is_complete and task_id in self._timeouts
+        )
+
     async def submit_agent_vote(
         self, item_id: str, agent_id: str, vote: VoteType, reasoning: str, confidence: float = 1.0
     ) -> bool:
@@ -370,13 +741,12 @@ class DeliberationQueue:
             # Check for consensus
             if self._check_consensus(task):
                 task.status = DeliberationStatus.APPROVED  # Or specific consensus state
+                self._cancel_timeout(item_id)
+                self._log_status(item_id, task.status)
                 # Update stats with global lock
                 async with self._lock:
                     self.stats["approved"] += 1
 
-        # Persist asynchronously
-        if self.persistence_path:
-            asyncio.create_task(self._async_save_tasks())
         return True
 
     def _check_consensus(self, task: DeliberationTask) -> bool:
@@ -411,6 +781,9 @@ class DeliberationQueue:
             task.human_decision = decision
             task.human_reasoning = reasoning
             task.status = decision
+            if task.is_complete:
+                self._cancel_timeout(item_id)
+            self._log_status(item_id, decision)
 
         # Update stats with global lock (minimal critical section)
         async with self._lock:
@@ -419,29 +792,32 @@ class DeliberationQueue:
             else:
                 self.stats["rejected"] += 1
 
-        # Persist asynchronously
-        if self.persistence_path:
-            asyncio.create_task(self._async_save_tasks())
         return True
 
     def _save_tasks(self) -> None:
-        """Save current tasks to persistent storage."""
+        """Snapshot current tasks to persistent storage and reset the write-ahead log."""
         if not self.persistence_path:
             return
         try:
-            storage = {
-                tid: {
-                    "message": t.message.to_dict_raw() if t.message else {},
-                    "status": get_enum_value(t.status),
-                    "metadata": t.metadata,
-                    "created_at": t.created_at.isoformat(),
-                }
-                for tid, t in self.tasks.items()
-            }
-            with open(self.persistence_path, "w") as f:
+            if self._wal.rotate():
+                self._wal.finish_rotation(self._write_snapshot(list(self.tasks.items())))
+        except OSError as e:
+            logger.error(f"Failed to persist deliberation tasks: {e}")
+
+    def _write_snapshot(self, items: List[Tuple[str, DeliberationTask]]) -> bool:
+        """Atomically replace the snapshot file with the given tasks."""
+        tmp_path = f"{self.persistence_path}.tmp"
+        try:
+            storage = {tid: self._task_entry(t) for tid, t in items}
+            with open(tmp_path, "w") as f:
                 json.dump(storage, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.persistence_path)
+            return True
         except Exception as e:
             logger.error(f"Failed to persist deliberation tasks: {e}")
+            return False
 
     async def resolve_task(self, task_id: str, approved: bool) -> None:
         """Resolve a task and return approval status."""
@@ -527,6 +903,8 @@ def cleanup_all_deliberation_queues() -> None:
                 if not task.done():
                     task.cancel()
             queue.processing_tasks.clear()
+            if queue._wal is not None:
+                queue._wal.close()
     _all_queue_instances.clear()
 
 
@@ -537,6 +915,8 @@ __all__ = [
     "DeliberationItem",
     "AgentVote",
     "DeliberationQueue",
+    "TimerWheel",
+    "WriteAheadLog",
     "get_deliberation_queue",
     "reset_deliberation_queue",
     "cleanup_all_deliberation_queues",
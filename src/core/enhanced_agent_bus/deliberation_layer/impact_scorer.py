@@ -10,11 +10,19 @@ The fallback cascade ensures the service remains operational even when
 ML dependencies are unavailable.
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 try:
     from core.shared.types import JSONDict, JSONValue
@@ -48,7 +56,6 @@ except ImportError:
 TRANSFORMERS_AVAILABLE = False
 try:
     import torch
-    from sklearn.metrics.pairwise import cosine_similarity
     from transformers import AutoModel, AutoTokenizer
 
     TRANSFORMERS_AVAILABLE = True
@@ -93,6 +100,302 @@ class ImpactAnalysis:
     requires_deliberation: bool
 
 
+class InferenceBatcher:
+    """
+    Dynamic micro-batching scheduler for embedding inference.
+
+    Concurrent ``submit()`` calls are gathered into one batch that is
+    dispatched when it reaches ``max_batch_size`` or when its oldest request
+    has waited ``max_wait_ms``. Batches run on a dedicated thread pool so the
+    event loop never blocks on a forward pass; while all workers are busy,
+    new requests keep accumulating into the next batch.
+
+    With ``group_key`` a batch is split by key (e.g. padded length) and the
+    groups run smallest key first, each resolving its callers as soon as it
+    finishes, so short texts do not wait behind long ones. ``split`` replaces
+    that per-text key when grouping needs the whole batch at once (e.g. one
+    tokenizer call): it returns ``(indices, group)`` pairs in run order, and
+    ``infer`` then receives each ``group`` instead of a list of texts.
+
+    Args:
+        infer: Maps a list of texts (or a ``split`` group) to an embedding
+            matrix with one row per text
+        max_batch_size: Largest batch handed to ``infer``
+        max_wait_ms: Longest a request waits for its batch to fill
+        workers: Inference threads (and batches in flight)
+        group_key: Optional sort key splitting a batch into ``infer`` calls
+        split: Optional batch splitter, used instead of ``group_key``
+    """
+
+    def __init__(
+        self,
+        infer: Callable[[Any], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        workers: int = 1,
+        group_key: Optional[Callable[[str], int]] = None,
+        split: Optional[Callable[[List[str]], List[Tuple[List[int], Any]]]] = None,
+    ):
+        if max_batch_size < 1 or max_wait_ms < 0 or workers < 1:
+            raise ValueError("max_batch_size and workers must be >= 1, max_wait_ms >= 0")
+        self.infer = infer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.workers = workers
+        self.group_key = group_key
+        self.split = split
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="impact-scorer")
+        self._pending: Deque[Tuple[str, asyncio.Future, float]] = deque()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight: set = set()
+        self.stats = {"requests": 0, "batches": 0}
+
+    async def submit(self, text: str) -> np.ndarray:
+        """Queue one text for the next batch and return its embedding row."""
+        loop = asyncio.get_running_loop()
+        dispatcher = self._dispatcher
+        if dispatcher is None or dispatcher.done() or dispatcher.get_loop() is not loop:
+            self._pending.clear()
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.workers)
+            self._dispatcher = loop.create_task(self._dispatch())
+        future = loop.create_future()
+        self._pending.append((text, future, time.monotonic()))
+        if len(self._pending) == 1 or len(self._pending) >= self.max_batch_size:
+            self._wakeup.set()
+        return await future
+
+    async def _dispatch(self) -> None:
+        """Form batches from pending requests and hand them to free workers."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await self._slots.acquire()
+            while self._pending and len(self._pending) < self.max_batch_size:
+                remaining = self._pending[0][2] + self.max_wait - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            size = min(len(self._pending), self.max_batch_size)
+            batch = [self._pending.popleft() for _ in range(size)]
+            if not batch:
+                self._slots.release()
+                continue
+            task = loop.create_task(self._run_batch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future, float]]) -> None:
+        """Run one batch on the worker pool; its futures resolve group by group."""
+        self.stats["requests"] += len(batch)
+        self.stats["batches"] += 1
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self.executor, self._infer_batch, loop, batch)
+        finally:
+            self._slots.release()
+
+    def _infer_batch(
+        self, loop: asyncio.AbstractEventLoop, batch: List[Tuple[str, asyncio.Future, float]]
+    ) -> None:
+        """Worker-thread side: run ``infer`` per group and post results back to the loop."""
+        texts = [text for text, _, _ in batch]
+        try:
+            groups = self._split(texts)
+        except Exception as e:
+            loop.call_soon_threadsafe(self._fail, [future for _, future, _ in batch], e)
+            return
+        for indices, group in groups:
+            futures = [batch[i][1] for i in indices]
+            try:
+                embeddings = self.infer(group)
+            except Exception as e:
+                loop.call_soon_threadsafe(self._fail, futures, e)
+            else:
+                loop.call_soon_threadsafe(self._resolve, futures, embeddings)
+
+    def _split(self, texts: List[str]) -> List[Tuple[List[int], Any]]:
+        """``(indices, group)`` pairs for one batch, by ``split`` or ``group_key``."""
+        if self.split is not None:
+            return self.split(texts)
+        groups: Dict[int, List[int]] = {}
+        try:
+            for i, text in enumerate(texts):
+                key = self.group_key(text) if self.group_key else 0
+                groups.setdefault(key, []).append(i)
+        except Exception:
+            groups = {0: list(range(len(texts)))}
+        return [(indices, [texts[i] for i in indices]) for _, indices in sorted(groups.items())]
+
+    @staticmethod
+    def _resolve(futures: List[asyncio.Future], embeddings: np.ndarray) -> None:
+        for row, future in enumerate(futures):
+            if not future.done():
+                future.set_result(embeddings[row : row + 1])
+
+    @staticmethod
+    def _fail(futures: List[asyncio.Future], error: Exception) -> None:
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def close(self) -> None:
+        """Stop the dispatcher and release the worker threads."""
+        if self._dispatcher is not None and not self._dispatcher.done():
+            self._dispatcher.cancel()
+        self._dispatcher = None
+        self.executor.shutdown(wait=False)
+
+
+class EmbeddingStore:
+    """
+    Fixed-size embedding table in a memory-mapped file shared across processes.
+
+    The file holds ``slots`` records of (key, crc32, vector) in 4-way sets
+    indexed by key. Every process mapping the same file sees the others'
+    writes through the page cache, and a restarted worker starts warm from
+    what is already on disk. Writers clear the key, write the vector and
+    checksum, then publish the key; readers accept a record only if key and
+    checksum match, so a concurrent or torn write reads as a miss.
+
+    Args:
+        path: Backing file, created on first use
+        dim: Embedding width
+        slots: Total records (rounded down to a multiple of 4)
+    """
+
+    MAGIC = b"ACGSEMB1"
+    WAYS = 4
+
+    def __init__(self, path: str, dim: int = 768, slots: int = 65_536):
+        self.path = path
+        self.dim = dim
+        self.sets = max(1, slots // self.WAYS)
+        self._dtype = np.dtype([("key", "<u8"), ("crc", "<u4"), ("vec", "<f4", (dim,))])
+        header = np.dtype([("magic", "S8"), ("dim", "<u4"), ("sets", "<u4")])
+        size = header.itemsize + self.sets * self.WAYS * self._dtype.itemsize
+        with open(path, "a+b") as f:
+            if os.fstat(f.fileno()).st_size < size:
+                f.truncate(size)
+        meta = np.memmap(path, dtype=header, mode="r+", shape=(1,))
+        if meta[0]["magic"] == b"":
+            meta[0] = (self.MAGIC, dim, self.sets)
+            meta.flush()
+        elif (meta[0]["magic"], meta[0]["dim"], meta[0]["sets"]) != (self.MAGIC, dim, self.sets):
+            raise ValueError(f"{path} holds an embedding store with a different layout")
+        self._table = np.memmap(
+            path,
+            dtype=self._dtype,
+            mode="r+",
+            offset=header.itemsize,
+            shape=(self.sets, self.WAYS),
+        )
+
+    def get(self, key: int) -> Optional[np.ndarray]:
+        """Return a copy of the vector stored under ``key``, if intact."""
+        ways = self._table[key % self.sets]
+        for way in np.flatnonzero(ways["key"] == key):
+            vec = np.array(ways[way]["vec"])
+            if zlib.crc32(vec.tobytes()) == ways[way]["crc"] and ways[way]["key"] == key:
+                return vec
+        return None
+
+    def put(self, key: int, vec: np.ndarray) -> None:
+        """Store ``vec`` under ``key``, replacing a same-key, empty or pseudo-random way."""
+        vec = np.asarray(vec, dtype=np.float32).reshape(-1)
+        if vec.shape[0] != self.dim:
+            return
+        ways = self._table[key % self.sets]
+        keys = ways["key"]
+        matches = np.flatnonzero((keys == key) | (keys == 0))
+        way = int(matches[0]) if matches.size else (key >> 32) % self.WAYS
+        record = ways[way]
+        record["key"] = 0
+        record["vec"] = vec
+        record["crc"] = zlib.crc32(vec.tobytes())
+        record["key"] = key
+
+    def flush(self) -> None:
+        self._table.flush()
+
+
+class EmbeddingCache:
+    """
+    Bounded cache of text embeddings keyed by a hash of the normalized text.
+
+    An in-process LRU sits in front of an optional shared EmbeddingStore.
+    Normalization lower-cases and collapses whitespace, which does not change
+    what the uncased tokenizer sees. Thread-safe: the inference worker
+    threads fill it while the event loop reads it.
+
+    Args:
+        maxsize: In-process LRU capacity
+        store: Optional memory-mapped store shared with other processes
+    """
+
+    def __init__(self, maxsize: int = 10_000, store: Optional[EmbeddingStore] = None):
+        self.maxsize = maxsize
+        self.store = store
+        self._entries: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str) -> int:
+        """64-bit non-zero key of the normalized text."""
+        digest = hashlib.blake2b(" ".join(text.lower().split()).encode(), digest_size=8)
+        return int.from_bytes(digest.digest(), "little") or 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: int) -> Optional[np.ndarray]:
+        """Return the cached 1-D embedding stored under ``key``, or None."""
+        with self._lock:
+            vec = self._entries.get(key)
+            if vec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return vec
+        vec = self.store.get(key) if self.store is not None else None
+        with self._lock:
+            if vec is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._insert(key, vec)
+        return vec
+
+    def put(self, key: int, vec: np.ndarray) -> None:
+        """Cache an embedding locally and in the shared store."""
+        vec = np.asarray(vec).reshape(-1)
+        with self._lock:
+            self._insert(key, vec)
+        if self.store is not None:
+            self.store.put(key, vec)
+
+    def _insert(self, key: int, vec: np.ndarray) -> None:
+        self._entries[key] = vec
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the in-process entries; the shared store is left intact."""
+        with self._lock:
+            self._entries.clear()
+
+
 class ImpactScorer:
     """
     ImpactScorer v3.1.0 - ML-Powered Governance Impact Assessment
@@ -119,6 +422,11 @@ class ImpactScorer:
         use_onnx: bool = True,
         tokenization_cache_size: int = 1000,
         onnx_model_path: Optional[str] = None,
+        batch_max_size: int = 32,
+        batch_max_wait_ms: float = 2.0,
+        inference_workers: int = 1,
+        embedding_cache_size: int = 10_000,
+        embedding_cache_path: Optional[str] = None,
     ):
         self.config = config or ScoringConfig()
         self.model_name = model_name
@@ -126,6 +434,9 @@ class ImpactScorer:
         self._onnx_enabled = use_onnx if ONNX_AVAILABLE else False
         self._bert_enabled = False
         self.session = None
+        # Lazy loading honours the availability seen here, so a scorer built
+        # for keyword-only scoring never loads a model on its first message
+        self._transformers_available = TRANSFORMERS_AVAILABLE
 
         if TRANSFORMERS_AVAILABLE:
             try:
@@ -203,6 +514,31 @@ class ImpactScorer:
         self._agent_history: Dict[str, List[float]] = {}
         self._keyword_embeddings: Optional[np.ndarray] = None
         self._model_loaded: bool = False
+        # Async scoring shares forward passes through a micro-batching scheduler
+        self.batch_max_size = batch_max_size
+        self.batch_max_wait_ms = batch_max_wait_ms
+        self.inference_workers = inference_workers
+        self._batcher: Optional[InferenceBatcher] = None
+        # Embeddings are cached by normalized-text hash; the optional mmap store
+        # is shared by every worker process pointed at the same file
+        self._embedding_cache = self._create_embedding_cache(
+            embedding_cache_size,
+            embedding_cache_path or os.getenv("IMPACT_SCORER_EMBEDDING_CACHE"),
+        )
+        self._keyword_unit: Optional[np.ndarray] = None
+        self._keyword_unit_source: Optional[np.ndarray] = None
+
+    @staticmethod
+    def _create_embedding_cache(size: int, path: Optional[str]) -> Optional[EmbeddingCache]:
+        if size <= 0:
+            return None
+        store = None
+        if path:
+            try:
+                store = EmbeddingStore(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Shared embedding cache unavailable at {path}: {e}")
+        return EmbeddingCache(size, store=store)
 
     def _ensure_model_loaded(self) -> bool:
         """
@@ -225,7 +561,7 @@ class ImpactScorer:
                 return True
 
         # Fall back to PyTorch Transformers
-        if USE_TRANSFORMERS and TRANSFORMERS_AVAILABLE:
+        if USE_TRANSFORMERS and self._transformers_available:
             if self._load_transformer_model():
                 return True
 
@@ -483,14 +819,7 @@ class ImpactScorer:
             return 0.0
 
         # Keyword-based scoring (always computed as baseline)
-        hits = sum(1 for k in self.high_impact_keywords if k in text)
-        keyword_score = 0.1
-        if hits >= 5:
-            keyword_score = 1.0
-        elif hits >= 3:
-            keyword_score = 0.8
-        elif hits > 0:
-            keyword_score = 0.5
+        keyword_score = self._keyword_score(text)
 
         # Embedding-based scoring (if ML available)
         embedding_score = 0.0
@@ -498,44 +827,80 @@ class ImpactScorer:
             try:
                 emb = self._get_embeddings(text)
                 kw_emb = self._get_keyword_embeddings()
+                embedding_score = self._embedding_score(emb, kw_emb, keyword_score)
+            except Exception as e:
+                logger.error(f"Semantic scoring failure: {e}")
 
-                # Skip if embeddings are zeros (fallback mode)
-                if np.any(emb) and np.any(kw_emb):
-                    if TRANSFORMERS_AVAILABLE:
-                        from sklearn.metrics.pairwise import cosine_similarity
+        return max(keyword_score, embedding_score)
 
-                        sim = cosine_similarity(
-                            emb.reshape(1, -1) if emb.ndim == 1 else emb, kw_emb
-                        )
-                        raw_embedding_score = float(np.max(sim))
-                    else:
-                        # Manual cosine similarity fallback
-                        emb_flat = emb.flatten()
-                        sims = [cosine_similarity_fallback(emb_flat, kw) for kw in kw_emb]
-                        raw_embedding_score = max(sims) if sims else 0.0
-
-                    # Apply confidence threshold - BERT embeddings can show high similarity
-                    # even for unrelated text. Use stricter threshold when keywords don't match.
-                    # If NO keywords matched (score < 0.3), require very high ML confidence (0.95+)
-                    # to override, as this likely indicates a false positive.
-                    if keyword_score < 0.3:
-                        # No or very few keywords - require very high confidence
-                        embedding_confidence_threshold = 0.95
-                    else:
-                        # Some keywords matched - moderate confidence is OK
-                        embedding_confidence_threshold = 0.85
+    async def _calculate_semantic_score_async(
+        self, message: Union[AgentMessage, JSONDict]
+    ) -> float:
+        """
+        Async semantic scoring; the embedding comes from the shared InferenceBatcher.
 
-                    if raw_embedding_score >= embedding_confidence_threshold:
-                        embedding_score = raw_embedding_score
-                    else:
-                        # For moderate similarity, scale down to avoid false positives
-                        embedding_score = raw_embedding_score * 0.3
+        Concurrent callers are folded into one forward pass, and model loading
+        and inference run on the batcher's worker threads instead of the event loop.
+        """
+        text = self._extract_text_content(message).strip().lower()
+        if not text:
+            return 0.0
 
+        keyword_score = self._keyword_score(text)
+        embedding_score = 0.0
+        loop = asyncio.get_running_loop()
+        batcher = self._get_batcher()
+        if not self._model_loaded:
+            await loop.run_in_executor(batcher.executor, self._ensure_model_loaded)
+        if self._ensure_model_loaded() and (self._bert_enabled or self._onnx_enabled):
+            try:
+                if self._keyword_embeddings is None:
+                    await loop.run_in_executor(batcher.executor, self._get_keyword_embeddings)
+                emb = self._cached_embedding(text)
+                if emb is None:
+                    emb = await batcher.submit(text)
+                embedding_score = self._embedding_score(
+                    emb, self._keyword_embeddings, keyword_score
+                )
             except Exception as e:
                 logger.error(f"Semantic scoring failure: {e}")
 
         return max(keyword_score, embedding_score)
 
+    def _keyword_score(self, text: str) -> float:
+        """Keyword-hit score for lower-cased message text."""
+        hits = sum(1 for k in self.high_impact_keywords if k in text)
+        if hits >= 5:
+            return 1.0
+        if hits >= 3:
+            return 0.8
+        if hits > 0:
+            return 0.5
+        return 0.1
+
+    def _embedding_score(self, emb: np.ndarray, kw_emb: np.ndarray, keyword_score: float) -> float:
+        """Confidence-gated similarity of a message embedding to the keyword embeddings."""
+        # Skip if embeddings are zeros (fallback mode)
+        if not (np.any(emb) and np.any(kw_emb)):
+            return 0.0
+        raw_embedding_score = float(np.max(self._max_keyword_similarity(emb, kw_emb)))
+
+        # Apply confidence threshold - BERT embeddings can show high similarity
+        # even for unrelated text. Use stricter threshold when keywords don't match.
+        # If NO keywords matched (score < 0.3), require very high ML confidence (0.95+)
+        # to override, as this likely indicates a false positive.
+        if keyword_score < 0.3:
+            # No or very few keywords - require very high confidence
+            embedding_confidence_threshold = 0.95
+        else:
+            # Some keywords matched - moderate confidence is OK
+            embedding_confidence_threshold = 0.85
+
+        if raw_embedding_score >= embedding_confidence_threshold:
+            return raw_embedding_score
+        # For moderate similarity, scale down to avoid false positives
+        return raw_embedding_score * 0.3
+
     async def calculate_impact_score_async(
         self, message: Union[AgentMessage, JSONDict], context: JSONDict = None
     ) -> float:
@@ -554,7 +919,7 @@ class ImpactScorer:
         if context and "semantic_override" in context:
             semantic = context["semantic_override"]
         else:
-            semantic = self._calculate_semantic_score(message)
+            semantic = await self._calculate_semantic_score_async(message)
 
         scores = {
             "semantic": semantic,
@@ -646,49 +1011,16 @@ class ImpactScorer:
             return [self.calculate_impact_score(m) for m in messages]
 
         try:
-            # Batch tokenization
-            inputs = self.tokenizer(
-                texts,
-                return_tensors="np" if self._onnx_enabled else "pt",
-                padding=True,
-                truncation=True,
-                max_length=512,
-            )
-
-            if self._onnx_enabled and self.session:
-                onnx_inputs = {k: v for k, v in inputs.items()}
-                outputs = self.session.run(None, onnx_inputs)
-                embeddings = outputs[0][:, 0, :]
-            else:
-                import torch
-
-                with torch.no_grad():
-                    outputs = self.model(**inputs)
-                    embeddings = outputs.last_hidden_state[:, 0, :].cpu().numpy()
-
-            # For each message, calculate its semantic score using the embedding
-            kw_emb = self._get_keyword_embeddings()
-
-            results = []
-            for i, message in enumerate(messages):
-                emb = embeddings[i : i + 1]
+            # Batch tokenization and inference with length-bucketed padding
+            embeddings = self._embed_batch(texts)
 
-                # Semantic score calculation (max similarity to keywords)
-                if TRANSFORMERS_AVAILABLE:
-                    from sklearn.metrics.pairwise import cosine_similarity
+            # Max similarity to the keywords for the whole batch in one matrix product
+            embedding_scores = self._max_keyword_similarity(embeddings)
 
-                    sim = cosine_similarity(emb, kw_emb)
-                    embedding_score = float(np.max(sim))
-                else:
-                    sims = [cosine_similarity_fallback(emb, kw) for kw in kw_emb]
-                    embedding_score = max(sims) if sims else 0.0
-
-                # Keyword-based scoring (already in calculate_impact_score, but we want to avoid re-embedding)
-                # We'll just call calculate_impact_score but override the semantic part
-                # Actually, better to refactor calculate_impact_score to accept an optional semantic score
-                results.append(self._calculate_impact_with_semantic(message, embedding_score))
-
-            return results
+            return [
+                self._calculate_impact_with_semantic(message, float(score))
+                for message, score in zip(messages, embedding_scores, strict=True)
+            ]
         except Exception as e:
             logger.error(f"Batch scoring failed: {e}")
             return [self.calculate_impact_score(m) for m in messages]
@@ -780,8 +1112,8 @@ class ImpactScorer:
         """
         Batch scoring using BERT embeddings.
 
-        Performs batch tokenization with caching and inference for optimal throughput.
-        Uses _tokenize_batch for cached tokenization when texts repeat across batches.
+        Performs batch tokenization and inference for optimal throughput.
+        Uses _embed_batch so each length bucket is padded only to its own longest text.
         """
         try:
             # Filter out empty texts and track their indices
@@ -792,24 +1124,11 @@ class ImpactScorer:
                 # All texts are empty - return low scores
                 return [0.0] * len(messages)
 
-            # Batch tokenization with caching (uses _tokenize_batch helper)
-            batch_inputs = self._tokenize_batch(non_empty_texts, use_cache=True)
-            if batch_inputs is None:
-                # Tokenization failed, fall back to sequential
-                return self._batch_score_sequential(messages, contexts)
-
-            # Batch inference
-            with torch.no_grad():
-                outputs = self.model(**batch_inputs)
-                # Extract [CLS] token embeddings for each text
-                batch_embeddings = outputs.last_hidden_state[:, 0, :].numpy()
-
-            # Get keyword embeddings for similarity computation
-            keyword_embs = self._get_keyword_embeddings()
+            # Batch tokenization and inference with length-bucketed padding
+            batch_embeddings = self._embed_batch(non_empty_texts)
 
             # Compute batch similarities using vectorized operations
-            similarities = cosine_similarity(batch_embeddings, keyword_embs)
-            max_similarities = np.max(similarities, axis=1)
+            max_similarities = self._max_keyword_similarity(batch_embeddings)
 
             # Build result array with semantic scores
             semantic_scores = np.zeros(len(messages))
@@ -918,31 +1237,177 @@ class ImpactScorer:
             return np.zeros((1, 768))
 
         try:
-            inputs = self.tokenizer(
-                text,
-                return_tensors="np" if self._onnx_enabled else "pt",
-                padding=True,
-                truncation=True,
-                max_length=512,
-            )
-
-            if self._onnx_enabled and self.session:
-                # Prepare inputs for ONNX
-                onnx_inputs = {k: v for k, v in inputs.items()}
-                outputs = self.session.run(None, onnx_inputs)
-                # DistilBERT output is [last_hidden_state]
-                return outputs[0][:, 0, :]  # CLS token
-            else:
-                # Standard PyTorch BERT
-                import torch
-
-                with torch.no_grad():
-                    outputs = self.model(**inputs)
-                    return outputs.last_hidden_state[:, 0, :].cpu().numpy()
+            return self._embed_batch([text])
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             return np.zeros((1, 768))
 
+    @staticmethod
+    def _length_bucket(length: int) -> int:
+        """
+        Length bucket of a tokenized text.
+
+        Texts up to 32 tokens share one bucket: their forward pass is bound by
+        reading the weights, so batching them matters more than padding. Above
+        that, where cost grows with sequence length, there are four buckets per
+        power of two so padding stays under 25%.
+        """
+        if length <= 32:
+            return 32
+        step = (1 << ((length - 1).bit_length() - 1)) // 4
+        return -(-length // step) * step
+
+    def _cached_embedding(self, text: str) -> Optional[np.ndarray]:
+        """Cached (1, dim) embedding of ``text``, or None."""
+        if self._embedding_cache is None:
+            return None
+        vec = self._embedding_cache.get(EmbeddingCache.key(text))
+        return None if vec is None else vec.reshape(1, -1)
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        [CLS] embeddings for a batch of texts, served from the embedding cache.
+
+        Only texts missing from the cache reach the model, each distinct
+        normalized text once.
+        """
+        cache = self._embedding_cache
+        if cache is None or not texts:
+            return self._embed_uncached(texts)
+        keys = [EmbeddingCache.key(t) for t in texts]
+        rows: List[Optional[np.ndarray]] = [cache.get(k) for k in keys]
+        missing = [i for i, row in enumerate(rows) if row is None]
+        if missing:
+            computed = self._embed_uncached([texts[i] for i in missing])
+            for row, i in enumerate(missing):
+                rows[i] = computed[row]
+        return np.vstack(rows)
+
+    def _embed_uncached(self, texts: List[str]) -> np.ndarray:
+        """Run the model once per distinct normalized text and cache the results."""
+        embeddings: Optional[np.ndarray] = None
+        for indices, group in self._split_batch(texts):
+            rows = self._embed_group(group)
+            if embeddings is None:
+                embeddings = np.empty((len(texts), rows.shape[-1]), dtype=rows.dtype)
+            embeddings[indices] = rows
+        return embeddings if embeddings is not None else np.zeros((0, 768))
+
+    def _split_batch(self, texts: List[str]) -> List[Tuple[List[int], Tuple[Any, ...]]]:
+        """
+        Tokenize a batch once and split it into length-bucket groups.
+
+        Each distinct normalized text is tokenized and embedded once. Groups
+        come shortest bucket first as ``(indices, (encoded, rows, keys))``:
+        ``rows`` index the distinct texts in ``encoded`` and ``keys`` holds the
+        cache key of every text at ``indices``. This is the ``split`` hook of
+        the scorer's InferenceBatcher, with ``_embed_group`` as its ``infer``.
+        """
+        keys = [EmbeddingCache.key(t) for t in texts]
+        distinct = dict(zip(keys, texts, strict=True))
+        encoded = self._tokenize(list(distinct.values()))
+        if encoded is None:
+            return [(list(range(len(texts))), (None, [], keys))]
+        row_of = {key: row for row, key in enumerate(distinct)}
+        groups = []
+        for rows in self._length_groups(encoded):
+            members = set(rows)
+            indices = [i for i, key in enumerate(keys) if row_of[key] in members]
+            groups.append((indices, (encoded, rows, [keys[i] for i in indices])))
+        return groups
+
+    def _embed_group(self, group: Tuple[Any, ...]) -> np.ndarray:
+        """Embed one ``_split_batch`` group; returns a row per key, caching new vectors."""
+        encoded, rows, keys = group
+        if encoded is None:
+            return np.zeros((len(keys), 768))
+        computed = self._forward_group(encoded, rows)
+        # ``rows`` follow the first appearance of each distinct key in ``keys``
+        distinct = list(dict.fromkeys(keys))
+        if self._embedding_cache is not None:
+            for key, vec in zip(distinct, computed, strict=True):
+                self._embedding_cache.put(key, vec)
+        if len(distinct) == len(keys):
+            return computed
+        row = {key: i for i, key in enumerate(distinct)}
+        return computed[[row[k] for k in keys]]
+
+    def _tokenize(self, texts: List[str]) -> Optional[Any]:
+        """
+        Unpadded, truncated encodings of ``texts``, or None if unusable.
+
+        A tokenizer that returns nothing, or no ``input_ids`` list with one
+        sequence per text, leaves the texts without embeddings (zero rows)
+        instead of failing the whole batch.
+        """
+        encoded = self.tokenizer(texts, truncation=True, max_length=512)
+        ids = encoded.get("input_ids") if isinstance(encoded, Mapping) else None
+        if not isinstance(ids, (list, tuple)) or len(ids) != len(texts):
+            logger.debug("Tokenizer returned no usable input_ids; using zero embeddings")
+            return None
+        return encoded
+
+    def _length_groups(self, encoded: Any) -> List[List[int]]:
+        """Indices of the encoded texts grouped by ``_length_bucket``, shortest first."""
+        buckets: Dict[int, List[int]] = {}
+        for i, ids in enumerate(encoded["input_ids"]):
+            buckets.setdefault(self._length_bucket(len(ids)), []).append(i)
+        return [buckets[bucket] for bucket in sorted(buckets)]
+
+    def _forward_group(self, encoded: Any, indices: List[int]) -> np.ndarray:
+        """
+        [CLS] embeddings of the encoded texts at ``indices``, in one forward pass.
+
+        The group is padded only to its own longest sequence, so short
+        messages are never padded to 512 tokens or to a long neighbour.
+        """
+        pad_id = getattr(self.tokenizer, "pad_token_id", None) or 0
+        width = max(len(encoded["input_ids"][i]) for i in indices)
+        inputs = {}
+        for key in encoded.keys():
+            padded = np.full(
+                (len(indices), width), pad_id if key == "input_ids" else 0, dtype=np.int64
+            )
+            for row, i in enumerate(indices):
+                values = encoded[key][i]
+                padded[row, : len(values)] = values
+            inputs[key] = padded
+        return self._forward(inputs)
+
+    def _forward(self, inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        """Run one padded batch through ONNX Runtime or PyTorch; returns [CLS] rows."""
+        session = self.session or getattr(self, "onnx_session", None)
+        if self._onnx_enabled and session is not None:
+            input_names = [i.name for i in session.get_inputs()]
+            outputs = session.run(None, {n: inputs[n] for n in input_names if n in inputs})
+            return outputs[0][:, 0, :] if outputs[0].ndim == 3 else outputs[0]
+
+        import torch
+
+        with torch.no_grad():
+            outputs = self.model(**{k: torch.from_numpy(v) for k, v in inputs.items()})
+            return outputs.last_hidden_state[:, 0, :].cpu().numpy()
+
+    def _get_batcher(self) -> InferenceBatcher:
+        """Micro-batching scheduler shared by concurrent async scoring calls."""
+        if self._batcher is None:
+            self._batcher = InferenceBatcher(
+                self._embed_group,
+                max_batch_size=self.batch_max_size,
+                max_wait_ms=self.batch_max_wait_ms,
+                workers=self.inference_workers,
+                split=self._split_batch,
+            )
+        return self._batcher
+
+    def close(self) -> None:
+        """Release the inference worker threads and flush the shared embedding store."""
+        if self._batcher is not None:
+            self._batcher.close()
+            self._batcher = None
+        if self._embedding_cache is not None and self._embedding_cache.store is not None:
+            self._embedding_cache.store.flush()
+
     def _onnx_inference(self, text: str) -> np.ndarray:
         """Run inference using ONNX Runtime."""
         if self.tokenizer is None or self.onnx_session is None:
@@ -950,7 +1415,7 @@ class ImpactScorer:
 
         # Tokenize input
         inputs = self.tokenizer(
-            text, max_length=512, truncation=True, padding="max_length", return_tensors="np"
+            text, max_length=512, truncation=True, padding=True, return_tensors="np"
         )
 
         # Run ONNX inference
@@ -977,7 +1442,7 @@ class ImpactScorer:
 
         # Tokenize input
         inputs = self.tokenizer(
-            text, max_length=512, truncation=True, padding="max_length", return_tensors="pt"
+            text, max_length=512, truncation=True, padding=True, return_tensors="pt"
         )
 
         # Run inference without gradient computation
@@ -988,6 +1453,26 @@ class ImpactScorer:
 
         return embeddings
 
+    def _max_keyword_similarity(
+        self, embeddings: np.ndarray, kw_emb: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Max cosine similarity of each embedding row to the keyword embeddings.
+
+        One product of row-normalized matrices for the whole batch; the
+        normalized keyword matrix is kept until the keyword embeddings change.
+        Zero vectors score 0.0, as in cosine_similarity_fallback.
+        """
+        if kw_emb is None:
+            kw_emb = self._get_keyword_embeddings()
+        if self._keyword_unit_source is not kw_emb:
+            self._keyword_unit = _unit_rows(kw_emb)
+            self._keyword_unit_source = kw_emb
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(-1, kw_emb.shape[-1])
+        if not (len(embeddings) and len(kw_emb)):
+            return np.zeros(len(embeddings))
+        return np.max(_unit_rows(embeddings) @ self._keyword_unit.T, axis=1)
+
     def _get_keyword_embeddings(self) -> np.ndarray:
         if self._keyword_embeddings is None:
             if not self._bert_enabled:
@@ -1015,32 +1500,13 @@ class ImpactScorer:
         self._ensure_model_loaded()
 
         # Use batch tokenization if Transformers available
-        if self._bert_enabled and self.tokenizer is not None and self.model is not None:
+        if self._bert_enabled and getattr(self, "tokenizer", None) is not None:
             try:
-                import torch
-
-                # Batch tokenization
-                inputs = self.tokenizer(
-                    texts,
-                    max_length=512,
-                    truncation=True,
-                    padding="max_length",
-                    return_tensors="pt",
-                )
-
-                # Batch inference
-                with torch.no_grad():
-                    outputs = self.model(**inputs)
-                    embeddings = outputs.last_hidden_state[:, 0, :].numpy()
-
-                # Compute similarities against keyword embeddings
-                kw_emb = self._get_keyword_embeddings()
-                from sklearn.metrics.pairwise import cosine_similarity
+                # Batch tokenization and inference with length-bucketed padding
+                embeddings = self._embed_batch(texts)
 
-                sims = cosine_similarity(embeddings, kw_emb)
-
-                # Return max similarity as score
-                return [float(np.max(sim)) for sim in sims]
+                # Return max similarity against keyword embeddings as score
+                return self._max_keyword_similarity(embeddings).tolist()
 
             except Exception as e:
                 logger.warning(f"Batch inference failed: {e}")
@@ -1049,6 +1515,14 @@ class ImpactScorer:
         return [self._calculate_semantic_score({"content": text}) for text in texts]
 
 
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    """Rows scaled to unit L2 norm; all-zero rows stay zero."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
 def cosine_similarity_fallback(a: Any, b: Any) -> float:
     try:
         a = np.array(a).flatten()
@@ -1086,6 +1560,8 @@ def get_vector_space_metrics():
 def reset_impact_scorer():
     """Reset global scorer and clear model caches."""
     global _global_scorer
+    if _global_scorer is not None:
+        _global_scorer.close()
     _global_scorer = None
     # Also reset class-level tokenizer/model cache
     ImpactScorer.reset_class_cache()
@@ -6,11 +6,22 @@ Categorizes user intent for dynamic routing and prompt compilation.
 Implements hybrid classification with LLM fallback for ambiguous cases.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
 
 from core.enhanced_agent_bus.config import BusConfiguration
 from core.shared.types import JSONDict, JSONValue
@@ -103,6 +114,76 @@ except ImportError:
     Cache = MockLiteLLMCache  # type: ignore[assignment, misc]
 
 
+class KeywordMatcher:
+    """
+    Multi-intent keyword matcher compiled once from all keyword lists.
+
+    ``count`` lower-cases the content once and returns for every intent how
+    many of its keywords occur (each keyword at most once, as with
+    ``keyword in content``). Results are memoized in a bounded LRU keyed by
+    a 128-bit digest of the content, so the cache never holds message bodies.
+
+    With at least ``automaton_min_keywords`` distinct keywords, all intents
+    are matched in a single Aho-Corasick pass. Below that, or without
+    pyahocorasick, each distinct keyword is one substring search, which is
+    faster than an automaton walk for a couple of dozen keywords.
+    """
+
+    def __init__(
+        self,
+        keywords: Dict["IntentType", Sequence[str]],
+        cache_size: int = 1024,
+        automaton_min_keywords: int = 24,
+    ):
+        self.intents: List[IntentType] = list(keywords)
+        owners: Dict[str, List[int]] = {}
+        for index, intent in enumerate(self.intents):
+            for keyword in keywords[intent]:
+                owners.setdefault(keyword.lower(), []).append(index)
+        self._keywords: List[Tuple[str, Tuple[int, ...]]] = [
+            (keyword, tuple(indices)) for keyword, indices in owners.items() if keyword
+        ]
+        self._automaton = None
+        if len(self._keywords) >= max(1, automaton_min_keywords) and AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword_id, (keyword, _) in enumerate(self._keywords):
+                self._automaton.add_word(keyword, keyword_id)
+            self._automaton.make_automaton()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, Tuple[int, ...]]" = OrderedDict()
+
+    def count(self, content: str) -> Tuple[int, ...]:
+        """Per-intent match counts for ``content``, in ``self.intents`` order."""
+        key = hashlib.blake2b(content.encode(errors="surrogatepass"), digest_size=16).digest()
+        counts = self._cache.get(key)
+        if counts is not None:
+            self._cache.move_to_end(key)
+            return counts
+        counts = self._count(content)
+        if self.cache_size > 0:
+            self._cache[key] = counts
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return counts
+
+    def _count(self, content: str) -> Tuple[int, ...]:
+        """Uncached per-intent match counts."""
+        content_lower = content.lower()
+        if self._automaton is not None:
+            found = {keyword_id for _, keyword_id in self._automaton.iter(content_lower)}
+        else:
+            found = {
+                keyword_id
+                for keyword_id, (keyword, _) in enumerate(self._keywords)
+                if keyword in content_lower
+            }
+        counts = [0] * len(self.intents)
+        for keyword_id in found:
+            for index in self._keywords[keyword_id][1]:
+                counts[index] += 1
+        return tuple(counts)
+
+
 class IntentClassifier:
     """Classifies user intent to determine optimal processing strategies."""
 
@@ -149,48 +230,28 @@ class IntentClassifier:
             self.config.llm_confidence_threshold = llm_confidence_threshold
 
         # For Phase 1, we use dynamic heuristic pattern matching with an LLM fallback hook.
+        # Keyword lists are listed in tie-break priority order.
+        self._matcher = KeywordMatcher(
+            {
+                IntentType.REASONING: self.REASONING_KEYWORDS,
+                IntentType.FACTUAL: self.FACTUAL_KEYWORDS,
+                IntentType.CREATIVE: self.CREATIVE_KEYWORDS,
+            }
+        )
         logger.info(f"IntentClassifier initialized with model: {model_name}")
         self._llm_client_initialized = False  # Used by tests
 
     def classify(self, content: str) -> IntentType:
         """Determines the intent type of the provided content."""
-        content_lower = content.lower()
-
-        # Heuristic Pattern Matching (Fast Path)
-        if any(
-            word in content_lower
-            for word in ["calculate", "prove", "reason", "step by step", "analyze"]
-        ):
-            return IntentType.REASONING
-
-        if any(
-            word in content_lower
-            for word in [
-                "tell me about",
-                "who is",
-                "what is",
-                "where is",
-                "what happened in",
-                "date of",
-                "historical",
-                "how many",
-            ]
-        ):
-            return IntentType.FACTUAL
-
-        if any(
-            word in content_lower
-            for word in ["write a story", "poem", "joke", "creative", "imagine", "song"]
-        ):
-            return IntentType.CREATIVE
+        # Heuristic Pattern Matching (Fast Path): first intent in priority order with a match
+        counts = self._matcher.count(content)
+        for intent_type, count in zip(self._matcher.intents, counts, strict=True):
+            if count:
+                return intent_type
 
         # Default to general intent
         return IntentType.GENERAL
 
-    def _count_keyword_matches(self, content_lower: str, keywords: List[str]) -> int:
-        """Count how many keywords from the list appear in the content."""
-        return sum(1 for keyword in keywords if keyword in content_lower)
-
     def _calculate_confidence(self, match_count: int, is_default: bool = False) -> float:
         """Calculate confidence score based on keyword match count."""
         if is_default:
@@ -209,21 +270,10 @@ class IntentClassifier:
             Tuple of (IntentType, confidence) where confidence is a float between 0 and 1.
             Higher confidence indicates stronger keyword matches.
         """
-        content_lower = content.lower()
-
-        # Count matches for each intent type
-        reasoning_matches = self._count_keyword_matches(content_lower, self.REASONING_KEYWORDS)
-        factual_matches = self._count_keyword_matches(content_lower, self.FACTUAL_KEYWORDS)
-        creative_matches = self._count_keyword_matches(content_lower, self.CREATIVE_KEYWORDS)
+        # Count matches for each intent type in one pass over the content
+        match_counts = zip(self._matcher.intents, self._matcher.count(content), strict=True)
 
-        # Determine intent based on highest match count, with priority order for ties
-        match_counts = [
-            (IntentType.REASONING, reasoning_matches),
-            (IntentType.FACTUAL, factual_matches),
-            (IntentType.CREATIVE, creative_matches),
-        ]
-
-        # Find the intent with the most matches
+        # Find the intent with the most matches, with priority order for ties
         best_intent = IntentType.GENERAL
         best_count = 0
 
@@ -415,3 +465,19 @@ Respond with ONLY a JSON object in this exact format:
         """Asynchronous classification with optional context/LLM fallback."""
         result = await self.classify_async_with_metadata(content, context)
         return result.intent
+
+    async def classify_batch_async(
+        self, contents: List[str], context: Optional[JSONDict] = None
+    ) -> List[IntentType]:
+        """
+        Classify a batch of contents, returning intents in input order.
+
+        Identical contents are classified once and the result is shared.
+        """
+        unique: Dict[str, int] = {}
+        for content in contents:
+            unique.setdefault(content, len(unique))
+        intents = await asyncio.gather(
+            *(self.classify_async(content, context) for content in unique)
+        )
+        return [intents[unique[content]] for content in contents]
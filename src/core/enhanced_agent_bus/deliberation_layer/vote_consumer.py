@@ -7,7 +7,6 @@ Consumes vote events from Kafka, deduplicates, and updates Redis elections.
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
@@ -39,6 +38,11 @@ try:
 except ImportError:
     from ...shared.config import settings  # type: ignore
 
+try:
+    from ..wire_codec import WireCodec
+except ImportError:
+    from wire_codec import WireCodec  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
@@ -84,7 +88,7 @@ class VoteEventConsumer:
                 self._vote_topic,
                 bootstrap_servers=self.bootstrap_servers,
                 group_id=f"acgs-voting-group-{self.tenant_id}",
-                value_deserializer=lambda v: json.loads(v.decode("utf-8")),
+                value_deserializer=WireCodec().decode,  # JSON or msgpack
                 enable_auto_commit=False,  # Manual commit for exactly-once semantics
                 isolation_level="read_committed",  # Only read committed messages
                 security_protocol=settings.kafka.get("security_protocol", "PLAINTEXT"),
@@ -10,12 +10,16 @@ and alerts when production data distribution diverges from training baseline.
 from __future__ import annotations
 
 import logging
+import math
 import os
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
 
 # Type checking imports for static analysis
 if TYPE_CHECKING:
@@ -49,6 +53,11 @@ DRIFT_CHECK_INTERVAL_HOURS = int(os.getenv("DRIFT_CHECK_INTERVAL_HOURS", "6"))
 DRIFT_PSI_THRESHOLD = float(os.getenv("DRIFT_PSI_THRESHOLD", "0.2"))
 DRIFT_SHARE_THRESHOLD = float(os.getenv("DRIFT_SHARE_THRESHOLD", "0.5"))
 MIN_SAMPLES_FOR_DRIFT = int(os.getenv("MIN_SAMPLES_FOR_DRIFT", "100"))
+DRIFT_SKETCH_BINS = int(os.getenv("DRIFT_SKETCH_BINS", "20"))
+DRIFT_STREAMING_ENABLED = os.getenv("DRIFT_STREAMING_ENABLED", "false").lower() == "true"
+
+# Columns never treated as features
+NON_FEATURE_COLUMNS = ("target", "label", "y", "prediction", "timestamp", "id")
 
 
 class DriftSeverity(str, Enum):
@@ -130,6 +139,85 @@ class DriftReport:
         }
 
 
+class HistogramSketch:
+    """
+    Fixed-bin histogram of one numeric feature for streaming drift detection.
+
+    ``edges`` are the ascending interior cut points; the first and last bins
+    are open-ended, so values outside the reference range are still counted.
+    Memory is O(bins) however many values are added, an update is a binary
+    search over the edges, and PSI between two sketches with the same edges
+    is O(bins).
+    """
+
+    __slots__ = ("edges", "counts", "total")
+
+    def __init__(self, edges: Sequence[float]):
+        self.edges = [float(e) for e in edges]
+        self.counts = [0] * (len(self.edges) + 1)
+        self.total = 0
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any], bins: int = DRIFT_SKETCH_BINS) -> HistogramSketch:
+        """
+        Sketch ``values`` with quantile bins.
+
+        Features with at most ``bins`` distinct values get one bin per value,
+        matching Evidently's PSI on low-cardinality columns.
+        """
+        arr = np.asarray(list(values), dtype=float)
+        arr = arr[~np.isnan(arr)]
+        distinct = np.unique(arr)
+        if len(distinct) <= bins:
+            edges = (distinct[1:] + distinct[:-1]) / 2
+        else:
+            edges = np.unique(np.quantile(arr, np.linspace(0.0, 1.0, bins + 1)[1:-1]))
+        sketch = cls(edges.tolist())
+        sketch.add_many(arr)
+        return sketch
+
+    def empty_like(self) -> HistogramSketch:
+        """Return an empty sketch with the same bins."""
+        return HistogramSketch(self.edges)
+
+    def add(self, value: float) -> None:
+        """Count one value; NaN is ignored."""
+        if value != value:
+            return
+        self.counts[bisect_right(self.edges, value)] += 1
+        self.total += 1
+
+    def add_many(self, values: Iterable[Any]) -> None:
+        """Count an array of values; NaN is ignored."""
+        arr = np.asarray(values, dtype=float)
+        arr = arr[~np.isnan(arr)]
+        binned = np.bincount(
+            np.searchsorted(self.edges, arr, side="right"), minlength=len(self.counts)
+        )
+        self.counts = [c + int(n) for c, n in zip(self.counts, binned, strict=True)]
+        self.total += len(arr)
+
+    def proportions(self) -> List[float]:
+        """Share of values per bin, with empty bins floored the way Evidently does."""
+        shares = [c / self.total for c in self.counts]
+        smallest = min(p for p in shares if p > 0)
+        floor = smallest / 10**6 if smallest <= 0.0001 else 0.0001
+        return [p or floor for p in shares]
+
+    def psi(self, current: HistogramSketch) -> float:
+        """Population Stability Index of ``current`` against this (reference) sketch."""
+        return float(
+            sum(
+                (r - c) * math.log(r / c)
+                for r, c in zip(self.proportions(), current.proportions(), strict=True)
+            )
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Bin edges and counts, for FeatureDriftResult distributions."""
+        return {"edges": list(self.edges), "counts": list(self.counts), "total": self.total}
+
+
 @dataclass
 class DriftAlertConfig:
     """Configuration for drift alerting."""
@@ -161,6 +249,12 @@ class DriftDetector:
         if report.dataset_drift:
             trigger_retraining_pipeline()
             send_drift_alert(report)
+
+    Streaming mode keeps a HistogramSketch per feature for the reference and
+    the current window instead of DataFrames. Observations are added one at a
+    time with observe() and detect_drift_streaming() computes PSI from the
+    sketches, producing the same DriftReport. Without reference data, the
+    first ``min_samples`` observations become the reference window.
     """
 
     def __init__(
@@ -170,6 +264,7 @@ class DriftDetector:
         drift_share_threshold: float = DRIFT_SHARE_THRESHOLD,
         min_samples: int = MIN_SAMPLES_FOR_DRIFT,
         alert_config: Optional[DriftAlertConfig] = None,
+        sketch_bins: int = DRIFT_SKETCH_BINS,
     ):
         """
         Initialize the drift detector.
@@ -180,18 +275,28 @@ class DriftDetector:
             drift_share_threshold: Proportion of features that must drift for dataset drift
             min_samples: Minimum samples required for valid drift detection
             alert_config: Configuration for drift alerting
+            sketch_bins: Maximum number of histogram bins per feature in streaming mode
         """
         self.reference_data_path = reference_data_path or REFERENCE_DATA_PATH
         self.psi_threshold = psi_threshold
         self.drift_share_threshold = drift_share_threshold
         self.min_samples = min_samples
         self.alert_config = alert_config or DriftAlertConfig()
+        self.sketch_bins = sketch_bins
 
         self._reference_data: Optional[pd.DataFrame] = None
         self._feature_columns: Optional[List[str]] = None
         self._last_report: Optional[DriftReport] = None
         self._drift_history: List[DriftReport] = []
 
+        # Streaming mode state
+        self._reference_sketches: Dict[str, HistogramSketch] = {}
+        self._current_sketches: Dict[str, HistogramSketch] = {}
+        self._reference_window: List[Mapping[str, Any]] = []
+        self._reference_data_sketched = False
+        self._stream_reference_samples = 0
+        self._stream_current_samples = 0
+
     def _check_dependencies(self) -> None:
         """Check that required dependencies are available."""
         if not PANDAS_AVAILABLE:
@@ -267,8 +372,9 @@ class DriftDetector:
             self._feature_columns = [
                 col
                 for col in self._reference_data.columns
-                if col.lower() not in ("target", "label", "y", "prediction", "timestamp", "id")
+                if col.lower() not in NON_FEATURE_COLUMNS
             ]
+            self._reset_sketches()
 
             logger.info(
                 f"Loaded reference data: {len(self._reference_data)} samples, "
@@ -445,23 +551,7 @@ class DriftDetector:
                 columns=available_columns,
             )
 
-            # Store report
-            self._last_report = drift_report
-            self._drift_history.append(drift_report)
-
-            # Log drift status
-            if drift_report.dataset_drift:
-                logger.warning(
-                    f"Dataset drift detected: {drift_report.drifted_features}/{drift_report.total_features} "
-                    f"features drifted ({drift_report.drift_share:.1%}). "
-                    f"Severity: {drift_report.drift_severity.value}"
-                )
-            else:
-                logger.info(
-                    f"No significant dataset drift detected. "
-                    f"Drift share: {drift_report.drift_share:.1%}"
-                )
-
+            self._record_report(drift_report)
             return drift_report
 
         except Exception as e:
@@ -475,6 +565,207 @@ class DriftDetector:
                 recommendations=["Check data format and compatibility with Evidently"],
             )
 
+    def _record_report(self, drift_report: DriftReport) -> None:
+        """Store a successful report and log its drift status."""
+        self._last_report = drift_report
+        self._drift_history.append(drift_report)
+
+        if drift_report.dataset_drift:
+            logger.warning(
+                f"Dataset drift detected: {drift_report.drifted_features}/{drift_report.total_features} "
+                f"features drifted ({drift_report.drift_share:.1%}). "
+                f"Severity: {drift_report.drift_severity.value}"
+            )
+        else:
+            logger.info(
+                f"No significant dataset drift detected. "
+                f"Drift share: {drift_report.drift_share:.1%}"
+            )
+
+    def observe(self, record: Mapping[str, Any]) -> None:
+        """
+        Add one observation (feature name -> value) to the streaming current window.
+
+        Until reference sketches exist, observations fill the reference window
+        instead. Non-numeric and missing values are skipped.
+        """
+        if not self._reference_sketches and not self._build_reference_sketches():
+            if self.has_reference_data:
+                return  # no numeric features in the reference data
+            self._reference_window.append(record)
+            if len(self._reference_window) >= self.min_samples:
+                self._build_reference_sketches()
+            return
+
+        for name, sketch in self._current_sketches.items():
+            value = record.get(name)
+            if value is None:
+                continue
+            try:
+                sketch.add(float(value))
+            except (TypeError, ValueError):
+                continue
+        self._stream_current_samples += 1
+
+    def detect_drift_streaming(self, reset_window: bool = True) -> DriftReport:
+        """
+        Detect drift between the reference and current streaming windows.
+
+        PSI is computed per feature from the histogram sketches in O(bins),
+        without pandas or Evidently. The report has the same shape as
+        detect_drift's.
+
+        Args:
+            reset_window: Start a new current window after a successful check
+
+        Returns:
+            DriftReport with detection results and recommendations
+        """
+        timestamp = datetime.now(timezone.utc)
+
+        if not self._reference_sketches and not self._build_reference_sketches():
+            return DriftReport(
+                timestamp=timestamp,
+                status=DriftStatus.NO_REFERENCE,
+                reference_samples=len(self._reference_window),
+                error_message=(
+                    f"No reference window yet ({len(self._reference_window)} of "
+                    f"{self.min_samples} observations)"
+                ),
+                recommendations=[
+                    "Load reference baseline data or keep observing until the reference "
+                    "window is full"
+                ],
+            )
+
+        reference_samples = self._stream_reference_samples
+        current_samples = self._stream_current_samples
+
+        if current_samples < self.min_samples:
+            return DriftReport(
+                timestamp=timestamp,
+                status=DriftStatus.INSUFFICIENT_DATA,
+                reference_samples=reference_samples,
+                current_samples=current_samples,
+                error_message=(
+                    f"Insufficient current data samples ({current_samples}). "
+                    f"Minimum required: {self.min_samples}"
+                ),
+                recommendations=[
+                    f"Collect at least {self.min_samples} samples before running drift detection",
+                    "Increase data collection window if necessary",
+                ],
+            )
+
+        feature_results: List[FeatureDriftResult] = []
+        for name, reference in self._reference_sketches.items():
+            current = self._current_sketches[name]
+            if not reference.total or not current.total:
+                continue
+            psi = reference.psi(current)
+            feature_results.append(
+                FeatureDriftResult(
+                    feature_name=name,
+                    drift_detected=psi >= self.psi_threshold,
+                    drift_score=psi,
+                    threshold=self.psi_threshold,
+                    psi_value=psi,
+                    reference_distribution=reference.to_dict(),
+                    current_distribution=current.to_dict(),
+                )
+            )
+
+        total_columns = len(feature_results)
+        drifted_columns = sum(1 for f in feature_results if f.drift_detected)
+        drift_share = drifted_columns / total_columns if total_columns else 0.0
+        dataset_drift = bool(total_columns) and drift_share >= self.drift_share_threshold
+        severity = self._calculate_severity(drift_share)
+
+        drift_report = DriftReport(
+            timestamp=timestamp,
+            status=DriftStatus.SUCCESS,
+            dataset_drift=dataset_drift,
+            drift_severity=severity,
+            drift_share=drift_share,
+            total_features=total_columns,
+            drifted_features=drifted_columns,
+            feature_results=feature_results,
+            reference_samples=reference_samples,
+            current_samples=current_samples,
+            raw_results={"method": "streaming_psi", "sketch_bins": self.sketch_bins},
+            recommendations=self._generate_recommendations(
+                dataset_drift=dataset_drift,
+                severity=severity,
+                drift_share=drift_share,
+                drifted_columns=drifted_columns,
+                feature_results=feature_results,
+            ),
+        )
+        self._record_report(drift_report)
+
+        if reset_window:
+            self._current_sketches = {
+                name: sketch.empty_like() for name, sketch in self._reference_sketches.items()
+            }
+            self._stream_current_samples = 0
+
+        return drift_report
+
+    def _build_reference_sketches(self) -> bool:
+        """
+        Build reference sketches from reference data or a full reference window.
+
+        Returns:
+            True if reference sketches exist afterwards
+        """
+        if self._reference_sketches:
+            return True
+
+        columns: Dict[str, Iterable[Any]] = {}
+        if self.has_reference_data:
+            if self._reference_data_sketched:
+                return False  # already scanned; it has no numeric features
+            self._reference_data_sketched = True
+            for col in self._feature_columns or []:
+                series = self._reference_data[col]
+                if pd_module is not None and pd_module.api.types.is_numeric_dtype(series):
+                    columns[col] = series.to_numpy(dtype=float, na_value=np.nan)
+            samples = len(self._reference_data)
+        elif len(self._reference_window) >= self.min_samples:
+            names = {
+                name
+                for record in self._reference_window
+                for name, value in record.items()
+                if isinstance(value, (int, float)) and name.lower() not in NON_FEATURE_COLUMNS
+            }
+            for name in sorted(names):
+                values = (r.get(name) for r in self._reference_window)
+                columns[name] = [v if isinstance(v, (int, float)) else np.nan for v in values]
+            samples = len(self._reference_window)
+        else:
+            return False
+
+        for name, values in columns.items():
+            sketch = HistogramSketch.from_values(values, self.sketch_bins)
+            if sketch.total:
+                self._reference_sketches[name] = sketch
+        self._current_sketches = {
+            name: sketch.empty_like() for name, sketch in self._reference_sketches.items()
+        }
+        self._reference_window = []
+        self._stream_reference_samples = samples
+        self._stream_current_samples = 0
+        return bool(self._reference_sketches)
+
+    def _reset_sketches(self) -> None:
+        """Drop streaming sketches so they are rebuilt from the new reference data."""
+        self._reference_sketches = {}
+        self._current_sketches = {}
+        self._reference_window = []
+        self._reference_data_sketched = False
+        self._stream_reference_samples = 0
+        self._stream_current_samples = 0
+
     def _parse_evidently_results(
         self,
         drift_results: Dict[str, Any],
@@ -726,8 +1017,9 @@ class DriftDetector:
             self._feature_columns = [
                 col
                 for col in self._reference_data.columns
-                if col.lower() not in ("target", "label", "y", "prediction", "timestamp", "id")
+                if col.lower() not in NON_FEATURE_COLUMNS
             ]
+            self._reset_sketches()
 
             logger.info(
                 f"Reference baseline updated ({strategy}): "
@@ -857,8 +1149,9 @@ __all__ = [
     "FeatureDriftResult",
     "DriftReport",
     "DriftAlertConfig",
-    # Main Class
+    # Main Classes
     "DriftDetector",
+    "HistogramSketch",
     # Availability Flags
     "EVIDENTLY_AVAILABLE",
     "PANDAS_AVAILABLE",
@@ -868,6 +1161,8 @@ __all__ = [
     "DRIFT_PSI_THRESHOLD",
     "DRIFT_SHARE_THRESHOLD",
     "MIN_SAMPLES_FOR_DRIFT",
+    "DRIFT_SKETCH_BINS",
+    "DRIFT_STREAMING_ENABLED",
     # Convenience Functions
     "get_drift_detector",
     "detect_drift",
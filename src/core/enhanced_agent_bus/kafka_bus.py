@@ -5,7 +5,6 @@ Provides high-throughput, multi-tenant isolated messaging.
 """
 
 import asyncio
-import json
 import logging
 import re
 import ssl
@@ -22,10 +21,12 @@ try:
     from .exceptions import MessageDeliveryError
     from .models import AgentMessage, MessageType
     from .shared.config import settings
+    from .wire_codec import WIRE_FORMAT_JSON, WireCodec
 except ImportError:
     from core.shared.config import settings  # type: ignore
     from exceptions import MessageDeliveryError  # type: ignore
     from models import AgentMessage, MessageType  # type: ignore
+    from wire_codec import WIRE_FORMAT_JSON, WireCodec  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +35,21 @@ class KafkaEventBus:
     """
     Kafka-based event bus for high-performance multi-agent orchestration.
     Supports topic-level multi-tenant isolation.
+
+    Values are produced in ``wire_format`` ("json" or "msgpack", default from
+    ``settings.kafka["wire_format"]``) and consumed in either, so consumers
+    can be upgraded before producers switch to msgpack.
     """
 
-    def __init__(self, bootstrap_servers: str = "localhost:9092", client_id: str = "acgs2-bus"):
+    def __init__(
+        self,
+        bootstrap_servers: str = "localhost:9092",
+        client_id: str = "acgs2-bus",
+        wire_format: Optional[str] = None,
+    ):
         self.bootstrap_servers = bootstrap_servers
         self.client_id = client_id
+        self.codec = WireCodec(wire_format or settings.kafka.get("wire_format", WIRE_FORMAT_JSON))
         self.producer: Optional[AIOKafkaProducer] = None
         self._consumers: Dict[str, AIOKafkaConsumer] = {}
         self._running = False
@@ -53,7 +64,7 @@ class KafkaEventBus:
         self.producer = AIOKafkaProducer(
             bootstrap_servers=self.bootstrap_servers,
             client_id=self.client_id,
-            value_serializer=lambda v: json.dumps(v, default=str).encode("utf-8"),
+            value_serializer=self.codec.serialize,
             acks="all",  # Ensure durability for production
             enable_idempotence=True,  # Prevent duplicate votes
             retry_backoff_ms=500,
@@ -132,10 +143,15 @@ class KafkaEventBus:
         key = message.conversation_id.encode("utf-8") if message.conversation_id else None
 
         try:
-            # Re-convert to dict ensuring all fields are present
-            msg_dict = message.to_dict_raw()
-
-            await self.producer.send_and_wait(topic, value=msg_dict, key=key)
+            if self.codec.wire_format == WIRE_FORMAT_JSON:
+                # Re-convert to dict ensuring all fields are present
+                value = message.to_dict_raw()
+            else:
+                value = self.codec.encode_message(message)
+
+            await self.producer.send_and_wait(
+                topic, value=value, key=key, headers=self.codec.headers
+            )
 
             return True
         except Exception as e:
@@ -158,7 +174,6 @@ class KafkaEventBus:
             *topics,
             bootstrap_servers=self.bootstrap_servers,
             group_id=f"{self.client_id}-group-{tenant_id}",
-            value_deserializer=lambda v: json.loads(v.decode("utf-8")),
             security_protocol=settings.kafka.get("security_protocol", "PLAINTEXT"),
             ssl_context=self._ssl_context,
         )
@@ -172,8 +187,8 @@ class KafkaEventBus:
                     if not self._running:
                         break
                     try:
-                        # Reconstruct AgentMessage
-                        message_data = msg.value
+                        # Decoded in the loop so a bad record skips only itself
+                        message_data = self.codec.decode(msg.value, msg.headers)
                         # In a real implementation, we'd have a from_dict method
                         # For now, we'll assume the handler can take the dict or we wrap it
                         await handler(message_data)
@@ -216,7 +231,9 @@ class KafkaEventBus:
         key = election_id.encode("utf-8") if election_id else None
 
         try:
-            await self.producer.send_and_wait(topic, value=vote_event, key=key)
+            await self.producer.send_and_wait(
+                topic, value=vote_event, key=key, headers=self.codec.headers
+            )
 
             return True
         except Exception as e:
@@ -247,7 +264,9 @@ class KafkaEventBus:
         key = election_id.encode("utf-8") if election_id else None
 
         try:
-            await self.producer.send_and_wait(topic, value=audit_record, key=key)
+            await self.producer.send_and_wait(
+                topic, value=audit_record, key=key, headers=self.codec.headers
+            )
 
             return True
         except Exception as e:
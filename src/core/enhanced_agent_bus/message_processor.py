@@ -2,9 +2,9 @@
 Constitutional Hash: cdd01ef066bc6cf2
 """
 
+import asyncio
 import hashlib
 import logging
-import re
 import time
 from contextlib import nullcontext
 from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
@@ -36,21 +36,17 @@ from .models import (
     Priority,
 )
 from .runtime_security import get_runtime_security_scanner
-from .utils import LRUCache
+from .security.content_inspector import (
+    PROMPT_INJECTION,
+    PROMPT_INJECTION_RULES,
+    get_content_inspector,
+)
+from .utils import LRUCache, TTLCache
 from .validators import ValidationResult
 
 logger = logging.getLogger(__name__)
 
-PROMPT_INJECTION_PATTERNS = [
-    r"ignore (all )?previous instructions",
-    r"system prompt (leak|override|manipulation)",
-    r"do anything now",
-    r"jailbreak",
-    r"persona (adoption|override)",
-    r"\(note to self: .*\)",
-    r"\[INST\].*\[/INST\]",
-]
-_INJECTION_RE = re.compile("|".join(PROMPT_INJECTION_PATTERNS), re.IGNORECASE)
+PROMPT_INJECTION_PATTERNS = [pattern for pattern, _ in PROMPT_INJECTION_RULES]
 
 
 class MessageProcessor:
@@ -108,6 +104,11 @@ class MessageProcessor:
         self.constitutional_hash = CONSTITUTIONAL_HASH
         self._opa_client, self._audit_client = get_opa_client(), kwargs.get("audit_client")
         self._validation_cache = LRUCache(maxsize=1000)
+        # Content-addressed cache of pure security check outcomes
+        self._scan_cache = TTLCache(
+            maxsize=kwargs.get("scan_cache_size", 10000),
+            ttl_seconds=kwargs.get("scan_cache_ttl_seconds", 300.0),
+        )
 
         # SDPC Phase 2/3 Verifiers
         # SDPC Phase 2/3 Verifiers
@@ -164,12 +165,94 @@ class MessageProcessor:
             )
         return base
 
-    async def process(self, msg: AgentMessage) -> ValidationResult:
+    async def process(self, msg: AgentMessage, run_handlers: bool = True) -> ValidationResult:
+        """
+        Validate a message and run its registered handlers.
+
+        With ``run_handlers=False`` only validation runs; callers deliver the
+        validated content themselves and run ``execute_handlers`` on each
+        delivered copy.
+        """
+        if CIRCUIT_BREAKER_ENABLED:
+            return await self._process_cb.call(self._do_process, msg, run_handlers)
+        return await self._do_process(msg, run_handlers)
+
+    async def execute_handlers(self, msg: AgentMessage) -> ValidationResult:
+        """Run the registered handlers for a message that has already been validated."""
+        from core.enhanced_agent_bus.processing_strategies import HandlerExecutorMixin
+
+        return await HandlerExecutorMixin()._execute_handlers(msg, self._handlers)
+
+    async def process_batch(self, msgs: List[AgentMessage]) -> List[ValidationResult]:
+        """
+        Process a batch of messages, returning results in input order.
+
+        Security scanning and intent classification run once over the whole
+        batch; per-message strategy processing (including OPA evaluation) is
+        issued concurrently.
+        """
+        if not msgs:
+            return []
         if CIRCUIT_BREAKER_ENABLED:
-            return await self._process_cb.call(self._do_process, msg)
-        return await self._do_process(msg)
+            return await self._process_cb.call(self._do_process_batch, msgs)
+        return await self._do_process_batch(msgs)
 
-    async def _do_process(self, msg: AgentMessage) -> ValidationResult:
+    @staticmethod
+    def _security_scan_request(msg: AgentMessage) -> JSONDict:
+        return {
+            "content": msg.content,
+            "tenant_id": msg.tenant_id,
+            "agent_id": msg.from_agent,
+            "constitutional_hash": msg.constitutional_hash,
+            "context": {"priority": msg.priority.value, "message_type": msg.message_type.value},
+        }
+
+    @staticmethod
+    def _scan_cache_key(request: JSONDict) -> str:
+        # repr keeps content types apart ("1" vs 1) and covers every scan input
+        return hashlib.sha256(repr(sorted(request.items())).encode()).hexdigest()
+
+    async def _security_scan_request_for(
+        self, security_scanner: Any, msg: AgentMessage
+    ) -> JSONDict:
+        """
+        Build a scan request, reusing cached content check results.
+
+        On a cache miss the content checks run once and their outcome is
+        cached unless it reflects a transient failure. If they raise, the
+        plain request is returned so the full scan applies its fail-closed
+        handling.
+        """
+        request = self._security_scan_request(msg)
+        skey = self._scan_cache_key(request)
+        content_result = self._scan_cache.get(skey)
+        if content_result is None:
+            try:
+                content_result = await security_scanner.scan_content_checks(**request)
+            except Exception as e:
+                logger.warning(f"Content scan failed, falling back to full scan: {e}")
+                return request
+            if content_result.cacheable:
+                self._scan_cache.set(skey, content_result)
+        request["content_result"] = content_result
+        return request
+
+    def _security_block_result(self, security_res: Any) -> ValidationResult:
+        self._failed_count += 1
+        return ValidationResult(
+            is_valid=False,
+            errors=[security_res.block_reason],
+            metadata={
+                "rejection_reason": "security_block",
+                "security_events": [e.to_dict() for e in security_res.events],
+            },
+        )
+
+    @staticmethod
+    def _validation_cache_key(msg: AgentMessage) -> str:
+        return f"{hashlib.sha256(str(msg.content).encode()).hexdigest()[:16]}:{msg.constitutional_hash}"
+
+    async def _do_process(self, msg: AgentMessage, run_handlers: bool = True) -> ValidationResult:
         start = time.perf_counter()
 
         # Memory profiling integration (fire-and-forget, <5μs impact)
@@ -187,43 +270,76 @@ class MessageProcessor:
             # Phase 2 Breakthrough: Unified Runtime Security Scanning
             security_scanner = get_runtime_security_scanner()
             security_res = await security_scanner.scan(
-                content=msg.content,
-                tenant_id=msg.tenant_id,
-                agent_id=msg.from_agent,
-                constitutional_hash=msg.constitutional_hash,
-                context={"priority": msg.priority.value, "message_type": msg.message_type.value},
+                **await self._security_scan_request_for(security_scanner, msg)
             )
 
             if security_res.blocked:
-                self._failed_count += 1
-                return ValidationResult(
-                    is_valid=False,
-                    errors=[security_res.block_reason],
-                    metadata={
-                        "rejection_reason": "security_block",
-                        "security_events": [e.to_dict() for e in security_res.events],
-                    },
-                )
+                return self._security_block_result(security_res)
 
-        ckey = f"{hashlib.sha256(str(msg.content).encode()).hexdigest()[:16]}:{msg.constitutional_hash}"
+        ckey = self._validation_cache_key(msg)
         cached = self._validation_cache.get(ckey)
         if cached:
             return cached
 
-        # Extract session_id for multi-turn PACAR context tracking
-        # Priority: headers > content > payload (for flexibility)
-        session_id: Optional[str] = None
-        if hasattr(msg, "headers") and msg.headers:
-            session_id = msg.headers.get("X-Session-ID") or msg.headers.get("x-session-id")
-        if not session_id and hasattr(msg, "content") and isinstance(msg.content, dict):
-            session_id = msg.content.get("session_id")
-        if not session_id and hasattr(msg, "payload") and isinstance(msg.payload, dict):
-            session_id = msg.payload.get("session_id")
+        content_str = str(msg.content)
+        intent = await self.intent_classifier.classify_async(content_str)
+        return await self._process_classified(msg, content_str, intent, ckey, start, run_handlers)
+
+    async def _do_process_batch(self, msgs: List[AgentMessage]) -> List[ValidationResult]:
+        start = time.perf_counter()
+
+        profiler = get_memory_profiler()
+        context_manager = (
+            profiler.profile_async(f"message_batch_processing_{len(msgs)}")
+            if profiler and profiler.config.enabled
+            else nullcontext()
+        )
+
+        async with context_manager:
+            security_scanner = get_runtime_security_scanner()
+            security_results = await security_scanner.scan_batch(
+                [await self._security_scan_request_for(security_scanner, msg) for msg in msgs]
+            )
 
+        results: List[Optional[ValidationResult]] = [None] * len(msgs)
+        pending = []
+        for idx, (msg, security_res) in enumerate(zip(msgs, security_results, strict=True)):
+            if security_res.blocked:
+                results[idx] = self._security_block_result(security_res)
+                continue
+            ckey = self._validation_cache_key(msg)
+            cached = self._validation_cache.get(ckey)
+            if cached:
+                results[idx] = cached
+                continue
+            pending.append((idx, msg, str(msg.content), ckey))
+
+        if pending:
+            intents = await self.intent_classifier.classify_batch_async(
+                [content_str for _, _, content_str, _ in pending]
+            )
+            processed = await asyncio.gather(
+                *(
+                    self._process_classified(msg, content_str, intent, ckey, start)
+                    for (_, msg, content_str, ckey), intent in zip(pending, intents, strict=True)
+                )
+            )
+            for (idx, _, _, _), res in zip(pending, processed, strict=True):
+                results[idx] = res
+
+        return results
+
+    async def _process_classified(
+        self,
+        msg: AgentMessage,
+        content_str: str,
+        intent: Any,
+        ckey: str,
+        start: float,
+        run_handlers: bool = True,
+    ) -> ValidationResult:
         # SDPC Logic (Phase 2/3)
         sdpc_metadata = {}
-        content_str = str(msg.content)
-        intent = await self.intent_classifier.classify_async(content_str)
         # Handle case where impact_score is None or explicitly set to None
         impact_score = getattr(msg, "impact_score", 0.0)
         if impact_score is None:
@@ -259,7 +375,7 @@ class MessageProcessor:
         if verifications:
             self.evolution_controller.record_feedback(intent, verifications)
 
-        res = await self._processing_strategy.process(msg, self._handlers)
+        res = await self._processing_strategy.process(msg, self._handlers if run_handlers else {})
         lat = (time.perf_counter() - start) * 1000
 
         res.metadata.update(sdpc_metadata)
@@ -277,9 +393,8 @@ class MessageProcessor:
         return res
 
     def _detect_prompt_injection(self, msg: AgentMessage) -> Optional[ValidationResult]:
-        content = msg.content
-        content_str = content if isinstance(content, str) else str(content)
-        if _INJECTION_RE.search(content_str):
+        inspection = get_content_inspector().inspect(msg.content, families=(PROMPT_INJECTION,))
+        if inspection.has(PROMPT_INJECTION):
             return ValidationResult(
                 is_valid=False,
                 errors=["Prompt injection detected"],
@@ -336,6 +451,9 @@ class MessageProcessor:
                 self._processing_strategy.get_name() if self._processing_strategy else "none"
             ),
             "metering_enabled": self._enable_metering and self._metering_hooks is not None,
+            "scan_cache_hits": self._scan_cache.hits,
+            "scan_cache_misses": self._scan_cache.misses,
+            "scan_cache_size": len(self._scan_cache),
         }
 
     def _set_strategy(self, strategy: ProcessingStrategy) -> None:
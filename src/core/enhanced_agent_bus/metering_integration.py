@@ -11,7 +11,7 @@ import logging
 import time
 from datetime import datetime, timezone
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 # Import metering service with fallback
 try:
@@ -93,12 +93,26 @@ class MeteringConfig:
         self.constitutional_hash = constitutional_hash
 
 
+def _metadata_key(metadata: Dict[str, Any]) -> Any:
+    """Hashable key for event metadata, so only events with equal metadata are aggregated."""
+    try:
+        return frozenset(metadata.items())
+    except TypeError:
+        # Unhashable values (lists, nested dicts)
+        return repr(sorted(metadata.items(), key=lambda item: item[0]))
+
+
 class AsyncMeteringQueue:
     """
     Non-blocking async queue for metering events.
 
     Uses fire-and-forget pattern to ensure zero impact on P99 latency.
-    Events are batched and flushed periodically to the metering service.
+    Events are flushed every ``flush_interval_seconds``, or as soon as the
+    queue is half full. Each flush drains the whole queue, pre-aggregates the
+    events into usage counters (see ``_aggregate``) and writes them
+    through the metering service's bulk ``record_events`` in chunks of
+    ``batch_size`` rows. A chunk the service rejects is retried row by row;
+    rows that still fail are counted as dropped.
     """
 
     def __init__(
@@ -112,6 +126,11 @@ class AsyncMeteringQueue:
         self._events_queued = 0
         self._events_flushed = 0
         self._events_dropped = 0
+        self._flush_wakeup = asyncio.Event()
+        self._flush_high_water = max(1, config.max_queue_size // 2)
+        self._flushes = 0
+        self._last_flush_latency_ms = 0.0
+        self._max_flush_latency_ms = 0.0
 
     async def start(self) -> None:
         """Start the async queue processor."""
@@ -200,6 +219,8 @@ class AsyncMeteringQueue:
         try:
             self._queue.put_nowait(event_data)
             self._events_queued += 1
+            if self._queue.qsize() >= self._flush_high_water:
+                self._flush_wakeup.set()
             return True
         except asyncio.QueueFull:
             self._events_dropped += 1
@@ -210,7 +231,13 @@ class AsyncMeteringQueue:
         """Background loop to flush events to metering service."""
         while self._running:
             try:
-                await asyncio.sleep(self.config.flush_interval_seconds)
+                try:
+                    await asyncio.wait_for(
+                        self._flush_wakeup.wait(), timeout=self.config.flush_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_wakeup.clear()
                 await self._flush_batch()
             except asyncio.CancelledError:
                 break
@@ -218,38 +245,89 @@ class AsyncMeteringQueue:
                 logger.error(f"Metering flush error: {e}")
 
     async def _flush_batch(self) -> None:
-        """Flush a batch of events to the metering service."""
+        """Drain the queue and write it to the metering service as aggregated usage counters."""
         if not self._metering_service or self._queue.empty():
             return
 
+        start = time.perf_counter()
         batch = []
         try:
-            for _ in range(self.config.batch_size):
-                if self._queue.empty():
-                    break
+            while True:
                 batch.append(self._queue.get_nowait())
         except asyncio.QueueEmpty:
             pass
 
-        if not batch:
-            return
+        rows = self._aggregate(batch)
+        for i in range(0, len(rows), self.config.batch_size):
+            chunk = rows[i : i + self.config.batch_size]
+            try:
+                await self._metering_service.record_events(chunk)
+                self._events_flushed += sum(row["units"] for row in chunk)
+            except Exception as e:
+                logger.error(f"Failed to record metering events, retrying row by row: {e}")
+                await self._record_rows(chunk)
 
-        # Record events to metering service
-        for event_data in batch:
+        latency_ms = (time.perf_counter() - start) * 1000
+        self._flushes += 1
+        self._last_flush_latency_ms = latency_ms
+        self._max_flush_latency_ms = max(self._max_flush_latency_ms, latency_ms)
+
+    async def _record_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Record a failed chunk one row at a time so a bad row only drops its own units."""
+        for row in rows:
             try:
-                await self._metering_service.record_event(
-                    tenant_id=event_data["tenant_id"],
-                    operation=event_data["operation"],
-                    tier=event_data["tier"],
-                    agent_id=event_data["agent_id"],
-                    tokens_processed=event_data["tokens_processed"],
-                    latency_ms=event_data["latency_ms"],
-                    compliance_score=event_data["compliance_score"],
-                    metadata=event_data["metadata"],
-                )
-                self._events_flushed += 1
+                await self._metering_service.record_events([row])
+                self._events_flushed += row["units"]
             except Exception as e:
-                logger.error(f"Failed to record metering event: {e}")
+                self._events_dropped += row["units"]
+                logger.error(f"Dropping metering row for tenant {row.get('tenant_id')}: {e}")
+
+    @staticmethod
+    def _aggregate(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Collapse queued events into usage counter rows.
+
+        Events share a row when they have the same tenant, operation, tier,
+        agent ID and metadata and were queued within the same second, so each
+        row keeps its events' attribution. ``units`` is the number of events in
+        the row, tokens are summed, latency and compliance score are averaged
+        and the timestamp is the row's first event's.
+        """
+        groups: Dict[Tuple[Any, ...], List[Any]] = {}
+        for event in batch:
+            key = (
+                event["tenant_id"],
+                event["operation"],
+                event["tier"],
+                event["agent_id"],
+                event["timestamp"].replace(microsecond=0),
+                _metadata_key(event["metadata"]),
+            )
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [
+                    event,
+                    1,
+                    event["tokens_processed"],
+                    event["latency_ms"],
+                    event["compliance_score"],
+                ]
+                continue
+            group[1] += 1
+            group[2] += event["tokens_processed"]
+            group[3] += event["latency_ms"]
+            group[4] += event["compliance_score"]
+
+        return [
+            {
+                **first,
+                "units": units,
+                "tokens_processed": tokens,
+                "latency_ms": latency / units,
+                "compliance_score": score / units,
+            }
+            for first, units, tokens, latency, score in groups.values()
+        ]
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get queue metrics."""
@@ -258,6 +336,9 @@ class AsyncMeteringQueue:
             "events_flushed": self._events_flushed,
             "events_dropped": self._events_dropped,
             "queue_size": self._queue.qsize(),
+            "flushes": self._flushes,
+            "last_flush_latency_ms": self._last_flush_latency_ms,
+            "max_flush_latency_ms": self._max_flush_latency_ms,
             "running": self._running,
             "enabled": self.config.enabled,
             "constitutional_hash": self.config.constitutional_hash,
@@ -5,11 +5,12 @@ Constitutional Hash: cdd01ef066bc6cf2
 Data models for agent communication and message handling.
 """
 
+import time
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -150,62 +151,280 @@ class RoutingContext:
             raise ValueError("target_agent_id is required")
 
 
-@dataclass
-class AgentMessage:
-    """Agent message with constitutional compliance."""
-
-    # Message identification
-    message_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    conversation_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-
-    # Content and routing
-    content: MessageContent = field(default_factory=dict)
-    payload: MessageContent = field(default_factory=dict)
-    from_agent: str = ""
-    to_agent: str = ""
-    sender_id: str = ""
-    message_type: MessageType = MessageType.COMMAND
-    routing: Optional["RoutingContext"] = None
-    headers: Dict[str, str] = field(default_factory=dict)
-
-    # Multi-tenant security
-    tenant_id: str = ""
-    security_context: SecurityContext = field(default_factory=dict)
-
-    # Priority and lifecycle
-    priority: Priority = Priority.MEDIUM
-    status: MessageStatus = MessageStatus.PENDING
-
-    # Constitutional compliance
-    constitutional_hash: str = CONSTITUTIONAL_HASH
-    constitutional_validated: bool = False
+class _Factory:
+    """Placeholder for an AgentMessage field whose default is built on first access."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<factory>"
+
+
+_FACTORY: Any = _Factory()
+
+# Wall-clock anchor for monotonic timestamps, taken once per process
+_ANCHOR_MONOTONIC_NS = time.monotonic_ns()
+_ANCHOR_WALL = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(
+    microseconds=time.time_ns() // 1000
+)
+
+
+def _monotonic_to_datetime(ns: int) -> datetime:
+    """Convert a ``time.monotonic_ns()`` reading to a UTC datetime."""
+    return _ANCHOR_WALL + timedelta(microseconds=(ns - _ANCHOR_MONOTONIC_NS) // 1000)
+
 
-    # Metadata and extra data
-    metadata: Dict[str, Any] = field(default_factory=dict)
+def _lazy_field(name: str, factory: Callable[[], Any], doc: str) -> property:
+    slot = f"_{name}"
 
-    # Post-Quantum Cryptography support (NIST FIPS 203/204)
-    pqc_signature: Optional[str] = None  # CRYSTALS-Dilithium signature (base64)
-    pqc_public_key: Optional[str] = None  # CRYSTALS-Kyber public key (base64)
-    pqc_algorithm: Optional[str] = None  # "dilithium-3", "kyber-768", etc.
+    def getter(self: "AgentMessage") -> Any:
+        value = getattr(self, slot)
+        if value is _FACTORY:
+            value = factory()
+            setattr(self, slot, value)
+        return value
 
-    # Timestamps
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    expires_at: Optional[datetime] = None
+    def setter(self: "AgentMessage", value: Any) -> None:
+        setattr(self, slot, value)
 
-    # Impact assessment for deliberation layer
-    impact_score: Optional[float] = None
+    return property(getter, setter, doc=doc)
 
-    # Performance tracking
-    performance_metrics: PerformanceMetrics = field(default_factory=dict)
+
+class AgentMessage:
+    """
+    Agent message with constitutional compliance.
+
+    A slotted class with the constructor, attributes and equality of the
+    former dataclass. Message and conversation IDs and the empty dict fields
+    are created on first access, and ``created_at``/``updated_at`` are kept
+    as ``time.monotonic_ns()`` readings until read, so a message that is only
+    routed allocates neither. Monotonic readings map to UTC through a
+    per-process anchor; pickling and copying materialize every field.
+    """
+
+    __slots__ = (
+        "_message_id",
+        "_conversation_id",
+        "_content",
+        "_payload",
+        "from_agent",
+        "to_agent",
+        "sender_id",
+        "message_type",
+        "routing",
+        "_headers",
+        "tenant_id",
+        "_security_context",
+        "priority",
+        "status",
+        "constitutional_hash",
+        "constitutional_validated",
+        "_metadata",
+        "pqc_signature",
+        "pqc_public_key",
+        "pqc_algorithm",
+        "_created_at",
+        "_updated_at",
+        "expires_at",
+        "impact_score",
+        "_performance_metrics",
+        "__weakref__",
+    )
+
+    # Field names in constructor order, as the dataclass declared them
+    _FIELDS: ClassVar[Tuple[str, ...]] = (
+        "message_id",
+        "conversation_id",
+        "content",
+        "payload",
+        "from_agent",
+        "to_agent",
+        "sender_id",
+        "message_type",
+        "routing",
+        "headers",
+        "tenant_id",
+        "security_context",
+        "priority",
+        "status",
+        "constitutional_hash",
+        "constitutional_validated",
+        "metadata",
+        "pqc_signature",
+        "pqc_public_key",
+        "pqc_algorithm",
+        "created_at",
+        "updated_at",
+        "expires_at",
+        "impact_score",
+        "performance_metrics",
+    )
+
+    # Allow flexible constitutional hash for testing (can be overridden)
+    _skip_validation: ClassVar[bool] = False
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, as with the dataclass
+
+    def __init__(
+        self,
+        # Message identification
+        message_id: str = _FACTORY,
+        conversation_id: str = _FACTORY,
+        # Content and routing
+        content: MessageContent = _FACTORY,
+        payload: MessageContent = _FACTORY,
+        from_agent: str = "",
+        to_agent: str = "",
+        sender_id: str = "",
+        message_type: MessageType = MessageType.COMMAND,
+        routing: Optional["RoutingContext"] = None,
+        headers: Dict[str, str] = _FACTORY,
+        # Multi-tenant security
+        tenant_id: str = "",
+        security_context: SecurityContext = _FACTORY,
+        # Priority and lifecycle
+        priority: Priority = Priority.MEDIUM,
+        status: MessageStatus = MessageStatus.PENDING,
+        # Constitutional compliance
+        constitutional_hash: str = CONSTITUTIONAL_HASH,
+        constitutional_validated: bool = False,
+        # Metadata and extra data
+        metadata: Dict[str, Any] = _FACTORY,
+        # Post-Quantum Cryptography support (NIST FIPS 203/204)
+        pqc_signature: Optional[str] = None,  # CRYSTALS-Dilithium signature (base64)
+        pqc_public_key: Optional[str] = None,  # CRYSTALS-Kyber public key (base64)
+        pqc_algorithm: Optional[str] = None,  # "dilithium-3", "kyber-768", etc.
+        # Timestamps
+        created_at: datetime = _FACTORY,
+        updated_at: datetime = _FACTORY,
+        expires_at: Optional[datetime] = None,
+        # Impact assessment for deliberation layer
+        impact_score: Optional[float] = None,
+        # Performance tracking
+        performance_metrics: PerformanceMetrics = _FACTORY,
+    ) -> None:
+        self._message_id = message_id
+        self._conversation_id = conversation_id
+        self._content = content
+        self._payload = payload
+        self.from_agent = from_agent
+        self.to_agent = to_agent
+        self.sender_id = sender_id
+        self.message_type = message_type
+        self.routing = routing
+        self._headers = headers
+        self.tenant_id = tenant_id
+        self._security_context = security_context
+        self.priority = priority
+        self.status = status
+        self.constitutional_hash = constitutional_hash
+        self.constitutional_validated = constitutional_validated
+        self._metadata = metadata
+        self.pqc_signature = pqc_signature
+        self.pqc_public_key = pqc_public_key
+        self.pqc_algorithm = pqc_algorithm
+        if created_at is _FACTORY or updated_at is _FACTORY:
+            now = time.monotonic_ns()
+            if created_at is _FACTORY:
+                created_at = now
+            if updated_at is _FACTORY:
+                updated_at = now
+        self._created_at = created_at
+        self._updated_at = updated_at
+        self.expires_at = expires_at
+        self.impact_score = impact_score
+        self._performance_metrics = performance_metrics
+        self.__post_init__()
 
     def __post_init__(self) -> None:
         """Post-initialization validation."""
-        # Allow flexible constitutional hash for testing (can be overridden)
-        if hasattr(self, "_skip_validation") and self._skip_validation:
+        if self._skip_validation:
             return
         self.constitutional_validated = True
 
+    @property
+    def message_id(self) -> str:
+        """Unique message ID."""
+        value = self._message_id
+        if value is _FACTORY:
+            value = self._message_id = str(uuid.uuid4())
+        return value
+
+    @message_id.setter
+    def message_id(self, value: str) -> None:
+        self._message_id = value
+
+    @property
+    def conversation_id(self) -> str:
+        """Conversation ID."""
+        value = self._conversation_id
+        if value is _FACTORY:
+            value = self._conversation_id = str(uuid.uuid4())
+        return value
+
+    @conversation_id.setter
+    def conversation_id(self, value: str) -> None:
+        self._conversation_id = value
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time (UTC)."""
+        value = self._created_at
+        if value.__class__ is int:
+            if self._updated_at is value:
+                value = self._updated_at = _monotonic_to_datetime(value)
+            else:
+                value = _monotonic_to_datetime(value)
+            self._created_at = value
+        return value
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = value
+
+    @property
+    def updated_at(self) -> datetime:
+        """Last update time (UTC)."""
+        value = self._updated_at
+        if value.__class__ is int:
+            if self._created_at is value:
+                value = self._created_at = _monotonic_to_datetime(value)
+            else:
+                value = _monotonic_to_datetime(value)
+            self._updated_at = value
+        return value
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self._updated_at = value
+
+    content = _lazy_field("content", dict, "Message content")
+    payload = _lazy_field("payload", dict, "Message payload")
+    headers = _lazy_field("headers", dict, "Transport headers")
+    security_context = _lazy_field("security_context", dict, "Multi-tenant security context")
+    metadata = _lazy_field("metadata", dict, "Metadata and extra data")
+    performance_metrics = _lazy_field("performance_metrics", dict, "Performance tracking")
+
+    def _astuple(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()  # type: ignore[attr-defined]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"{self.__class__.__qualname__}({fields})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Monotonic readings are meaningless in another process, so persist datetimes
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def to_dict(self) -> JSONDict:
         """Convert message to dictionary."""
         return {
@@ -251,16 +470,16 @@ class AgentMessage:
     def from_dict(cls, data: JSONDict) -> "AgentMessage":
         """Create message from dictionary."""
         return cls(
-            message_id=data.get("message_id", str(uuid.uuid4())),
-            conversation_id=data.get("conversation_id", str(uuid.uuid4())),
-            content=data.get("content", {}),
+            message_id=data.get("message_id", _FACTORY),
+            conversation_id=data.get("conversation_id", _FACTORY),
+            content=data.get("content", _FACTORY),
             from_agent=data.get("from_agent", ""),
             to_agent=data.get("to_agent", ""),
             message_type=MessageType(data.get("message_type", "command")),
             tenant_id=data.get("tenant_id", ""),
             priority=Priority(data.get("priority", 1)),  # Default to MEDIUM/NORMAL
             status=MessageStatus(data.get("status", "pending")),
-            metadata=data.get("metadata", {}),
+            metadata=data.get("metadata", _FACTORY),
             pqc_signature=data.get("pqc_signature"),
             pqc_public_key=data.get("pqc_public_key"),
             pqc_algorithm=data.get("pqc_algorithm"),
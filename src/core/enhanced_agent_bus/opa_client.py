@@ -13,8 +13,10 @@ import logging
 import os
 import re
 import ssl
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
@@ -88,6 +90,212 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _policy_path_of(cache_key: str) -> str:
+    """Policy path of an ``opa:{policy_path}:{digest}`` cache key."""
+    return cache_key.split(":", 2)[1] if cache_key.startswith("opa:") else ""
+
+
+class DecisionCache(OrderedDict):
+    """
+    Size-bounded, LRU-ordered in-process cache of OPA decisions.
+
+    Entries are ``{"result": ..., "timestamp": <epoch seconds>}`` keyed by
+    ``opa:{policy_path}:{digest}``. The least recently used entry is evicted
+    once ``maxsize`` is exceeded. Keys are indexed by policy path, like the
+    ``opa:path_keys:{policy_path}`` sets kept in Redis, so invalidating a
+    path touches only its own keys.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        super().__init__()
+        self.maxsize = maxsize
+        self._path_keys: Dict[str, set] = {}
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        if key in self:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            return
+        super().__setitem__(key, value)
+        self._path_keys.setdefault(_policy_path_of(key), set()).add(key)
+        while len(self) > self.maxsize:
+            del self[next(iter(self))]
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        path = _policy_path_of(key)
+        keys = self._path_keys.get(path)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._path_keys[path]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            value = super().__getitem__(key)
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self, last: bool = True) -> Tuple[str, Any]:
+        if not self:
+            raise KeyError("popitem(): cache is empty")
+        key = next(reversed(self)) if last else next(iter(self))
+        return key, self.pop(key)
+
+    def clear(self) -> None:
+        super().clear()
+        self._path_keys.clear()
+
+    def get_fresh(self, key: str, ttl: float) -> Optional[Dict[str, Any]]:
+        """Return a non-expired result and mark it recently used."""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry["timestamp"] >= ttl:
+            del self[key]
+            return None
+        self.move_to_end(key)
+        return entry["result"]
+
+    def invalidate_path(self, policy_path: str) -> int:
+        """Drop every entry for ``policy_path``; returns the number removed."""
+        keys = self._path_keys.pop(policy_path, ())
+        for key in keys:
+            super().__delitem__(key)
+        return len(keys)
+
+
+class _BatchEndpointUnavailable(Exception):
+    """Raised when the OPA server has no batch evaluation endpoint."""
+
+
+class PolicyEvaluationBatcher:
+    """
+    Coalesces concurrent HTTP policy evaluations into batched requests.
+
+    Evaluations for the same policy path that arrive within ``window_ms`` of
+    the first are sent together, up to ``max_batch_size`` per request, to the
+    batch endpoint (``POST /v1/batch/data/{path}``). Results are fanned back
+    out to each caller. A per-input error, or a failed batch request, raises
+    in the affected callers exactly as a failed single request would, so
+    OPAClient's fail-closed handling is unchanged. If the server has no
+    batch endpoint, batching is switched off and pending inputs are
+    evaluated one at a time.
+    """
+
+    def __init__(self, client: "OPAClient", window_ms: float = 2.0, max_batch_size: int = 64):
+        self._client = client
+        self.window_seconds = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self.enabled = True
+        self._pending: Dict[str, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set = set()
+        self._stats = {"batches_sent": 0, "batched_evaluations": 0, "max_batch_size_seen": 0}
+
+    async def evaluate(self, input_data: Dict[str, Any], policy_path: str) -> Dict[str, Any]:
+        """Queue one evaluation and wait for its result."""
+        if not self.enabled:
+            return await self._client._evaluate_http(input_data, policy_path)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        pending = self._pending.setdefault(policy_path, [])
+        pending.append((input_data, future))
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(policy_path)
+        elif policy_path not in self._timers:
+            self._timers[policy_path] = loop.call_later(
+                self.window_seconds, self._flush, policy_path
+            )
+        return await future
+
+    def _flush(self, policy_path: str) -> None:
+        timer = self._timers.pop(policy_path, None)
+        if timer is not None:
+            timer.cancel()
+        items = [item for item in self._pending.pop(policy_path, []) if not item[1].done()]
+        if not items:
+            return
+        task = asyncio.ensure_future(self._dispatch(policy_path, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(
+        self, policy_path: str, items: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ) -> None:
+        if len(items) == 1:
+            input_data, future = items[0]
+            await self._settle(future, self._client._evaluate_http(input_data, policy_path))
+            return
+
+        try:
+            results = await self._client._evaluate_http_batch(
+                [input_data for input_data, _ in items], policy_path
+            )
+            if len(results) != len(items):
+                raise ValueError(
+                    f"OPA batch returned {len(results)} results for {len(items)} inputs"
+                )
+        except _BatchEndpointUnavailable:
+            logger.warning("OPA batch endpoint unavailable; disabling evaluation batching")
+            self.enabled = False
+            await asyncio.gather(
+                *(
+                    self._settle(future, self._client._evaluate_http(input_data, policy_path))
+                    for input_data, future in items
+                )
+            )
+            return
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self._stats["batches_sent"] += 1
+        self._stats["batched_evaluations"] += len(items)
+        self._stats["max_batch_size_seen"] = max(self._stats["max_batch_size_seen"], len(items))
+        for (_, future), result in zip(items, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    async def _settle(future: asyncio.Future, coro: Any) -> None:
+        try:
+            result = await coro
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Fail pending evaluations and wait for in-flight batches."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for items in self._pending.values():
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(OPANotInitializedError("HTTP policy evaluation"))
+        self._pending.clear()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"batching_enabled": self.enabled, **self._stats}
+
+
 class OPAClient:
     """
     Client for OPA (Open Policy Agent) policy evaluation.
@@ -105,12 +313,25 @@ class OPAClient:
         timeout: float = 5.0,
         cache_ttl: int = 300,  # 5 minutes
         enable_cache: bool = True,
+        cache_maxsize: int = 10000,
         redis_url: Optional[str] = None,
         ssl_verify: bool = True,
         ssl_cert: Optional[str] = None,
         ssl_key: Optional[str] = None,
+        enable_batching: bool = False,
+        batch_window_ms: float = 2.0,
+        max_batch_size: int = 64,
     ):
-        """Initialize OPA client."""
+        """Initialize OPA client.
+
+        Decisions are cached in Redis when available and otherwise in a
+        DecisionCache of at most ``cache_maxsize`` entries. Concurrent
+        evaluations of the same policy path and input share one evaluation.
+
+        With ``enable_batching``, concurrent HTTP evaluations of one policy
+        path are coalesced for up to ``batch_window_ms`` into requests of at
+        most ``max_batch_size`` inputs (see PolicyEvaluationBatcher).
+        """
         # Use settings defaults if not provided
         self.opa_url = opa_url or settings.opa.url
         self.opa_url = self.opa_url.rstrip("/")
@@ -127,8 +348,19 @@ class OPAClient:
         self._http_client: Optional[httpx.AsyncClient] = None
         self._redis_client: Optional[Any] = None
         self._embedded_opa: Optional[Any] = None
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        self._memory_cache = DecisionCache(maxsize=cache_maxsize)
+        # Single-flight: cache key -> in-progress evaluation
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Bumped on invalidation so in-flight results are not cached afterwards
+        self._cache_epoch = 0
+        self._path_epochs: Dict[str, int] = {}
+        self._coalesced_evaluations = 0
         self._lkg_bundle_path: Optional[str] = None
+        self._batcher: Optional[PolicyEvaluationBatcher] = (
+            PolicyEvaluationBatcher(self, batch_window_ms, max_batch_size)
+            if enable_batching
+            else None
+        )
 
         # Redis configuration
         self.redis_url = redis_url or get_redis_url(db=2)
@@ -198,6 +430,9 @@ class OPAClient:
 
     async def close(self) -> None:
         """Close all connections."""
+        if self._batcher:
+            await self._batcher.close()
+
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
@@ -208,11 +443,16 @@ class OPAClient:
 
         self._embedded_opa = None
         self._memory_cache.clear()
+        self._inflight.clear()
 
     def _generate_cache_key(self, policy_path: str, input_data: Dict[str, Any]) -> str:
         """Generate cache key."""
-        input_str = json.dumps(input_data, sort_keys=True)
-        input_hash = hashlib.sha256(input_str.encode()).hexdigest()[:16]
+        return self._cache_key_from_json(policy_path, json.dumps(input_data, sort_keys=True))
+
+    @staticmethod
+    def _cache_key_from_json(policy_path: str, input_json: str) -> str:
+        """Cache key for input already serialized with ``sort_keys=True``."""
+        input_hash = hashlib.sha256(input_json.encode()).hexdigest()[:16]
         return f"opa:{policy_path}:{input_hash}"
 
     async def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
@@ -228,15 +468,7 @@ class OPAClient:
             except Exception as e:
                 logger.warning(f"Redis cache read error: {e}")
 
-        if cache_key in self._memory_cache:
-            cached = self._memory_cache[cache_key]
-            now = datetime.now(timezone.utc).timestamp()
-            if now - cached["timestamp"] < self.cache_ttl:
-                return cached["result"]
-            else:
-                del self._memory_cache[cache_key]
-
-        return None
+        return self._memory_cache.get_fresh(cache_key, self.cache_ttl)
 
     async def _set_to_cache(self, cache_key: str, result: Dict[str, Any]) -> None:
         """Set result in cache."""
@@ -255,10 +487,7 @@ class OPAClient:
             except Exception as e:
                 logger.warning(f"Redis cache write error: {e}")
 
-        self._memory_cache[cache_key] = {
-            "result": result,
-            "timestamp": datetime.now(timezone.utc).timestamp(),
-        }
+        self._memory_cache[cache_key] = {"result": result, "timestamp": time.time()}
 
     async def clear_cache(self, policy_path: Optional[str] = None) -> None:
         """
@@ -273,6 +502,16 @@ class OPAClient:
 
         logger.info(f"Clearing OPA cache (path={policy_path or 'ALL'})")
 
+        # Evaluations already in flight must not repopulate the cache
+        if policy_path:
+            self._path_epochs[policy_path] = self._path_epochs.get(policy_path, 0) + 1
+            prefix = f"opa:{policy_path}:"
+            for key in [k for k in self._inflight if k.startswith(prefix)]:
+                del self._inflight[key]
+        else:
+            self._cache_epoch += 1
+            self._inflight.clear()
+
         if self._redis_client:
             try:
                 if policy_path:
@@ -296,11 +535,7 @@ class OPAClient:
                 logger.error(f"Failed to clear Redis cache: {e}")
 
         if policy_path:
-            # Clear specific path from memory
-            prefix = f"opa:{policy_path}:"
-            keys_to_del = [k for k in self._memory_cache if k.startswith(prefix)]
-            for k in keys_to_del:
-                del self._memory_cache[k]
+            self._memory_cache.invalidate_path(policy_path)
         else:
             self._memory_cache.clear()
 
@@ -308,24 +543,55 @@ class OPAClient:
         self, input_data: Dict[str, Any], policy_path: str = "data.acgs.allow"
     ) -> Dict[str, Any]:
         """Evaluate a policy."""
-        cache_key = self._generate_cache_key(policy_path, input_data)
+        try:
+            input_json = json.dumps(input_data, sort_keys=True)
+        except (TypeError, ValueError) as e:
+            return self._handle_evaluation_error(e, policy_path)
+
+        cache_key = self._cache_key_from_json(policy_path, input_json)
         cached_result = await self._get_from_cache(cache_key)
         if cached_result:
             return cached_result
 
+        # Single-flight: identical concurrent misses share one evaluation. The
+        # evaluation runs as its own task so a cancelled caller cannot cancel it
+        # for the others.
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._evaluate_uncached(input_data, policy_path, cache_key, len(input_json))
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda t: self._release_inflight(cache_key, t))
+        else:
+            self._coalesced_evaluations += 1
+        return await asyncio.shield(task)
+
+    def _release_inflight(self, cache_key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+
+    async def _evaluate_uncached(
+        self, input_data: Dict[str, Any], policy_path: str, cache_key: str, input_size: int
+    ) -> Dict[str, Any]:
+        """Evaluate a cache miss and cache the result unless invalidated meanwhile."""
         try:
             # SECURITY FIX (VULN-009): Strict input validation
             self._validate_policy_path(policy_path)
-            self._validate_input_data(input_data)
+            self._validate_input_data(input_data, input_size)
+            epoch = (self._cache_epoch, self._path_epochs.get(policy_path, 0))
 
-            if self.mode == "http":
+            if self.mode == "http" and self._batcher:
+                result = await self._batcher.evaluate(input_data, policy_path)
+            elif self.mode == "http":
                 result = await self._evaluate_http(input_data, policy_path)
             elif self.mode == "embedded":
                 result = await self._evaluate_embedded(input_data, policy_path)
             else:
                 result = await self._evaluate_fallback(input_data, policy_path)
 
-            await self._set_to_cache(cache_key, result)
+            if epoch == (self._cache_epoch, self._path_epochs.get(policy_path, 0)):
+                await self._set_to_cache(cache_key, result)
             return result
 
         except Exception as e:
@@ -340,9 +606,13 @@ class OPAClient:
         if ".." in policy_path:
             raise ValueError(f"Path traversal detected in policy path: {policy_path}")
 
-    def _validate_input_data(self, input_data: Dict[str, Any]) -> None:
+    def _validate_input_data(
+        self, input_data: Dict[str, Any], serialized_size: Optional[int] = None
+    ) -> None:
         """Validate input data size and structure (VULN-009)."""
-        if len(json.dumps(input_data)) > 1024 * 512:  # 512KB limit
+        if serialized_size is None:
+            serialized_size = len(json.dumps(input_data))
+        if serialized_size > 1024 * 512:  # 512KB limit
             raise ValueError("Input data exceeds maximum allowed size")
 
     def _sanitize_error(self, error: Exception) -> str:
@@ -383,39 +653,80 @@ class OPAClient:
             response.raise_for_status()
 
             data = response.json()
-            opa_result = data.get("result", False)
-
-            if isinstance(opa_result, bool):
-                return {
-                    "result": opa_result,
-                    "allowed": opa_result,
-                    "reason": "Policy evaluated successfully",
-                    "metadata": {"mode": "http", "policy_path": policy_path},
-                }
-            elif isinstance(opa_result, dict):
-                return {
-                    "result": opa_result,
-                    "allowed": opa_result.get("allow", False),
-                    "reason": opa_result.get("reason", "Success"),
-                    "metadata": {
-                        "mode": "http",
-                        "policy_path": policy_path,
-                        **opa_result.get("metadata", {}),
-                    },
-                }
-            else:
-                return {
-                    "result": False,
-                    "allowed": False,
-                    "reason": f"Unexpected result type: {type(opa_result)}",
-                    "metadata": {"mode": "http", "policy_path": policy_path},
-                }
+            return self._format_http_result(data.get("result", False), policy_path)
 
         except Exception as e:
             sanitized_error = self._sanitize_error(e)
             logger.error(f"OPA evaluation error: {sanitized_error}")
             raise
 
+    async def _evaluate_http_batch(
+        self, inputs: List[Dict[str, Any]], policy_path: str
+    ) -> List[Any]:
+        """
+        Evaluate several inputs against one policy in a single request.
+
+        Returns one entry per input, in order: the formatted result, or the
+        exception for an input the server could not evaluate.
+        """
+        if not self._http_client:
+            raise OPANotInitializedError("HTTP policy evaluation")
+
+        path_parts = policy_path.replace("data.", "").replace(".", "/")
+        url = f"{self.opa_url}/v1/batch/data/{path_parts}"
+        body = {"inputs": {str(i): input_data for i, input_data in enumerate(inputs)}}
+
+        try:
+            response = await self._http_client.post(url, json=body)
+            if response.status_code in (404, 405):
+                raise _BatchEndpointUnavailable(url)
+            # 207 Multi-Status: some inputs failed, reported per response
+            if response.status_code != 207:
+                response.raise_for_status()
+            responses = response.json().get("responses", {})
+        except _BatchEndpointUnavailable:
+            raise
+        except Exception as e:
+            logger.error(f"OPA batch evaluation error: {self._sanitize_error(e)}")
+            raise
+
+        results: List[Any] = []
+        for i in range(len(inputs)):
+            item = responses.get(str(i))
+            if not isinstance(item, dict) or "http_status_code" in item:
+                results.append(ValueError(f"No batch result for input {i}"))
+            else:
+                results.append(self._format_http_result(item.get("result", False), policy_path))
+        return results
+
+    def _format_http_result(self, opa_result: Any, policy_path: str) -> Dict[str, Any]:
+        """Build the evaluation response for an OPA HTTP ``result`` value."""
+        if isinstance(opa_result, bool):
+            return {
+                "result": opa_result,
+                "allowed": opa_result,
+                "reason": "Policy evaluated successfully",
+                "metadata": {"mode": "http", "policy_path": policy_path},
+            }
+        elif isinstance(opa_result, dict):
+            return {
+                "result": opa_result,
+                "allowed": opa_result.get("allow", False),
+                "reason": opa_result.get("reason", "Success"),
+                "metadata": {
+                    "mode": "http",
+                    "policy_path": policy_path,
+                    **opa_result.get("metadata", {}),
+                },
+            }
+        else:
+            return {
+                "result": False,
+                "allowed": False,
+                "reason": f"Unexpected result type: {type(opa_result)}",
+                "metadata": {"mode": "http", "policy_path": policy_path},
+            }
+
     async def _evaluate_embedded(
         self, input_data: Dict[str, Any], policy_path: str
     ) -> Dict[str, Any]:
@@ -653,10 +964,13 @@ class OPAClient:
             "mode": self.mode,
             "cache_enabled": self.enable_cache,
             "cache_size": len(self._memory_cache),
+            "cache_maxsize": self._memory_cache.maxsize,
+            "coalesced_evaluations": self._coalesced_evaluations,
             "cache_backend": "redis" if self._redis_client else "memory",
             "opa_url": self.opa_url if self.mode == "http" else None,
             "lkg_bundle": self._lkg_bundle_path,
             "fail_closed": self.fail_closed,
+            **(self._batcher.get_stats() if self._batcher else {}),
         }
 
 
@@ -698,7 +1012,9 @@ async def close_opa_client() -> None:
 
 
 __all__ = [
+    "DecisionCache",
     "OPAClient",
+    "PolicyEvaluationBatcher",
     "get_opa_client",
     "initialize_opa_client",
     "close_opa_client",
@@ -7,7 +7,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 try:
     from core.shared.types import AgentInfo, JSONDict, JSONValue, MetadataDict
@@ -95,9 +95,104 @@ DEFAULT_REDIS_SOCKET_TIMEOUT = 5.0
 DEFAULT_REDIS_SOCKET_CONNECT_TIMEOUT = 5.0
 
 
+def _index_terms(info: AgentInfo) -> Tuple[List[str], Any, Any]:
+    """Extract (capabilities, agent type, tenant) from registry or bus agent info."""
+    meta = info.get("metadata") or {}
+    caps = info.get("capabilities") or []
+    agent_type = info.get("agent_type") or meta.get("type") or meta.get("agent_type")
+    tenant = info.get("tenant_id") or meta.get("tenant_id")
+    return [c for c in caps if isinstance(c, str)], agent_type, tenant
+
+
+class AgentIndex:
+    """In-memory inverted index of agents by capability, type and tenant.
+
+    Postings are insertion-ordered, so lookups return agents in registration
+    order, matching the linear scans they replace.
+    """
+
+    def __init__(self) -> None:
+        self._by_capability: Dict[str, Dict[str, None]] = {}
+        self._by_type: Dict[Any, Dict[str, None]] = {}
+        self._by_tenant: Dict[Any, Dict[str, None]] = {}
+        self._terms: Dict[str, Tuple[List[str], Any, Any]] = {}
+
+    @staticmethod
+    def _post(postings: Dict[Any, Dict[str, None]], term: Any, agent_id: str) -> None:
+        if term is not None:
+            postings.setdefault(term, {})[agent_id] = None
+
+    @staticmethod
+    def _unpost(postings: Dict[Any, Dict[str, None]], term: Any, agent_id: str) -> None:
+        if term is not None and term in postings:
+            postings[term].pop(agent_id, None)
+            if not postings[term]:
+                del postings[term]
+
+    def add(self, agent_id: str, info: AgentInfo) -> None:
+        """Index (or re-index) an agent from its info dict."""
+        self.remove(agent_id)
+        caps, agent_type, tenant = terms = _index_terms(info)
+        for cap in caps:
+            self._post(self._by_capability, cap, agent_id)
+        self._post(self._by_type, agent_type, agent_id)
+        self._post(self._by_tenant, tenant, agent_id)
+        self._terms[agent_id] = terms
+
+    def remove(self, agent_id: str) -> None:
+        terms = self._terms.pop(agent_id, None)
+        if terms is None:
+            return
+        caps, agent_type, tenant = terms
+        for cap in caps:
+            self._unpost(self._by_capability, cap, agent_id)
+        self._unpost(self._by_type, agent_type, agent_id)
+        self._unpost(self._by_tenant, tenant, agent_id)
+
+    def clear(self) -> None:
+        self._by_capability.clear()
+        self._by_type.clear()
+        self._by_tenant.clear()
+        self._terms.clear()
+
+    def find_by_capabilities(
+        self, capabilities: Iterable[str], limit: Optional[int] = None
+    ) -> List[str]:
+        """Agents holding every capability (set intersection, smallest posting first)."""
+        postings = []
+        for cap in set(capabilities):
+            posting = self._by_capability.get(cap)
+            if not posting:
+                return []
+            postings.append(posting)
+        if not postings:
+            return []
+        postings.sort(key=len)
+        smallest, others = postings[0], postings[1:]
+        if limit is None:
+            common = smallest.keys() & others[0].keys() if others else smallest.keys()
+            for other in others[1:]:
+                common &= other.keys()
+            return [agent_id for agent_id in smallest if agent_id in common]
+        result = []
+        for agent_id in smallest:
+            if all(agent_id in other for other in others):
+                result.append(agent_id)
+                if len(result) >= limit:
+                    break
+        return result
+
+    def find_by_type(self, agent_type: Any) -> List[str]:
+        return list(self._by_type.get(agent_type, ()))
+
+    def find_by_tenant(self, tenant_id: Any) -> List[str]:
+        return list(self._by_tenant.get(tenant_id, ()))
+
+
 class InMemoryAgentRegistry:
     def __init__(self) -> None:
         self._agents: Dict[str, AgentInfo] = {}
+        self._index = AgentIndex()
         self._lock = asyncio.Lock()
         self._constitutional_hash = CONSTITUTIONAL_HASH
 
@@ -117,6 +212,7 @@ class InMemoryAgentRegistry:
                 "registered_at": datetime.now(timezone.utc).isoformat(),
                 "constitutional_hash": self._constitutional_hash,
             }
+            self._index.add(agent_id, self._agents[agent_id])
             return True
 
     async def unregister(self, agent_id: str) -> bool:
@@ -124,6 +220,7 @@ class InMemoryAgentRegistry:
             if agent_id not in self._agents:
                 return False
             del self._agents[agent_id]
+            self._index.remove(agent_id)
             return True
 
     async def get(self, agent_id: str) -> Optional[AgentInfo]:
@@ -144,11 +241,28 @@ class InMemoryAgentRegistry:
                 return False
             self._agents[agent_id]["metadata"].update(metadata)
             self._agents[agent_id]["updated_at"] = datetime.now(timezone.utc).isoformat()
+            self._index.add(agent_id, self._agents[agent_id])
             return True
 
     async def clear(self) -> None:
         async with self._lock:
             self._agents.clear()
+            self._index.clear()
+
+    async def find_by_capabilities(
+        self, capabilities: List[str], limit: Optional[int] = None
+    ) -> List[str]:
+        """Agents holding all of the given capabilities, in registration order."""
+        async with self._lock:
+            return self._index.find_by_capabilities(capabilities, limit)
+
+    async def find_by_type(self, agent_type: str) -> List[str]:
+        async with self._lock:
+            return self._index.find_by_type(agent_type)
+
+    async def find_by_tenant(self, tenant_id: str) -> List[str]:
+        async with self._lock:
+            return self._index.find_by_tenant(tenant_id)
 
     @property
     def agent_count(self) -> int:
@@ -156,6 +270,13 @@ class InMemoryAgentRegistry:
 
 
 class RedisAgentRegistry:
+    """Agent registry stored in a Redis hash.
+
+    The capability/type/tenant index is mirrored as Redis sets under
+    ``{key_prefix}:idx:*`` and maintained on register/unregister/update, so
+    capability routing is a single SINTER instead of one HGET per agent.
+    """
+
     def __init__(
         self,
         redis_url: str,
@@ -172,6 +293,7 @@ class RedisAgentRegistry:
         self._socket_timeout, self._socket_connect_timeout = socket_timeout, socket_connect_timeout
         self._constitutional_hash = CONSTITUTIONAL_HASH
         self._redis = self._pool = None
+        self._index_built = False
 
     async def _get_client(self) -> Any:
         try:
@@ -200,11 +322,97 @@ class RedisAgentRegistry:
             "registered_at": datetime.now(timezone.utc).isoformat(),
             "constitutional_hash": self._constitutional_hash,
         }
-        return bool(await client.hsetnx(self._key_prefix, aid, json.dumps(info)))
+        keys = self._index_keys(info)
+
+        async def claim(pipe: Any) -> bool:
+            if await pipe.hexists(self._key_prefix, aid):
+                return False
+            pipe.multi()
+            pipe.hsetnx(self._key_prefix, aid, json.dumps(info))
+            self._queue_index_add(pipe, aid, keys)
+            return True
+
+        return bool(await self._transaction(client, claim))
+
+    def _cap_key(self, cap: str) -> str:
+        return f"{self._key_prefix}:idx:cap:{cap}"
+
+    def _type_key(self, agent_type: str) -> str:
+        return f"{self._key_prefix}:idx:type:{agent_type}"
+
+    def _tenant_key(self, tenant_id: str) -> str:
+        return f"{self._key_prefix}:idx:tenant:{tenant_id}"
+
+    def _index_keys(self, info: AgentInfo) -> List[str]:
+        caps, agent_type, tenant = _index_terms(info)
+        keys = [self._cap_key(c) for c in caps]
+        if agent_type is not None:
+            keys.append(self._type_key(agent_type))
+        if tenant is not None:
+            keys.append(self._tenant_key(tenant))
+        return keys
+
+    def _queue_index_add(self, pipe: Any, aid: str, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if keys:
+            pipe.sadd(f"{self._key_prefix}:idx", *keys)
+            for key in keys:
+                pipe.sadd(key, aid)
+
+    def _queue_index_remove(self, pipe: Any, aid: str, keys: Iterable[str]) -> None:
+        for key in keys:
+            pipe.srem(key, aid)
+
+    async def _transaction(self, client: Any, func: Any) -> Any:
+        """Run func(pipe) as MULTI/EXEC under WATCH on the agents hash.
+
+        func reads through the pipeline, calls pipe.multi() and queues its
+        writes; the transaction is retried if the hash changes in between, so
+        index sets never diverge from a concurrent register/unregister.
+        """
+        return await client.transaction(func, self._key_prefix, value_from_callable=True)
+
+    async def rebuild_index(self) -> None:
+        """Rebuild the capability/type/tenant sets from the agents hash.
+
+        Runs once per registry before the first index lookup, so agents
+        registered before the index existed (or by older writers) are routable.
+        """
+        client = await self._get_client()
+
+        async def rebuild(pipe: Any) -> None:
+            agents = await pipe.hgetall(self._key_prefix)
+            stale = await pipe.smembers(f"{self._key_prefix}:idx")
+            pipe.multi()
+            if stale:
+                pipe.delete(*stale, f"{self._key_prefix}:idx")
+            for aid, data in agents.items():
+                self._queue_index_add(pipe, aid, self._index_keys(json.loads(data)))
+            pipe.set(f"{self._key_prefix}:idx:built", 1)
+
+        await self._transaction(client, rebuild)
+        self._index_built = True
+
+    async def _ensure_index(self, client: Any) -> None:
+        if not self._index_built:
+            if await client.exists(f"{self._key_prefix}:idx:built"):
+                self._index_built = True
+            else:
+                await self.rebuild_index()
 
     async def unregister(self, aid: str) -> bool:
         client = await self._get_client()
-        return bool(await client.hdel(self._key_prefix, aid) > 0)
+
+        async def drop(pipe: Any) -> bool:
+            data = await pipe.hget(self._key_prefix, aid)
+            if not data:
+                return False
+            pipe.multi()
+            pipe.hdel(self._key_prefix, aid)
+            self._queue_index_remove(pipe, aid, self._index_keys(json.loads(data)))
+            return True
+
+        return bool(await self._transaction(client, drop))
 
     async def get(self, aid: str) -> Optional[AgentInfo]:
         client = await self._get_client()
@@ -221,18 +429,62 @@ class RedisAgentRegistry:
 
     async def update_metadata(self, aid: str, meta: MetadataDict) -> bool:
         client = await self._get_client()
-        data = await client.hget(self._key_prefix, aid)
-        if not data:
-            return False
-        info = json.loads(data)
-        info["metadata"].update(meta)
-        info["updated_at"] = datetime.now(timezone.utc).isoformat()
-        await client.hset(self._key_prefix, aid, json.dumps(info))
-        return True
+
+        async def update(pipe: Any) -> bool:
+            data = await pipe.hget(self._key_prefix, aid)
+            if not data:
+                return False
+            info = json.loads(data)
+            old_keys = set(self._index_keys(info))
+            info["metadata"].update(meta)
+            info["updated_at"] = datetime.now(timezone.utc).isoformat()
+            new_keys = set(self._index_keys(info))
+            pipe.multi()
+            pipe.hset(self._key_prefix, aid, json.dumps(info))
+            self._queue_index_remove(pipe, aid, sorted(old_keys - new_keys))
+            self._queue_index_add(pipe, aid, sorted(new_keys - old_keys))
+            return True
+
+        return bool(await self._transaction(client, update))
 
     async def clear(self) -> None:
         client = await self._get_client()
+        index_keys = await client.smembers(f"{self._key_prefix}:idx")
+        if index_keys:
+            await client.delete(*index_keys, f"{self._key_prefix}:idx")
+        await client.delete(f"{self._key_prefix}:idx:built")
         await client.delete(self._key_prefix)
+        self._index_built = False
+
+    async def find_by_capabilities(
+        self, capabilities: List[str], limit: Optional[int] = None
+    ) -> List[str]:
+        """Agents holding all of the given capabilities, sorted by agent id.
+
+        Redis hash and set order is not stable, so results are ordered by agent
+        id to keep routing deterministic: route() picks the lowest matching id.
+        """
+        client = await self._get_client()
+        await self._ensure_index(client)
+        keys = [self._cap_key(c) for c in dict.fromkeys(capabilities)]
+        if not keys:
+            return []
+        if len(keys) == 1:
+            if limit is None:
+                return list(await client.sort(keys[0], alpha=True))
+            return list(await client.sort(keys[0], start=0, num=limit, alpha=True))
+        members = sorted(await client.sinter(keys))
+        return members[:limit] if limit is not None else members
+
+    async def find_by_type(self, agent_type: str) -> List[str]:
+        client = await self._get_client()
+        await self._ensure_index(client)
+        return sorted(await client.smembers(self._type_key(agent_type)))
+
+    async def find_by_tenant(self, tenant_id: str) -> List[str]:
+        client = await self._get_client()
+        await self._ensure_index(client)
+        return sorted(await client.smembers(self._tenant_key(tenant_id)))
 
     async def close(self) -> None:
         if self._redis:
@@ -282,6 +534,10 @@ class CapabilityBasedRouter:
         req = msg.content.get("required_capabilities", []) if isinstance(msg.content, dict) else []
         if not req:
             return None
+        find = getattr(reg, "find_by_capabilities", None)
+        if find is not None:
+            found = await find(req, limit=1)
+            return found[0] if found else None
         for aid in await reg.list_agents():
             info = await reg.get(aid)
             if info and all(c in info.get("capabilities", {}) for c in req):
@@ -297,6 +553,10 @@ class CapabilityBasedRouter:
         )
         if msg.from_agent:
             ex.add(msg.from_agent)
+        find = getattr(reg, "find_by_capabilities", None)
+        if find is not None:
+            candidates = await find(req) if req else await reg.list_agents()
+            return [aid for aid in candidates if aid not in ex]
         res = []
         for aid in await reg.list_agents():
             if aid in ex:
@@ -308,6 +568,7 @@ class CapabilityBasedRouter:
 
 
 __all__ = [
+    "AgentIndex",
     "InMemoryAgentRegistry",
     "RedisAgentRegistry",
     "DirectMessageRouter",
@@ -14,9 +14,9 @@ Unified runtime security scanning and validation that aggregates all security fe
 
 import asyncio
 import logging
-import re
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -41,15 +41,27 @@ try:
         RuntimeSafetyGuardrails,
         RuntimeSafetyGuardrailsConfig,
     )
+    from .security.content_inspector import (
+        PROMPT_INJECTION,
+        SUSPICIOUS_PATTERN,
+        SUSPICIOUS_PATTERN_RULES,
+        ContentInspection,
+        get_content_inspector,
+    )
     from .security.tenant_validator import TenantValidator
-    from .security_helpers import detect_prompt_injection
     from .validators import validate_constitutional_hash
 except ImportError:
     # Fallback for standalone usage
-    detect_prompt_injection = None  # type: ignore
     TenantValidator = None  # type: ignore
     RuntimeSafetyGuardrails = None  # type: ignore
     RuntimeSafetyGuardrailsConfig = None  # type: ignore
+    from security.content_inspector import (  # type: ignore
+        PROMPT_INJECTION,
+        SUSPICIOUS_PATTERN,
+        SUSPICIOUS_PATTERN_RULES,
+        ContentInspection,
+        get_content_inspector,
+    )
     from validators import validate_constitutional_hash  # type: ignore
 
     get_constitutional_classifier = None  # type: ignore
@@ -125,6 +137,9 @@ class SecurityScanResult:
     checks_performed: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     constitutional_hash: str = CONSTITUTIONAL_HASH
+    # False when the outcome reflects a transient condition (check errors,
+    # slow guardrails) rather than a verdict on the content itself
+    cacheable: bool = True
 
     def add_event(self, event: SecurityEvent) -> None:
         """Add a security event to the result."""
@@ -169,6 +184,10 @@ class RuntimeSecurityConfig:
     # Thresholds
     rate_limit_qps: int = 100
     rate_limit_burst: int = 200
+    rate_limit_window_buckets: int = 10
+    rate_limit_shards: int = 64
+    rate_limit_idle_seconds: float = 60.0
+    rate_limit_max_keys: int = 100000
     max_input_length: int = 100000
     max_nested_depth: int = 50
     constitutional_classifier_threshold: float = 0.85
@@ -185,6 +204,135 @@ class RuntimeSecurityConfig:
     fail_closed: bool = True
 
 
+class ShardedRateCounter:
+    """
+    Fixed-memory sliding-window request counter, sharded by key.
+
+    Each key owns a ring of ``buckets`` sub-window counts covering
+    ``window_seconds`` plus a running total, so recording a request and
+    reading the current rate cost O(buckets) worst case and O(1) amortized.
+    Every operation is synchronous and therefore atomic on the event loop;
+    no lock is taken. Shards keep keys in least-recently-used order, so when
+    a new key is inserted idle keys are evicted from the front in O(1)
+    amortized time and each shard stays within ``max_keys // shards`` keys.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 1.0,
+        buckets: int = 10,
+        shards: int = 64,
+        idle_seconds: float = 60.0,
+        max_keys: int = 100000,
+    ):
+        self._buckets = max(1, buckets)
+        self._bucket_width = window_seconds / self._buckets
+        self._idle_ticks = max(self._buckets, int(idle_seconds / self._bucket_width))
+        self._shards: List[OrderedDict] = [OrderedDict() for _ in range(max(1, shards))]
+        self._max_keys_per_shard = max(1, max_keys // len(self._shards))
+
+    def hit(self, key: str, now: Optional[float] = None) -> int:
+        """
+        Record one request for ``key``.
+
+        Returns:
+            Number of requests already recorded for ``key`` in the window
+        """
+        tick = int((time.monotonic() if now is None else now) / self._bucket_width)
+        buckets = self._buckets
+        shard = self._shards[hash(key) % len(self._shards)]
+
+        # State layout: [last_tick, total, count_0 .. count_{buckets-1}]
+        state = shard.get(key)
+        if state is None:
+            # Memory only grows on insert, so that is the only place to evict
+            self._evict(shard, tick)
+            state = [tick, 0] + [0] * buckets
+            shard[key] = state
+        else:
+            shard.move_to_end(key)
+            if tick > state[0]:
+                self._advance(state, tick)
+
+        current = state[1]
+        state[2 + tick % buckets] += 1
+        state[1] = current + 1
+        return current
+
+    def count(self, key: str, now: Optional[float] = None) -> int:
+        """Number of requests recorded for ``key`` in the current window."""
+        state = self._shards[hash(key) % len(self._shards)].get(key)
+        if state is None:
+            return 0
+        tick = int((time.monotonic() if now is None else now) / self._bucket_width)
+        self._advance(state, tick)
+        return state[1]
+
+    def _advance(self, state: List[int], tick: int) -> None:
+        """Zero the buckets that slid out of the window since the last update."""
+        last_tick = state[0]
+        if tick <= last_tick:
+            return
+        buckets = self._buckets
+        if tick - last_tick >= buckets:
+            state[1:] = [0] * (buckets + 1)
+        else:
+            for t in range(last_tick + 1, tick + 1):
+                idx = 2 + t % buckets
+                state[1] -= state[idx]
+                state[idx] = 0
+        state[0] = tick
+
+    def _evict(self, shard: OrderedDict, tick: int) -> None:
+        """Drop idle keys and make room for one more key under the shard cap."""
+        while shard:
+            oldest = next(iter(shard.values()))
+            if len(shard) < self._max_keys_per_shard and tick - oldest[0] <= self._idle_ticks:
+                break
+            shard.popitem(last=False)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+class _BatchAnomalyCounts:
+    """
+    Recent-event counts per (tenant, agent) for one batch scan.
+
+    Counts start from the scanner's stored events and include the events of
+    every item already scanned in the batch, so anomaly detection sees a
+    burst inside a batch exactly as it would across sequential scans.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[tuple, int] = {}
+        self._events: List[SecurityEvent] = []
+
+    @staticmethod
+    def _matches(event: SecurityEvent, key: tuple) -> bool:
+        tenant_id, agent_id = key
+        return event.tenant_id == tenant_id and (agent_id is None or event.agent_id == agent_id)
+
+    def get(self, key: tuple) -> Optional[int]:
+        return self._counts.get(key)
+
+    def start(self, key: tuple, stored_count: int) -> int:
+        """Start counting a key from its stored-event count, adding earlier batch events."""
+        count = stored_count + sum(1 for e in self._events if self._matches(e, key))
+        self._counts[key] = count
+        return count
+
+    def record(self, events: List[SecurityEvent]) -> None:
+        """Count the events of a scanned item towards every later item."""
+        self._events.extend(events)
+        for key in self._counts:
+            self._counts[key] += sum(1 for e in events if self._matches(e, key))
+
+
 class RuntimeSecurityScanner:
     """
     Unified runtime security scanner for ACGS-2.
@@ -205,21 +353,7 @@ class RuntimeSecurityScanner:
     """
 
     # Additional suspicious patterns beyond prompt injection
-    SUSPICIOUS_PATTERNS = [
-        r"<script[^>]*>",  # XSS attempts
-        r"javascript:",  # JavaScript protocol
-        r"on\w+\s*=",  # Event handlers
-        r"(?:union|select|insert|update|delete|drop)\s+",  # SQL injection
-        r"\.\./",  # Path traversal
-        r"\\x[0-9a-fA-F]{2}",  # Hex escapes
-        r"\\u[0-9a-fA-F]{4}",  # Unicode escapes used maliciously
-        r"base64_decode",  # Base64 decode attempts
-        r"eval\s*\(",  # Eval calls
-        r"exec\s*\(",  # Exec calls
-        r"__import__",  # Python import injection
-        r"subprocess\.",  # Subprocess access
-        r"os\.system",  # OS command execution
-    ]
+    SUSPICIOUS_PATTERNS = [pattern for pattern, _ in SUSPICIOUS_PATTERN_RULES]
 
     def __init__(self, config: Optional[RuntimeSecurityConfig] = None):
         """
@@ -229,9 +363,15 @@ class RuntimeSecurityScanner:
             config: Security configuration (uses defaults if not provided)
         """
         self.config = config or RuntimeSecurityConfig()
-        self._compiled_patterns = [re.compile(p, re.IGNORECASE) for p in self.SUSPICIOUS_PATTERNS]
+        self._inspector = get_content_inspector()
         self._event_buffer: List[SecurityEvent] = []
-        self._rate_counters: Dict[str, List[float]] = {}
+        self._rate_counter = ShardedRateCounter(
+            window_seconds=1.0,
+            buckets=self.config.rate_limit_window_buckets,
+            shards=self.config.rate_limit_shards,
+            idle_seconds=self.config.rate_limit_idle_seconds,
+            max_keys=self.config.rate_limit_max_keys,
+        )
         self._lock = asyncio.Lock()
 
         # Metrics
@@ -250,6 +390,7 @@ class RuntimeSecurityScanner:
         agent_id: Optional[str] = None,
         constitutional_hash: Optional[str] = None,
         context: Optional[JSONDict] = None,
+        content_result: Optional[SecurityScanResult] = None,
     ) -> SecurityScanResult:
         """
         Perform comprehensive security scan on content.
@@ -260,10 +401,94 @@ class RuntimeSecurityScanner:
             agent_id: Agent identifier for tracking
             constitutional_hash: Constitutional hash to validate
             context: Additional context for scanning
+            content_result: Previously computed result of ``scan_content_checks``
+                for the same content, tenant, agent and hash. When given, the
+                content checks are skipped and only the stateful checks run.
 
         Returns:
             SecurityScanResult with scan results and any events
         """
+        result = await self._scan_one(
+            content, tenant_id, agent_id, constitutional_hash, context, content_result
+        )
+
+        # Store events
+        await self._store_events(result.events)
+
+        return result
+
+    async def scan_batch(self, items: List[JSONDict]) -> List[SecurityScanResult]:
+        """
+        Perform security scans on a batch of payloads.
+
+        Each item is a mapping accepting the same keyword arguments as ``scan``
+        (``content``, ``tenant_id``, ``agent_id``, ``constitutional_hash``,
+        ``context``, ``content_result``). Stateful checks still run per item; security events for
+        the whole batch are stored under a single lock acquisition, and the
+        runtime guardrails instance is shared by every item in the batch.
+        Anomaly detection counts the events of earlier items in the batch, as
+        if each item had been scanned and stored on its own.
+
+        Args:
+            items: Scan requests
+
+        Returns:
+            List of SecurityScanResult in input order
+        """
+        guardrails = (
+            RuntimeSafetyGuardrails(RuntimeSafetyGuardrailsConfig())
+            if self.config.enable_runtime_guardrails and RuntimeSafetyGuardrails
+            else None
+        )
+        anomaly_counts = _BatchAnomalyCounts()
+        results = []
+        for item in items:
+            result = await self._scan_one(
+                **item, guardrails=guardrails, anomaly_counts=anomaly_counts
+            )
+            anomaly_counts.record(result.events)
+            results.append(result)
+        await self._store_events([event for result in results for event in result.events])
+        return results
+
+    async def scan_content_checks(
+        self,
+        content: Any,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        constitutional_hash: Optional[str] = None,
+        context: Optional[JSONDict] = None,
+    ) -> SecurityScanResult:
+        """
+        Run only the pure content checks, without metrics or event storage.
+
+        The outcome depends only on the arguments, so callers may cache it and
+        pass it back to ``scan`` as ``content_result``. Results with
+        ``cacheable`` unset reflect a transient failure and should not be
+        reused. Other errors propagate to the caller instead of being
+        converted into a fail-closed result.
+
+        Returns:
+            SecurityScanResult containing content check events only
+        """
+        result = SecurityScanResult()
+        await self._run_content_checks(
+            result, content, tenant_id, agent_id, constitutional_hash, context or {}
+        )
+        return result
+
+    async def _scan_one(
+        self,
+        content: Any,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        constitutional_hash: Optional[str] = None,
+        context: Optional[JSONDict] = None,
+        content_result: Optional[SecurityScanResult] = None,
+        guardrails: Optional[Any] = None,
+        anomaly_counts: Optional[_BatchAnomalyCounts] = None,
+    ) -> SecurityScanResult:
+        """Run all configured checks for one payload without storing events."""
         start_time = time.monotonic()
         result = SecurityScanResult()
         context = context or {}
@@ -272,51 +497,14 @@ class RuntimeSecurityScanner:
             # Track scan
             self._total_scans += 1
 
-            # 1. Constitutional hash validation
-            if self.config.enable_constitutional_validation and constitutional_hash:
-                result.checks_performed.append("constitutional_hash_validation")
-                await self._check_constitutional_hash(
-                    result, constitutional_hash, tenant_id, agent_id
+            if content_result is None:
+                await self._run_content_checks(
+                    result, content, tenant_id, agent_id, constitutional_hash, context, guardrails
                 )
+            else:
+                self._apply_content_result(result, content_result)
 
-            # 2. Tenant validation
-            if self.config.enable_tenant_validation and tenant_id is not None:
-                result.checks_performed.append("tenant_validation")
-                await self._check_tenant(result, tenant_id, agent_id)
-
-            # 3. Rate limiting
-            if self.config.enable_rate_limit_check:
-                result.checks_performed.append("rate_limit_check")
-                await self._check_rate_limit(result, tenant_id, agent_id)
-
-            # 4. Input sanitization and validation
-            if self.config.enable_input_sanitization:
-                result.checks_performed.append("input_sanitization")
-                await self._check_input(result, content, tenant_id, agent_id)
-
-            # 5. Prompt injection detection
-            if self.config.enable_prompt_injection_detection:
-                result.checks_performed.append("prompt_injection_detection")
-                await self._check_prompt_injection(result, content, tenant_id, agent_id)
-
-            # 6. Suspicious pattern detection
-            result.checks_performed.append("suspicious_pattern_detection")
-            await self._check_suspicious_patterns(result, content, tenant_id, agent_id)
-
-            # 7. Anomaly detection
-            if self.config.enable_anomaly_detection:
-                result.checks_performed.append("anomaly_detection")
-                await self._check_anomalies(result, tenant_id, agent_id)
-
-            # 8. Constitutional classification (Phase 2 Breakthrough)
-            if self.config.enable_constitutional_classifier:
-                result.checks_performed.append("constitutional_classification")
-                await self._check_constitutional_compliance(result, content, tenant_id, agent_id)
-
-            # 9. Runtime Safety Guardrails (OWASP 6-layer protection)
-            if self.config.enable_runtime_guardrails and RuntimeSafetyGuardrails:
-                result.checks_performed.append("runtime_safety_guardrails")
-                await self._check_runtime_guardrails(result, content, context, tenant_id, agent_id)
+            await self._run_stateful_checks(result, tenant_id, agent_id, anomaly_counts)
 
         except Exception as e:
             logger.error(f"Security scan error: {e}")
@@ -333,11 +521,95 @@ class RuntimeSecurityScanner:
             self._blocked_requests += 1
         self._events_detected += len(result.events)
 
-        # Store events
-        await self._store_events(result.events)
-
         return result
 
+    async def _run_content_checks(
+        self,
+        result: SecurityScanResult,
+        content: Any,
+        tenant_id: Optional[str],
+        agent_id: Optional[str],
+        constitutional_hash: Optional[str],
+        context: JSONDict,
+        guardrails: Optional[Any] = None,
+    ) -> None:
+        """Run the checks whose outcome depends only on their inputs."""
+        # Serialize and pattern-match the content once for all content checks
+        inspection = self._inspector.inspect(content)
+
+        # 1. Constitutional hash validation
+        if self.config.enable_constitutional_validation and constitutional_hash:
+            result.checks_performed.append("constitutional_hash_validation")
+            await self._check_constitutional_hash(result, constitutional_hash, tenant_id, agent_id)
+
+        # 2. Tenant validation
+        if self.config.enable_tenant_validation and tenant_id is not None:
+            result.checks_performed.append("tenant_validation")
+            await self._check_tenant(result, tenant_id, agent_id)
+
+        # 3. Input sanitization and validation
+        if self.config.enable_input_sanitization:
+            result.checks_performed.append("input_sanitization")
+            await self._check_input(result, content, tenant_id, agent_id, inspection)
+
+        # 4. Prompt injection detection
+        if self.config.enable_prompt_injection_detection:
+            result.checks_performed.append("prompt_injection_detection")
+            await self._check_prompt_injection(result, content, tenant_id, agent_id, inspection)
+
+        # 5. Suspicious pattern detection
+        result.checks_performed.append("suspicious_pattern_detection")
+        await self._check_suspicious_patterns(result, content, tenant_id, agent_id, inspection)
+
+        # 6. Constitutional classification (Phase 2 Breakthrough)
+        if self.config.enable_constitutional_classifier:
+            result.checks_performed.append("constitutional_classification")
+            await self._check_constitutional_compliance(
+                result, inspection.text, tenant_id, agent_id
+            )
+
+        # 7. Runtime Safety Guardrails (OWASP 6-layer protection)
+        if self.config.enable_runtime_guardrails and RuntimeSafetyGuardrails:
+            result.checks_performed.append("runtime_safety_guardrails")
+            await self._check_runtime_guardrails(
+                result, content, context, tenant_id, agent_id, guardrails
+            )
+
+    async def _run_stateful_checks(
+        self,
+        result: SecurityScanResult,
+        tenant_id: Optional[str],
+        agent_id: Optional[str],
+        anomaly_counts: Optional[_BatchAnomalyCounts] = None,
+    ) -> None:
+        """Run the checks that depend on scanner state and must see every message."""
+        # 8. Rate limiting
+        if self.config.enable_rate_limit_check:
+            result.checks_performed.append("rate_limit_check")
+            await self._check_rate_limit(result, tenant_id, agent_id)
+
+        # 9. Anomaly detection
+        if self.config.enable_anomaly_detection:
+            result.checks_performed.append("anomaly_detection")
+            await self._check_anomalies(result, tenant_id, agent_id, anomaly_counts)
+
+    @staticmethod
+    def _apply_content_result(
+        result: SecurityScanResult, content_result: SecurityScanResult
+    ) -> None:
+        """Copy a cached content check outcome into a fresh result."""
+        now = datetime.now(timezone.utc)
+        # Re-stamp events so they count towards the current anomaly window
+        for event in content_result.events:
+            result.add_event(replace(event, timestamp=now))
+        result.checks_performed.extend(content_result.checks_performed)
+        result.warnings.extend(content_result.warnings)
+        if not content_result.is_secure:
+            result.is_secure = False
+        if content_result.blocked:
+            result.blocked = True
+            result.block_reason = content_result.block_reason
+
     async def _check_constitutional_hash(
         self,
         result: SecurityScanResult,
@@ -389,35 +661,23 @@ class RuntimeSecurityScanner:
     ) -> None:
         """Check rate limiting."""
         key = f"{tenant_id or 'global'}:{agent_id or 'unknown'}"
-        now = time.monotonic()
-
-        async with self._lock:
-            if key not in self._rate_counters:
-                self._rate_counters[key] = []
 
-            # Clean old entries
-            window_start = now - 1.0  # 1 second window
-            self._rate_counters[key] = [t for t in self._rate_counters[key] if t > window_start]
-
-            # Check rate
-            current_rate = len(self._rate_counters[key])
-            if current_rate >= self.config.rate_limit_qps:
-                event = SecurityEvent(
-                    event_type=SecurityEventType.RATE_LIMIT_EXCEEDED,
-                    severity=SecuritySeverity.MEDIUM,
-                    message=f"Rate limit exceeded: {current_rate} QPS",
-                    tenant_id=tenant_id,
-                    agent_id=agent_id,
-                    metadata={
-                        "current_rate": current_rate,
-                        "limit": self.config.rate_limit_qps,
-                    },
-                )
-                result.add_event(event)
-                result.warnings.append(f"Rate limit exceeded: {current_rate} QPS")
-
-            # Record this request
-            self._rate_counters[key].append(now)
+        # Records this request and returns the count seen in the last second
+        current_rate = self._rate_counter.hit(key)
+        if current_rate >= self.config.rate_limit_qps:
+            event = SecurityEvent(
+                event_type=SecurityEventType.RATE_LIMIT_EXCEEDED,
+                severity=SecuritySeverity.MEDIUM,
+                message=f"Rate limit exceeded: {current_rate} QPS",
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                metadata={
+                    "current_rate": current_rate,
+                    "limit": self.config.rate_limit_qps,
+                },
+            )
+            result.add_event(event)
+            result.warnings.append(f"Rate limit exceeded: {current_rate} QPS")
 
     async def _check_input(
         self,
@@ -425,12 +685,15 @@ class RuntimeSecurityScanner:
         content: Any,
         tenant_id: Optional[str],
         agent_id: Optional[str],
+        inspection: Optional[ContentInspection] = None,
     ) -> None:
         """Validate and sanitize input."""
-        content_str = str(content) if content is not None else ""
+        if inspection is None:
+            inspection = self._inspector.inspect(content, families=())
+        content_length = inspection.length
 
         # Check length
-        if len(content_str) > self.config.max_input_length:
+        if content_length > self.config.max_input_length:
             event = SecurityEvent(
                 event_type=SecurityEventType.INVALID_INPUT,
                 severity=SecuritySeverity.MEDIUM,
@@ -438,7 +701,7 @@ class RuntimeSecurityScanner:
                 tenant_id=tenant_id,
                 agent_id=agent_id,
                 metadata={
-                    "length": len(content_str),
+                    "length": content_length,
                     "max_length": self.config.max_input_length,
                 },
             )
@@ -469,21 +732,19 @@ class RuntimeSecurityScanner:
         content: Any,
         tenant_id: Optional[str],
         agent_id: Optional[str],
+        inspection: Optional[ContentInspection] = None,
     ) -> None:
         """Check for prompt injection attempts."""
-        if detect_prompt_injection is None:
-            result.warnings.append("Prompt injection detection not available")
-            return
-
-        content_str = str(content) if content is not None else ""
-        if detect_prompt_injection(content_str):
+        if inspection is None:
+            inspection = self._inspector.inspect(content, families=(PROMPT_INJECTION,))
+        if inspection.has(PROMPT_INJECTION):
             event = SecurityEvent(
                 event_type=SecurityEventType.PROMPT_INJECTION_ATTEMPT,
                 severity=SecuritySeverity.HIGH,
                 message="Potential prompt injection attempt detected",
                 tenant_id=tenant_id,
                 agent_id=agent_id,
-                metadata={"content_length": len(content_str)},
+                metadata={"content_length": inspection.length},
             )
             result.add_blocking_event(event, "Prompt injection detected")
 
@@ -493,19 +754,22 @@ class RuntimeSecurityScanner:
         content: Any,
         tenant_id: Optional[str],
         agent_id: Optional[str],
+        inspection: Optional[ContentInspection] = None,
     ) -> None:
         """Check for suspicious patterns."""
-        content_str = str(content) if content is not None else ""
+        if inspection is None:
+            inspection = self._inspector.inspect(content, families=(SUSPICIOUS_PATTERN,))
+        matched = set(inspection.patterns(SUSPICIOUS_PATTERN))
 
-        for pattern in self._compiled_patterns:
-            if pattern.search(content_str):
+        for pattern in self.SUSPICIOUS_PATTERNS:
+            if pattern in matched:
                 event = SecurityEvent(
                     event_type=SecurityEventType.SUSPICIOUS_PATTERN,
                     severity=SecuritySeverity.MEDIUM,
-                    message=f"Suspicious pattern detected: {pattern.pattern[:30]}...",
+                    message=f"Suspicious pattern detected: {pattern[:30]}...",
                     tenant_id=tenant_id,
                     agent_id=agent_id,
-                    metadata={"pattern": pattern.pattern},
+                    metadata={"pattern": pattern},
                 )
                 result.add_event(event)
 
@@ -514,29 +778,40 @@ class RuntimeSecurityScanner:
         result: SecurityScanResult,
         tenant_id: Optional[str],
         agent_id: Optional[str],
+        anomaly_counts: Optional[_BatchAnomalyCounts] = None,
     ) -> None:
-        """Check for security anomalies based on event history."""
-        now = datetime.now(timezone.utc)
-        window_start = now.timestamp() - self.config.anomaly_window_seconds
-
-        # Count recent events for this tenant/agent
-        recent_events = [
-            e
-            for e in self._event_buffer
-            if e.timestamp.timestamp() > window_start
-            and e.tenant_id == tenant_id
-            and (agent_id is None or e.agent_id == agent_id)
-        ]
-
-        if len(recent_events) >= self.config.anomaly_threshold_events:
+        """
+        Check for security anomalies based on event history.
+
+        When ``anomaly_counts`` is given (one batch scan), the stored events
+        are counted once per tenant/agent and the batch's own events on top.
+        """
+        count_key = (tenant_id, agent_id)
+        recent_count = anomaly_counts.get(count_key) if anomaly_counts is not None else None
+        if recent_count is None:
+            now = datetime.now(timezone.utc)
+            window_start = now.timestamp() - self.config.anomaly_window_seconds
+
+            # Count recent events for this tenant/agent
+            recent_count = sum(
+                1
+                for e in self._event_buffer
+                if e.timestamp.timestamp() > window_start
+                and e.tenant_id == tenant_id
+                and (agent_id is None or e.agent_id == agent_id)
+            )
+            if anomaly_counts is not None:
+                recent_count = anomaly_counts.start(count_key, recent_count)
+
+        if recent_count >= self.config.anomaly_threshold_events:
             event = SecurityEvent(
                 event_type=SecurityEventType.ANOMALY_DETECTED,
                 severity=SecuritySeverity.HIGH,
-                message=f"Anomaly detected: {len(recent_events)} events in {self.config.anomaly_window_seconds}s",
+                message=f"Anomaly detected: {recent_count} events in {self.config.anomaly_window_seconds}s",
                 tenant_id=tenant_id,
                 agent_id=agent_id,
                 metadata={
-                    "event_count": len(recent_events),
+                    "event_count": recent_count,
                     "window_seconds": self.config.anomaly_window_seconds,
                     "threshold": self.config.anomaly_threshold_events,
                 },
@@ -602,6 +877,7 @@ class RuntimeSecurityScanner:
         context: JSONDict,
         tenant_id: Optional[str],
         agent_id: Optional[str],
+        guardrails: Optional[Any] = None,
     ) -> None:
         """Check content through comprehensive OWASP-compliant runtime safety guardrails."""
         if RuntimeSafetyGuardrails is None:
@@ -609,9 +885,10 @@ class RuntimeSecurityScanner:
             return
 
         try:
-            # Initialize guardrails with default config
-            guardrails_config = RuntimeSafetyGuardrailsConfig()
-            guardrails = RuntimeSafetyGuardrails(guardrails_config)
+            # Initialize guardrails with default config unless a batch shares one
+            if guardrails is None:
+                guardrails_config = RuntimeSafetyGuardrailsConfig()
+                guardrails = RuntimeSafetyGuardrails(guardrails_config)
 
             # Prepare context for guardrails processing
             processing_context = {
@@ -666,9 +943,11 @@ class RuntimeSecurityScanner:
             processing_time = guardrails_result.get("processing_time_ms", 0)
             if processing_time > 100:  # Log slow guardrails processing
                 result.warnings.append(f"Guardrails processing slow: {processing_time}ms")
+                result.cacheable = False
 
         except Exception as e:
             logger.error(f"Runtime guardrails check failed: {e}")
+            result.cacheable = False
             if self.config.fail_closed:
                 result.blocked = True
                 result.block_reason = f"Guardrails check failed: {str(e)}"
@@ -712,6 +991,7 @@ class RuntimeSecurityScanner:
                 self._blocked_requests / self._total_scans if self._total_scans > 0 else 0.0
             ),
             "events_buffered": len(self._event_buffer),
+            "rate_limit_keys": len(self._rate_counter),
             "constitutional_hash": CONSTITUTIONAL_HASH,
         }
 
@@ -782,6 +1062,7 @@ __all__ = [
     "SecurityEventType",
     "SecurityScanResult",
     "SecuritySeverity",
+    "ShardedRateCounter",
     "get_runtime_security_scanner",
     "scan_content",
 ]
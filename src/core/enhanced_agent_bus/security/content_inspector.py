@@ -0,0 +1,262 @@
+"""
+ACGS-2 Enhanced Agent Bus - Content Inspector
+Constitutional Hash: cdd01ef066bc6cf2
+
+Single-pass, multi-pattern content inspection shared by the runtime security
+scanner, the message processor and the security helpers. Content is
+serialized once per message; an Aho-Corasick prefilter over the case-folded
+text selects candidate rules by their literal anchors, and one combined regex
+over those candidates returns the tagged matches.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Pattern families
+PROMPT_INJECTION = "prompt_injection"
+SUSPICIOUS_PATTERN = "suspicious_pattern"
+
+# A rule is a regex plus the lowercase literals, at least one of which appears
+# in every match. Rules without anchors are always evaluated.
+PatternRule = Tuple[str, Tuple[str, ...]]
+
+PROMPT_INJECTION_RULES: List[PatternRule] = [
+    (r"ignore (all )?previous instructions", ("previous instructions",)),
+    (r"system prompt (leak|override|manipulation)", ("system prompt ",)),
+    (r"do anything now", ("do anything now",)),
+    (r"jailbreak", ("jailbreak",)),
+    (r"persona (adoption|override)", ("persona ",)),
+    (r"\(note to self: .*\)", ("(note to self: ",)),
+    (r"\[INST\].*\[/INST\]", ("[inst]",)),
+]
+
+SUSPICIOUS_PATTERN_RULES: List[PatternRule] = [
+    (r"<script[^>]*>", ("<script",)),  # XSS attempts
+    (r"javascript:", ("javascript:",)),  # JavaScript protocol
+    (r"on\w+\s*=", ("=",)),  # Event handlers
+    (
+        r"(?:union|select|insert|update|delete|drop)\s+",
+        ("union", "select", "insert", "update", "delete", "drop"),
+    ),  # SQL injection
+    (r"\.\./", ("../",)),  # Path traversal
+    (r"\\x[0-9a-fA-F]{2}", ("\\x",)),  # Hex escapes
+    (r"\\u[0-9a-fA-F]{4}", ("\\u",)),  # Unicode escapes used maliciously
+    (r"base64_decode", ("base64_decode",)),  # Base64 decode attempts
+    (r"eval\s*\(", ("eval",)),  # Eval calls
+    (r"exec\s*\(", ("exec",)),  # Exec calls
+    (r"__import__", ("__import__",)),  # Python import injection
+    (r"subprocess\.", ("subprocess.",)),  # Subprocess access
+    (r"os\.system", ("os.system",)),  # OS command execution
+]
+
+DEFAULT_RULES: Dict[str, List[PatternRule]] = {
+    PROMPT_INJECTION: PROMPT_INJECTION_RULES,
+    SUSPICIOUS_PATTERN: SUSPICIOUS_PATTERN_RULES,
+}
+
+# Non-ASCII characters that re.IGNORECASE treats as equal to ASCII letters.
+# Folding them before lowercasing keeps the prefilter from missing matches.
+_CASE_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+
+def serialize_content(content: Any) -> str:
+    """Serialize message content to the text form every check inspects."""
+    if content is None:
+        return ""
+    return content if isinstance(content, str) else str(content)
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """A rule match tagged with its family."""
+
+    family: str
+    pattern: str
+    start: int
+    end: int
+
+
+@dataclass
+class ContentInspection:
+    """Serialized content plus every rule match found in it."""
+
+    text: str
+    matches: List[PatternMatch] = field(default_factory=list)
+
+    @property
+    def length(self) -> int:
+        return len(self.text)
+
+    def has(self, family: str) -> bool:
+        """Whether any rule of ``family`` matched."""
+        return any(m.family == family for m in self.matches)
+
+    def patterns(self, family: str) -> List[str]:
+        """Distinct matched patterns of ``family``, in match order."""
+        return list(dict.fromkeys(m.pattern for m in self.matches if m.family == family))
+
+
+class ContentInspector:
+    """
+    Compiled multi-family pattern matcher.
+
+    Rules are compiled once. ``inspect`` serializes content once, runs the
+    literal prefilter over the case-folded text, and then scans the original
+    text with one combined regex built from the candidate rules. Each rule is
+    wrapped in a zero-width lookahead, so overlapping matches of different
+    rules are all reported; when two rules match at the same offset only the
+    first-listed is.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, Sequence[PatternRule]]] = None,
+        flags: int = re.IGNORECASE,
+    ):
+        rules = DEFAULT_RULES if rules is None else rules
+        self._flags = flags
+        self._rules: List[Tuple[str, str]] = []
+        self._family_ids: Dict[str, FrozenSet[int]] = {}
+        self._unanchored: Set[int] = set()
+        anchors: Dict[str, Set[int]] = {}
+
+        for family, family_rules in rules.items():
+            ids = []
+            for pattern, rule_anchors in family_rules:
+                rule_id = len(self._rules)
+                self._rules.append((family, pattern))
+                ids.append(rule_id)
+                if not rule_anchors:
+                    self._unanchored.add(rule_id)
+                for anchor in rule_anchors:
+                    anchors.setdefault(anchor.translate(_CASE_FOLD).lower(), set()).add(rule_id)
+            self._family_ids[family] = frozenset(ids)
+
+        self._anchor_rules = {anchor: frozenset(ids) for anchor, ids in anchors.items()}
+        self._automaton = None
+        self._anchor_re = None
+        self._anchor_re_rules: Dict[str, FrozenSet[int]] = {}
+        if self._anchor_rules and AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for anchor, ids in self._anchor_rules.items():
+                self._automaton.add_word(anchor, ids)
+            self._automaton.make_automaton()
+        elif self._anchor_rules:
+            # The lookahead reports the longest anchor starting at every offset,
+            # so overlapping anchors are found; shorter anchors inside a longer
+            # one are covered by adding their rules to the longer anchor's.
+            self._anchor_re = re.compile(
+                "(?=(%s))"
+                % "|".join(re.escape(a) for a in sorted(self._anchor_rules, key=len, reverse=True))
+            )
+            self._anchor_re_rules = {
+                anchor: frozenset().union(
+                    *(ids for other, ids in self._anchor_rules.items() if other in anchor)
+                )
+                for anchor in self._anchor_rules
+            }
+
+        self._combined = lru_cache(maxsize=256)(self._compile_combined)
+
+    @property
+    def families(self) -> List[str]:
+        return list(self._family_ids)
+
+    def inspect(self, content: Any, families: Optional[Iterable[str]] = None) -> ContentInspection:
+        """
+        Serialize ``content`` once and match it against the compiled rules.
+
+        Args:
+            content: Message content (string, dict, or any)
+            families: Restrict matching to these families (default: all)
+
+        Returns:
+            ContentInspection with the serialized text and tagged matches
+        """
+        text = serialize_content(content)
+        return ContentInspection(text=text, matches=self.scan_text(text, families))
+
+    def scan_text(self, text: str, families: Optional[Iterable[str]] = None) -> List[PatternMatch]:
+        """Match already-serialized text against the compiled rules."""
+        if not text:
+            return []
+
+        candidates = self._prefilter(text)
+        if families is not None:
+            allowed: Set[int] = set()
+            for family in families:
+                allowed |= self._family_ids.get(family, frozenset())
+            candidates &= allowed
+        if not candidates:
+            return []
+
+        regex = self._combined(frozenset(candidates))
+        matches = []
+        for m in regex.finditer(text):
+            group = m.lastgroup
+            if group is None:
+                continue
+            family, pattern = self._rules[int(group[1:])]
+            matches.append(PatternMatch(family, pattern, m.start(group), m.end(group)))
+        return matches
+
+    def _prefilter(self, text: str) -> Set[int]:
+        """Rule ids whose anchors occur in the case-folded text."""
+        candidates = set(self._unanchored)
+        folded = text.lower() if text.isascii() else text.translate(_CASE_FOLD).lower()
+        if self._automaton is not None:
+            seen: Set[FrozenSet[int]] = set()
+            for _, ids in self._automaton.iter(folded):
+                if ids not in seen:
+                    seen.add(ids)
+                    candidates |= ids
+        elif self._anchor_re is not None:
+            for anchor in set(self._anchor_re.findall(folded)):
+                candidates |= self._anchor_re_rules[anchor]
+        return candidates
+
+    def _compile_combined(self, rule_ids: FrozenSet[int]) -> "re.Pattern[str]":
+        return re.compile(
+            "|".join(f"(?=(?P<r{i}>{self._rules[i][1]}))" for i in sorted(rule_ids)),
+            self._flags,
+        )
+
+
+# Shared inspector for the default rule set
+_inspector: Optional[ContentInspector] = None
+
+
+def get_content_inspector() -> ContentInspector:
+    """Get or create the shared content inspector."""
+    global _inspector
+    if _inspector is None:
+        _inspector = ContentInspector()
+    return _inspector
+
+
+__all__ = [
+    "AHOCORASICK_AVAILABLE",
+    "DEFAULT_RULES",
+    "PROMPT_INJECTION",
+    "PROMPT_INJECTION_RULES",
+    "SUSPICIOUS_PATTERN",
+    "SUSPICIOUS_PATTERN_RULES",
+    "ContentInspection",
+    "ContentInspector",
+    "PatternMatch",
+    "get_content_inspector",
+    "serialize_content",
+]
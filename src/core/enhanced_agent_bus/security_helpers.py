@@ -3,9 +3,13 @@ ACGS-2 Enhanced Agent Bus - Security Helpers
 Constitutional Hash: cdd01ef066bc6cf2
 """
 
-import re
 from typing import Any, List, Optional
 
+from .security.content_inspector import (
+    PROMPT_INJECTION,
+    PROMPT_INJECTION_RULES,
+    get_content_inspector,
+)
 from .security.tenant_validator import TenantValidator
 
 
@@ -45,19 +49,11 @@ def validate_tenant_consistency(
     return errors
 
 
-PROMPT_INJECTION_PATTERNS = [
-    r"ignore (all )?previous instructions",
-    r"system prompt (leak|override)",
-    r"do anything now",
-    r"jailbreak",
-    r"persona (adoption|override)",
-    r"\(note to self: .*\)",
-    r"\[INST\].*\[/INST\]",
-]
-_INJECTION_RE = re.compile("|".join(PROMPT_INJECTION_PATTERNS), re.IGNORECASE)
+PROMPT_INJECTION_PATTERNS = [pattern for pattern, _ in PROMPT_INJECTION_RULES]
 
 
 def detect_prompt_injection(content: Any) -> bool:
     """Detect potential prompt injection attacks."""
-    content_str = content if isinstance(content, str) else str(content)
-    return bool(_INJECTION_RE.search(content_str))
+    return (
+        get_content_inspector().inspect(content, families=(PROMPT_INJECTION,)).has(PROMPT_INJECTION)
+    )
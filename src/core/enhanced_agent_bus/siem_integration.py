@@ -23,11 +23,11 @@ import json
 import logging
 import socket
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from .core import CONSTITUTIONAL_HASH
 from .runtime_security import SecurityEvent, SecurityEventType, SecuritySeverity
@@ -459,80 +459,161 @@ class AlertManager:
             self._states[event_type] = AlertState()
 
 
+@dataclass
+class _CorrelationBucket:
+    """Counters and correlated events of one EventCorrelator time bucket."""
+
+    index: int
+    tenant_high: Dict[str, int] = field(default_factory=dict)
+    type_sources: Dict[SecurityEventType, Dict[str, int]] = field(default_factory=dict)
+    correlated: Dict[str, List[SecurityEvent]] = field(default_factory=dict)
+
+
+def _add_count(counts: Dict[str, int], key: str) -> None:
+    counts[key] = counts.get(key, 0) + 1
+
+
+def _subtract_counts(totals: Dict[str, int], counts: Dict[str, int]) -> None:
+    for key, count in counts.items():
+        left = totals[key] - count
+        if left:
+            totals[key] = left
+        else:
+            del totals[key]
+
+
 class EventCorrelator:
-    """Correlates security events to detect attack patterns."""
+    """
+    Correlates security events to detect attack patterns.
+
+    The window is a ring of ``buckets`` time buckets keyed by event timestamp.
+    Each bucket holds per-tenant high-severity counts, per-event-type counts
+    by source agent, and the events it correlated; window totals of the same
+    counters are kept alongside. Pattern detection reads the totals, and
+    expiry drops whole buckets and subtracts their counters, so each event
+    costs O(1) amortized however large the window. Events expire at bucket
+    granularity (``window_seconds / buckets``).
+    """
 
-    def __init__(self, window_seconds: int = 300):
+    _HIGH_SEVERITIES = (SecuritySeverity.HIGH, SecuritySeverity.CRITICAL)
+
+    def __init__(
+        self,
+        window_seconds: int = 300,
+        buckets: int = 60,
+        max_events_per_correlation: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
         self._window_seconds = window_seconds
-        self._events: List[SecurityEvent] = []
-        self._correlations: Dict[str, List[SecurityEvent]] = defaultdict(list)
+        self._bucket_seconds = max(window_seconds, 1) / max(buckets, 1)
+        self._max_events_per_correlation = max_events_per_correlation
+        self._clock = clock
+        self._buckets: Deque[_CorrelationBucket] = deque()
+        self._tenant_high: Dict[str, int] = {}
+        self._type_sources: Dict[SecurityEventType, Dict[str, int]] = {}
+        self._correlated_counts: Dict[str, int] = {}
+        self._recent: Deque[Tuple[float, bool]] = deque(maxlen=10)
+        self._cutoff = 0.0
+        self._id_second = -1
+        self._ids: Dict[Tuple[str, str], str] = {}
         self._lock = asyncio.Lock()
 
     async def add_event(self, event: SecurityEvent) -> Optional[str]:
         """Add event and return correlation ID if pattern detected."""
         async with self._lock:
-            now = datetime.now(timezone.utc)
-            cutoff = now - timedelta(seconds=self._window_seconds)
-
-            # Prune old events
-            self._events = [e for e in self._events if e.timestamp > cutoff]
-            for key in list(self._correlations.keys()):
-                self._correlations[key] = [
-                    e for e in self._correlations[key] if e.timestamp > cutoff
-                ]
-                if not self._correlations[key]:
-                    del self._correlations[key]
-
-            # Add new event
-            self._events.append(event)
+            self._cutoff = self._clock() - self._window_seconds
+            self._expire()
+
+            timestamp = event.timestamp.timestamp()
+            bucket = self._bucket_for(timestamp)
+            high = event.severity in self._HIGH_SEVERITIES
+            if event.tenant_id and high:
+                _add_count(bucket.tenant_high, event.tenant_id)
+                _add_count(self._tenant_high, event.tenant_id)
+            if event.agent_id:
+                _add_count(bucket.type_sources.setdefault(event.event_type, {}), event.agent_id)
+                _add_count(self._type_sources.setdefault(event.event_type, {}), event.agent_id)
+            self._recent.append((timestamp, high))
 
             # Generate correlation ID based on attack patterns
             correlation_id = self._detect_pattern(event)
             if correlation_id:
-                self._correlations[correlation_id].append(event)
+                count = self._correlated_counts.get(correlation_id, 0)
+                if count < self._max_events_per_correlation:
+                    bucket.correlated.setdefault(correlation_id, []).append(event)
+                    self._correlated_counts[correlation_id] = count + 1
 
             return correlation_id
 
+    def _bucket_for(self, timestamp: float) -> _CorrelationBucket:
+        """Bucket holding ``timestamp``; late events older than the ring join the oldest."""
+        index = int(timestamp // self._bucket_seconds)
+        buckets = self._buckets
+        if not buckets or index > buckets[-1].index:
+            buckets.append(_CorrelationBucket(index))
+            return buckets[-1]
+        if index <= buckets[0].index:
+            return buckets[0]
+        for position in range(len(buckets) - 1, -1, -1):
+            if buckets[position].index == index:
+                return buckets[position]
+            if buckets[position].index < index:
+                buckets.insert(position + 1, _CorrelationBucket(index))
+                return buckets[position + 1]
+        return buckets[0]
+
+    def _expire(self) -> None:
+        """Drop buckets that ended before the window and subtract their counters."""
+        buckets = self._buckets
+        while buckets and (buckets[0].index + 1) * self._bucket_seconds <= self._cutoff:
+            bucket = buckets.popleft()
+            _subtract_counts(self._tenant_high, bucket.tenant_high)
+            for event_type, sources in bucket.type_sources.items():
+                totals = self._type_sources[event_type]
+                _subtract_counts(totals, sources)
+                if not totals:
+                    del self._type_sources[event_type]
+            _subtract_counts(
+                self._correlated_counts, {k: len(v) for k, v in bucket.correlated.items()}
+            )
+
     def _detect_pattern(self, event: SecurityEvent) -> Optional[str]:
         """Detect attack patterns and generate correlation ID."""
         # Pattern 1: Same tenant multiple failures
-        if event.tenant_id:
-            tenant_events = [
-                e
-                for e in self._events
-                if e.tenant_id == event.tenant_id
-                and e.severity in (SecuritySeverity.HIGH, SecuritySeverity.CRITICAL)
-            ]
-            if len(tenant_events) >= 3:
-                return self._generate_correlation_id("tenant_attack", event.tenant_id)
+        if event.tenant_id and self._tenant_high.get(event.tenant_id, 0) >= 3:
+            return self._generate_correlation_id("tenant_attack", event.tenant_id)
 
         # Pattern 2: Same event type from multiple sources
-        type_events = [e for e in self._events if e.event_type == event.event_type]
-        unique_sources = set(e.agent_id for e in type_events if e.agent_id)
-        if len(unique_sources) >= 3:
+        if len(self._type_sources.get(event.event_type, ())) >= 3:
             return self._generate_correlation_id("distributed_attack", event.event_type.value)
 
         # Pattern 3: Escalating severity
         if event.severity == SecuritySeverity.CRITICAL:
-            recent_high = [
-                e
-                for e in self._events[-10:]
-                if e.severity in (SecuritySeverity.HIGH, SecuritySeverity.CRITICAL)
-            ]
-            if len(recent_high) >= 3:
+            recent_high = sum(1 for ts, high in self._recent if high and ts > self._cutoff)
+            if recent_high >= 3:
                 return self._generate_correlation_id("escalating_attack", "severity")
 
         return None
 
     def _generate_correlation_id(self, pattern: str, identifier: str) -> str:
-        """Generate a unique correlation ID."""
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-        hash_input = f"{pattern}:{identifier}:{timestamp}"
-        return hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+        """Generate a unique correlation ID (stable within a UTC second)."""
+        second = int(self._clock())
+        if second != self._id_second:
+            self._id_second = second
+            self._ids.clear()
+        correlation_id = self._ids.get((pattern, identifier))
+        if correlation_id is None:
+            timestamp = datetime.fromtimestamp(second, timezone.utc).strftime("%Y%m%d%H%M%S")
+            hash_input = f"{pattern}:{identifier}:{timestamp}"
+            correlation_id = hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+            self._ids[(pattern, identifier)] = correlation_id
+        return correlation_id
 
     def get_correlated_events(self, correlation_id: str) -> List[SecurityEvent]:
         """Get all events with a specific correlation ID."""
-        return self._correlations.get(correlation_id, [])
+        return [
+            event for bucket in self._buckets for event in bucket.correlated.get(correlation_id, ())
+        ]
 
 
 class SIEMIntegration:
@@ -17,6 +17,7 @@ from enhanced_agent_bus.adaptive_governance import (
     initialize_adaptive_governance,
     provide_governance_feedback,
 )
+from enhanced_agent_bus.drift_monitoring import DriftDetector, DriftStatus
 
 logger = logging.getLogger(__name__)
 
@@ -186,6 +187,25 @@ class TestAdaptiveGovernance:
         assert decision.recommended_threshold == 0.4
         assert decision.features_used == sample_features
 
+    @pytest.mark.asyncio
+    async def test_decisions_feed_streaming_drift_sketches(
+        self, constitutional_hash, sample_message, sample_context, sample_features
+    ):
+        """Test each decision updates the drift sketches used by scheduled checks."""
+        engine = AdaptiveGovernanceEngine(constitutional_hash)
+        engine._drift_detector = DriftDetector(min_samples=2)
+        engine._drift_streaming = True
+        engine.impact_scorer.assess_impact = AsyncMock(return_value=sample_features)
+
+        for _ in range(4):
+            await engine.evaluate_governance_decision(sample_message, sample_context)
+        engine._run_scheduled_drift_detection()
+
+        report = engine.get_latest_drift_report()
+        assert report.status == DriftStatus.SUCCESS
+        assert (report.reference_samples, report.current_samples) == (2, 2)
+        assert not report.dataset_drift
+
     @pytest.mark.asyncio
     async def test_global_governance_functions(
         self, constitutional_hash, sample_message, sample_context
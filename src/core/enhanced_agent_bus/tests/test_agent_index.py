@@ -0,0 +1,237 @@
+"""
+ACGS-2 Enhanced Agent Bus - Agent Index Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for the capability/type/tenant inverted index used by the registries,
+CapabilityBasedRouter and EnhancedAgentBus lookups.
+"""
+
+import asyncio
+import json
+import socket
+import uuid
+
+import pytest
+
+try:
+    from fakeredis import aioredis as fake_aioredis
+except ImportError:
+    fake_aioredis = None
+
+from enhanced_agent_bus.agent_bus import EnhancedAgentBus
+from enhanced_agent_bus.models import AgentMessage
+from enhanced_agent_bus.registry import (
+    AgentIndex,
+    CapabilityBasedRouter,
+    InMemoryAgentRegistry,
+    RedisAgentRegistry,
+)
+
+
+def _redis_available() -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", 6379), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def _info(caps, agent_type=None, tenant_id=None) -> dict:
+    return {"capabilities": caps, "metadata": {"type": agent_type, "tenant_id": tenant_id}}
+
+
+class TestAgentIndex:
+    """Tests for AgentIndex."""
+
+    def test_intersection_in_registration_order(self):
+        index = AgentIndex()
+        index.add("a", _info(["read", "write"]))
+        index.add("b", _info(["read"]))
+        index.add("c", _info(["write", "read", "admin"]))
+
+        assert index.find_by_capabilities(["read"]) == ["a", "b", "c"]
+        assert index.find_by_capabilities(["write", "read"]) == ["a", "c"]
+        assert index.find_by_capabilities(["read", "write"], limit=1) == ["a"]
+        assert index.find_by_capabilities(["read", "missing"]) == []
+        assert index.find_by_capabilities([]) == []
+
+    def test_capability_dict_and_metadata_terms(self):
+        index = AgentIndex()
+        index.add("a", _info({"read": True}, agent_type="worker", tenant_id="t1"))
+        index.add("b", {"capabilities": [], "agent_type": "worker", "tenant_id": "t2"})
+
+        assert index.find_by_capabilities(["read"]) == ["a"]
+        assert index.find_by_type("worker") == ["a", "b"]
+        assert index.find_by_tenant("t2") == ["b"]
+
+    def test_reindex_and_remove(self):
+        index = AgentIndex()
+        index.add("a", _info(["read"], agent_type="worker", tenant_id="t1"))
+        index.add("a", _info(["write"], agent_type="auditor", tenant_id="t1"))
+
+        assert index.find_by_capabilities(["read"]) == []
+        assert index.find_by_capabilities(["write"]) == ["a"]
+        assert index.find_by_type("worker") == []
+
+        index.remove("a")
+        index.remove("a")
+        assert index.find_by_capabilities(["write"]) == []
+        assert index.find_by_tenant("t1") == []
+        assert index._by_capability == {} and index._by_type == {} and index._by_tenant == {}
+
+
+class TestInMemoryRegistryIndex:
+    """Tests for index maintenance in InMemoryAgentRegistry."""
+
+    async def test_index_follows_registry_changes(self):
+        reg = InMemoryAgentRegistry()
+        await reg.register("a", ["read"], {"type": "worker", "tenant_id": "t1"})
+        await reg.register("b", ["read", "write"], {"type": "worker"})
+        await reg.update_metadata("a", {"tenant_id": "t2"})
+        await reg.unregister("b")
+
+        assert await reg.find_by_capabilities(["read"]) == ["a"]
+        assert await reg.find_by_type("worker") == ["a"]
+        assert await reg.find_by_tenant("t1") == []
+        assert await reg.find_by_tenant("t2") == ["a"]
+
+        await reg.clear()
+        assert await reg.find_by_capabilities(["read"]) == []
+
+    async def test_router_uses_index(self):
+        reg = InMemoryAgentRegistry()
+        for i in range(5):
+            await reg.register(f"agent-{i}", ["read"] + (["write"] if i % 2 else []))
+        router = CapabilityBasedRouter()
+        msg = AgentMessage(
+            from_agent="agent-1", content={"required_capabilities": ["read", "write"]}
+        )
+
+        async def no_scan(aid):
+            raise AssertionError("router should not fetch agents one by one")
+
+        reg.get = no_scan
+        assert await router.route(msg, reg) == "agent-1"
+        assert await router.broadcast(msg, reg) == ["agent-3"]
+        assert await router.broadcast(msg, reg, exclude=["agent-3"]) == []
+
+
+class TestBusIndex:
+    """Tests for EnhancedAgentBus type/capability/tenant lookups."""
+
+    async def test_bus_lookups(self):
+        bus = EnhancedAgentBus()
+        await bus.register_agent("a", agent_type="worker", capabilities=["read"], tenant_id="t1")
+        await bus.register_agent("b", agent_type="auditor", capabilities=["read"], tenant_id="t2")
+        await bus.unregister_agent("b")
+
+        assert bus.get_agents_by_type("worker") == ["a"]
+        assert bus.get_agents_by_type("auditor") == []
+        assert bus.get_agents_by_capability("read") == ["a"]
+        assert bus._agent_index.find_by_tenant("t1") == ["a"]
+
+
+@pytest.mark.skipif(fake_aioredis is None, reason="fakeredis not installed")
+class TestRedisRegistryIndexTransactions:
+    """Tests for index backfill, ordering and transactional writes (fakeredis)."""
+
+    @pytest.fixture
+    async def registry(self):
+        reg = RedisAgentRegistry(redis_url="redis://fake", key_prefix="acgs2:test:agents")
+        reg._redis = fake_aioredis.FakeRedis(decode_responses=True)
+        yield reg
+        await reg._redis.aclose()
+        reg._redis = None
+
+    async def test_agents_registered_before_index_are_backfilled(self, registry):
+        client = await registry._get_client()
+        for aid, caps in (("b", ["read"]), ("a", ["read", "write"])):
+            info = {"agent_id": aid, "capabilities": caps, "metadata": {"type": "worker"}}
+            await client.hset(registry._key_prefix, aid, json.dumps(info))
+        router = CapabilityBasedRouter()
+        msg = AgentMessage(content={"required_capabilities": ["read"]})
+
+        assert await router.route(msg, registry) == "a"
+        assert await registry.find_by_capabilities(["read", "write"]) == ["a"]
+        assert await registry.find_by_type("worker") == ["a", "b"]
+
+        # The backfill runs once; later writes maintain the sets themselves.
+        await registry.register("c", ["write"])
+        assert await registry.find_by_capabilities(["write"]) == ["a", "c"]
+
+    async def test_rebuild_index_drops_stale_sets(self, registry):
+        await registry.register("a", ["read"], {"tenant_id": "t1"})
+        client = await registry._get_client()
+        await client.hdel(registry._key_prefix, "a")
+
+        await registry.rebuild_index()
+
+        assert await registry.find_by_capabilities(["read"]) == []
+        assert await registry.find_by_tenant("t1") == []
+
+    async def test_route_picks_lowest_agent_id(self, registry):
+        for aid in ("agent-3", "agent-1", "agent-2"):
+            await registry.register(aid, ["read"])
+        router = CapabilityBasedRouter()
+        msg = AgentMessage(content={"required_capabilities": ["read"]})
+
+        assert [await router.route(msg, registry) for _ in range(5)] == ["agent-1"] * 5
+        assert await registry.find_by_capabilities(["read"], limit=2) == ["agent-1", "agent-2"]
+
+    async def test_duplicate_register_keeps_original_index(self, registry):
+        assert await registry.register("a", ["read"]) is True
+        assert await registry.register("a", ["write"]) is False
+
+        assert await registry.find_by_capabilities(["read"]) == ["a"]
+        assert await registry.find_by_capabilities(["write"]) == []
+
+    async def test_concurrent_register_unregister_keeps_index_consistent(self, registry):
+        async def churn(aid):
+            for _ in range(5):
+                await registry.register(aid, ["read"], {"tenant_id": "t1"})
+                await registry.unregister(aid)
+            await registry.register(aid, ["read"], {"tenant_id": "t1"})
+
+        await asyncio.gather(*(churn(f"agent-{i}") for i in range(10)))
+        await asyncio.gather(*(registry.unregister(f"agent-{i}") for i in range(0, 10, 2)))
+
+        expected = sorted(f"agent-{i}" for i in range(1, 10, 2))
+        assert sorted(await registry.list_agents()) == expected
+        assert await registry.find_by_capabilities(["read"]) == expected
+        assert await registry.find_by_tenant("t1") == expected
+
+
+@pytest.mark.skipif(not _redis_available(), reason="Redis not available on 127.0.0.1:6379")
+class TestRedisRegistryIndex:
+    """Tests for the Redis set mirror of the agent index."""
+
+    @pytest.fixture
+    async def registry(self):
+        reg = RedisAgentRegistry(
+            redis_url="redis://127.0.0.1:6379", key_prefix=f"acgs2:test:{uuid.uuid4().hex}"
+        )
+        yield reg
+        await reg.clear()
+        await reg.close()
+
+    async def test_sets_follow_registry_changes(self, registry):
+        await registry.register("a", ["read"], {"type": "worker", "tenant_id": "t1"})
+        await registry.register("b", ["read", "write"], {"type": "worker"})
+        await registry.update_metadata("a", {"tenant_id": "t2"})
+
+        assert sorted(await registry.find_by_capabilities(["read"])) == ["a", "b"]
+        assert await registry.find_by_capabilities(["read", "write"]) == ["b"]
+        assert len(await registry.find_by_capabilities(["read"], limit=1)) == 1
+        assert await registry.find_by_tenant("t1") == []
+        assert await registry.find_by_tenant("t2") == ["a"]
+
+        await registry.unregister("b")
+        assert await registry.find_by_capabilities(["write"]) == []
+        assert await registry.find_by_type("worker") == ["a"]
+
+    async def test_clear_removes_index_keys(self, registry):
+        await registry.register("a", ["read"], {"type": "worker"})
+        await registry.clear()
+        client = await registry._get_client()
+
+        assert await client.keys(f"{registry._key_prefix}*") == []
@@ -0,0 +1,127 @@
+"""
+ACGS-2 Enhanced Agent Bus - Slotted AgentMessage Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for the compact AgentMessage representation: lazy IDs and dicts,
+monotonic timestamps and dataclass-compatible copy, pickle and equality.
+"""
+
+import copy
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.enhanced_agent_bus.models import AgentMessage, MessageType
+
+
+class TestLazyFields:
+    """Tests for fields built on first access."""
+
+    def test_no_instance_dict(self):
+        msg = AgentMessage()
+
+        assert not hasattr(msg, "__dict__")
+        with pytest.raises(AttributeError):
+            msg.unknown_field = 1
+
+    def test_empty_dicts_created_on_first_access(self):
+        msg = AgentMessage()
+
+        assert msg._metadata is not msg.metadata
+        msg.metadata["k"] = "v"
+        assert msg.metadata == {"k": "v"}
+        assert AgentMessage().metadata == {}
+
+    def test_explicit_none_is_kept(self):
+        msg = AgentMessage(content={"a": 1})
+        msg.content = None
+
+        assert msg.content is None
+
+    def test_ids_are_stable_and_unique(self):
+        a, b = AgentMessage(), AgentMessage()
+
+        assert a.message_id == a.message_id
+        assert a.message_id != b.message_id
+        assert a.conversation_id != a.message_id
+
+    def test_from_dict_keeps_ids(self):
+        msg = AgentMessage(content={"x": 1}, message_type=MessageType.QUERY)
+
+        restored = AgentMessage.from_dict(msg.to_dict())
+
+        assert restored.message_id == msg.message_id
+        assert restored.conversation_id == msg.conversation_id
+        assert restored.content == {"x": 1}
+
+
+class TestTimestamps:
+    """Tests for monotonic timestamps."""
+
+    def test_default_timestamps_are_current_utc(self):
+        before = datetime.now(timezone.utc)
+        msg = AgentMessage()
+
+        assert msg.created_at.tzinfo is timezone.utc
+        assert msg.created_at == msg.updated_at
+        assert abs(msg.created_at - before) < timedelta(seconds=1)
+
+    def test_timestamps_serialize_to_iso(self):
+        msg = AgentMessage()
+        data = msg.to_dict()
+
+        assert datetime.fromisoformat(data["created_at"]) == msg.created_at
+        assert data["updated_at"] == msg.updated_at.isoformat()
+
+    def test_explicit_and_assigned_datetimes(self):
+        created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        msg = AgentMessage(created_at=created)
+        updated = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        msg.updated_at = updated
+
+        assert msg.created_at is created
+        assert msg.to_dict()["updated_at"] == updated.isoformat()
+
+    def test_creation_order_preserved(self):
+        first, second = AgentMessage(), AgentMessage()
+
+        assert first.created_at <= second.created_at
+
+
+class TestDataclassCompatibility:
+    """Tests for behaviour carried over from the dataclass."""
+
+    def test_equality_and_unhashable(self):
+        msg = AgentMessage(content={"a": 1})
+
+        assert copy.copy(msg) == msg
+        assert msg != AgentMessage(content={"a": 1})
+        with pytest.raises(TypeError):
+            hash(msg)
+
+    def test_pickle_materializes_fields(self):
+        msg = AgentMessage(content={"a": 1}, tenant_id="t1")
+
+        restored = pickle.loads(pickle.dumps(msg))
+
+        assert restored == msg
+        assert isinstance(restored._created_at, datetime)
+
+    def test_deepcopy_is_independent(self):
+        msg = AgentMessage(metadata={"k": [1]})
+
+        clone = copy.deepcopy(msg)
+        clone.metadata["k"].append(2)
+
+        assert clone.message_id == msg.message_id
+        assert msg.metadata == {"k": [1]}
+
+    def test_repr_lists_fields(self):
+        text = repr(AgentMessage(from_agent="a"))
+
+        assert text.startswith("AgentMessage(message_id=")
+        assert "from_agent='a'" in text
+
+    def test_constitutional_validated_on_init(self):
+        assert AgentMessage().constitutional_validated is True
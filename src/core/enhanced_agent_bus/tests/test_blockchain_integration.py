@@ -58,6 +58,12 @@ except ImportError:
     AUDIT_LEDGER_AVAILABLE = False
 
 
+@pytest.fixture(autouse=True)
+def anchor_storage_in_tmp_path(tmp_path, monkeypatch):
+    """Keep the local anchor's default audit_anchor_production.json out of the cwd."""
+    monkeypatch.chdir(tmp_path)
+
+
 # =============================================================================
 # AuditClient Tests
 # =============================================================================
@@ -0,0 +1,154 @@
+"""
+ACGS-2 Enhanced Agent Bus - Broadcast Fan-out Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for validate-once, bounded-concurrency EnhancedAgentBus.broadcast_message.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from enhanced_agent_bus.agent_bus import EnhancedAgentBus
+from enhanced_agent_bus.message_processor import MessageProcessor
+from enhanced_agent_bus.models import CONSTITUTIONAL_HASH, AgentMessage, MessageStatus, MessageType
+from enhanced_agent_bus.validators import ValidationResult
+
+
+class SlowKafka:
+    """Kafka stand-in recording deliveries and peak in-flight sends."""
+
+    def __init__(self, delay: float = 0.001):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.delivered = []
+        self.messages = []
+
+    async def send_message(self, msg: AgentMessage) -> bool:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        self.delivered.append(msg.to_agent)
+        self.messages.append(msg)
+        return True
+
+
+@pytest.fixture
+def processor():
+    processor = MagicMock(spec=MessageProcessor)
+    processor.process = AsyncMock(return_value=ValidationResult(is_valid=True))
+    processor.execute_handlers = AsyncMock(return_value=ValidationResult(is_valid=True))
+    return processor
+
+
+async def _bus(
+    processor, agents: int, tenant_id: str = "tenant-a", kafka=None, **kwargs
+) -> EnhancedAgentBus:
+    bus = EnhancedAgentBus(
+        enable_maci=False, enable_adaptive_governance=False, processor=processor, **kwargs
+    )
+    bus._kafka_bus = kafka
+    for i in range(agents):
+        await bus.register_agent(f"agent-{i}", "worker", tenant_id=tenant_id)
+    return bus
+
+
+def _message(**kwargs) -> AgentMessage:
+    return AgentMessage(
+        from_agent="agent-0",
+        message_type=MessageType.NOTIFICATION,
+        content={"event": "policy_updated"},
+        constitutional_hash=CONSTITUTIONAL_HASH,
+        **kwargs,
+    )
+
+
+class TestBroadcastFanout:
+    """Tests for broadcast_message fan-out."""
+
+    async def test_content_validated_once(self, processor):
+        kafka = SlowKafka()
+        bus = await _bus(processor, 20, kafka=kafka)
+
+        results = await bus.broadcast_message(_message(tenant_id="tenant-a"))
+
+        assert processor.process.await_count == 1
+        assert list(results) == [f"agent-{i}" for i in range(1, 20)]
+        assert sorted(kafka.delivered) == sorted(results)
+        assert bus._metrics["messages_sent"] == 19
+
+    async def test_concurrency_is_bounded(self, processor):
+        kafka = SlowKafka()
+        bus = await _bus(processor, 50, kafka=kafka, broadcast_concurrency=8)
+
+        await bus.broadcast_message(_message(tenant_id="tenant-a"))
+        assert kafka.peak == 8
+
+        kafka.peak = 0
+        await bus.broadcast_message(_message(tenant_id="tenant-a"), max_concurrency=3)
+        assert kafka.peak == 3
+
+    async def test_rejected_content_is_not_delivered(self, processor):
+        processor.process.return_value = ValidationResult(is_valid=False, errors=["blocked"])
+        kafka = SlowKafka()
+        bus = await _bus(processor, 5, kafka=kafka)
+
+        results = await bus.broadcast_message(_message(tenant_id="tenant-a"))
+
+        assert results == {}
+        assert kafka.delivered == []
+        assert bus._metrics["messages_failed"] == 1
+
+    async def test_recipient_tenant_checked_per_target(self, processor):
+        bus = await _bus(processor, 3, tenant_id=None)
+        await bus.register_agent("other-tenant", "worker", tenant_id="tenant-b")
+
+        results = await bus.broadcast_message(_message())
+
+        assert list(results) == ["agent-1", "agent-2"]
+
+    async def test_per_recipient_validation(self, processor):
+        bus = await _bus(processor, 6)
+
+        results = await bus.broadcast_message(_message(tenant_id="tenant-a"), validate_once=False)
+
+        assert processor.process.await_count == 5
+        assert len(results) == 5
+
+    async def test_handlers_and_status_per_recipient(self):
+        processor = MessageProcessor(isolated_mode=True)
+        handled = []
+        processor.register_handler(
+            MessageType.NOTIFICATION, lambda m: handled.append((m.to_agent, m.status.value))
+        )
+        kafka = SlowKafka()
+        bus = await _bus(processor, 4, kafka=kafka)
+
+        results = await bus.broadcast_message(_message(tenant_id="tenant-a"))
+
+        recipients = ["agent-1", "agent-2", "agent-3"]
+        assert sorted(handled) == [(aid, MessageStatus.PROCESSING.value) for aid in recipients]
+        assert sorted(m.to_agent for m in kafka.messages) == recipients
+        assert all(m.status.value == MessageStatus.DELIVERED.value for m in kafka.messages)
+        assert len({id(r) for r in results.values()}) == 3
+        results["agent-1"].metadata["note"] = "mutated"
+        assert "note" not in results["agent-2"].metadata
+
+    async def test_handler_failure_only_fails_that_recipient(self):
+        processor = MessageProcessor(isolated_mode=True)
+
+        def handler(m: AgentMessage) -> None:
+            if m.to_agent == "agent-2":
+                raise RuntimeError("recipient unavailable")
+
+        processor.register_handler(MessageType.NOTIFICATION, handler)
+        kafka = SlowKafka()
+        bus = await _bus(processor, 4, kafka=kafka)
+
+        results = await bus.broadcast_message(_message(tenant_id="tenant-a"))
+
+        assert list(results) == ["agent-1", "agent-3"]
+        assert sorted(kafka.delivered) == ["agent-1", "agent-3"]
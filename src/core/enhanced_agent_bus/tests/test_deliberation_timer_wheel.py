@@ -0,0 +1,152 @@
+"""
+ACGS-2 Enhanced Agent Bus - Deliberation Timer Wheel Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for the TimerWheel that owns DeliberationQueue timeouts.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from enhanced_agent_bus.deliberation_layer.deliberation_queue import (
+    DeliberationQueue,
+    DeliberationStatus,
+    TimerWheel,
+    VoteType,
+)
+from enhanced_agent_bus.models import AgentMessage, MessageType
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTimerWheel:
+    """Tests for TimerWheel."""
+
+    def test_fires_in_batches_at_deadline(self):
+        clock = FakeClock()
+        wheel = TimerWheel(tick=1.0, slots=8, levels=2, clock=clock)
+        for key in ("a", "b", "c"):
+            wheel.schedule(key, 3)
+        wheel.schedule("d", 5)
+
+        clock.now = 2.5
+        assert wheel.advance() == []
+        clock.now = 3.0
+        assert sorted(wheel.advance()) == ["a", "b", "c"]
+        clock.now = 10.0
+        assert wheel.advance() == ["d"]
+        assert len(wheel) == 0
+
+    def test_cancel_and_reschedule(self):
+        clock = FakeClock()
+        wheel = TimerWheel(tick=1.0, slots=8, levels=2, clock=clock)
+        wheel.schedule("a", 2)
+        wheel.schedule("b", 2)
+        assert wheel.cancel("a") is True
+        assert wheel.cancel("a") is False
+        wheel.schedule("b", 6)
+
+        clock.now = 4.0
+        assert wheel.advance() == []
+        clock.now = 6.0
+        assert wheel.advance() == ["b"]
+
+    def test_cascading_and_overflow_deadlines(self):
+        clock = FakeClock()
+        wheel = TimerWheel(tick=1.0, slots=4, levels=2, clock=clock)
+        rng = random.Random(7)
+        deadlines = {}
+        fired = {}
+        for key in range(500):
+            clock.now += rng.random() * 0.3
+            delay = rng.uniform(0, 100)  # the wheel itself only spans 16 ticks
+            wheel.schedule(key, delay)
+            deadlines[key] = clock.now + delay
+            for expired in wheel.advance():
+                fired[expired] = clock.now
+        while len(wheel):
+            clock.now += 0.5
+            for expired in wheel.advance():
+                fired[expired] = clock.now
+
+        assert fired.keys() == deadlines.keys()
+        for key, deadline in deadlines.items():
+            assert deadline - 1e-9 <= fired[key] <= deadline + 1.5
+
+
+def _message() -> AgentMessage:
+    return AgentMessage(
+        from_agent="agent-a",
+        to_agent="agent-b",
+        message_type=MessageType.GOVERNANCE_REQUEST,
+        content={"action": "review"},
+    )
+
+
+class TestDeliberationQueueTimeouts:
+    """Tests for DeliberationQueue timeout handling."""
+
+    @pytest.fixture
+    async def queue(self):
+        queue = DeliberationQueue(timeout_tick=0.02)
+        yield queue
+        await queue.stop()
+
+    async def test_single_runner_expires_batch(self, queue):
+        ids = [
+            await queue.enqueue_for_deliberation(_message(), timeout_seconds=0.1) for _ in range(50)
+        ]
+
+        assert len(queue.processing_tasks) == 1
+        assert queue.get_queue_status()["processing_count"] == 50
+
+        await asyncio.sleep(0.3)
+        assert all(queue.get_task(i).status == DeliberationStatus.TIMED_OUT for i in ids)
+        assert queue.stats["timed_out"] == 50
+        assert queue.get_queue_status()["processing_count"] == 0
+
+    async def test_resolved_task_cancels_deadline(self, queue):
+        voted = await queue.enqueue_for_deliberation(
+            _message(), requires_multi_agent_vote=True, timeout_seconds=0.1
+        )
+        resolved = await queue.enqueue_for_deliberation(_message(), timeout_seconds=0.1)
+        pending = await queue.enqueue_for_deliberation(_message(), timeout_seconds=0.1)
+
+        for i in range(5):
+            await queue.submit_agent_vote(voted, f"agent-{i}", VoteType.APPROVE, "ok")
+        await queue.resolve_task(resolved, approved=False)
+        assert queue.get_queue_status()["processing_count"] == 1
+
+        await asyncio.sleep(0.3)
+        assert queue.get_task(voted).status == DeliberationStatus.APPROVED
+        assert queue.get_task(resolved).status == DeliberationStatus.REJECTED
+        assert queue.get_task(pending).status == DeliberationStatus.TIMED_OUT
+        assert queue.stats["timed_out"] == 1
+
+    async def test_processing_count_tracks_open_monitored_tasks(self, queue):
+        ids = [
+            await queue.enqueue_for_deliberation(_message(), timeout_seconds=60) for _ in range(3)
+        ]
+        queue.get_task(ids[0]).status = DeliberationStatus.APPROVED
+
+        assert queue.get_queue_status()["processing_count"] == 2
+
+        await queue.stop()
+        assert queue.get_queue_status()["processing_count"] == 0
+
+    async def test_stop_cancels_runner(self, queue):
+        await queue.enqueue_for_deliberation(_message(), timeout_seconds=60)
+        runner = queue._timeout_runner
+
+        await queue.stop()
+
+        assert runner.done()
+        assert queue.processing_tasks == []
@@ -0,0 +1,148 @@
+"""
+ACGS-2 Enhanced Agent Bus - Deliberation Write-Ahead Log Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for the write-ahead log behind DeliberationQueue persistence.
+"""
+
+import json
+import os
+
+from enhanced_agent_bus.deliberation_layer.deliberation_queue import (
+    DeliberationQueue,
+    DeliberationStatus,
+    VoteType,
+    WriteAheadLog,
+)
+from enhanced_agent_bus.models import AgentMessage, MessageType
+
+
+def _message() -> AgentMessage:
+    return AgentMessage(
+        from_agent="agent-a",
+        to_agent="agent-b",
+        message_type=MessageType.GOVERNANCE_REQUEST,
+        content={"action": "review"},
+    )
+
+
+def _records(path) -> list:
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestWriteAheadLog:
+    """Tests for WriteAheadLog."""
+
+    def test_fsync_is_batched(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr(os, "fsync", synced.append)
+        wal = WriteAheadLog(str(tmp_path / "q.wal"), fsync_batch=4, fsync_interval=3600)
+
+        for i in range(10):
+            wal.append({"op": "status", "id": str(i), "status": "pending"})
+
+        assert len(synced) == 2
+        wal.close()
+        assert len(synced) == 3
+        assert len(_records(wal.path)) == 10
+
+    def test_replay_cuts_torn_tail(self, tmp_path):
+        path = tmp_path / "q.wal"
+        path.write_text('{"op":"put","id":"a"}\n{"op":"status","id":"a","sta')
+        wal = WriteAheadLog(str(path))
+
+        assert list(wal.replay()) == [{"op": "put", "id": "a"}]
+        wal.append({"op": "status", "id": "a", "status": "approved"})
+        wal.close()
+        assert _records(path)[-1]["status"] == "approved"
+        assert wal.records == 2
+
+
+class TestDeliberationQueueWal:
+    """Tests for DeliberationQueue write-ahead log persistence."""
+
+    async def test_mutations_append_instead_of_rewriting(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        queue = DeliberationQueue(persistence_path=path)
+        voted = await queue.enqueue_for_deliberation(_message(), requires_multi_agent_vote=True)
+        reviewed = await queue.enqueue_for_deliberation(_message())
+        await queue.submit_agent_vote(voted, "agent-1", VoteType.APPROVE, "ok")
+        await queue.update_status(reviewed, "under_review")
+        await queue.submit_human_decision(reviewed, "alice", DeliberationStatus.REJECTED, "no")
+        await queue.stop()
+
+        assert not os.path.exists(path)
+        ops = [(r["op"], r.get("status")) for r in _records(f"{path}.wal")]
+        assert ops == [
+            ("put", None),
+            ("put", None),
+            ("status", "under_review"),
+            ("status", "rejected"),
+        ]
+
+    async def test_recovery_replays_log_over_snapshot(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        queue = DeliberationQueue(persistence_path=path)
+        first = await queue.enqueue_for_deliberation(_message())
+        queue._save_tasks()
+        second = await queue.enqueue_for_deliberation(_message())
+        await queue.resolve_task(first, approved=True)
+        await queue.stop()
+
+        restored = DeliberationQueue(persistence_path=path)
+
+        assert restored.get_task(first).status == DeliberationStatus.APPROVED
+        assert restored.get_task(second).status == DeliberationStatus.PENDING
+        await restored.stop()
+
+    async def test_compaction_folds_log_into_snapshot(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        queue = DeliberationQueue(persistence_path=path, compact_threshold=10)
+        ids = [await queue.enqueue_for_deliberation(_message()) for _ in range(25)]
+        await queue.stop()
+
+        with open(path) as f:
+            snapshot = json.load(f)
+        assert len(snapshot) >= 10
+        assert not os.path.exists(f"{path}.wal.old")
+        assert queue._wal.records == 25 - len(snapshot)
+
+        restored = DeliberationQueue(persistence_path=path)
+        assert list(restored.tasks) == ids
+        await restored.stop()
+
+    async def test_interrupted_compaction_is_recovered(self, tmp_path):
+        path = str(tmp_path / "tasks.json")
+        queue = DeliberationQueue(persistence_path=path)
+        first = await queue.enqueue_for_deliberation(_message())
+        queue._wal.rotate()  # crash before the snapshot was written
+        second = await queue.enqueue_for_deliberation(_message())
+        await queue.stop()
+
+        restored = DeliberationQueue(persistence_path=path)
+
+        assert set(restored.tasks) == {first, second}
+        assert not os.path.exists(f"{path}.wal.old")
+        assert not os.path.exists(f"{path}.wal")
+        await restored.stop()
+
+    async def test_failed_snapshot_is_retried_by_next_compaction(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "tasks.json")
+        queue = DeliberationQueue(persistence_path=path, compact_threshold=10)
+        monkeypatch.setattr(queue, "_write_snapshot", lambda items: False)
+        ids = [await queue.enqueue_for_deliberation(_message()) for _ in range(10)]
+        await queue._compaction
+        assert os.path.exists(f"{path}.wal.old")
+
+        monkeypatch.undo()
+        ids += [await queue.enqueue_for_deliberation(_message()) for _ in range(5)]
+        await queue._compact()
+        await queue.stop()
+
+        assert not os.path.exists(f"{path}.wal.old")
+        with open(path) as f:
+            assert list(json.load(f)) == ids
+        restored = DeliberationQueue(persistence_path=path)
+        assert list(restored.tasks) == ids
+        await restored.stop()
@@ -12,6 +12,7 @@ import sys
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pytest
 
 # Add parent directory to path for module imports
@@ -34,6 +35,7 @@ from drift_monitoring import (
     DriftSeverity,
     DriftStatus,
     FeatureDriftResult,
+    HistogramSketch,
     check_drift_and_alert,
     detect_drift,
     get_drift_detector,
@@ -1002,5 +1004,119 @@ class TestErrorHandling:
                 assert result is False
 
 
+class TestHistogramSketch:
+    """Tests for HistogramSketch."""
+
+    def test_low_cardinality_gets_one_bin_per_value(self):
+        sketch = HistogramSketch.from_values([0, 1, 1, 2, 2, 2], bins=10)
+
+        assert sketch.edges == [0.5, 1.5]
+        assert sketch.counts == [1, 2, 3]
+
+    def test_quantile_bins_are_open_ended(self):
+        sketch = HistogramSketch.from_values(range(1000), bins=4)
+        sketch.add(-50.0)
+        sketch.add(5000.0)
+        sketch.add(float("nan"))
+
+        assert len(sketch.counts) == 4
+        assert sketch.counts[0] == 251 and sketch.counts[-1] == 251
+        assert sketch.total == 1002
+
+    def test_psi(self):
+        reference = HistogramSketch([0.0])
+        reference.add_many([-1.0] * 50 + [1.0] * 50)
+        current = reference.empty_like()
+        current.add_many([-1.0] * 20 + [1.0] * 80)
+
+        assert reference.psi(reference) == 0.0
+        expected = (0.5 - 0.2) * np.log(0.5 / 0.2) + (0.5 - 0.8) * np.log(0.5 / 0.8)
+        assert reference.psi(current) == pytest.approx(expected)
+
+
+class TestStreamingDriftDetection:
+    """Tests for DriftDetector streaming mode."""
+
+    @pytest.fixture
+    def detector(self):
+        return DriftDetector(psi_threshold=0.2, drift_share_threshold=0.5, min_samples=200)
+
+    @staticmethod
+    def observe(detector, rng, count, shift=0.0):
+        for _ in range(count):
+            detector.observe(
+                {"risk_score": rng.normal(shift), "agent_count": int(rng.integers(1, 4))}
+            )
+
+    def test_first_observations_become_reference(self, detector):
+        rng = np.random.default_rng(1)
+        self.observe(detector, rng, 199)
+
+        report = detector.detect_drift_streaming()
+        assert report.status == DriftStatus.NO_REFERENCE
+
+        self.observe(detector, rng, 1)
+        report = detector.detect_drift_streaming()
+        assert report.status == DriftStatus.INSUFFICIENT_DATA
+        assert report.reference_samples == 200
+
+    def test_detects_shift_and_resets_window(self, detector):
+        rng = np.random.default_rng(2)
+        self.observe(detector, rng, 1000)
+        self.observe(detector, rng, 1000, shift=1.0)
+
+        report = detector.detect_drift_streaming()
+
+        assert report.status == DriftStatus.SUCCESS
+        scores = {f.feature_name: f for f in report.feature_results}
+        assert scores["risk_score"].drift_detected
+        assert not scores["agent_count"].drift_detected
+        assert report.drift_share == 0.5 and report.dataset_drift
+        assert report.to_dict()["feature_results"][0]["stattest"] == "psi"
+        assert detector.get_last_report() is report
+
+        self.observe(detector, rng, 1000)
+        report = detector.detect_drift_streaming()
+        assert report.current_samples == 1000
+        assert not report.dataset_drift
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not available")
+    def test_reference_sketches_come_from_reference_data(self, detector):
+        import pandas as pd
+
+        rng = np.random.default_rng(3)
+        detector.load_reference_data(
+            pd.DataFrame({"risk_score": rng.normal(size=5000), "label": rng.integers(0, 2, 5000)})
+        )
+        self.observe(detector, rng, 500)
+
+        report = detector.detect_drift_streaming()
+
+        assert report.reference_samples == 5000
+        assert [f.feature_name for f in report.feature_results] == ["risk_score"]
+        assert report.feature_results[0].psi_value < 0.1
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not available")
+    def test_reference_data_without_numeric_features_is_scanned_once(self, detector):
+        import pandas as pd
+
+        reference = pd.DataFrame({"agent_type": ["worker", "auditor"] * 100})
+        detector.load_reference_data(reference)
+        rng = np.random.default_rng(4)
+
+        with patch.object(
+            pd.api.types, "is_numeric_dtype", wraps=pd.api.types.is_numeric_dtype
+        ) as is_numeric:
+            self.observe(detector, rng, 50)
+            report = detector.detect_drift_streaming()
+            assert is_numeric.call_count == 1
+
+            detector.load_reference_data(reference)
+            self.observe(detector, rng, 50)
+            assert is_numeric.call_count == 2
+
+        assert report.status == DriftStatus.NO_REFERENCE
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
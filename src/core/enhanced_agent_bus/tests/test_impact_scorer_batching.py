@@ -0,0 +1,195 @@
+"""
+ACGS-2 Enhanced Agent Bus - Impact Scorer Micro-batching Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for the InferenceBatcher and length-bucketed dynamic padding used by
+ImpactScorer async scoring.
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from enhanced_agent_bus.deliberation_layer.impact_scorer import ImpactScorer, InferenceBatcher
+
+
+class RecordingInfer:
+    """Embeds each text as [len(text)] and records batches and threads."""
+
+    def __init__(self):
+        self.batches = []
+        self.threads = set()
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        return np.array([[float(len(t))] for t in texts])
+
+
+class WordTokenizer:
+    """Whitespace tokenizer with [CLS]/[SEP] ids, shaped like a HF tokenizer."""
+
+    pad_token_id = 0
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, texts, truncation=True, max_length=512):
+        self.calls += 1
+        if isinstance(texts, str):
+            texts = [texts]
+        ids = [[101] + [7] * len(t.split()) + [102] for t in texts]
+        ids = [seq[:max_length] for seq in ids]
+        return {"input_ids": ids, "attention_mask": [[1] * len(seq) for seq in ids]}
+
+
+class FakeSession:
+    """ONNX session stand-in whose [CLS] row encodes the unpadded length."""
+
+    def __init__(self):
+        self.shapes = []
+
+    def get_inputs(self):
+        return [type("Input", (), {"name": n})() for n in ("input_ids", "attention_mask")]
+
+    def run(self, _, inputs):
+        ids, mask = inputs["input_ids"], inputs["attention_mask"]
+        self.shapes.append(ids.shape)
+        hidden = np.zeros(ids.shape + (4,), dtype=np.float32)
+        hidden[:, 0, 0] = mask.sum(axis=1)
+        hidden[:, 0, 1] = 1.0
+        return [hidden]
+
+
+@pytest.fixture
+def scorer():
+    with patch("enhanced_agent_bus.deliberation_layer.impact_scorer.TRANSFORMERS_AVAILABLE", False):
+        scorer = ImpactScorer(use_onnx=True, batch_max_size=8, batch_max_wait_ms=20)
+    scorer.tokenizer = WordTokenizer()
+    scorer.session = FakeSession()
+    scorer._onnx_enabled = True
+    scorer._bert_enabled = True
+    scorer._model_loaded = True
+    yield scorer
+    scorer.close()
+
+
+class TestInferenceBatcher:
+    """Tests for InferenceBatcher."""
+
+    async def test_concurrent_requests_share_batches(self):
+        infer = RecordingInfer()
+        batcher = InferenceBatcher(infer, max_batch_size=4, max_wait_ms=50)
+        texts = [f"text-{'x' * i}" for i in range(10)]
+
+        results = await asyncio.gather(*(batcher.submit(t) for t in texts))
+
+        assert [len(b) for b in infer.batches] == [4, 4, 2]
+        assert [float(r[0, 0]) for r in results] == [float(len(t)) for t in texts]
+        assert infer.threads and threading.current_thread().name not in infer.threads
+        batcher.close()
+
+    async def test_partial_batch_dispatched_after_max_wait(self):
+        infer = RecordingInfer()
+        batcher = InferenceBatcher(infer, max_batch_size=64, max_wait_ms=10)
+
+        result = await asyncio.wait_for(batcher.submit("alone"), timeout=1.0)
+
+        assert float(result[0, 0]) == 5.0
+        assert infer.batches == [["alone"]]
+        batcher.close()
+
+    async def test_groups_run_smallest_key_first(self):
+        infer = RecordingInfer()
+        batcher = InferenceBatcher(infer, max_batch_size=4, max_wait_ms=50, group_key=len)
+
+        await asyncio.gather(*(batcher.submit(t) for t in ("ccc", "a", "ccc", "a")))
+
+        assert infer.batches == [["a", "a"], ["ccc", "ccc"]]
+        batcher.close()
+
+    async def test_split_groups_reach_infer(self):
+        def split(texts):
+            return [([i], [text.upper()]) for i, text in enumerate(texts)]
+
+        infer = RecordingInfer()
+        batcher = InferenceBatcher(infer, max_batch_size=2, max_wait_ms=50, split=split)
+
+        results = await asyncio.gather(batcher.submit("ab"), batcher.submit("c"))
+
+        assert infer.batches == [["AB"], ["C"]]
+        assert [float(r[0, 0]) for r in results] == [2.0, 1.0]
+        batcher.close()
+
+    async def test_inference_errors_reach_every_caller(self):
+        def infer(texts):
+            raise RuntimeError("model crashed")
+
+        batcher = InferenceBatcher(infer, max_batch_size=2, max_wait_ms=50)
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        batcher.close()
+
+
+class TestDynamicPadding:
+    """Tests for ImpactScorer length-bucketed padding."""
+
+    def test_length_buckets(self):
+        assert ImpactScorer._length_bucket(3) == 32
+        assert ImpactScorer._length_bucket(32) == 32
+        assert ImpactScorer._length_bucket(33) == 40
+        assert ImpactScorer._length_bucket(129) == 160
+        assert ImpactScorer._length_bucket(512) == 512
+
+    def test_buckets_padded_to_own_longest_text(self, scorer):
+        texts = ["short alert", "word " * 200, "another short one", "word " * 150]
+
+        embeddings = scorer._embed_batch(texts)
+
+        assert sorted(scorer.session.shapes) == [(1, 152), (1, 202), (2, 5)]
+        assert embeddings[:, 0].tolist() == [4.0, 202.0, 5.0, 152.0]
+
+    async def test_async_scoring_batches_forward_passes(self, scorer):
+        scorer._keyword_embeddings = np.array([[0.0, 1.0, 0.0, 0.0]], dtype=np.float32)
+        messages = [{"content": f"routine status update {i}"} for i in range(16)]
+
+        scores = await asyncio.gather(*(scorer.calculate_impact_score_async(m) for m in messages))
+
+        assert len(scores) == 16
+        assert scorer._batcher.stats == {"requests": 16, "batches": 2}
+        assert len(scorer.session.shapes) == 2
+
+    async def test_async_batches_are_tokenized_once(self, scorer):
+        scorer._keyword_embeddings = np.array([[0.0, 1.0, 0.0, 0.0]], dtype=np.float32)
+        messages = [{"content": "short alert"}, {"content": "word " * 200}] * 4
+
+        await asyncio.gather(*(scorer.calculate_impact_score_async(m) for m in messages))
+
+        assert scorer._batcher.stats == {"requests": 8, "batches": 1}
+        assert scorer.tokenizer.calls == 1
+        assert sorted(scorer.session.shapes) == [(1, 4), (1, 202)]
+
+    def test_unusable_tokenizer_output_gives_zero_rows(self, scorer):
+        scorer.tokenizer = lambda texts, **kwargs: None
+
+        embeddings = scorer._embed_batch(["short alert", "payment transfer"])
+
+        assert embeddings.shape == (2, 768) and not embeddings.any()
+        assert scorer.session.shapes == []
+        assert len(scorer._embedding_cache) == 0
+
+
+def test_keyword_only_scorer_does_not_load_model_lazily():
+    with patch("enhanced_agent_bus.deliberation_layer.impact_scorer.TRANSFORMERS_AVAILABLE", False):
+        scorer = ImpactScorer(use_onnx=False)
+
+    with patch.object(ImpactScorer, "_load_transformer_model") as load:
+        scorer.calculate_impact_score({"content": "critical security breach"})
+
+    load.assert_not_called()
@@ -0,0 +1,172 @@
+"""
+ACGS-2 Enhanced Agent Bus - Impact Scorer Embedding Cache Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for the embedding cache, the memory-mapped shared store and the
+vectorized keyword similarity used by ImpactScorer.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from enhanced_agent_bus.deliberation_layer.impact_scorer import (
+    EmbeddingCache,
+    EmbeddingStore,
+    ImpactScorer,
+    cosine_similarity_fallback,
+)
+
+
+class WordTokenizer:
+    """Whitespace tokenizer with [CLS]/[SEP] ids, shaped like a HF tokenizer."""
+
+    pad_token_id = 0
+
+    def __call__(self, texts, truncation=True, max_length=512):
+        if isinstance(texts, str):
+            texts = [texts]
+        ids = [[101] + [7] * len(t.split()) + [102] for t in texts]
+        return {"input_ids": ids, "attention_mask": [[1] * len(seq) for seq in ids]}
+
+
+class CountingSession:
+    """ONNX session stand-in counting the rows it embeds."""
+
+    def __init__(self):
+        self.rows = 0
+
+    def get_inputs(self):
+        return [type("Input", (), {"name": n})() for n in ("input_ids", "attention_mask")]
+
+    def run(self, _, inputs):
+        mask = inputs["attention_mask"]
+        self.rows += len(mask)
+        hidden = np.zeros(mask.shape + (4,), dtype=np.float32)
+        hidden[:, 0, 0] = mask.sum(axis=1)
+        hidden[:, 0, 1] = 1.0
+        return [hidden]
+
+
+def _read_store(path):
+    return EmbeddingStore(path, dim=4, slots=64).get(42)
+
+
+@pytest.fixture
+def scorer():
+    with patch("enhanced_agent_bus.deliberation_layer.impact_scorer.TRANSFORMERS_AVAILABLE", False):
+        scorer = ImpactScorer(use_onnx=True, batch_max_wait_ms=20)
+    scorer.tokenizer = WordTokenizer()
+    scorer.session = CountingSession()
+    scorer._onnx_enabled = True
+    scorer._bert_enabled = True
+    scorer._model_loaded = True
+    yield scorer
+    scorer.close()
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_key_normalizes_case_and_whitespace(self):
+        assert EmbeddingCache.key("Critical  Alert\n") == EmbeddingCache.key("critical alert")
+        assert EmbeddingCache.key("critical alert") != EmbeddingCache.key("critical alerts")
+
+    def test_lru_is_bounded(self):
+        cache = EmbeddingCache(maxsize=2)
+        cache.put(1, np.ones(3))
+        cache.put(2, np.ones(3))
+        assert cache.get(1) is not None
+        cache.put(3, np.ones(3))
+
+        assert len(cache) == 2
+        assert cache.get(2) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestEmbeddingStore:
+    """Tests for the memory-mapped EmbeddingStore."""
+
+    def test_restarted_cache_starts_warm(self, tmp_path):
+        path = str(tmp_path / "emb.bin")
+        key = EmbeddingCache.key("payment transfer")
+        EmbeddingCache(store=EmbeddingStore(path, dim=4, slots=64)).put(key, np.arange(4.0))
+
+        restarted = EmbeddingCache(store=EmbeddingStore(path, dim=4, slots=64))
+
+        assert restarted.get(key).tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    def test_writes_are_visible_to_other_processes(self, tmp_path):
+        path = str(tmp_path / "emb.bin")
+        store = EmbeddingStore(path, dim=4, slots=64)
+        store.put(42, np.full(4, 7.0))
+        context = multiprocessing.get_context("fork")
+
+        with ProcessPoolExecutor(1, mp_context=context) as pool:
+            vec = pool.submit(_read_store, path).result(timeout=30)
+
+        assert vec.tolist() == [7.0] * 4
+
+    def test_corrupt_record_reads_as_miss(self, tmp_path):
+        store = EmbeddingStore(str(tmp_path / "emb.bin"), dim=4, slots=64)
+        store.put(42, np.ones(4))
+        way = int(np.flatnonzero(store._table["key"][42 % store.sets] == 42)[0])
+        store._table["vec"][42 % store.sets, way, 0] = 5.0
+
+        assert store.get(42) is None
+
+    def test_layout_mismatch_is_rejected(self, tmp_path):
+        path = str(tmp_path / "emb.bin")
+        EmbeddingStore(path, dim=4, slots=64)
+
+        with pytest.raises(ValueError):
+            EmbeddingStore(path, dim=8, slots=64)
+
+
+class TestScorerEmbeddingCache:
+    """Tests for ImpactScorer embedding reuse and vectorized similarity."""
+
+    def test_repeated_texts_are_embedded_once(self, scorer):
+        texts = ["routine status update", "payment transfer", "Routine  status update"]
+
+        first = scorer._embed_batch(texts)
+        second = scorer._embed_batch(texts)
+
+        assert scorer.session.rows == 2
+        assert np.array_equal(first, second)
+        assert np.array_equal(first[0], first[2])
+
+    async def test_async_scoring_skips_batcher_on_hit(self, scorer):
+        scorer._keyword_embeddings = np.array([[0.0, 1.0, 0.0, 0.0]], dtype=np.float32)
+        message = {"content": "routine status update"}
+
+        await scorer.calculate_impact_score_async(message)
+        await scorer.calculate_impact_score_async(message)
+
+        assert scorer._batcher.stats["requests"] == 1
+
+    def test_matrix_similarity_matches_pairwise_fallback(self, scorer):
+        rng = np.random.default_rng(3)
+        kw_emb = rng.normal(size=(6, 4)).astype(np.float32)
+        embeddings = rng.normal(size=(5, 4)).astype(np.float32)
+        embeddings[2] = 0.0
+
+        got = scorer._max_keyword_similarity(embeddings, kw_emb)
+
+        expected = [max(cosine_similarity_fallback(e, k) for k in kw_emb) for e in embeddings]
+        assert np.allclose(got, expected, atol=1e-6)
+
+    def test_batch_scoring_uses_one_similarity_product(self, scorer):
+        scorer._keyword_embeddings = np.array([[0.0, 1.0, 0.0, 0.0]], dtype=np.float32)
+        messages = [{"content": f"status update {i}"} for i in range(4)]
+
+        with patch.object(
+            scorer, "_max_keyword_similarity", wraps=scorer._max_keyword_similarity
+        ) as similarity:
+            scores = scorer.score_messages_batch(messages)
+
+        assert len(scores) == 4
+        assert similarity.call_count == 1
@@ -11,6 +11,7 @@ from core.enhanced_agent_bus.deliberation_layer.intent_classifier import (
     ClassificationResult,
     IntentClassifier,
     IntentType,
+    KeywordMatcher,
     RoutingPath,
 )
 
@@ -42,6 +43,60 @@ def test_classify_general():
     assert classifier.classify("Remind me to buy milk") == IntentType.GENERAL
 
 
+def test_classify_with_confidence_counts_all_intents_in_one_pass():
+    classifier = IntentClassifier()
+    intent, confidence = classifier.classify_with_confidence(
+        "Write a POEM or a song, then tell me about the poem step by step"
+    )
+    assert intent == IntentType.CREATIVE
+    assert confidence == pytest.approx(0.8)
+    assert classifier._matcher.count("Write a POEM or a song") == (0, 0, 2)
+
+
+@pytest.mark.parametrize("automaton_min_keywords", [1, 24])
+def test_keyword_matcher_counts_overlapping_keywords_once(automaton_min_keywords):
+    matcher = KeywordMatcher(
+        {IntentType.FACTUAL: ["what is", "is the"], IntentType.CREATIVE: ["is the", "poem"]},
+        automaton_min_keywords=automaton_min_keywords,
+    )
+    assert (matcher._automaton is not None) == (automaton_min_keywords == 1)
+    assert matcher.count("What is the poem? What is the poem?") == (2, 2)
+    assert matcher.count("nothing here") == (0, 0)
+
+
+def test_keyword_matcher_memoizes_repeated_content():
+    matcher = KeywordMatcher({IntentType.REASONING: ["analyze"]})
+    content = "please analyze " + "x" * 10_000
+    with patch.object(matcher, "_count", wraps=matcher._count) as scan:
+        assert matcher.count(content) == (1,)
+        assert matcher.count(content) == (1,)
+    assert scan.call_count == 1
+    assert [len(key) for key in matcher._cache] == [16]
+
+
+def test_keyword_matcher_cache_is_bounded_lru():
+    matcher = KeywordMatcher({IntentType.REASONING: ["analyze"]}, cache_size=2)
+    for content in ("a", "b", "a", "c"):
+        matcher.count(content)
+    with patch.object(matcher, "_count", wraps=matcher._count) as scan:
+        matcher.count("a")
+        matcher.count("b")
+    assert len(matcher._cache) == 2
+    assert scan.call_count == 1
+
+
+def test_keyword_matcher_without_automaton():
+    with patch(
+        "core.enhanced_agent_bus.deliberation_layer.intent_classifier.AHOCORASICK_AVAILABLE",
+        False,
+    ):
+        matcher = KeywordMatcher(
+            {IntentType.FACTUAL: ["who is", "date of"]}, automaton_min_keywords=1
+        )
+    assert matcher._automaton is None
+    assert matcher.count("Who is he and what is the date of birth?") == (2,)
+
+
 @pytest.mark.asyncio
 async def test_classify_async_heuristic():
     classifier = IntentClassifier()
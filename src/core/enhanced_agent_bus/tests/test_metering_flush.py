@@ -0,0 +1,177 @@
+"""
+ACGS-2 Enhanced Agent Bus - Metering Flush Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for AsyncMeteringQueue's bulk, pre-aggregated flushes.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from enhanced_agent_bus.metering_integration import (
+    CONSTITUTIONAL_HASH,
+    METERING_AVAILABLE,
+    AsyncMeteringQueue,
+    MeterableOperation,
+    MeteringConfig,
+    MeteringTier,
+    UsageMeteringService,
+)
+
+pytestmark = pytest.mark.skipif(not METERING_AVAILABLE, reason="Metering service not available")
+
+
+@pytest.fixture
+def metering_config():
+    """Create a metering configuration for testing."""
+    return MeteringConfig(
+        enabled=True,
+        max_queue_size=100,
+        batch_size=10,
+        flush_interval_seconds=0.1,
+        constitutional_hash=CONSTITUTIONAL_HASH,
+    )
+
+
+@pytest.fixture
+def service():
+    """Create an in-memory metering service."""
+    return UsageMeteringService(constitutional_hash=CONSTITUTIONAL_HASH)
+
+
+def _event(agent_id="agent-1", metadata=None, timestamp=None, latency_ms=1.0):
+    return {
+        "tenant_id": "tenant",
+        "operation": MeterableOperation.AGENT_MESSAGE,
+        "tier": MeteringTier.STANDARD,
+        "agent_id": agent_id,
+        "tokens_processed": 2,
+        "latency_ms": latency_ms,
+        "compliance_score": 1.0,
+        "metadata": metadata or {},
+        "timestamp": timestamp or datetime(2026, 1, 1, 12, 0, 0, 100, tzinfo=timezone.utc),
+    }
+
+
+class TestAggregate:
+    """Tests for collapsing queued events into usage counter rows."""
+
+    def test_events_with_same_attribution_share_a_row(self):
+        rows = AsyncMeteringQueue._aggregate(
+            [_event(latency_ms=1.0), _event(latency_ms=3.0), _event(latency_ms=2.0)]
+        )
+
+        assert len(rows) == 1
+        assert rows[0]["units"] == 3
+        assert rows[0]["tokens_processed"] == 6
+        assert rows[0]["latency_ms"] == 2.0
+        assert rows[0]["agent_id"] == "agent-1"
+
+    def test_rows_keep_agent_and_metadata(self):
+        rows = AsyncMeteringQueue._aggregate(
+            [
+                _event("agent-1", {"to_agent": "a"}),
+                _event("agent-2", {"to_agent": "a"}),
+                _event("agent-1", {"to_agent": "b"}),
+                _event("agent-1", {"to_agent": "a"}),
+                _event("agent-1", {"tags": ["x"]}),
+                _event("agent-1", {"tags": ["x"]}),
+            ]
+        )
+
+        assert [(r["agent_id"], r["metadata"], r["units"]) for r in rows] == [
+            ("agent-1", {"to_agent": "a"}, 2),
+            ("agent-2", {"to_agent": "a"}, 1),
+            ("agent-1", {"to_agent": "b"}, 1),
+            ("agent-1", {"tags": ["x"]}, 2),
+        ]
+
+    def test_rows_split_by_second(self):
+        first = datetime(2026, 1, 1, 12, 0, 0, 500, tzinfo=timezone.utc)
+        same_second = first.replace(microsecond=900_000)
+        next_second = first.replace(second=1)
+
+        rows = AsyncMeteringQueue._aggregate(
+            [_event(timestamp=first), _event(timestamp=same_second), _event(timestamp=next_second)]
+        )
+
+        assert [(r["timestamp"], r["units"]) for r in rows] == [(first, 2), (next_second, 1)]
+
+
+class TestBulkFlush:
+    """Tests for flushing the queue through record_events."""
+
+    async def test_flush_writes_aggregated_counters(self, metering_config, service):
+        """Test a flush drains the queue into one bulk write of usage counters."""
+        queue = AsyncMeteringQueue(metering_config, service)
+        for i in range(30):
+            queue.enqueue_nowait(
+                tenant_id=f"tenant-{i % 2}",
+                operation=MeterableOperation.CONSTITUTIONAL_VALIDATION,
+                tier=MeteringTier.STANDARD,
+                agent_id="agent-1",
+                tokens_processed=2,
+                latency_ms=float(i % 2 + 1),
+            )
+
+        await queue._flush_batch()
+
+        assert queue._queue.qsize() == 0
+        assert queue._events_flushed == 30
+        assert sum(e.units for e in service._event_buffer) == 30
+        assert len(service._event_buffer) <= 4
+        summary = await service.get_usage_summary("tenant-1")
+        assert summary["total_events"] == 15
+        assert summary["total_tokens"] == 30
+        assert summary["avg_latency_ms"] == 2.0
+        assert {e.agent_id for e in service._event_buffer} == {"agent-1"}
+        assert queue.get_metrics()["flushes"] == 1
+
+    async def test_flush_loop_wakes_at_high_water(self, metering_config, service):
+        """Test a half-full queue is flushed before the flush interval elapses."""
+        metering_config.flush_interval_seconds = 60.0
+        queue = AsyncMeteringQueue(metering_config, service)
+        await queue.start()
+        half = metering_config.max_queue_size // 2
+        for i in range(half):
+            queue.enqueue_nowait(
+                tenant_id="tenant",
+                operation=MeterableOperation.CONSTITUTIONAL_VALIDATION,
+                agent_id=f"agent-{i % 5}",
+            )
+
+        await asyncio.sleep(0.1)
+
+        assert queue._events_flushed == half
+        agents = {e.agent_id: 0 for e in service._event_buffer}
+        for event in service._event_buffer:
+            agents[event.agent_id] += event.units
+        assert agents == {f"agent-{i}": half // 5 for i in range(5)}
+        await queue.stop()
+
+    async def test_invalid_row_only_drops_its_own_units(self, metering_config, service):
+        """Test a rejected chunk is retried row by row and only the bad row is dropped."""
+        queue = AsyncMeteringQueue(metering_config, service)
+        for agent_id in ("agent-1", "agent-1", "agent-2"):
+            queue.enqueue_nowait(
+                tenant_id="tenant",
+                operation=MeterableOperation.AGENT_MESSAGE,
+                agent_id=agent_id,
+            )
+        queue.enqueue_nowait(
+            tenant_id="tenant",
+            operation=MeterableOperation.AGENT_MESSAGE,
+            tier="not-a-tier",
+            agent_id="agent-3",
+        )
+
+        await queue._flush_batch()
+
+        assert queue._events_flushed == 3
+        assert queue.get_metrics()["events_dropped"] == 1
+        assert {e.agent_id: e.units for e in service._event_buffer} == {
+            "agent-1": 2,
+            "agent-2": 1,
+        }
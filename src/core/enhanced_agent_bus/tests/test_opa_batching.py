@@ -0,0 +1,168 @@
+"""
+ACGS-2 Enhanced Agent Bus - OPA Evaluation Batching Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for PolicyEvaluationBatcher coalescing of concurrent OPA HTTP
+evaluations, against an in-process stub OPA server.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from enhanced_agent_bus.opa_client import OPAClient
+
+
+class StubOPA:
+    """httpx transport handler emulating the OPA data and batch APIs."""
+
+    def __init__(self, batch_supported: bool = True, fail_batch: bool = False):
+        self.batch_supported = batch_supported
+        self.fail_batch = fail_batch
+        self.single_requests = 0
+        self.batch_sizes = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path.startswith("/v1/batch/data/"):
+            if not self.batch_supported:
+                return httpx.Response(404, json={"code": "not_found"})
+            if self.fail_batch:
+                return httpx.Response(500, json={"code": "internal_error"})
+            self.batch_sizes.append(len(body["inputs"]))
+            responses = {}
+            for key, value in body["inputs"].items():
+                if value.get("broken"):
+                    responses[key] = {"code": "eval_error", "http_status_code": "500"}
+                else:
+                    responses[key] = {"result": value["allow"]}
+            status = 207 if any("http_status_code" in r for r in responses.values()) else 200
+            return httpx.Response(status, json={"responses": responses})
+        self.single_requests += 1
+        return httpx.Response(200, json={"result": body["input"]["allow"]})
+
+
+async def _client(stub: StubOPA, **kwargs) -> OPAClient:
+    client = OPAClient(mode="http", enable_cache=False, enable_batching=True, **kwargs)
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(stub.handler))
+    return client
+
+
+class TestPolicyEvaluationBatcher:
+    """Tests for batched HTTP evaluation."""
+
+    async def test_concurrent_calls_share_one_request(self):
+        stub = StubOPA()
+        client = await _client(stub)
+
+        results = await asyncio.gather(
+            *(client.evaluate_policy({"allow": i % 2 == 0, "n": i}) for i in range(10))
+        )
+        await client.close()
+
+        assert stub.batch_sizes == [10]
+        assert stub.single_requests == 0
+        assert [r["allowed"] for r in results] == [i % 2 == 0 for i in range(10)]
+        assert results[0]["metadata"] == {"mode": "http", "policy_path": "data.acgs.allow"}
+
+    async def test_max_batch_size_splits_batches(self):
+        stub = StubOPA()
+        client = await _client(stub, max_batch_size=4)
+
+        await asyncio.gather(*(client.evaluate_policy({"allow": True, "n": i}) for i in range(10)))
+        stats = client.get_stats()
+        await client.close()
+
+        assert sorted(stub.batch_sizes) == [2, 4, 4]
+        assert stats["batched_evaluations"] == 10
+
+    async def test_paths_are_batched_separately(self):
+        stub = StubOPA()
+        client = await _client(stub)
+
+        await asyncio.gather(
+            client.evaluate_policy({"allow": True}, "data.acgs.allow"),
+            client.evaluate_policy({"allow": True, "x": 1}, "data.acgs.allow"),
+            client.evaluate_policy({"allow": True}, "data.acgs.other"),
+        )
+        await client.close()
+
+        assert stub.batch_sizes == [2]
+        assert stub.single_requests == 1
+
+    async def test_single_call_uses_plain_endpoint(self):
+        stub = StubOPA()
+        client = await _client(stub)
+
+        result = await client.evaluate_policy({"allow": True})
+        await client.close()
+
+        assert result["allowed"] is True
+        assert stub.single_requests == 1
+        assert stub.batch_sizes == []
+
+    async def test_per_input_error_fails_closed(self):
+        stub = StubOPA()
+        client = await _client(stub)
+
+        ok, broken = await asyncio.gather(
+            client.evaluate_policy({"allow": True}),
+            client.evaluate_policy({"allow": True, "broken": True}),
+        )
+        await client.close()
+
+        assert ok["allowed"] is True
+        assert broken["allowed"] is False
+        assert broken["metadata"]["security"] == "fail-closed"
+
+    async def test_batch_failure_fails_closed_for_all(self):
+        client = await _client(StubOPA(fail_batch=True))
+
+        results = await asyncio.gather(
+            *(client.evaluate_policy({"allow": True, "n": i}) for i in range(3))
+        )
+        await client.close()
+
+        assert all(r["allowed"] is False for r in results)
+        assert all(r["metadata"]["security"] == "fail-closed" for r in results)
+
+    async def test_misaligned_batch_results_fail_closed_for_all(self):
+        client = await _client(StubOPA())
+        evaluate_batch = client._evaluate_http_batch
+
+        async def short_batch(inputs, policy_path):
+            return (await evaluate_batch(inputs, policy_path))[:-1]
+
+        client._evaluate_http_batch = short_batch
+        results = await asyncio.gather(
+            *(client.evaluate_policy({"allow": True, "n": i}) for i in range(3))
+        )
+        await client.close()
+
+        assert all(r["allowed"] is False for r in results)
+        assert all(r["metadata"]["security"] == "fail-closed" for r in results)
+
+    async def test_missing_batch_endpoint_disables_batching(self):
+        stub = StubOPA(batch_supported=False)
+        client = await _client(stub)
+
+        first = await asyncio.gather(
+            *(client.evaluate_policy({"allow": True, "n": i}) for i in range(3))
+        )
+        second = await asyncio.gather(
+            *(client.evaluate_policy({"allow": False, "n": i}) for i in range(2))
+        )
+        stats = client.get_stats()
+        await client.close()
+
+        assert [r["allowed"] for r in first + second] == [True, True, True, False, False]
+        assert stub.single_requests == 5
+        assert stats["batching_enabled"] is False
+
+    async def test_batching_disabled_by_default(self):
+        client = OPAClient(mode="http", enable_cache=False)
+
+        assert client._batcher is None
+        assert "batching_enabled" not in client.get_stats()
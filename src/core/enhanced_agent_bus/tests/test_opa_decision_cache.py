@@ -0,0 +1,154 @@
+"""
+ACGS-2 Enhanced Agent Bus - OPA Decision Cache Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for the bounded in-process DecisionCache and single-flight
+coalescing of identical OPA evaluations.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from enhanced_agent_bus.opa_client import DecisionCache, OPAClient
+
+
+def _entry(result, age: float = 0.0) -> dict:
+    return {"result": result, "timestamp": time.time() - age}
+
+
+class TestDecisionCache:
+    """Tests for DecisionCache."""
+
+    def test_lru_eviction(self):
+        cache = DecisionCache(maxsize=2)
+        cache["opa:p:a"] = _entry(1)
+        cache["opa:p:b"] = _entry(2)
+        cache.get_fresh("opa:p:a", ttl=60)
+        cache["opa:p:c"] = _entry(3)
+
+        assert list(cache) == ["opa:p:a", "opa:p:c"]
+
+    def test_expired_entry_removed(self):
+        cache = DecisionCache()
+        cache["opa:p:a"] = _entry(1, age=100)
+
+        assert cache.get_fresh("opa:p:a", ttl=10) is None
+        assert "opa:p:a" not in cache
+
+    def test_invalidate_path_only_touches_path(self):
+        cache = DecisionCache()
+        cache["opa:data.a:1"] = _entry(1)
+        cache["opa:data.a:2"] = _entry(2)
+        cache["opa:data.b:1"] = _entry(3)
+
+        assert cache.invalidate_path("data.a") == 2
+        assert list(cache) == ["opa:data.b:1"]
+
+    def test_path_index_follows_eviction_and_deletes(self):
+        cache = DecisionCache(maxsize=1)
+        cache["opa:data.a:1"] = _entry(1)
+        cache["opa:data.a:2"] = _entry(2)
+        cache.pop("opa:data.a:2")
+
+        assert cache._path_keys == {}
+        assert cache.invalidate_path("data.a") == 0
+
+
+class TestSingleFlight:
+    """Tests for coalescing identical in-flight evaluations."""
+
+    @pytest.fixture
+    def client(self):
+        return OPAClient(mode="http", enable_cache=True)
+
+    async def test_identical_misses_share_one_evaluation(self, client):
+        calls = 0
+
+        async def evaluate(input_data, policy_path):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"result": True, "allowed": True, "metadata": {}}
+
+        with patch.object(client, "_evaluate_http", side_effect=evaluate):
+            results = await asyncio.gather(
+                *(client.evaluate_policy({"agent": "a", "action": "read"}) for _ in range(20))
+            )
+            cached = await client.evaluate_policy({"action": "read", "agent": "a"})
+
+        assert calls == 1
+        assert all(r["allowed"] for r in results)
+        assert cached is results[0]
+        assert client.get_stats()["coalesced_evaluations"] == 19
+        assert client._inflight == {}
+
+    async def test_cancelled_caller_does_not_cancel_others(self, client):
+        release = asyncio.Event()
+
+        async def evaluate(input_data, policy_path):
+            await release.wait()
+            return {"result": True, "allowed": True, "metadata": {}}
+
+        with patch.object(client, "_evaluate_http", side_effect=evaluate):
+            first = asyncio.ensure_future(client.evaluate_policy({"x": 1}))
+            second = asyncio.ensure_future(client.evaluate_policy({"x": 1}))
+            await asyncio.sleep(0)
+            first.cancel()
+            release.set()
+            result = await second
+
+        assert result["allowed"] is True
+
+    async def test_invalidation_during_flight_skips_caching(self, client):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def evaluate(input_data, policy_path):
+            started.set()
+            await release.wait()
+            return {"result": True, "allowed": True, "metadata": {}}
+
+        with patch.object(client, "_evaluate_http", side_effect=evaluate):
+            pending = asyncio.ensure_future(client.evaluate_policy({"x": 1}, "data.acgs.allow"))
+            await started.wait()
+            await client.clear_cache("data.acgs.allow")
+            release.set()
+            await pending
+
+        assert len(client._memory_cache) == 0
+
+    async def test_failures_are_shared_but_not_cached(self, client):
+        calls = 0
+
+        async def evaluate(input_data, policy_path):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise ConnectionError("OPA down")
+
+        with patch.object(client, "_evaluate_http", side_effect=evaluate):
+            results = await asyncio.gather(*(client.evaluate_policy({"x": 1}) for _ in range(5)))
+            await client.evaluate_policy({"x": 1})
+
+        assert calls == 2
+        assert all(r["allowed"] is False for r in results)
+        assert len(client._memory_cache) == 0
+
+    async def test_cache_key_unchanged(self, client):
+        input_data = {"b": [1, 2], "a": {"z": None}}
+        expected_json = json.dumps(input_data, sort_keys=True)
+
+        key = client._generate_cache_key("data.acgs.allow", input_data)
+
+        assert key == client._cache_key_from_json("data.acgs.allow", expected_json)
+        assert key.startswith("opa:data.acgs.allow:")
+
+    async def test_unserializable_input_fails_closed(self, client):
+        result = await client.evaluate_policy({"obj": object()})
+
+        assert result["allowed"] is False
+        assert result["metadata"]["security"] == "fail-closed"
@@ -17,6 +17,19 @@ def mock_redis():
     mock.hkeys.return_value = []
     mock.hexists.return_value = False
     mock.close = AsyncMock()
+
+    async def transaction(func, *watches, value_from_callable=False):
+        # Like redis-py: reads run immediately, writes after multi() run on EXEC.
+        queued = []
+        pipe = MagicMock(hexists=mock.hexists, hget=mock.hget, hgetall=mock.hgetall)
+        pipe.smembers = mock.smembers
+        for name in ("hsetnx", "hset", "hdel", "sadd", "srem", "delete", "set"):
+            setattr(pipe, name, lambda *args, _name=name: queued.append((_name, args)))
+        value = await func(pipe)
+        results = [await getattr(mock, name)(*args) for name, args in queued]
+        return value if value_from_callable else results
+
+    mock.transaction.side_effect = transaction
     return mock
 
 
@@ -55,11 +68,12 @@ class TestRedisAgentRegistry:
         assert info["constitutional_hash"] == CONSTITUTIONAL_HASH
 
     async def test_register_duplicate(self, registry, mock_redis):
-        mock_redis.hsetnx.return_value = 0
+        mock_redis.hexists.return_value = True
         success = await registry.register("agent-1")
         assert success is False
 
     async def test_unregister_success(self, registry, mock_redis):
+        mock_redis.hget.return_value = json.dumps({"agent_id": "agent-1", "capabilities": ["a"]})
         mock_redis.hdel.return_value = 1
         success = await registry.unregister("agent-1")
         assert success is True
@@ -15,6 +15,7 @@ from enhanced_agent_bus.runtime_security import (
     SecurityEventType,
     SecurityScanResult,
     SecuritySeverity,
+    ShardedRateCounter,
     get_runtime_security_scanner,
     scan_content,
 )
@@ -375,6 +376,54 @@ class TestRuntimeSecurityScanner:
         assert result.is_secure is True
 
 
+class TestShardedRateCounter:
+    """Tests for ShardedRateCounter."""
+
+    def test_counts_within_window(self):
+        """Test that hit returns the count recorded before it."""
+        counter = ShardedRateCounter(window_seconds=1.0, buckets=10)
+        assert [counter.hit("a", now=100.0) for _ in range(3)] == [0, 1, 2]
+        assert counter.count("a", now=100.5) == 3
+        assert counter.count("b", now=100.5) == 0
+
+    def test_old_buckets_slide_out(self):
+        """Test that requests older than the window stop counting."""
+        counter = ShardedRateCounter(window_seconds=1.0, buckets=10)
+        counter.hit("a", now=100.0)
+        counter.hit("a", now=100.55)
+        assert counter.count("a", now=101.05) == 1
+        assert counter.count("a", now=105.0) == 0
+
+    def test_idle_keys_evicted(self):
+        """Test that idle keys are dropped when their shard is touched."""
+        counter = ShardedRateCounter(shards=1, idle_seconds=5.0)
+        counter.hit("idle", now=100.0)
+        counter.hit("active", now=110.0)
+        assert len(counter) == 1
+
+    def test_key_cap_enforced(self):
+        """Test that shards never exceed their key budget."""
+        counter = ShardedRateCounter(shards=4, max_keys=40)
+        for i in range(1000):
+            counter.hit(f"agent-{i}", now=100.0)
+        assert len(counter) <= 40
+
+    @pytest.mark.asyncio
+    async def test_scanner_flags_excess_rate(self):
+        """Test that the scanner raises a rate limit event past the QPS limit."""
+        scanner = RuntimeSecurityScanner(
+            RuntimeSecurityConfig(enable_anomaly_detection=False, rate_limit_qps=3)
+        )
+        results = [await scanner.scan(content="test", tenant_id="t1") for _ in range(5)]
+
+        rate_limited = [
+            any(e.event_type == SecurityEventType.RATE_LIMIT_EXCEEDED for e in r.events)
+            for r in results
+        ]
+        assert rate_limited == [False, False, False, True, True]
+        assert scanner.get_metrics()["rate_limit_keys"] == 1
+
+
 class TestGlobalScanner:
     """Tests for global scanner functions."""
 
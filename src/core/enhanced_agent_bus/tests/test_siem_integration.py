@@ -6,6 +6,7 @@ Constitutional Hash: cdd01ef066bc6cf2
 
 import asyncio
 import json
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 
 import pytest
@@ -354,6 +355,67 @@ class TestEventCorrelator:
             correlated = correlator.get_correlated_events(correlation_id)
             assert len(correlated) >= 1
 
+    @pytest.mark.asyncio
+    async def test_window_expiry_drops_counters(self):
+        """Test that expired buckets no longer count toward patterns."""
+        now = [1_700_000_000.0]
+        correlator = EventCorrelator(window_seconds=60, buckets=6, clock=lambda: now[0])
+
+        def event(agent_id):
+            return SecurityEvent(
+                event_type=SecurityEventType.RATE_LIMIT_EXCEEDED,
+                severity=SecuritySeverity.MEDIUM,
+                message="Test",
+                agent_id=agent_id,
+                timestamp=datetime.fromtimestamp(now[0], timezone.utc),
+            )
+
+        assert await correlator.add_event(event("agent-0")) is None
+        assert await correlator.add_event(event("agent-1")) is None
+        now[0] += 75
+        assert await correlator.add_event(event("agent-2")) is None
+        assert correlator._type_sources == {SecurityEventType.RATE_LIMIT_EXCEEDED: {"agent-2": 1}}
+        assert len(correlator._buckets) == 1
+
+    @pytest.mark.asyncio
+    async def test_late_event_joins_its_own_bucket(self):
+        """Test that out-of-order events are placed by timestamp."""
+        now = [1_700_000_000.0]
+        correlator = EventCorrelator(window_seconds=60, buckets=6, clock=lambda: now[0])
+        for offset in (0, 30, 15):
+            await correlator.add_event(
+                SecurityEvent(
+                    event_type=SecurityEventType.AUTHENTICATION_FAILURE,
+                    severity=SecuritySeverity.HIGH,
+                    message="Test",
+                    tenant_id="tenant-late",
+                    timestamp=datetime.fromtimestamp(now[0] + offset, timezone.utc),
+                )
+            )
+
+        assert [b.index for b in correlator._buckets] == sorted(
+            b.index for b in correlator._buckets
+        )
+        assert len(correlator._buckets) == 3
+        assert correlator._tenant_high == {"tenant-late": 3}
+
+    @pytest.mark.asyncio
+    async def test_correlated_events_are_capped(self):
+        """Test that each correlation keeps at most max_events_per_correlation events."""
+        correlator = EventCorrelator(window_seconds=60, max_events_per_correlation=5)
+        correlation_id = None
+        for i in range(20):
+            correlation_id = await correlator.add_event(
+                SecurityEvent(
+                    event_type=SecurityEventType.AUTHENTICATION_FAILURE,
+                    severity=SecuritySeverity.CRITICAL,
+                    message=f"Test {i}",
+                    tenant_id="tenant-burst",
+                )
+            )
+
+        assert len(correlator.get_correlated_events(correlation_id)) <= 5
+
 
 # --- SIEMIntegration Tests ---
 
@@ -0,0 +1,168 @@
+"""
+ACGS-2 Enhanced Agent Bus - Wire Codec Tests
+Constitutional Hash: cdd01ef066bc6cf2
+
+Tests for the versioned Kafka wire codec and its use by KafkaEventBus.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.enhanced_agent_bus import wire_codec
+from core.enhanced_agent_bus.kafka_bus import KafkaEventBus
+from core.enhanced_agent_bus.models import AgentMessage, MessageType, Priority
+from core.enhanced_agent_bus.wire_codec import (
+    CODEC_HEADER,
+    WIRE_FORMAT_JSON,
+    WIRE_FORMAT_MSGPACK,
+    WireCodec,
+)
+
+pytestmark = pytest.mark.skipif(not wire_codec.MSGPACK_AVAILABLE, reason="msgpack not installed")
+
+
+def _governance_message(**kwargs) -> AgentMessage:
+    return AgentMessage(
+        from_agent="policy-agent",
+        to_agent="executive-agent",
+        message_type=MessageType.GOVERNANCE_REQUEST,
+        priority=Priority.HIGH,
+        tenant_id="tenant-1",
+        content={"action": "approve_budget", "amount": 125000, "tags": ["finance", "q3"]},
+        metadata={"trace_id": "abc123"},
+        impact_score=0.82,
+        **kwargs,
+    )
+
+
+def _json_roundtrip(message: AgentMessage) -> dict:
+    return json.loads(json.dumps(message.to_dict_raw(), default=str))
+
+
+class TestWireCodec:
+    """Tests for WireCodec."""
+
+    def test_msgpack_message_decodes_like_json(self):
+        message = _governance_message(expires_at=datetime.now(timezone.utc) + timedelta(hours=1))
+        codec = WireCodec(WIRE_FORMAT_MSGPACK)
+
+        decoded = codec.decode(codec.encode_message(message), codec.headers)
+
+        assert decoded == _json_roundtrip(message)
+
+    def test_non_utc_timestamps_keep_iso_form(self):
+        local = timezone(timedelta(hours=2))
+        message = _governance_message(created_at=datetime(2024, 5, 1, 12, tzinfo=local))
+        codec = WireCodec(WIRE_FORMAT_MSGPACK)
+
+        decoded = codec.decode(codec.encode_message(message))
+
+        assert decoded["created_at"] == "2024-05-01T12:00:00+02:00"
+
+    def test_msgpack_is_smaller(self):
+        message = _governance_message()
+
+        binary = WireCodec(WIRE_FORMAT_MSGPACK).encode_message(message)
+        text = WireCodec(WIRE_FORMAT_JSON).encode_message(message)
+
+        assert len(binary) < len(text) * 0.7
+
+    @pytest.mark.parametrize("fmt", [WIRE_FORMAT_JSON, WIRE_FORMAT_MSGPACK])
+    def test_generic_values(self, fmt):
+        event = {"election_id": "e-1", "votes": [1, 2], "cast_at": datetime(2024, 1, 1)}
+        codec = WireCodec(fmt)
+
+        decoded = WireCodec().decode(codec.encode(event))
+
+        assert decoded == {"election_id": "e-1", "votes": [1, 2], "cast_at": "2024-01-01 00:00:00"}
+
+    def test_json_consumer_reads_legacy_records(self):
+        legacy = json.dumps({"message_id": "m-1"}).encode("utf-8")
+
+        assert WireCodec(WIRE_FORMAT_MSGPACK).decode(legacy) == {"message_id": "m-1"}
+
+    def test_header_selects_format(self):
+        codec = WireCodec(WIRE_FORMAT_MSGPACK)
+        value = codec.encode({"a": 1})
+
+        assert codec.decode(value, [(CODEC_HEADER, b"msgpack")]) == {"a": 1}
+        with pytest.raises(ValueError):
+            codec.decode(value, [(CODEC_HEADER, b"json")])
+
+    def test_unknown_schema_rejected(self):
+        with pytest.raises(ValueError, match="schema"):
+            WireCodec().decode(b"\xac\x7f\x90")
+
+    def test_falls_back_to_json_without_msgpack(self):
+        with patch.object(wire_codec, "MSGPACK_AVAILABLE", False):
+            codec = WireCodec(WIRE_FORMAT_MSGPACK)
+
+        assert codec.wire_format == WIRE_FORMAT_JSON
+        assert codec.headers == [(CODEC_HEADER, b"json")]
+
+    def test_unknown_format_rejected(self):
+        with pytest.raises(ValueError):
+            WireCodec("avro")
+
+
+class TestKafkaEventBusWireFormat:
+    """Tests for KafkaEventBus wire format selection."""
+
+    async def test_send_message_msgpack(self):
+        bus = KafkaEventBus(wire_format=WIRE_FORMAT_MSGPACK)
+        bus.producer = AsyncMock()
+        bus._running = True
+        message = _governance_message()
+
+        assert await bus.send_message(message) is True
+
+        kwargs = bus.producer.send_and_wait.call_args.kwargs
+        assert kwargs["headers"] == [(CODEC_HEADER, b"msgpack")]
+        assert bus.codec.serialize(kwargs["value"]) == kwargs["value"]
+        assert bus.codec.decode(kwargs["value"], kwargs["headers"]) == _json_roundtrip(message)
+
+    async def test_send_message_json_default(self):
+        bus = KafkaEventBus()
+        bus.producer = AsyncMock()
+        bus._running = True
+
+        await bus.send_message(_governance_message())
+
+        kwargs = bus.producer.send_and_wait.call_args.kwargs
+        assert kwargs["headers"] == [(CODEC_HEADER, b"json")]
+        assert kwargs["value"]["to_agent"] == "executive-agent"
+
+    async def test_consumer_handles_both_formats(self):
+        bus = KafkaEventBus()
+        bus._running = True
+        message = _governance_message()
+        records = [
+            MagicMock(value=WireCodec(fmt).encode_message(message), headers=headers)
+            for fmt, headers in (
+                (WIRE_FORMAT_JSON, []),
+                (WIRE_FORMAT_MSGPACK, [(CODEC_HEADER, b"msgpack")]),
+            )
+        ]
+        consumer = MagicMock()
+        consumer.start = AsyncMock()
+        consumer.stop = AsyncMock()
+        consumer.__aiter__.return_value = records
+        handler = AsyncMock()
+        created = []
+
+        with (
+            patch("core.enhanced_agent_bus.kafka_bus.KAFKA_AVAILABLE", True),
+            patch("core.enhanced_agent_bus.kafka_bus.AIOKafkaConsumer", return_value=consumer),
+            patch(
+                "core.enhanced_agent_bus.kafka_bus.asyncio.create_task",
+                side_effect=lambda coro: created.append(coro),
+            ),
+        ):
+            await bus.subscribe("tenant-1", [MessageType.GOVERNANCE_REQUEST], handler)
+        await created[0]
+
+        expected = _json_roundtrip(message)
+        assert [c.args[0] for c in handler.await_args_list] == [expected, expected]
@@ -4,6 +4,7 @@ Constitutional Hash: cdd01ef066bc6cf2
 """
 
 import re
+import time
 from datetime import datetime, timezone
 from typing import Optional, TypeVar
 
@@ -54,3 +55,43 @@ class LRUCache:
 
     def clear(self) -> None:
         self._cache.clear()
+
+
+class TTLCache:
+    """LRU cache whose entries also expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int = 1000, ttl_seconds: float = 60.0):
+        from collections import OrderedDict
+
+        self._cache = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        self._cache[key] = (time.monotonic() + self._ttl, value)
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -0,0 +1,232 @@
+"""
+ACGS-2 Enhanced Agent Bus - Wire Codec
+Constitutional Hash: cdd01ef066bc6cf2
+
+Versioned encodings for values published to Kafka.
+
+Two wire formats are supported:
+
+- ``json``: UTF-8 JSON of ``AgentMessage.to_dict_raw()`` or of the event
+  dictionary, as the bus has always produced.
+- ``msgpack``: a two-byte frame (magic ``0xAC`` followed by a schema byte)
+  and a msgpack body. Schema 0 is any msgpack value, used for vote events
+  and audit records. Schema 1 is an ``AgentMessage`` as a positional array in
+  ``MESSAGE_FIELDS_V1`` order, with UTC timestamps stored as epoch
+  microseconds.
+
+Producers tag every record with the ``acgs-codec`` header. Consumers decode
+from that header and fall back to sniffing the first byte, so records from
+producers that predate the header still decode as JSON. ``0xAC`` cannot
+start a UTF-8 JSON document.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    from .models import AgentMessage
+except ImportError:
+    from models import AgentMessage  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Wire formats
+WIRE_FORMAT_JSON = "json"
+WIRE_FORMAT_MSGPACK = "msgpack"
+WIRE_FORMATS = (WIRE_FORMAT_JSON, WIRE_FORMAT_MSGPACK)
+
+# Record header naming the wire format of the value
+CODEC_HEADER = "acgs-codec"
+
+# msgpack frame: magic byte, then schema byte
+FRAME_MAGIC = 0xAC
+SCHEMA_GENERIC = 0
+SCHEMA_AGENT_MESSAGE_V1 = 1
+
+# AgentMessage fields, in to_dict_raw() order, carried by schema 1
+MESSAGE_FIELDS_V1: Tuple[str, ...] = (
+    "message_id",
+    "conversation_id",
+    "content",
+    "from_agent",
+    "to_agent",
+    "message_type",
+    "tenant_id",
+    "priority",
+    "status",
+    "constitutional_hash",
+    "constitutional_validated",
+    "metadata",
+    "pqc_signature",
+    "pqc_public_key",
+    "pqc_algorithm",
+    "created_at",
+    "updated_at",
+    "payload",
+    "sender_id",
+    "security_context",
+    "expires_at",
+    "impact_score",
+    "performance_metrics",
+)
+_TIMESTAMP_FIELDS = ("created_at", "updated_at", "expires_at")
+_TIMESTAMP_INDEXES = tuple(MESSAGE_FIELDS_V1.index(name) for name in _TIMESTAMP_FIELDS)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ZERO = timedelta(0)
+_FRAME_GENERIC = bytes((FRAME_MAGIC, SCHEMA_GENERIC))
+_FRAME_AGENT_MESSAGE_V1 = bytes((FRAME_MAGIC, SCHEMA_AGENT_MESSAGE_V1))
+
+
+def _encode_timestamp(value: Optional[datetime]) -> Any:
+    """UTC datetimes become epoch microseconds; others keep their ISO form."""
+    if value is None:
+        return None
+    if value.utcoffset() == _ZERO:
+        return (value - _EPOCH) // timedelta(microseconds=1)
+    return value.isoformat()
+
+
+def _decode_timestamp(value: Any) -> Optional[str]:
+    if isinstance(value, int):
+        return (_EPOCH + timedelta(microseconds=value)).isoformat()
+    return value
+
+
+class WireCodec:
+    """
+    Encoder/decoder for Kafka record values.
+
+    ``encode_message``/``encode`` produce values in the configured format;
+    ``decode`` accepts either format regardless of configuration, so a
+    consumer group can be upgraded before its producers switch to msgpack.
+    """
+
+    def __init__(self, wire_format: str = WIRE_FORMAT_JSON):
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"Unknown wire format: {wire_format!r}")
+        if wire_format == WIRE_FORMAT_MSGPACK and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not installed; falling back to JSON wire format")
+            wire_format = WIRE_FORMAT_JSON
+        self.wire_format = wire_format
+        self.headers: List[Tuple[str, bytes]] = [(CODEC_HEADER, wire_format.encode("ascii"))]
+
+    def encode_message(self, message: AgentMessage) -> bytes:
+        """Encode an AgentMessage."""
+        if self.wire_format == WIRE_FORMAT_JSON:
+            return self._encode_json(message.to_dict_raw())
+
+        values = [
+            message.message_id,
+            message.conversation_id,
+            message.content,
+            message.from_agent,
+            message.to_agent,
+            message.message_type.value,
+            message.tenant_id,
+            message.priority.value,
+            message.status.value,
+            message.constitutional_hash,
+            message.constitutional_validated,
+            message.metadata,
+            message.pqc_signature,
+            message.pqc_public_key,
+            message.pqc_algorithm,
+            _encode_timestamp(message.created_at),
+            _encode_timestamp(message.updated_at),
+            message.payload,
+            message.sender_id,
+            message.security_context,
+            _encode_timestamp(message.expires_at),
+            message.impact_score,
+            message.performance_metrics,
+        ]
+        return _FRAME_AGENT_MESSAGE_V1 + msgpack.packb(values, use_bin_type=True, default=str)
+
+    def encode(self, value: Any) -> bytes:
+        """Encode an arbitrary value (vote events, audit records)."""
+        if self.wire_format == WIRE_FORMAT_JSON:
+            return self._encode_json(value)
+        return _FRAME_GENERIC + msgpack.packb(value, use_bin_type=True, default=str)
+
+    def serialize(self, value: Any) -> bytes:
+        """Producer value_serializer: pass pre-encoded bytes through, encode the rest."""
+        if isinstance(value, (bytes, bytearray)):
+            return bytes(value)
+        return self.encode(value)
+
+    def decode(self, value: bytes, headers: Optional[Sequence[Tuple[str, bytes]]] = None) -> Any:
+        """
+        Decode a record value in either wire format.
+
+        Args:
+            value: Raw record value
+            headers: Record headers; ``acgs-codec`` selects the format when present
+
+        Returns:
+            The decoded value. AgentMessages decode to their to_dict_raw() form.
+        """
+        wire_format = self._header_format(headers)
+        if wire_format is None:
+            wire_format = WIRE_FORMAT_MSGPACK if value[:1] == b"\xac" else WIRE_FORMAT_JSON
+        if wire_format == WIRE_FORMAT_JSON:
+            return json.loads(value)
+        return self._decode_msgpack(value)
+
+    @staticmethod
+    def _encode_json(value: Any) -> bytes:
+        return json.dumps(value, default=str).encode("utf-8")
+
+    @staticmethod
+    def _header_format(headers: Optional[Sequence[Tuple[str, bytes]]]) -> Optional[str]:
+        for key, header_value in headers or ():
+            if key == CODEC_HEADER:
+                wire_format = header_value.decode("ascii", "replace")
+                return wire_format if wire_format in WIRE_FORMATS else None
+        return None
+
+    @staticmethod
+    def _decode_msgpack(value: bytes) -> Any:
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("msgpack-encoded record received but msgpack is not installed")
+        if len(value) < 2 or value[0] != FRAME_MAGIC:
+            raise ValueError("Invalid msgpack frame")
+
+        schema = value[1]
+        body = msgpack.unpackb(memoryview(value)[2:], raw=False, strict_map_key=False)
+        if schema == SCHEMA_GENERIC:
+            return body
+        if schema == SCHEMA_AGENT_MESSAGE_V1:
+            if len(body) != len(MESSAGE_FIELDS_V1):
+                raise ValueError("AgentMessage frame has the wrong number of fields")
+            last: Any = None
+            for index in _TIMESTAMP_INDEXES:
+                stamp = body[index]
+                if isinstance(stamp, int):
+                    # created_at and updated_at usually match; format once
+                    if last is None or last[0] != stamp:
+                        last = (stamp, _decode_timestamp(stamp))
+                    body[index] = last[1]
+            return dict(zip(MESSAGE_FIELDS_V1, body, strict=True))
+        raise ValueError(f"Unsupported wire schema: {schema}")
+
+
+__all__ = [
+    "CODEC_HEADER",
+    "MESSAGE_FIELDS_V1",
+    "MSGPACK_AVAILABLE",
+    "WIRE_FORMATS",
+    "WIRE_FORMAT_JSON",
+    "WIRE_FORMAT_MSGPACK",
+    "WireCodec",
+]
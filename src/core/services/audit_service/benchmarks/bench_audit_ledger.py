@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Audit Ledger Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures AuditLedger batch commit cost (incremental Merkle accumulator vs.
+per-batch MerkleTree rebuild with double serialization) and verify_entry
+cost (hash index vs. linear scan) on a ledger holding N entries.
+
+Usage:
+    python src/core/services/audit_service/benchmarks/bench_audit_ledger.py [--entries N] [--batch-size B]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.services.audit_service.core.audit_ledger import (  # noqa: E402
+    AuditEntry,
+    AuditLedger,
+    AuditLedgerConfig,
+    ValidationResult,
+)
+from src.core.services.audit_service.core.merkle_tree.merkle_tree import (  # noqa: E402
+    MerkleTree,
+)
+
+logging.getLogger("src.core.services.audit_service.core.audit_ledger").setLevel(logging.ERROR)
+
+
+def make_result(i: int) -> ValidationResult:
+    return ValidationResult(
+        is_valid=i % 7 != 0,
+        errors=[] if i % 7 else ["constitutional hash mismatch"],
+        warnings=["latency budget exceeded"] if i % 5 == 0 else [],
+        metadata={"tenant_id": "tenant-acme", "agent_id": f"agent-{i % 50}", "request": i},
+    )
+
+
+def legacy_commit(ledger: AuditLedger, results: List[ValidationResult]) -> None:
+    """Batch commit as previously done: serialize twice, rebuild tree, proofs."""
+    batch_data = []
+    for vr in results:
+        hash_data = {
+            "is_valid": vr.is_valid,
+            "errors": vr.errors,
+            "warnings": vr.warnings,
+            "metadata": vr.metadata,
+            "constitutional_hash": vr.constitutional_hash,
+        }
+        batch_data.append(json.dumps(hash_data, sort_keys=True).encode())
+        ledger._hash_validation_result(vr)
+    tree = MerkleTree(batch_data)
+    for i in range(len(results)):
+        tree.get_proof(i)
+
+
+def legacy_lookup(ledger: AuditLedger, entry_hash: str) -> Optional[AuditEntry]:
+    for e in ledger.entries:
+        if e.hash == entry_hash:
+            return e
+    return None
+
+
+async def no_storage(*args, **kwargs) -> None:
+    return None
+
+
+async def run(entries: int, batch_size: int) -> None:
+    config = AuditLedgerConfig(batch_size=batch_size, enable_blockchain_anchoring=False)
+    ledger = AuditLedger(config=config)
+    ledger.redis_client = None
+    ledger._save_to_storage = no_storage  # type: ignore[method-assign]
+
+    results = [make_result(i) for i in range(batch_size)]
+    rounds = 200
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        legacy_commit(ledger, results)
+    legacy = (time.perf_counter() - start) / rounds
+
+    hashes = [ledger._hash_validation_result(vr) for vr in results]
+    elapsed = 0.0
+    for _ in range(rounds):
+        for vr, entry_hash in zip(results, hashes, strict=True):
+            ledger._append_entry(AuditEntry(validation_result=vr, hash=entry_hash, timestamp=0.0))
+            ledger.current_batch.append(vr)
+        start = time.perf_counter()
+        for entry_hash in hashes:
+            ledger._batch_tree.add_leaf_hash(entry_hash)
+        await ledger._commit_batch()
+        elapsed += time.perf_counter() - start
+    current = elapsed / rounds
+    logger.info(
+        f"commit batch of {batch_size} (incl. accumulator appends): "
+        f"{legacy * 1e3:.3f} ms -> {current * 1e3:.3f} ms"
+    )
+
+    # Fill the ledger with N entries; the probe entry is the most recent one,
+    # the worst case for a scan.
+    ledger.reset_for_testing()
+    filler = make_result(0)
+    start = time.perf_counter()
+    for i in range(entries - batch_size):
+        ledger._append_entry(AuditEntry(validation_result=filler, hash=f"{i:064x}", timestamp=0.0))
+    for vr, entry_hash in zip(results, hashes, strict=True):
+        ledger._append_entry(AuditEntry(validation_result=vr, hash=entry_hash, timestamp=0.0))
+        ledger.current_batch.append(vr)
+        ledger._batch_tree.add_leaf_hash(entry_hash)
+    batch_id = await ledger._commit_batch()
+    logger.info(f"populated {len(ledger.entries)} entries in {time.perf_counter() - start:.1f} s")
+
+    probe = ledger.entries[-1]
+    root_hash = ledger.get_batch_root_hash(batch_id)
+
+    scans = 3
+    start = time.perf_counter()
+    for _ in range(scans):
+        legacy_lookup(ledger, probe.hash)
+    scan = (time.perf_counter() - start) / scans
+
+    verifies = 20000
+    start = time.perf_counter()
+    for _ in range(verifies):
+        assert await ledger.verify_entry(probe.hash, probe.merkle_proof, root_hash)
+    verify = (time.perf_counter() - start) / verifies
+    logger.info(
+        f"verify_entry at {len(ledger.entries)} entries: "
+        f"{(scan + verify) * 1e3:.1f} ms (scan) -> {verify * 1e6:.1f} us (index)"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.entries, args.batch_size))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Audit Log Persistence Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures local-file persistence of AuditLedger batches with N entries of
+history: commit latency of the segmented append-only log vs. the previous
+read-modify-rewrite JSON file, log replay (mmap scan + decode) time, and
+AuditLedger cold start, which replays only the batches after the last
+checkpoint, followed by the first access to the full history. Building
+AuditEntry objects costs ~600 MB of RSS per million entries, so the legacy-file
+and ledger measurements are only taken up to --ledger-max entries; log commit
+and replay run at every size.
+
+Usage:
+    python src/core/services/audit_service/benchmarks/bench_audit_log.py [--entries 1000000,10000000] [--batch-size B]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.services.audit_service.core.audit_ledger import (  # noqa: E402
+    AuditEntry,
+    AuditLedger,
+    AuditLedgerConfig,
+    ValidationResult,
+)
+from src.core.services.audit_service.core.segmented_log import SegmentedLog  # noqa: E402
+
+logging.getLogger("src.core.services.audit_service.core.audit_ledger").setLevel(logging.ERROR)
+
+
+def make_batch(batch_index: int, batch_size: int) -> List[Dict[str, Any]]:
+    entries = []
+    for i in range(batch_size):
+        vr = ValidationResult(
+            is_valid=i % 7 != 0,
+            metadata={"tenant_id": "tenant-acme", "agent_id": f"agent-{i % 50}", "request": i},
+        )
+        entry = AuditEntry(
+            validation_result=vr,
+            hash=f"{batch_index * batch_size + i:064x}",
+            timestamp=time.time(),
+            batch_id=f"batch_{batch_index}",
+            merkle_proof=[(f"{j:064x}", j % 2 == 0) for j in range(7)],
+        )
+        entries.append(entry.to_dict())
+    return entries
+
+
+def record(batch_index: int, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "batch_id": f"batch_{batch_index}",
+        "root": f"{batch_index:064x}",
+        "batch_counter": batch_index + 1,
+        "timestamp": time.time(),
+        "entries": entries,
+    }
+
+
+def ledger_state(
+    batch_index: int, batch_size: int, entries: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Checkpoint state as AuditLedger saves it after logging this batch."""
+    return {
+        "batch_counter": batch_index + 1,
+        "entries": (batch_index + 1) * batch_size,
+        "latest_batch": {
+            "batch_id": f"batch_{batch_index}",
+            "root": f"{batch_index:064x}",
+            "timestamp": time.time(),
+            "hashes": [entry["hash"] for entry in entries],
+        },
+    }
+
+
+def legacy_commit(path: Path, batch_id: str, entries: List[Dict[str, Any]]) -> None:
+    """The previous local-file fallback: load, add the batch, rewrite."""
+    with open(path, "r") as f:
+        storage_data = json.load(f)
+    storage_data["batches"][batch_id] = {"root": "r", "entries": entries}
+    with open(path, "w") as f:
+        json.dump(storage_data, f)
+
+
+def measure_log(root: Path, entries: int, batch_size: int, commits: int) -> None:
+    batch = make_batch(0, batch_size)
+    batches = entries // batch_size
+    log = SegmentedLog(str(root / "ledger.segments"), str(root / "ledger.json"))
+    start = time.perf_counter()
+    for b in range(batches):
+        log.append(record(b, batch), ledger_state(b, batch_size, batch))
+    log.close()
+    fill = time.perf_counter() - start
+
+    log = SegmentedLog(str(root / "ledger.segments"), str(root / "ledger.json"))
+    start = time.perf_counter()
+    replayed = sum(1 for _ in log.replay())
+    replay = time.perf_counter() - start
+
+    latencies = []
+    for b in range(batches, batches + commits):
+        start = time.perf_counter()
+        log.append(record(b, batch), ledger_state(b, batch_size, batch))
+        latencies.append(time.perf_counter() - start)
+    log.close()
+    size = sum(p.stat().st_size for p in (root / "ledger.segments").iterdir())
+    logger.info(
+        f"[{entries:>10} entries] segmented log: {size / 1e6:.0f} MB written in {fill:.1f} s; "
+        f"replay {replayed} records in {replay:.2f} s; "
+        f"commit p50 {statistics.median(latencies) * 1e3:.2f} ms"
+    )
+
+
+def measure_legacy(root: Path, entries: int, batch_size: int) -> None:
+    batch = make_batch(0, batch_size)
+    batches = {f"batch_{b}": {"root": "r", "entries": batch} for b in range(entries // batch_size)}
+    path = root / "legacy.json"
+    with open(path, "w") as f:
+        json.dump({"batch_counter": len(batches), "batches": batches}, f)
+    start = time.perf_counter()
+    legacy_commit(path, "extra", batch)
+    logger.info(
+        f"[{entries:>10} entries] legacy JSON file: commit "
+        f"{(time.perf_counter() - start) * 1e3:.0f} ms"
+    )
+    path.unlink()
+
+
+async def measure_cold_start(root: Path, entries: int) -> None:
+    config = AuditLedgerConfig(
+        enable_blockchain_anchoring=False, persistence_file=str(root / "ledger.json")
+    )
+    ledger = AuditLedger(config=config)
+    ledger.redis_client = None
+    start = time.perf_counter()
+    await ledger._load_from_storage()
+    elapsed = time.perf_counter() - start
+    stats = await ledger.get_ledger_stats()
+    replayed = len(ledger._entries)
+    start = time.perf_counter()
+    loaded = len(ledger.entries)
+    history = time.perf_counter() - start
+    logger.info(
+        f"[{entries:>10} entries] AuditLedger cold start: {stats['total_entries']} entries "
+        f"({replayed} replayed after the checkpoint) in {elapsed * 1e3:.1f} ms; "
+        f"first full-history access loads {loaded} entries in {history:.1f} s"
+    )
+
+
+async def run(sizes: List[int], batch_size: int, ledger_max: int, commits: int) -> None:
+    for entries in sizes:
+        root = Path(tempfile.mkdtemp(prefix="acgs2-audit-log-"))
+        try:
+            measure_log(root, entries, batch_size, commits)
+            if entries <= ledger_max:
+                measure_legacy(root, entries, batch_size)
+                await measure_cold_start(root, entries)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", default="1000000,10000000")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--ledger-max", type=int, default=1_000_000)
+    parser.add_argument("--commits", type=int, default=100)
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.entries.split(",")]
+    asyncio.run(run(sizes, args.batch_size, args.ledger_max, args.commits))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,14 +13,16 @@ import asyncio
 import hashlib
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from src.core.shared.constants import CONSTITUTIONAL_HASH
 
-from .merkle_tree.merkle_tree import MerkleTree
+from .merkle_tree.merkle_tree import IncrementalMerkleTree, MerkleTree
+from .segmented_log import CHECKPOINT_FORMAT, SegmentedLog
 
 # Blockchain anchoring - prefer unified manager, fallback to local
 try:
@@ -78,23 +80,78 @@ except ImportError:
             }
 
 
-@dataclass
+class _BatchProofs:
+    """Merkle proofs for a restored batch; the tree is built on the first request."""
+
+    def __init__(self, leaf_hashes: List[str]):
+        self._leaf_hashes: Optional[List[str]] = leaf_hashes
+        self._tree: Optional[IncrementalMerkleTree] = None
+
+    def get_proof(self, index: int) -> List[Tuple[str, bool]]:
+        if self._tree is None:
+            self._tree = IncrementalMerkleTree()
+            for leaf_hash in self._leaf_hashes:
+                self._tree.add_leaf_hash(leaf_hash)
+            self._leaf_hashes = None
+        return self._tree.get_proof(index)
+
+
+@dataclass(init=False)
 class AuditEntry:
-    """Represents a single entry in the audit ledger."""
+    """
+    Represents a single entry in the audit ledger.
+
+    The Merkle proof of a committed entry is read from its batch tree the
+    first time ``merkle_proof`` is accessed, not when the batch is committed.
+    """
 
     validation_result: ValidationResult
     hash: str
     timestamp: float
     batch_id: Optional[str] = None
-    merkle_proof: Optional[List[Tuple[str, bool]]] = None
+    _merkle_proof: Optional[List[Tuple[str, bool]]] = field(default=None, repr=False)
+    _proof_source: Optional[Tuple[Any, int]] = field(default=None, repr=False, compare=False)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def __init__(
+        self,
+        validation_result: ValidationResult,
+        hash: str,
+        timestamp: float,
+        batch_id: Optional[str] = None,
+        merkle_proof: Optional[List[Tuple[str, bool]]] = None,
+    ):
+        self.validation_result = validation_result
+        self.hash = hash
+        self.timestamp = timestamp
+        self.batch_id = batch_id
+        self._merkle_proof = merkle_proof
+        self._proof_source = None
+
+    @property
+    def merkle_proof(self) -> Optional[List[Tuple[str, bool]]]:
+        if self._merkle_proof is None and self._proof_source is not None:
+            source, index = self._proof_source
+            self._merkle_proof = source.get_proof(index)
+            self._proof_source = None
+        return self._merkle_proof
+
+    @merkle_proof.setter
+    def merkle_proof(self, proof: Optional[List[Tuple[str, bool]]]) -> None:
+        self._merkle_proof = proof
+        self._proof_source = None
+
+    def defer_proof(self, source: Any, index: int) -> None:
+        """Compute the proof from ``source.get_proof(index)`` when first requested."""
+        self._merkle_proof = None
+        self._proof_source = (source, index)
+
+    def to_dict(self, resolve_proof: bool = True) -> Dict[str, Any]:
         return {
             "validation_result": self.validation_result.to_dict(),
             "hash": self.hash,
             "timestamp": self.timestamp,
             "batch_id": self.batch_id,
-            "merkle_proof": self.merkle_proof,
+            "merkle_proof": self.merkle_proof if resolve_proof else self._merkle_proof,
         }
 
 
@@ -105,6 +162,11 @@ class AuditLedgerConfig:
     batch_size: int = 100
     redis_url: Optional[str] = None
     persistence_file: str = "audit_ledger_storage.json"
+    # Local file persistence: persistence_file holds the checkpoint, batches are
+    # appended to segment files in "<persistence_file stem>.segments/"
+    persistence_segment_max_bytes: int = 64 * 1024 * 1024
+    persistence_checkpoint_interval: int = 100
+    persistence_fsync: bool = False
 
     # Blockchain anchoring configuration
     enable_blockchain_anchoring: bool = True
@@ -149,10 +211,12 @@ class AuditLedger:
         else:
             self.config = AuditLedgerConfig(batch_size=batch_size, redis_url=redis_url)
 
-        self.entries: List[AuditEntry] = []
+        self._entries: List[AuditEntry] = []
         self.current_batch: List[ValidationResult] = []
         self.batch_size = self.config.batch_size
-        self.merkle_tree: Optional[MerkleTree] = None
+        self.merkle_tree: Optional[Union[MerkleTree, IncrementalMerkleTree]] = None
+        self._batch_tree = IncrementalMerkleTree()
+        self._entry_index: Dict[str, AuditEntry] = {}
         self.batches: Dict[str, Dict[str, Any]] = {}  # Phase 3: Store all batches
         self.batch_counter = 0
 
@@ -164,6 +228,18 @@ class AuditLedger:
         # Persistence (Redis first, then File fallback)
         self.redis_client = None
         self.persistence_file = self.config.persistence_file
+        self._log = SegmentedLog(
+            directory=f"{os.path.splitext(self.persistence_file)[0]}.segments",
+            checkpoint_path=self.persistence_file,
+            segment_max_bytes=self.config.persistence_segment_max_bytes,
+            checkpoint_interval=self.config.persistence_checkpoint_interval,
+            fsync=self.config.persistence_fsync,
+        )
+        # Ledger state as of the last logged batch, saved with log checkpoints
+        self._log_state: Dict[str, Any] = {"batch_counter": 0, "entries": 0, "latest_batch": None}
+        # Log position before which batches have not been loaded yet, and their entry count
+        self._history: Optional[Tuple[int, int]] = None
+        self._history_entries = 0
 
         if HAS_REDIS:
             url = self.config.redis_url or (
@@ -297,6 +373,11 @@ class AuditLedger:
                 if not self._worker_task.done():
                     self._worker_task.cancel()
 
+        try:
+            self._log.close()
+        except OSError as e:
+            logger.error(f"Error closing audit log: {e}")
+
         logger.info(f"[{CONSTITUTIONAL_HASH}] AuditLedger worker stopped")
 
     async def add_validation_result(self, validation_result: ValidationResult) -> str:
@@ -327,8 +408,9 @@ class AuditLedger:
 
                 async with self._lock:
                     entry = AuditEntry(validation_result=vr, hash=entry_hash, timestamp=ts)
-                    self.entries.append(entry)
+                    self._append_entry(entry)
                     self.current_batch.append(vr)
+                    self._batch_tree.add_leaf_hash(entry_hash)
 
                     if len(self.current_batch) >= self.batch_size:
                         await self._commit_batch()
@@ -346,7 +428,20 @@ class AuditLedger:
             except Exception as e:
                 logger.error(f"Error in AuditLedger worker: {e}")
 
-    def _hash_validation_result(self, validation_result: ValidationResult) -> str:
+    @property
+    def entries(self) -> List[AuditEntry]:
+        """All entries in append order, loading checkpointed history on first use."""
+        self._load_history()
+        return self._entries
+
+    def _append_entry(self, entry: AuditEntry) -> None:
+        """Append an entry and index it by hash (first occurrence wins)."""
+        self._entries.append(entry)
+        self._entry_index.setdefault(entry.hash, entry)
+
+    @staticmethod
+    def _canonical_bytes(validation_result: ValidationResult) -> bytes:
+        """Canonical serialization used for both the entry hash and its Merkle leaf."""
         hash_data = {
             "is_valid": validation_result.is_valid,
             "errors": validation_result.errors,
@@ -354,8 +449,10 @@ class AuditLedger:
             "metadata": validation_result.metadata,
             "constitutional_hash": validation_result.constitutional_hash,
         }
-        data = json.dumps(hash_data, sort_keys=True)
-        return hashlib.sha256(data.encode()).hexdigest()
+        return json.dumps(hash_data, sort_keys=True).encode()
+
+    def _hash_validation_result(self, validation_result: ValidationResult) -> str:
+        return hashlib.sha256(self._canonical_bytes(validation_result)).hexdigest()
 
     async def _commit_batch(self) -> str:
         if not self.current_batch:
@@ -364,22 +461,19 @@ class AuditLedger:
         batch_id = f"batch_{self.batch_counter}_{int(time.time())}"
         self.batch_counter += 1
 
-        batch_data = []
-        entries_hashes = []
-        for vr in self.current_batch:
-            hash_data = {
-                "is_valid": vr.is_valid,
-                "errors": vr.errors,
-                "warnings": vr.warnings,
-                "metadata": vr.metadata,
-                "constitutional_hash": vr.constitutional_hash,
-            }
-            batch_data.append(json.dumps(hash_data, sort_keys=True).encode())
-            entries_hashes.append(self._hash_validation_result(vr))
-
-        self.merkle_tree = MerkleTree(batch_data)
-        root_hash = self.merkle_tree.get_root_hash()
+        # Leaves were accumulated as entries arrived: each leaf is the entry hash,
+        # i.e. sha256 of the canonical serialization, so nothing is re-serialized here.
         batch_count = len(self.current_batch)
+        batch_entries = self._entries[-batch_count:]
+        entries_hashes = [entry.hash for entry in batch_entries]
+        if self._batch_tree.get_leaf_count() != batch_count:
+            self._batch_tree = IncrementalMerkleTree()
+            for entry_hash in entries_hashes:
+                self._batch_tree.add_leaf_hash(entry_hash)
+
+        self.merkle_tree = self._batch_tree
+        self._batch_tree = IncrementalMerkleTree()
+        root_hash = self.merkle_tree.get_root_hash()
 
         # Phase 3: Store batch metadata
         self.batches[batch_id] = {
@@ -390,17 +484,16 @@ class AuditLedger:
             "anchors": {},
         }
 
-        # Update entries with proofs
-        for i, entry in enumerate(self.entries[-batch_count:]):
+        # Proofs are read from the batch tree when requested
+        for i, entry in enumerate(batch_entries):
             entry.batch_id = batch_id
-            if self.merkle_tree:
-                entry.merkle_proof = self.merkle_tree.get_proof(i)
+            entry.defer_proof(self.merkle_tree, i)
 
         self.current_batch = []
         logger.info(f"[{CONSTITUTIONAL_HASH}] Committed batch {batch_id} with root {root_hash}")
 
         # Persist to Redis
-        await self._save_to_storage(batch_id, root_hash, batch_data)
+        await self._save_to_storage(batch_id, root_hash, batch_entries)
 
         # Anchor to Blockchain
         await self._anchor_batch(
@@ -527,10 +620,12 @@ class AuditLedger:
                 f"(error: {result.error})"
             )
 
-    async def _save_to_storage(self, batch_id: str, root_hash: str, batch_data: List[bytes]):
+    async def _save_to_storage(
+        self, batch_id: str, root_hash: str, batch_entries: List[AuditEntry]
+    ):
         """Persist batch information to storage."""
-        batch_count = len(batch_data)
-        entries_data = [entry.to_dict() for entry in self.entries[-batch_count:]]
+        # Proofs are not persisted; they are rebuilt from the batch's entry hashes
+        entries_data = [entry.to_dict(resolve_proof=False) for entry in batch_entries]
 
         # 1. Try Redis
         if self.redis_client:
@@ -544,22 +639,18 @@ class AuditLedger:
             except Exception as e:
                 logger.error(f"Error saving to Redis: {e}")
 
-        # 2. Local File Fallback
+        # 2. Local File Fallback: append-only segmented log, O(batch) per commit
+        record = {
+            "batch_id": batch_id,
+            "root": root_hash,
+            "batch_counter": self.batch_counter,
+            "timestamp": time.time(),
+            "entries": entries_data,
+        }
         try:
-            storage_data = {"batch_counter": self.batch_counter, "batches": {}}
-            # Load existing
-            try:
-                with open(self.persistence_file, "r") as f:
-                    storage_data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
-
-            storage_data["batch_counter"] = self.batch_counter
-            storage_data["batches"][batch_id] = {"root": root_hash, "entries": entries_data}
-
-            with open(self.persistence_file, "w") as f:
-                json.dump(storage_data, f)
-
+            state = self._next_log_state(record)
+            self._log.append(record, state)
+            self._log_state = state
         except Exception as e:
             logger.error(f"Error saving to local file: {e}")
 
@@ -585,26 +676,142 @@ class AuditLedger:
             except Exception as e:
                 logger.error(f"Error loading from Redis: {e}")
 
-        # 2. Local File Fallback
+        # 2. Local File Fallback: restore the ledger state saved with the last
+        # checkpoint and replay only the batches logged after it. Older batches
+        # are read from the log on first use (see _load_history).
         try:
-            with open(self.persistence_file, "r") as f:
-                storage_data = json.load(f)
-                self.batch_counter = storage_data.get("batch_counter", 0)
-                # Sort batches to maintain order if possible
-                for _, b_data in storage_data.get("batches", {}).items():
-                    self._reconstruct_entries(b_data["entries"])
-            # Rebuild the latest Merkle Tree if we have batches
-            if self.entries:
-                self.merkle_tree = MerkleTree([e.hash.encode() for e in self.entries])
-                logger.info(f"Rebuilt Merkle Tree with {len(self.entries)} entries")
-        except FileNotFoundError:
-            pass
+            legacy_data = self._read_legacy_file()
+            checkpoint = self._log.read_checkpoint()
+            state = (checkpoint or {}).get("state")
+            if state is not None:
+                self._log_state = state
+                self.batch_counter = state["batch_counter"]
+                self._history = (checkpoint["segment"], checkpoint["offset"])
+                self._history_entries = state["entries"]
+            for record in self._log.replay(from_checkpoint=state is not None):
+                self._restore_batch(record)
+                self._log_state = self._next_log_state(record)
+            self._log.state = self._log_state
+            if legacy_data:
+                self._migrate_legacy_file(legacy_data)
+            self._rebuild_latest_tree()
+            total = self._history_entries + len(self._entries)
+            if total:
+                logger.info(
+                    f"Loaded {total} entries from local audit log "
+                    f"({len(self._entries)} replayed after the checkpoint)"
+                )
         except Exception as e:
             logger.error(f"Error loading from local file: {e}")
 
+    def _next_log_state(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Ledger state to checkpoint once ``record`` is in the log."""
+        return {
+            "batch_counter": max(self._log_state["batch_counter"], record.get("batch_counter", 0)),
+            "entries": self._log_state["entries"] + len(record["entries"]),
+            "latest_batch": {
+                "batch_id": record["batch_id"],
+                "root": record.get("root"),
+                "timestamp": record.get("timestamp"),
+                "hashes": [entry["hash"] for entry in record["entries"]],
+            },
+        }
+
+    def _load_history(self) -> None:
+        """Load the batches before the checkpoint the ledger was restored from."""
+        if self._history is None:
+            return
+        segment, offset = self._history
+        self._history, self._history_entries = None, 0
+        entries, index, batches = self._entries, self._entry_index, self.batches
+        self._entries, self._entry_index, self.batches = [], {}, {}
+        try:
+            for record in self._log.read_until(segment, offset):
+                self._restore_batch(record)
+        except Exception as e:
+            logger.error(f"Error loading audit log history: {e}")
+        finally:
+            self._entries.extend(entries)
+            for entry_hash, entry in index.items():
+                self._entry_index.setdefault(entry_hash, entry)
+            # Batches restored since startup (incl. the latest tree) replace
+            # their historical copies and keep log order
+            self.batches.update(batches)
+        logger.info(f"Loaded {len(self._entries) - len(entries)} entries of audit log history")
+
+    def _read_legacy_file(self) -> Optional[Dict[str, Any]]:
+        """Return the contents of a pre-segmented-log JSON persistence file, if any."""
+        try:
+            with open(self.persistence_file, "r") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if isinstance(data, dict) and data.get("format") != CHECKPOINT_FORMAT:
+            return data
+        return None
+
+    def _migrate_legacy_file(self, storage_data: Dict[str, Any]) -> None:
+        """Load a legacy JSON persistence file and move its batches into the log."""
+        backup = f"{self.persistence_file}.legacy"
+        os.replace(self.persistence_file, backup)
+        batch_counter = storage_data.get("batch_counter", 0)
+        for batch_id, b_data in storage_data.get("batches", {}).items():
+            record = {
+                "batch_id": batch_id,
+                "root": b_data.get("root"),
+                "batch_counter": batch_counter,
+                "entries": b_data["entries"],
+            }
+            self._restore_batch(record)
+            state = self._next_log_state(record)
+            self._log.append(record, state)
+            self._log_state = state
+        self._log.checkpoint()
+        logger.info(
+            f"[{CONSTITUTIONAL_HASH}] Migrated {self.persistence_file} to segmented audit log "
+            f"(original kept as {backup})"
+        )
+
+    def _restore_batch(self, record: Dict[str, Any]) -> None:
+        """Restore one persisted batch's entries and metadata (without its tree)."""
+        entries_list = record["entries"]
+        self._reconstruct_entries(entries_list)
+        self.batch_counter = max(self.batch_counter, record.get("batch_counter", 0))
+        self.batches[record["batch_id"]] = {
+            "root_hash": record.get("root"),
+            "merkle_tree": None,
+            "timestamp": record.get("timestamp"),
+            "entry_count": len(entries_list),
+            "anchors": {},
+        }
+
+    def _rebuild_latest_tree(self) -> None:
+        """Rebuild the Merkle tree of the most recent batch only."""
+        tree = IncrementalMerkleTree()
+        if self.batches:
+            latest = self.batches[next(reversed(self.batches))]
+            for entry in self._entries[len(self._entries) - latest["entry_count"] :]:
+                tree.add_leaf_hash(entry.hash)
+        elif self._log_state["latest_batch"]:
+            # Nothing was logged after the checkpoint: use the saved leaf hashes
+            saved = self._log_state["latest_batch"]
+            for entry_hash in saved["hashes"]:
+                tree.add_leaf_hash(entry_hash)
+            latest = self.batches[saved["batch_id"]] = {
+                "root_hash": saved["root"],
+                "merkle_tree": None,
+                "timestamp": saved["timestamp"],
+                "entry_count": len(saved["hashes"]),
+                "anchors": {},
+            }
+        else:
+            return
+        latest["merkle_tree"] = self.merkle_tree = tree
+
     def _reconstruct_entries(self, entries_list: List[Dict[str, Any]]):
-        """Helper to reconstruct AuditEntry objects from dicts."""
-        for e_dict in entries_list:
+        """Helper to reconstruct AuditEntry objects from one batch's dicts."""
+        proofs = _BatchProofs([e_dict["hash"] for e_dict in entries_list])
+        for index, e_dict in enumerate(entries_list):
             vr_dict = e_dict["validation_result"]
             vr = ValidationResult(
                 is_valid=vr_dict["is_valid"],
@@ -619,12 +826,16 @@ class AuditLedger:
                 hash=e_dict["hash"],
                 timestamp=e_dict["timestamp"],
                 batch_id=e_dict["batch_id"],
-                merkle_proof=e_dict["merkle_proof"],
+                merkle_proof=e_dict.get("merkle_proof"),
             )
-            self.entries.append(entry)
+            if entry.merkle_proof is None and entry.batch_id:
+                entry.defer_proof(proofs, index)
+            self._append_entry(entry)
 
     def get_batch_root_hash(self, batch_id: str) -> Optional[str]:
         """Get root hash for a specific batch."""
+        if batch_id not in self.batches:
+            self._load_history()
         if batch_id in self.batches:
             return self.batches[batch_id]["root_hash"]
 
@@ -636,29 +847,20 @@ class AuditLedger:
     async def verify_entry(
         self, entry_hash: str, merkle_proof: List[Tuple[str, bool]], root_hash: str
     ) -> bool:
-        entry = None
-        async with self._lock:
-            for e in self.entries:
-                if e.hash == entry_hash:
-                    entry = e
-                    break
-
+        entry = self._entry_index.get(entry_hash)
+        if not entry and self._history is not None:
+            self._load_history()
+            entry = self._entry_index.get(entry_hash)
         if not entry:
             return False
 
-        hash_data = {
-            "is_valid": entry.validation_result.is_valid,
-            "errors": entry.validation_result.errors,
-            "warnings": entry.validation_result.warnings,
-            "metadata": entry.validation_result.metadata,
-            "constitutional_hash": entry.validation_result.constitutional_hash,
-        }
-        entry_data = json.dumps(hash_data, sort_keys=True).encode()
+        # Re-serialize the stored result so that tampering with it is detected
+        entry_data = self._canonical_bytes(entry.validation_result)
 
         # Phase 3: Find correct Merkle Tree for this batch
         tree = self.merkle_tree
         if entry.batch_id and entry.batch_id in self.batches:
-            tree = self.batches[entry.batch_id]["merkle_tree"]
+            tree = self.batches[entry.batch_id]["merkle_tree"] or tree
 
         return tree.verify_proof(entry_data, merkle_proof, root_hash) if tree else False
 
@@ -715,7 +917,7 @@ class AuditLedger:
     async def get_ledger_stats(self) -> Dict[str, Any]:
         async with self._lock:
             stats = {
-                "total_entries": len(self.entries),
+                "total_entries": self._history_entries + len(self._entries),
                 "current_batch_size": len(self.current_batch),
                 "batch_size_limit": self.batch_size,
                 "batches_committed": self.batch_counter,
@@ -821,7 +1023,11 @@ class AuditLedger:
                 break
 
         # Reset state
-        self.entries.clear()
+        self._entries.clear()
+        self._history, self._history_entries = None, 0
+        self._log_state = {"batch_counter": 0, "entries": 0, "latest_batch": None}
+        self._entry_index.clear()
+        self._batch_tree = IncrementalMerkleTree()
         self.current_batch.clear()
         self.batches.clear()
         self.batch_counter = 0
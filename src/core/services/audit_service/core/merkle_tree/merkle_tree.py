@@ -162,3 +162,116 @@ class MerkleTree:
     def get_leaf_count(self) -> int:
         """获取叶子节点数量"""
         return len(self.leaves)
+
+
+class IncrementalMerkleTree:
+    """
+    仅追加的增量Merkle累加器
+
+    与MerkleTree使用相同的树形（奇数节点复制自己），因此根哈希和证明路径
+    完全一致，可直接用MerkleTree.verify_proof验证。只保存已配对完成的节点，
+    追加叶子为均摊O(1)次哈希，右侧未完成的节点在需要根或证明时按需计算。
+    """
+
+    def __init__(self, data_list: Optional[List[bytes]] = None):
+        self.levels: List[List[str]] = [[]]
+        self._pending: Optional[List[Optional[str]]] = None
+
+        for data in data_list or ():
+            self.add_leaf(data)
+
+    @property
+    def leaves(self) -> List[str]:
+        return self.levels[0]
+
+    def add_leaf(self, data: bytes) -> int:
+        """添加叶子数据，返回叶子索引"""
+        return self.add_leaf_hash(hashlib.sha256(data).hexdigest())
+
+    def add_leaf_hash(self, leaf_hash: str) -> int:
+        """添加已计算好的叶子哈希，返回叶子索引"""
+        index = len(self.levels[0])
+        self.levels[0].append(leaf_hash)
+        self._pending = None
+
+        level = 0
+        while len(self.levels[level]) % 2 == 0:
+            nodes = self.levels[level]
+            parent_hash = hashlib.sha256((nodes[-2] + nodes[-1]).encode()).hexdigest()
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            self.levels[level + 1].append(parent_hash)
+            level += 1
+
+        return index
+
+    def _spine(self) -> List[Optional[str]]:
+        """计算右侧未完成节点：pending[k]为第k层已保存节点之后的那个节点"""
+        if self._pending is not None:
+            return self._pending
+
+        pending: List[Optional[str]] = [None]
+        level = 0
+        while True:
+            nodes = self.levels[level] if level < len(self.levels) else []
+            carry = pending[level]
+            width = len(nodes) + (carry is not None)
+            if width <= 1:
+                break
+            if len(nodes) % 2:
+                right = carry if carry is not None else nodes[-1]
+                parent = hashlib.sha256((nodes[-1] + right).encode()).hexdigest()
+            elif carry is not None:
+                parent = hashlib.sha256((carry + carry).encode()).hexdigest()
+            else:
+                parent = None
+            pending.append(parent)
+            level += 1
+
+        self._pending = pending
+        return pending
+
+    def _node(self, level: int, index: int, pending: List[Optional[str]]) -> Optional[str]:
+        nodes = self.levels[level] if level < len(self.levels) else []
+        if index < len(nodes):
+            return nodes[index]
+        return pending[level] if index == len(nodes) else None
+
+    def get_root_hash(self) -> Optional[str]:
+        """获取根哈希"""
+        if not self.levels[0]:
+            return None
+        pending = self._spine()
+        top = len(pending) - 1
+        return self._node(top, 0, pending)
+
+    def get_proof(self, index: int) -> List[Tuple[str, bool]]:
+        """
+        按需生成证明路径，格式与MerkleTree.get_proof相同
+        返回：[(sibling_hash, is_left), ...]
+        """
+        if index < 0 or index >= len(self.levels[0]):
+            return []
+
+        pending = self._spine()
+        proof: List[Tuple[str, bool]] = []
+        current_index = index
+
+        for level in range(len(pending) - 1):  # 不包括根层
+            sibling = self._node(level, current_index ^ 1, pending)
+            if sibling is None:
+                sibling = self._node(level, current_index, pending)
+            proof.append((sibling, current_index % 2 == 0))
+            current_index //= 2
+
+        return proof
+
+    verify_proof = MerkleTree.verify_proof
+
+    def get_tree_height(self) -> int:
+        """获取树的高度"""
+        return len(self._spine()) - 1 if self.levels[0] else 0
+
+    def get_leaf_count(self) -> int:
+        """获取叶子节点数量"""
+        return len(self.levels[0])
@@ -0,0 +1,285 @@
+"""
+ACGS-2 Audit Service - Segmented Append-Only Log
+Constitutional Hash: cdd01ef066bc6cf2
+
+Local persistence for the audit ledger. Each committed batch is appended as a
+length-prefixed, CRC-protected record to the active segment file, so a commit
+costs O(batch) regardless of history size. Segments roll over at a size limit.
+A small checkpoint file periodically records the verified end of the log,
+optionally with a caller-supplied state describing the log up to that point;
+recovery mmaps the segments, trusts the prefix covered by the checkpoint and
+validates (and truncates torn writes in) only the records written after it.
+Callers that keep their own state in the checkpoint can replay only those
+records and read the checkpointed prefix later, on demand.
+
+Record layout: ``>II`` header (payload length, CRC32 of payload) + JSON payload.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT = "acgs2-segmented-log-v1"
+_HEADER = struct.Struct(">II")
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log"
+
+
+class SegmentedLog:
+    """
+    Append-only log of JSON records split across fixed-size segment files.
+
+    Args:
+        directory: Directory holding the segment files
+        checkpoint_path: Path of the checkpoint (manifest) file
+        segment_max_bytes: Roll to a new segment once the active one reaches this size
+        checkpoint_interval: Write a checkpoint every N appended records
+        fsync: fsync the segment on every append (checkpoints are always fsynced)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        checkpoint_path: str,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        checkpoint_interval: int = 100,
+        fsync: bool = False,
+    ):
+        self.directory = os.path.abspath(directory)
+        self.checkpoint_path = os.path.abspath(checkpoint_path)
+        self.segment_max_bytes = segment_max_bytes
+        self.checkpoint_interval = checkpoint_interval
+        self.fsync = fsync
+
+        self._file: Optional[BinaryIO] = None
+        self._segment = 0
+        self._offset = 0
+        self._records = 0
+        self._since_checkpoint = 0
+        self._recovered = False
+        # Caller state as of the last appended record, saved with each checkpoint
+        self.state: Optional[Dict[str, Any]] = None
+
+    @property
+    def records(self) -> int:
+        """Number of records in the log."""
+        return self._records
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{_SEGMENT_PREFIX}{segment:08d}{_SEGMENT_SUFFIX}")
+
+    def _segments(self) -> List[int]:
+        if not os.path.isdir(self.directory):
+            return []
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX):
+                try:
+                    numbers.append(int(name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(numbers)
+
+    def read_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Return the checkpoint if the checkpoint file holds one for this log format."""
+        try:
+            with open(self.checkpoint_path, "rb") as f:
+                data = json.loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if isinstance(data, dict) and data.get("format") == CHECKPOINT_FORMAT:
+            return data
+        return None
+
+    def replay(self, from_checkpoint: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Yield records in append order and leave the log ready for appends.
+
+        Records up to the checkpoint were validated before it was written and
+        are decoded directly. Records after it are CRC-checked; a torn or
+        corrupt record at the tail of the active segment is truncated away.
+
+        Args:
+            from_checkpoint: Yield only the records written after the
+                checkpoint; the checkpointed prefix is not read at all
+        """
+        checkpoint = self.read_checkpoint()
+        segments = self._segments()
+        if checkpoint is None and segments:
+            # The checkpoint file is what makes the log exist; segments without
+            # one were orphaned (e.g. the file was deleted to reset the ledger)
+            orphaned = f"{self.directory}.orphaned-{int(time.time())}"
+            os.replace(self.directory, orphaned)
+            logger.warning(f"Moved audit log segments without a checkpoint to {orphaned}")
+            segments = []
+        trusted = (checkpoint or {}).get("segment", -1), (checkpoint or {}).get("offset", 0)
+        self._segment, self._offset, self._records = (segments[-1] if segments else 0), 0, 0
+        self.state = (checkpoint or {}).get("state")
+        if from_checkpoint and checkpoint is not None:
+            segments = [segment for segment in segments if segment >= trusted[0]]
+            self._records = checkpoint.get("records", 0)
+
+        for segment in segments:
+            path = self._segment_path(segment)
+            start = trusted[1] if from_checkpoint and segment == trusted[0] else 0
+            last_end, corrupt = start, False
+            for payload, end, corrupt in self._scan(path, segment, trusted, from_offset=start):
+                last_end = end
+                if corrupt:
+                    break
+                self._records += 1
+                yield json.loads(payload)
+
+            if corrupt and segment == self._segment:
+                # Torn write at the tail of the active segment: drop it
+                logger.warning(f"Truncating torn audit log record in {path} at offset {last_end}")
+                with open(path, "r+b") as f:
+                    f.truncate(last_end)
+            elif corrupt:
+                # Sealed segments are never truncated; keep them for investigation
+                logger.error(
+                    f"Audit log segment {path} is corrupt at offset {last_end}; "
+                    f"skipping the remainder of the segment"
+                )
+            self._offset = last_end
+
+        self._since_checkpoint = 0
+        self._recovered = True
+
+    def read_until(self, segment: int, offset: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records before position (segment, offset) in append order.
+
+        The position must be covered by a checkpoint (e.g. the one a
+        ``replay(from_checkpoint=True)`` started from), so the records are
+        decoded without validation.
+        """
+        for number in self._segments():
+            if number > segment:
+                break
+            stop = offset if number == segment else None
+            path = self._segment_path(number)
+            for payload, _, _ in self._scan(path, number, (segment, offset), stop=stop):
+                yield json.loads(payload)
+
+    def _scan(
+        self,
+        path: str,
+        segment: int,
+        trusted: Tuple[int, int],
+        from_offset: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple[bytes, int, bool]]:
+        """Yield (payload, end_offset, corrupt) for the records of one segment.
+
+        Scanning starts at ``from_offset`` and ends at ``stop`` if given, which
+        must be a record boundary.
+        """
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if stop is not None:
+                size = min(size, stop)
+            if size <= from_offset:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                offset = from_offset
+                trusted_end = (
+                    size
+                    if segment < trusted[0]
+                    else (min(trusted[1], size) if segment == trusted[0] else 0)
+                )
+                while offset + _HEADER.size <= size:
+                    length, crc = _HEADER.unpack_from(mm, offset)
+                    start = offset + _HEADER.size
+                    end = start + length
+                    if end > size:
+                        break
+                    payload = mm[start:end]
+                    if end > trusted_end and zlib.crc32(payload) != crc:
+                        yield b"", offset, True
+                        return
+                    offset = end
+                    yield payload, offset, False
+                if offset < size:
+                    # Torn header or payload at the tail
+                    yield b"", offset, True
+
+    def _open_active(self) -> BinaryIO:
+        if self._file is None:
+            if not self._recovered:
+                for _ in self.replay():
+                    pass
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self._segment_path(self._segment), "ab")
+            self._offset = self._file.tell()
+            if self._records == 0 and self.read_checkpoint() is None:
+                self.checkpoint()
+        return self._file
+
+    def append(self, record: Dict[str, Any], state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Append one record, rolling the segment and checkpointing as configured.
+
+        Args:
+            record: JSON-serializable record
+            state: Caller state as of this record, saved with later checkpoints
+        """
+        f = self._open_active()
+        if self._offset >= self.segment_max_bytes:
+            f.close()
+            self._segment += 1
+            self._file = None
+            f = self._open_active()
+
+        payload = json.dumps(record, separators=(",", ":")).encode()
+        f.write(_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+        self._offset += _HEADER.size + len(payload)
+        self._records += 1
+        self._since_checkpoint += 1
+        if state is not None:
+            self.state = state
+
+        if self._since_checkpoint >= self.checkpoint_interval:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Durably record the current end of the log."""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+        data = {
+            "format": CHECKPOINT_FORMAT,
+            "segment": self._segment,
+            "offset": self._offset,
+            "records": self._records,
+        }
+        if self.state is not None:
+            data["state"] = self.state
+        parent_dir = os.path.dirname(self.checkpoint_path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+        self._since_checkpoint = 0
+
+    def close(self) -> None:
+        """Checkpoint and close the active segment."""
+        if self._file is not None:
+            self.checkpoint()
+            self._file.close()
+            self._file = None
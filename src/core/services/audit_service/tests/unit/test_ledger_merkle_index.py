@@ -0,0 +1,118 @@
+"""
+Unit tests for AuditLedger incremental Merkle batches and hash index.
+Constitutional Hash: cdd01ef066bc6cf2
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from src.core.services.audit_service.core.audit_ledger import (
+    AuditEntry,
+    AuditLedger,
+    AuditLedgerConfig,
+    ValidationResult,
+)
+from src.core.services.audit_service.core.merkle_tree.merkle_tree import (
+    IncrementalMerkleTree,
+    MerkleTree,
+)
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    config = AuditLedgerConfig(
+        batch_size=5,
+        enable_blockchain_anchoring=False,
+        persistence_file=str(tmp_path / "ledger.json"),
+    )
+    with patch("redis.from_url", side_effect=Exception("Redis disabled for tests")):
+        return AuditLedger(config=config)
+
+
+def _add(ledger: AuditLedger, vr: ValidationResult) -> AuditEntry:
+    """Mirror the worker's per-entry bookkeeping without starting it."""
+    entry = AuditEntry(
+        validation_result=vr, hash=ledger._hash_validation_result(vr), timestamp=time.time()
+    )
+    ledger._append_entry(entry)
+    ledger.current_batch.append(vr)
+    ledger._batch_tree.add_leaf_hash(entry.hash)
+    return entry
+
+
+@pytest.mark.asyncio
+async def test_commit_matches_full_merkle_tree(ledger):
+    results = [ValidationResult(is_valid=i % 2 == 0, metadata={"n": i}) for i in range(7)]
+    entries = [_add(ledger, vr) for vr in results]
+
+    batch_id = await ledger.force_commit_batch()
+
+    full = MerkleTree([AuditLedger._canonical_bytes(vr) for vr in results])
+    assert ledger.get_batch_root_hash(batch_id) == full.get_root_hash()
+    for i, entry in enumerate(entries):
+        assert entry.batch_id == batch_id
+        assert entry.merkle_proof == full.get_proof(i)
+    assert ledger._batch_tree.get_leaf_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_proofs_are_computed_on_demand(ledger):
+    entries = [_add(ledger, ValidationResult(metadata={"n": i})) for i in range(5)]
+
+    with patch.object(IncrementalMerkleTree, "get_proof", autospec=True) as get_proof:
+        await ledger.force_commit_batch()
+        assert get_proof.call_count == 0
+
+    full = MerkleTree([AuditLedger._canonical_bytes(e.validation_result) for e in entries])
+    assert entries[3].merkle_proof == full.get_proof(3)
+    assert entries[3].to_dict()["merkle_proof"] == full.get_proof(3)
+    assert entries[4].to_dict(resolve_proof=False)["merkle_proof"] is None
+
+
+@pytest.mark.asyncio
+async def test_restored_entries_rebuild_proofs_on_demand(ledger):
+    entries = [_add(ledger, ValidationResult(metadata={"n": i})) for i in range(3)]
+    await ledger.force_commit_batch()
+    records = [e.to_dict(resolve_proof=False) for e in entries]
+
+    ledger.reset_for_testing()
+    ledger._reconstruct_entries(records)
+
+    restored = ledger._entries[1]
+    assert restored.merkle_proof == entries[1].merkle_proof
+
+
+@pytest.mark.asyncio
+async def test_verify_entry_uses_index(ledger):
+    entries = [_add(ledger, ValidationResult(metadata={"n": i})) for i in range(3)]
+    batch_id = await ledger.force_commit_batch()
+    root_hash = ledger.get_batch_root_hash(batch_id)
+
+    assert ledger._entry_index[entries[1].hash] is entries[1]
+    assert await ledger.verify_entry(entries[1].hash, entries[1].merkle_proof, root_hash)
+    assert not await ledger.verify_entry("unknown", entries[1].merkle_proof, root_hash)
+
+
+@pytest.mark.asyncio
+async def test_verify_entry_detects_tampering(ledger):
+    entry = _add(ledger, ValidationResult(metadata={"decision": "allow"}))
+    _add(ledger, ValidationResult(metadata={"decision": "deny"}))
+    batch_id = await ledger.force_commit_batch()
+    root_hash = ledger.get_batch_root_hash(batch_id)
+
+    entry.validation_result.metadata["decision"] = "deny-overridden"
+
+    assert not await ledger.verify_entry(entry.hash, entry.merkle_proof, root_hash)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_hash_resolves_to_first_entry(ledger):
+    first = _add(ledger, ValidationResult(metadata={"same": True}))
+    _add(ledger, ValidationResult(metadata={"same": True}))
+
+    assert ledger._entry_index[first.hash] is first
+
+    ledger.reset_for_testing()
+    assert ledger._entry_index == {}
+    assert ledger._batch_tree.get_leaf_count() == 0
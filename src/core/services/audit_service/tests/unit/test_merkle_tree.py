@@ -1,7 +1,10 @@
 import hashlib
 import unittest
 
-from src.core.services.audit_service.core.merkle_tree.merkle_tree import MerkleTree
+from src.core.services.audit_service.core.merkle_tree.merkle_tree import (
+    IncrementalMerkleTree,
+    MerkleTree,
+)
 
 
 class TestMerkleTree(unittest.TestCase):
@@ -121,5 +124,50 @@ class TestMerkleTree(unittest.TestCase):
         self.assertEqual(tree.get_tree_height(), 3)
 
 
+class TestIncrementalMerkleTree(unittest.TestCase):
+    """增量Merkle累加器单元测试"""
+
+    def test_empty_tree(self):
+        """测试空累加器"""
+        tree = IncrementalMerkleTree()
+        self.assertIsNone(tree.get_root_hash())
+        self.assertEqual(tree.get_proof(0), [])
+        self.assertEqual(tree.get_tree_height(), 0)
+
+    def test_matches_full_tree(self):
+        """测试根哈希、证明和高度与MerkleTree一致"""
+        tree = IncrementalMerkleTree()
+        data_list = []
+        for i in range(40):
+            data_list.append(f"data{i}".encode())
+            tree.add_leaf(data_list[-1])
+
+            full = MerkleTree(data_list)
+            self.assertEqual(tree.get_root_hash(), full.get_root_hash())
+            self.assertEqual(tree.get_tree_height(), full.get_tree_height())
+            for idx in range(len(data_list)):
+                self.assertEqual(tree.get_proof(idx), full.get_proof(idx))
+
+    def test_proof_verification(self):
+        """测试按需生成的证明可被验证"""
+        data_list = [f"data{i}".encode() for i in range(13)]
+        tree = IncrementalMerkleTree(data_list)
+        root_hash = tree.get_root_hash()
+
+        for idx, data in enumerate(data_list):
+            proof = tree.get_proof(idx)
+            self.assertTrue(MerkleTree().verify_proof(data, proof, root_hash))
+        self.assertFalse(tree.verify_proof(b"wrong data", tree.get_proof(0), root_hash))
+
+    def test_add_leaf_hash(self):
+        """测试直接添加叶子哈希"""
+        tree = IncrementalMerkleTree()
+        index = tree.add_leaf_hash(hashlib.sha256(b"data1").hexdigest())
+        tree.add_leaf(b"data2")
+
+        self.assertEqual(index, 0)
+        self.assertEqual(tree.get_root_hash(), MerkleTree([b"data1", b"data2"]).get_root_hash())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import asyncio
 import os
+import shutil
 from unittest.mock import patch
 
 import pytest
@@ -14,8 +15,10 @@ from src.core.services.audit_service.core.audit_ledger import (
 async def test_audit_ledger_persistence():
     """Test that AuditLedger persists to and recovers from Redis/File."""
     persistence_file = "audit_ledger_storage.json"
+    segments_dir = "audit_ledger_storage.segments"
     if os.path.exists(persistence_file):
         os.remove(persistence_file)
+    shutil.rmtree(segments_dir, ignore_errors=True)
 
     # 1. Initialize ledger and add entries with Redis disabled
     config = AuditLedgerConfig(
@@ -83,6 +86,7 @@ async def test_audit_ledger_persistence():
 
     if os.path.exists(persistence_file):
         os.remove(persistence_file)
+    shutil.rmtree(segments_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
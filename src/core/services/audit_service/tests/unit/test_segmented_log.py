@@ -0,0 +1,228 @@
+"""
+Unit tests for the segmented append-only audit log.
+Constitutional Hash: cdd01ef066bc6cf2
+"""
+
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from src.core.services.audit_service.core.audit_ledger import (
+    AuditEntry,
+    AuditLedger,
+    AuditLedgerConfig,
+    ValidationResult,
+)
+from src.core.services.audit_service.core.segmented_log import CHECKPOINT_FORMAT, SegmentedLog
+
+
+def _log(tmp_path, **kwargs) -> SegmentedLog:
+    return SegmentedLog(str(tmp_path / "segments"), str(tmp_path / "checkpoint.json"), **kwargs)
+
+
+class TestSegmentedLog:
+    """Test SegmentedLog append, rollover and recovery."""
+
+    def test_replay_returns_records_in_order(self, tmp_path):
+        log = _log(tmp_path, segment_max_bytes=64)
+        for i in range(10):
+            log.append({"n": i})
+        log.close()
+
+        reopened = _log(tmp_path)
+        assert [r["n"] for r in reopened.replay()] == list(range(10))
+        assert reopened.records == 10
+        assert len(os.listdir(tmp_path / "segments")) > 1
+
+    def test_checkpoint_written_periodically_and_on_close(self, tmp_path):
+        log = _log(tmp_path, checkpoint_interval=3)
+        for i in range(4):
+            log.append({"n": i})
+
+        assert log.read_checkpoint()["records"] == 3
+        log.close()
+        checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+        assert checkpoint["format"] == CHECKPOINT_FORMAT
+        assert checkpoint["records"] == 4
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        log = _log(tmp_path)
+        log.append({"n": 0})
+        log.append({"n": 1})
+        log.close()
+        segment = tmp_path / "segments" / os.listdir(tmp_path / "segments")[0]
+        size = segment.stat().st_size
+        with open(segment, "ab") as f:
+            f.write(b"\x00\x00\x01\x00partial")
+
+        reopened = _log(tmp_path)
+        assert [r["n"] for r in reopened.replay()] == [0, 1]
+        assert segment.stat().st_size == size
+        reopened.append({"n": 2})
+        reopened.close()
+        assert [r["n"] for r in _log(tmp_path).replay()] == [0, 1, 2]
+
+    def test_corrupt_record_after_checkpoint_is_dropped(self, tmp_path):
+        log = _log(tmp_path)
+        log.append({"n": 0})
+        log.checkpoint()
+        log.append({"n": 1})
+        log._file.close()
+        log._file = None
+        segment = tmp_path / "segments" / os.listdir(tmp_path / "segments")[0]
+        data = bytearray(segment.read_bytes())
+        data[-2] ^= 0xFF
+        segment.write_bytes(bytes(data))
+
+        assert [r["n"] for r in _log(tmp_path).replay()] == [0]
+
+    def test_replay_from_checkpoint_skips_checkpointed_prefix(self, tmp_path):
+        log = _log(tmp_path, segment_max_bytes=64)
+        for i in range(6):
+            log.append({"n": i}, state={"last": i})
+        log.checkpoint()
+        log.append({"n": 6}, state={"last": 6})
+        log._file.close()
+        log._file = None
+
+        reopened = _log(tmp_path)
+        checkpoint = reopened.read_checkpoint()
+        assert checkpoint["state"] == {"last": 5}
+        assert [r["n"] for r in reopened.replay(from_checkpoint=True)] == [6]
+        assert reopened.records == 7
+        assert reopened.state == {"last": 5}
+        prefix = reopened.read_until(checkpoint["segment"], checkpoint["offset"])
+        assert [r["n"] for r in prefix] == list(range(6))
+
+        reopened.append({"n": 7})
+        reopened.close()
+        assert [r["n"] for r in _log(tmp_path).replay()] == list(range(8))
+
+
+class TestLedgerFilePersistence:
+    """Test AuditLedger local persistence through the segmented log."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return AuditLedgerConfig(
+            batch_size=2,
+            enable_blockchain_anchoring=False,
+            persistence_file=str(tmp_path / "ledger.json"),
+        )
+
+    def _ledger(self, config) -> AuditLedger:
+        with patch("redis.from_url", side_effect=Exception("Redis disabled for tests")):
+            ledger = AuditLedger(config=config)
+        ledger.redis_client = None
+        return ledger
+
+    @pytest.mark.asyncio
+    async def test_restart_restores_entries_and_batches(self, config):
+        ledger = self._ledger(config)
+        for i in range(4):
+            vr = ValidationResult(metadata={"n": i})
+            ledger.current_batch.append(vr)
+            entry_hash = ledger._hash_validation_result(vr)
+            ledger._append_entry(AuditEntry(validation_result=vr, hash=entry_hash, timestamp=0.0))
+            ledger._batch_tree.add_leaf_hash(entry_hash)
+            if len(ledger.current_batch) == 2:
+                await ledger._commit_batch()
+        ledger._log.close()
+
+        restored = self._ledger(config)
+        await restored._load_from_storage()
+
+        assert [e.hash for e in restored.entries] == [e.hash for e in ledger.entries]
+        assert restored.batch_counter == 2
+        assert restored.batches.keys() == ledger.batches.keys()
+        for batch_id, batch in ledger.batches.items():
+            assert restored.get_batch_root_hash(batch_id) == batch["root_hash"]
+        entry = restored.entries[0]
+        assert await restored.verify_entry(
+            entry.hash, entry.merkle_proof, restored.get_batch_root_hash(entry.batch_id)
+        )
+
+    @pytest.mark.asyncio
+    async def test_restart_replays_only_after_checkpoint(self, config):
+        config.persistence_checkpoint_interval = 2
+        ledger = self._ledger(config)
+        for i in range(6):
+            vr = ValidationResult(metadata={"n": i})
+            ledger.current_batch.append(vr)
+            entry_hash = ledger._hash_validation_result(vr)
+            ledger._append_entry(AuditEntry(validation_result=vr, hash=entry_hash, timestamp=0.0))
+            ledger._batch_tree.add_leaf_hash(entry_hash)
+            if len(ledger.current_batch) == 2:
+                await ledger._commit_batch()
+        latest_root = ledger.merkle_tree.get_root_hash()
+
+        restored = self._ledger(config)
+        await restored._load_from_storage()
+
+        # Batches 0-1 are covered by the checkpoint and not read; batch 2 is replayed
+        assert len(restored._entries) == 2
+        assert (await restored.get_ledger_stats())["total_entries"] == 6
+        assert restored.batch_counter == 3
+        assert restored.merkle_tree.get_root_hash() == latest_root
+
+        entry = ledger.entries[0]
+        assert restored.get_batch_root_hash(entry.batch_id) == ledger.get_batch_root_hash(
+            entry.batch_id
+        )
+        assert [e.hash for e in restored.entries] == [e.hash for e in ledger.entries]
+        assert list(restored.batches) == list(ledger.batches)
+
+    @pytest.mark.asyncio
+    async def test_restart_after_clean_stop_reads_no_batches(self, config):
+        ledger = self._ledger(config)
+        for i in range(4):
+            await ledger.add_validation_result(ValidationResult(metadata={"n": i}))
+        ledger._running = True
+        worker = asyncio.create_task(ledger._processing_worker())
+        await ledger._queue.join()
+        ledger._running = False
+        await worker
+        ledger._log.close()
+
+        restored = self._ledger(config)
+        await restored._load_from_storage()
+
+        assert restored._entries == []
+        assert restored.merkle_tree.get_root_hash() == ledger.merkle_tree.get_root_hash()
+        entry = ledger.entries[0]
+        assert await restored.verify_entry(
+            entry.hash, entry.merkle_proof, ledger.get_batch_root_hash(entry.batch_id)
+        )
+        assert len(restored.entries) == 4
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_file_is_migrated(self, config):
+        vr = ValidationResult(metadata={"legacy": True})
+        entry = {
+            "validation_result": vr.to_dict(),
+            "hash": "a" * 64,
+            "timestamp": 1.0,
+            "batch_id": "batch_0_1",
+            "merkle_proof": [],
+        }
+        legacy = {"batch_counter": 1, "batches": {"batch_0_1": {"root": "r", "entries": [entry]}}}
+        with open(config.persistence_file, "w") as f:
+            json.dump(legacy, f)
+
+        ledger = self._ledger(config)
+        await ledger._load_from_storage()
+        ledger._log.close()
+
+        assert [e.hash for e in ledger.entries] == ["a" * 64]
+        assert ledger.get_batch_root_hash("batch_0_1") == "r"
+        with open(config.persistence_file) as f:
+            assert json.load(f)["format"] == CHECKPOINT_FORMAT
+        with open(f"{config.persistence_file}.legacy") as f:
+            assert json.load(f) == legacy
+
+        restored = self._ledger(config)
+        await restored._load_from_storage()
+        assert [e.hash for e in restored.entries] == ["a" * 64]
+        assert restored.batch_counter == 1
@@ -10,7 +10,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .models import (
     CONSTITUTIONAL_HASH,
@@ -126,6 +126,47 @@ class UsageMeteringService:
 
         return event
 
+    async def record_events(self, events: Iterable[Dict[str, Any]]) -> List[UsageEvent]:
+        """
+        Record many metered usage events in one write.
+
+        Each item holds record_event's keyword arguments, plus optional
+        ``units`` (for pre-aggregated counters) and ``timestamp``. Events are
+        appended to the buffer in a single extend and quota usage is updated
+        once per tenant and operation.
+
+        Returns the created events.
+        """
+        if self.constitutional_hash != CONSTITUTIONAL_HASH:
+            logger.error("Constitutional hash mismatch in metering service")
+            raise ValueError("Constitutional hash validation failed")
+
+        created = [
+            UsageEvent(
+                **{
+                    **fields,
+                    "metadata": fields.get("metadata") or {},
+                    "constitutional_hash": self.constitutional_hash,
+                }
+            )
+            for fields in events
+        ]
+        if not created:
+            return created
+
+        self._event_buffer.extend(created)
+
+        quota_units: Dict[Tuple[str, MeterableOperation], int] = defaultdict(int)
+        for event in created:
+            self._total_events_processed += event.units
+            self._events_by_operation[event.operation.value] += event.units
+            quota_units[(event.tenant_id, event.operation)] += event.units
+
+        for (tenant_id, operation), units in quota_units.items():
+            await self._check_and_update_quota(tenant_id, operation, units)
+
+        return created
+
     async def get_usage_summary(
         self,
         tenant_id: str,
@@ -151,9 +192,10 @@ class UsageMeteringService:
             "constitutional_hash": self.constitutional_hash,
         }
 
-        # Count from buffer
-        latencies = []
-        scores = []
+        # Count from buffer; averages are weighted by units so that
+        # pre-aggregated events count as the operations they stand for
+        latency_total = 0.0
+        score_total = 0.0
 
         for event in self._event_buffer:
             if event.tenant_id == tenant_id and start <= event.timestamp <= end:
@@ -161,13 +203,12 @@ class UsageMeteringService:
                 summary["tiers"][event.tier.value] += event.units
                 summary["total_events"] += event.units
                 summary["total_tokens"] += event.tokens_processed
-                latencies.append(event.latency_ms)
-                scores.append(event.compliance_score)
+                latency_total += event.latency_ms * event.units
+                score_total += event.compliance_score * event.units
 
-        if latencies:
-            summary["avg_latency_ms"] = sum(latencies) / len(latencies)
-        if scores:
-            summary["avg_compliance_score"] = sum(scores) / len(scores)
+        if summary["total_events"]:
+            summary["avg_latency_ms"] = latency_total / summary["total_events"]
+            summary["avg_compliance_score"] = score_total / summary["total_events"]
 
         return dict(summary)
 
@@ -267,7 +308,9 @@ class UsageMeteringService:
             "constitutional_hash": self.constitutional_hash,
         }
 
-    async def _check_and_update_quota(self, tenant_id: str, operation: MeterableOperation) -> bool:
+    async def _check_and_update_quota(
+        self, tenant_id: str, operation: MeterableOperation, units: int = 1
+    ) -> bool:
         """Check if operation is within quota and update usage."""
         quota = self._quotas.get(tenant_id)
         if not quota:
@@ -276,7 +319,7 @@ class UsageMeteringService:
         # Update current usage
         if operation.value not in quota.current_usage:
             quota.current_usage[operation.value] = 0
-        quota.current_usage[operation.value] += 1
+        quota.current_usage[operation.value] += units
 
         # Check limits (would enforce in production)
         if quota.monthly_total_limit:
@@ -246,3 +246,40 @@ async def test_tier_tracking(metering_service):
     assert summary["tiers"]["deliberation"] == 1
 
     await metering_service.stop()
+
+
+@pytest.mark.asyncio
+async def test_record_events_bulk(metering_service):
+    """Test recording pre-aggregated usage counters in one call."""
+    await metering_service.start()
+    await metering_service.set_quota(
+        MeteringQuota(tenant_id="bulk-tenant", monthly_total_limit=100)
+    )
+
+    events = await metering_service.record_events(
+        [
+            {
+                "tenant_id": "bulk-tenant",
+                "operation": MeterableOperation.CONSTITUTIONAL_VALIDATION,
+                "units": 3,
+                "latency_ms": 2.0,
+            },
+            {
+                "tenant_id": "bulk-tenant",
+                "operation": MeterableOperation.CONSTITUTIONAL_VALIDATION,
+                "latency_ms": 6.0,
+                "metadata": None,
+            },
+        ]
+    )
+
+    assert len(events) == 2
+    assert events[1].metadata == {}
+    summary = await metering_service.get_usage_summary("bulk-tenant")
+    assert summary["total_events"] == 4
+    assert summary["avg_latency_ms"] == 3.0
+    assert metering_service.get_metrics()["total_events_processed"] == 4
+    status = await metering_service.get_quota_status("bulk-tenant")
+    assert status["remaining"]["total"] == 96
+
+    await metering_service.stop()
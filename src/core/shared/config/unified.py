@@ -340,6 +340,7 @@ if HAS_PYDANTIC_SETTINGS:
                 "ssl_certificate_location": os.getenv("KAFKA_SSL_CERTIFICATE_LOCATION"),
                 "ssl_key_location": os.getenv("KAFKA_SSL_KEY_LOCATION"),
                 "ssl_password": os.getenv("KAFKA_SSL_PASSWORD"),
+                "wire_format": os.getenv("KAFKA_WIRE_FORMAT", "json"),
             },
             validation_alias="KAFKA_CONFIG",
         )
@@ -813,6 +814,7 @@ else:
                 "ssl_certificate_location": os.getenv("KAFKA_SSL_CERTIFICATE_LOCATION"),
                 "ssl_key_location": os.getenv("KAFKA_SSL_KEY_LOCATION"),
                 "ssl_password": os.getenv("KAFKA_SSL_PASSWORD"),
+                "wire_format": os.getenv("KAFKA_WIRE_FORMAT", "json"),
             }
         )
 
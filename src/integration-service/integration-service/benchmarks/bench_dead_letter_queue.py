@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Webhook Dead Letter Queue Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures the webhook DeadLetterQueue at up to 1M dead-lettered deliveries
+spread over 100 subscriptions:
+
+- operation cost when full (add with eviction, get_by_subscription, remove)
+  for the previous list-backed queue vs. the indexed queue
+- filling the file-backed queue, its log size and the time to reload it
+- replay_dead_letters throughput through the delivery lanes, unpaced, and
+  the achieved rate of a short paced replay
+
+Replay uses a canned 200 response in place of the HTTP request, so it
+measures the queue, replay and delivery-engine overhead, not the network.
+
+Usage (from src/integration-service/integration-service):
+    python benchmarks/bench_dead_letter_queue.py [--items N] [--paced-rate R]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from unittest.mock import MagicMock
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx  # noqa: E402
+
+from src.webhooks.config import WebhookFrameworkConfig  # noqa: E402
+from src.webhooks.delivery import DeadLetterQueue, WebhookDeliveryEngine  # noqa: E402
+from src.webhooks.models import (  # noqa: E402
+    WebhookConfig,
+    WebhookDelivery,
+    WebhookEvent,
+    WebhookEventType,
+    WebhookState,
+    WebhookSubscription,
+)
+
+logging.getLogger("src.webhooks").setLevel(logging.ERROR)
+
+SUBSCRIPTIONS = 100
+SAMPLES = 200
+
+
+class LegacyDeadLetterQueue:
+    """DeadLetterQueue as implemented before: a list with pop(0) eviction and linear scans."""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._queue: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+
+    async def add(self, delivery: WebhookDelivery, event: WebhookEvent, error_message: str) -> None:
+        async with self._lock:
+            if len(self._queue) >= self.max_size:
+                self._queue.pop(0)
+            self._queue.append(
+                {
+                    "delivery_id": delivery.id,
+                    "subscription_id": delivery.subscription_id,
+                    "event_id": event.id,
+                    "event_type": event.event_type.value,
+                    "error_message": error_message,
+                    "attempt_count": delivery.attempt_number,
+                    "dead_lettered_at": datetime.now(timezone.utc).isoformat(),
+                    "payload": event.to_payload(),
+                }
+            )
+
+    async def get_by_subscription(self, subscription_id: str) -> List[Dict[str, Any]]:
+        async with self._lock:
+            return [d for d in self._queue if d["subscription_id"] == subscription_id]
+
+    async def remove(self, delivery_id: str) -> bool:
+        async with self._lock:
+            for i, item in enumerate(self._queue):
+                if item["delivery_id"] == delivery_id:
+                    self._queue.pop(i)
+                    return True
+            return False
+
+
+OK_RESPONSE = MagicMock(spec=httpx.Response, status_code=200, text="OK", headers={})
+
+
+class StubResponseEngine(WebhookDeliveryEngine):
+    """Delivery engine answering every request with a canned 200 response."""
+
+    async def _make_request(self, webhook_config, payload):
+        return OK_RESPONSE
+
+
+def make_dead_letter(n: int) -> Tuple[WebhookDelivery, WebhookEvent]:
+    event = WebhookEvent(
+        id=f"evt-{n}",
+        event_type=WebhookEventType.POLICY_VIOLATION,
+        severity="high",
+        title=f"Policy violation {n}",
+        policy_id=f"POL-{n % 50}",
+        resource_id=f"res-{n}",
+    )
+    delivery = WebhookDelivery(
+        id=f"del-{n}", subscription_id=f"sub-{n % SUBSCRIPTIONS}", event_id=event.id
+    )
+    return delivery, event
+
+
+def make_subscriptions() -> Dict[str, WebhookSubscription]:
+    return {
+        f"sub-{i}": WebhookSubscription(
+            id=f"sub-{i}",
+            name=f"sub-{i}",
+            state=WebhookState.ACTIVE,
+            config=WebhookConfig(url=f"https://hooks-{i}.example.com/acgs"),
+        )
+        for i in range(SUBSCRIPTIONS)
+    }
+
+
+async def fill(dlq, items: int) -> float:
+    start = time.perf_counter()
+    for n in range(items):
+        await dlq.add(*make_dead_letter(n), "HTTP 503 after 4 attempts")
+    return time.perf_counter() - start
+
+
+async def timed_ops(dlq, items: int) -> Tuple[float, float, float]:
+    """Per-operation microseconds for add-with-eviction, get_by_subscription and remove."""
+    dead_letters = [make_dead_letter(n) for n in range(items, items + SAMPLES)]
+    start = time.perf_counter()
+    for delivery, event in dead_letters:
+        await dlq.add(delivery, event, "HTTP 503 after 4 attempts")
+    add_us = (time.perf_counter() - start) / SAMPLES * 1e6
+
+    start = time.perf_counter()
+    for i in range(20):
+        await dlq.get_by_subscription(f"sub-{i}")
+    get_us = (time.perf_counter() - start) / 20 * 1e6
+
+    start = time.perf_counter()
+    for n in range(items - SAMPLES, items):
+        await dlq.remove(f"del-{n}")
+    remove_us = (time.perf_counter() - start) / SAMPLES * 1e6
+    return add_us, get_us, remove_us
+
+
+async def compare_ops(items: int) -> None:
+    for label, cls in (("previous", LegacyDeadLetterQueue), ("indexed", DeadLetterQueue)):
+        dlq = cls(max_size=items)
+        await fill(dlq, items)
+        add_us, get_us, remove_us = await timed_ops(dlq, items)
+        logger.info(
+            f"{label:<8} {items:>8} entries: add {add_us:9.1f} us, "
+            f"get_by_subscription {get_us / 1e3:8.2f} ms, remove {remove_us:9.1f} us"
+        )
+        del dlq
+
+
+async def persistence_and_replay(args: argparse.Namespace, directory: str) -> None:
+    path = os.path.join(directory, "dead_letters.jsonl")
+    dlq = DeadLetterQueue(max_size=args.items, path=path)
+    fill_s = await fill(dlq, args.items)
+    dlq.close()
+    size_mib = os.path.getsize(path) / 2**20
+    logger.info(
+        f"persistent fill {args.items:>8} entries: {fill_s:6.1f} s "
+        f"({args.items / fill_s:7.0f} adds/s), log {size_mib:7.1f} MiB"
+    )
+
+    start = time.perf_counter()
+    dlq = DeadLetterQueue(max_size=args.items, path=path)
+    logger.info(f"reload    {dlq.size:>8} entries: {time.perf_counter() - start:6.1f} s")
+
+    config = WebhookFrameworkConfig(
+        dead_letter_queue_max_size=args.items, global_rate_limit_per_second=None
+    )
+    engine = StubResponseEngine(config=config)
+    engine.dead_letter_queue = dlq
+    subscriptions = make_subscriptions()
+
+    start = time.perf_counter()
+    counts = await engine.replay_dead_letters(subscriptions, limit=args.items - args.paced)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"replay    {counts['replayed']:>8} entries unpaced: {elapsed:6.1f} s "
+        f"({counts['replayed'] / elapsed:7.0f} replays/s), delivered {counts['delivered']}, "
+        f"left in queue {dlq.size}"
+    )
+
+    start = time.perf_counter()
+    counts = await engine.replay_dead_letters(subscriptions, rate_per_second=args.paced_rate)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"replay    {counts['replayed']:>8} entries at {args.paced_rate:.0f}/s: {elapsed:6.2f} s "
+        f"(achieved {counts['replayed'] / elapsed:7.0f} replays/s), left in queue {dlq.size}"
+    )
+    await engine.close()
+    dlq.close()
+    logger.info(f"log after replay: {os.path.getsize(path) / 2**20:7.1f} MiB")
+
+
+async def run(args: argparse.Namespace) -> None:
+    for items in args.op_sizes:
+        await compare_ops(items)
+    with tempfile.TemporaryDirectory() as directory:
+        await persistence_and_replay(args, directory)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--op-sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--paced", type=int, default=2_000)
+    parser.add_argument("--paced-rate", type=float, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Event Consumer Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Drains a backlog of governance events from an in-memory Kafka stand-in
+through EventConsumer in each processing mode: sequential (one record at a
+time), partition (partitions run concurrently) and key (keys run
+concurrently within a partition). The handler awaits a fixed delay to
+stand in for integration I/O, with every 50th event ten times slower.
+Reports drain time, throughput, peak in-flight records, lag sampled while
+draining and the number of offset commits.
+
+Usage (from src/integration-service/integration-service):
+    python benchmarks/bench_event_consumer.py [--events N] [--partitions P] [--keys K]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from aiokafka.structs import ConsumerRecord, TopicPartition  # noqa: E402
+
+from src.consumers.event_consumer import (  # noqa: E402
+    EventConsumer,
+    EventConsumerConfig,
+    EventConsumerState,
+    GovernanceEvent,
+    ProcessingMode,
+)
+
+logging.getLogger("src.consumers").setLevel(logging.ERROR)
+
+TOPIC = "governance-events"
+
+
+class InMemoryKafka:
+    """AIOKafkaConsumer stand-in serving a fixed backlog, interleaved across partitions."""
+
+    def __init__(self, events: int, partitions: int, keys: int):
+        self._records: List[ConsumerRecord] = []
+        self._end_offsets: Dict[TopicPartition, int] = defaultdict(int)
+        for n in range(events):
+            tp = TopicPartition(TOPIC, n % partitions)
+            key = f"tenant-{n % keys}".encode()
+            value = json.dumps(
+                {"event_type": "policy_violation", "title": f"event {n}", "tenant_id": key.decode()}
+            ).encode()
+            self._records.append(
+                ConsumerRecord(
+                    topic=TOPIC,
+                    partition=tp.partition,
+                    offset=self._end_offsets[tp],
+                    timestamp=0,
+                    timestamp_type=0,
+                    key=key,
+                    value=value,
+                    checksum=None,
+                    serialized_key_size=len(key),
+                    serialized_value_size=len(value),
+                    headers=[],
+                )
+            )
+            self._end_offsets[tp] += 1
+        self._next = 0
+        self._positions: Dict[TopicPartition, int] = defaultdict(int)
+        self.committed: Dict[TopicPartition, int] = {}
+
+    async def getmany(self, timeout_ms: int = 0, max_records: Optional[int] = None):
+        if self._next >= len(self._records):
+            await asyncio.sleep(timeout_ms / 1000)
+            return {}
+        await asyncio.sleep(0)
+        taken = self._records[self._next : self._next + max_records]
+        self._next += len(taken)
+        batch: Dict[TopicPartition, List[ConsumerRecord]] = defaultdict(list)
+        for record in taken:
+            tp = TopicPartition(record.topic, record.partition)
+            batch[tp].append(record)
+            self._positions[tp] = record.offset + 1
+        return dict(batch)
+
+    async def commit(self, offsets: Dict[TopicPartition, int]) -> None:
+        self.committed.update(offsets)
+
+    def assignment(self):
+        return set(self._end_offsets)
+
+    async def position(self, tp: TopicPartition) -> int:
+        return self._positions[tp]
+
+    async def end_offsets(self, partitions):
+        return {tp: self._end_offsets[tp] for tp in partitions}
+
+    async def stop(self) -> None:
+        pass
+
+
+async def consume_until(consumer: EventConsumer, done: asyncio.Event) -> None:
+    loop = asyncio.create_task(consumer.consume())
+    await done.wait()
+    await consumer.stop()
+    await loop
+
+
+async def measure(mode: ProcessingMode, args: argparse.Namespace) -> None:
+    kafka = InMemoryKafka(args.events, args.partitions, args.keys)
+    consumer = EventConsumer(
+        EventConsumerConfig(
+            processing_mode=mode,
+            max_in_flight=args.max_in_flight,
+            batch_size=args.batch_size,
+            batch_timeout_seconds=0.1,
+        )
+    )
+    consumer._consumer = kafka
+    consumer._state = EventConsumerState.RUNNING
+
+    done = asyncio.Event()
+    processed = 0
+
+    async def handler(event: GovernanceEvent) -> bool:
+        nonlocal processed
+        slow = event.kafka_offset % 50 == 0
+        await asyncio.sleep(args.handler_ms / 1000 * (10 if slow else 1))
+        processed += 1
+        if processed == args.events:
+            done.set()
+        return True
+
+    consumer.add_handler(handler)
+    start = time.perf_counter()
+    task = asyncio.create_task(consume_until(consumer, done))
+    lag_samples: List[int] = []
+    while not done.is_set():
+        lag_samples.append(sum((await consumer.get_lag()).values()))
+        await asyncio.sleep(0.05)
+    await task
+    elapsed = time.perf_counter() - start
+
+    metrics = consumer.metrics
+    committed = sum(kafka.committed.values())
+    logger.info(
+        f"{mode.value:<10} {args.events:>6} events in {elapsed:7.2f} s "
+        f"({args.events / elapsed:8.0f} events/s) | "
+        f"in flight max {metrics.max_in_flight_observed:>4} | "
+        f"lag mean {sum(lag_samples) / max(1, len(lag_samples)):7.0f} | "
+        f"{metrics.offsets_committed:>4} commits, committed through {committed:>6}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    logger.info(
+        f"{args.partitions} partitions, {args.keys} keys, handler {args.handler_ms} ms "
+        f"(every 50th x10), max in flight {args.max_in_flight}"
+    )
+    for mode in ProcessingMode:
+        await measure(mode, args)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2_000)
+    parser.add_argument("--partitions", type=int, default=12)
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--handler-ms", type=float, default=2.0)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--max-in-flight", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
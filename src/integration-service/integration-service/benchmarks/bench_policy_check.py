@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 CI Policy Check Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Validates a synthetic monorepo request (default 10k files: Python modules,
+Kubernetes manifests, Dockerfiles and config files, some with violations)
+with the previous and the current policy_check implementations:
+
+- built-in checks (OPA unavailable): per-pattern lowercase/split scanning
+  vs. the token-driven line scanner, checking both report the same violations
+- OPA evaluation against a local OPA stub: one request for all files on a
+  new client vs. parallel chunks over the pooled client
+- repeated OPA health checks: new client per check vs. the pooled client
+
+The stub charges a fixed per-request latency plus a per-resource evaluation
+delay, standing in for an OPA server evaluating requests concurrently.
+
+Usage (from src/integration-service/integration-service):
+    python benchmarks/bench_policy_check.py [--files N] [--chunk-size N]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx  # noqa: E402
+from aiohttp import web  # noqa: E402
+
+from src.api import policy_check  # noqa: E402
+from src.api.policy_check import (  # noqa: E402
+    PolicyViolation,
+    ResourceInfo,
+    ViolationSeverity,
+    evaluate_policies_with_opa,
+    iter_builtin_violations,
+    run_builtin_checks,
+)
+
+logging.getLogger("src.api").setLevel(logging.ERROR)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("aiohttp").setLevel(logging.ERROR)
+
+
+def legacy_run_builtin_checks(
+    resources: List[ResourceInfo], resource_type: Optional[str]
+) -> List[PolicyViolation]:
+    """run_builtin_checks as implemented before: lowercase and split once per pattern."""
+    violations = []
+    for resource in resources:
+        content = resource.content or ""
+        file_path = resource.path
+        res_type = resource.type or resource_type or "unknown"
+        secret_patterns = [
+            ("password", "Potential hardcoded password found"),
+            ("secret_key", "Potential hardcoded secret key found"),
+            ("api_key", "Potential hardcoded API key found"),
+            ("AWS_SECRET", "Potential AWS secret found"),
+            ("private_key", "Potential private key found"),
+        ]
+        for pattern, message in secret_patterns:
+            if pattern.lower() in content.lower():
+                lines = content.lower().split("\n")
+                for line_num, line in enumerate(lines, 1):
+                    if pattern.lower() in line and "=" in line:
+                        violations.append(
+                            PolicyViolation(
+                                severity=ViolationSeverity.HIGH,
+                                policy_id="acgs2-security-001",
+                                message=message,
+                                file=file_path,
+                                line=line_num,
+                            )
+                        )
+                        break
+        if "http://" in content and "localhost" not in content and "127.0.0.1" not in content:
+            for line_num, line in enumerate(content.split("\n"), 1):
+                if "http://" in line and "localhost" not in line and "127.0.0.1" not in line:
+                    violations.append(
+                        PolicyViolation(
+                            severity=ViolationSeverity.MEDIUM,
+                            policy_id="acgs2-security-002",
+                            message="HTTP URL found, should use HTTPS",
+                            file=file_path,
+                            line=line_num,
+                        )
+                    )
+                    break
+        if res_type == "kubernetes" or file_path.endswith((".yaml", ".yml")):
+            if "privileged: true" in content:
+                violations.append(
+                    PolicyViolation(
+                        severity=ViolationSeverity.HIGH,
+                        policy_id="acgs2-k8s-001",
+                        message="Privileged container detected",
+                        file=file_path,
+                    )
+                )
+            if "containers:" in content and "resources:" not in content:
+                violations.append(
+                    PolicyViolation(
+                        severity=ViolationSeverity.MEDIUM,
+                        policy_id="acgs2-k8s-002",
+                        message="Container missing resource limits",
+                        file=file_path,
+                    )
+                )
+        if res_type == "docker" or "dockerfile" in file_path.lower():
+            if ":latest" in content or (
+                "FROM " in content
+                and ":latest" not in content
+                and ":" not in content.split("FROM ")[1].split()[0]
+                if "FROM " in content
+                else False
+            ):
+                violations.append(
+                    PolicyViolation(
+                        severity=ViolationSeverity.MEDIUM,
+                        policy_id="acgs2-docker-001",
+                        message="Docker image using 'latest' tag or no tag",
+                        file=file_path,
+                    )
+                )
+    return violations
+
+
+async def legacy_evaluate_policies_with_opa(
+    resources: List[ResourceInfo],
+) -> Tuple[bool, List[PolicyViolation]]:
+    """evaluate_policies_with_opa as implemented before: one request on a new client."""
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        input_data = {
+            "resources": [r.model_dump() for r in resources],
+            "resource_type": None,
+            "policy_id": None,
+            "context": {},
+        }
+        response = await client.post(
+            f"{policy_check.OPA_URL}/v1/data/acgs2/policy/validate",
+            json={"input": input_data},
+        )
+        result = response.json().get("result", {})
+        return True, [
+            PolicyViolation(
+                severity=ViolationSeverity(v.get("severity", "info")),
+                policy_id=v.get("policy_id"),
+                message=v.get("message", "Policy violation"),
+                file=v.get("file"),
+            )
+            for v in result.get("violations", [])
+        ]
+
+
+async def legacy_check_opa_health() -> bool:
+    """check_opa_health as implemented before: a new client per check."""
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        response = await client.get(f"{policy_check.OPA_URL}/health")
+        return response.status_code == 200
+
+
+PYTHON_LINES = [
+    "import os",
+    "def handler(event, context):",
+    "    value = compute(event)",
+    "    return {'status': 'ok', 'value': value}",
+    "# TODO: refactor",
+    "logger.info('processing %s', event)",
+]
+
+
+def make_resources(files: int, lines: int, seed: int = 7) -> List[ResourceInfo]:
+    rng = random.Random(seed)
+    resources = []
+    for n in range(files):
+        kind = n % 10
+        if kind < 6:
+            body = [rng.choice(PYTHON_LINES) for _ in range(lines)]
+            if rng.random() < 0.05:
+                body[rng.randrange(lines)] = "API_KEY = 'sk-live-123'"
+            if rng.random() < 0.05:
+                body[rng.randrange(lines)] = "url = 'http://api.example.com/v1'"
+            if rng.random() < 0.3:
+                body[rng.randrange(lines)] = "password_field = form.get('password')"
+            path, rtype = f"services/svc{n % 50}/module_{n}.py", "code"
+        elif kind < 8:
+            body = ["apiVersion: apps/v1", "kind: Deployment", "spec:", "  containers:"]
+            body += [f"    - name: c{i}\n      image: app:{i}.0" for i in range(lines // 8)]
+            if rng.random() < 0.5:
+                body.append("      resources: {limits: {cpu: 1}}")
+            if rng.random() < 0.1:
+                body.append("      privileged: true")
+            path, rtype = f"deploy/app{n}.yaml", "kubernetes"
+        elif kind < 9:
+            tag = rng.choice(["python:3.11-slim", "node:latest", "alpine"])
+            body = [f"FROM {tag}", "RUN pip install -r requirements.txt", "CMD ['app']"]
+            path, rtype = f"images/app{n}/Dockerfile", "docker"
+        else:
+            body = [f"key_{i} = value_{i}" for i in range(lines)]
+            body[rng.randrange(lines)] = "endpoint = http://internal.example.com"
+            path, rtype = f"config/app{n}.ini", "config"
+        resources.append(ResourceInfo(path=path, type=rtype, content="\n".join(body)))
+    return resources
+
+
+def violation_keys(violations: List[PolicyViolation]) -> List[Tuple]:
+    return [(v.policy_id, v.file, v.line, v.message) for v in violations]
+
+
+def bench_builtin(resources: List[ResourceInfo]) -> None:
+    start = time.perf_counter()
+    legacy = legacy_run_builtin_checks(resources, None)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = run_builtin_checks(resources, None)
+    current_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    first = next(iter_builtin_violations(resources, None))
+    first_ms = (time.perf_counter() - start) * 1000
+
+    assert violation_keys(current) == violation_keys(legacy), "built-in results differ"
+    assert violation_keys([first]) == violation_keys(current[:1])
+    logger.info(
+        f"built-in checks  previous {legacy_s * 1000:8.1f} ms | "
+        f"token scan {current_s * 1000:8.1f} ms ({legacy_s / current_s:4.1f}x), "
+        f"{len(current)} violations, "
+        f"first streamed after {first_ms:.2f} ms"
+    )
+
+
+class StubOPA:
+    """Local OPA stand-in reporting a violation for every tenth resource."""
+
+    def __init__(self, base_ms: float, per_resource_ms: float):
+        self.base_ms = base_ms
+        self.per_resource_ms = per_resource_ms
+        self.requests = 0
+
+    async def validate(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        resources = (await request.json())["input"]["resources"]
+        await asyncio.sleep((self.base_ms + self.per_resource_ms * len(resources)) / 1000)
+        violations = [
+            {"severity": "medium", "policy_id": "opa-001", "message": "flagged", "file": r["path"]}
+            for r in resources
+            if hash(r["path"]) % 10 == 0
+        ]
+        return web.json_response({"result": {"violations": violations}})
+
+    async def health(self, request: web.Request) -> web.Response:
+        return web.json_response({})
+
+
+async def bench_opa(resources: List[ResourceInfo], args: argparse.Namespace) -> None:
+    stub = StubOPA(args.opa_base_ms, args.opa_per_resource_ms)
+    app = web.Application(client_max_size=1024**3)
+    app.router.add_post("/v1/data/acgs2/policy/validate", stub.validate)
+    app.router.add_get("/health", stub.health)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    policy_check.OPA_URL = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    policy_check.OPA_EVALUATION_CHUNK_SIZE = args.chunk_size
+    policy_check.OPA_MAX_PARALLEL_EVALUATIONS = args.parallel
+
+    try:
+        start = time.perf_counter()
+        _, legacy = await legacy_evaluate_policies_with_opa(resources)
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        available, current = await evaluate_policies_with_opa(resources, None, None, None)
+        current_s = time.perf_counter() - start
+
+        assert available and len(current) == len(legacy), "OPA results differ"
+        logger.info(
+            f"OPA evaluation   previous {legacy_s * 1000:8.1f} ms | "
+            f"{args.chunk_size}-file chunks x{args.parallel} {current_s * 1000:8.1f} ms "
+            f"({legacy_s / current_s:4.1f}x), {len(current)} violations"
+        )
+
+        start = time.perf_counter()
+        for _ in range(args.health_checks):
+            await legacy_check_opa_health()
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.health_checks):
+            await policy_check.check_opa_health()
+        current_s = time.perf_counter() - start
+        logger.info(
+            f"OPA health check previous {legacy_s / args.health_checks * 1000:8.2f} ms | "
+            f"pooled {current_s / args.health_checks * 1000:8.2f} ms per check "
+            f"({legacy_s / current_s:4.1f}x)"
+        )
+    finally:
+        await policy_check.close_opa_client()
+        await runner.cleanup()
+
+
+async def run(args: argparse.Namespace) -> None:
+    resources = make_resources(args.files, args.lines)
+    size_mib = sum(len(r.content or "") for r in resources) / 2**20
+    logger.info(f"{args.files} files, {size_mib:.1f} MiB of content")
+    bench_builtin(resources)
+    await bench_opa(resources, args)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--lines", type=int, default=80)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--parallel", type=int, default=4)
+    parser.add_argument("--opa-base-ms", type=float, default=5.0)
+    parser.add_argument("--opa-per-resource-ms", type=float, default=0.05)
+    parser.add_argument("--health-checks", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Ticket Field Mapping Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Measures TicketFieldMapper throughput for Jira, ServiceNow and PagerDuty
+mapping configurations during an incident burst of governance events:
+
+- the default configurations from the create_*_mapping_config factories
+- "rich" configurations adding multi-placeholder templates over nested
+  event details, event field mappings and conditional routing fields
+
+Compares the previous mapper (interpreting every FieldMapping per event,
+regex template substitution, dotted-path lookups with hasattr/getattr) with
+compiled mapping plans via map_event and the map_events batch API, and
+checks both produce the same results.
+
+Usage (from src/integration-service/integration-service):
+    python benchmarks/bench_ticket_mapping.py [--events N] [--rounds N]
+"""
+
+import argparse
+import gc
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Union
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.integration_types import JSONDict, JSONValue  # noqa: E402
+from src.integrations.base import EventSeverity, IntegrationEvent  # noqa: E402
+from src.integrations.ticket_mapping import (  # noqa: E402
+    FieldMapping,
+    FieldMappingResult,
+    FieldMappingType,
+    FieldTransformers,
+    FieldValidator,
+    TicketFieldMapper,
+    TicketMappingConfig,
+    TicketMappingResult,
+    create_jira_mapping_config,
+    create_pagerduty_mapping_config,
+    create_servicenow_mapping_config,
+)
+
+logging.getLogger("src.integrations").setLevel(logging.ERROR)
+
+
+class LegacyTicketFieldMapper:
+    """TicketFieldMapper as implemented before: every FieldMapping interpreted per event."""
+
+    TEMPLATE_PATTERN = re.compile(r"\{(\w+(?:\.\w+)*)\}")
+
+    def __init__(self, config: TicketMappingConfig):
+        self.config = config
+
+    def map_event(self, event: IntegrationEvent) -> TicketMappingResult:
+        result = TicketMappingResult()
+        all_errors = []
+        for mapping in self.config.field_mappings:
+            field_result = self._map_field(event, mapping)
+            result.field_results.append(field_result)
+            if field_result.success:
+                result.fields[field_result.field_name] = field_result.value
+            elif mapping.required:
+                all_errors.append(
+                    f"Required field '{mapping.target_field}' mapping failed: "
+                    f"{field_result.error_message}"
+                )
+            else:
+                result.warnings.append(
+                    f"Optional field '{mapping.target_field}' mapping failed: "
+                    f"{field_result.error_message}"
+                )
+            if field_result.validation_errors:
+                if mapping.required:
+                    all_errors.extend(field_result.validation_errors)
+                else:
+                    result.warnings.extend(field_result.validation_errors)
+        result.validation_errors = all_errors
+        result.success = len(all_errors) == 0
+        return result
+
+    def _map_field(self, event: IntegrationEvent, mapping: FieldMapping) -> FieldMappingResult:
+        try:
+            value = self._compute_value(event, mapping)
+            validation_errors = FieldValidator.validate(
+                value, mapping.validation_rules, mapping.target_field
+            )
+            if mapping.required and (value is None or value == ""):
+                validation_errors.append(
+                    f"Field '{mapping.target_field}' is required but has no value"
+                )
+            return FieldMappingResult(
+                field_name=mapping.target_field,
+                value=value,
+                success=len(validation_errors) == 0,
+                validation_errors=validation_errors,
+            )
+        except Exception as e:
+            return FieldMappingResult(
+                field_name=mapping.target_field, value=None, success=False, error_message=str(e)
+            )
+
+    def _compute_value(self, event: IntegrationEvent, mapping: FieldMapping) -> JSONValue:
+        if mapping.mapping_type == FieldMappingType.STATIC:
+            return mapping.static_value
+        elif mapping.mapping_type == FieldMappingType.TEMPLATE:
+            return self._apply_template(event, mapping.template or "")
+        elif mapping.mapping_type == FieldMappingType.EVENT_FIELD:
+            return self._get_event_field(event, mapping.source_field or "")
+        elif mapping.mapping_type == FieldMappingType.TRANSFORM:
+            transform_func = FieldTransformers.get(mapping.transform_name or "")
+            if transform_func:
+                return transform_func(event, mapping.transform_params)
+            raise ValueError(f"Unknown transform: {mapping.transform_name}")
+        elif mapping.mapping_type == FieldMappingType.CONDITIONAL:
+            for condition in mapping.conditions:
+                actual = self._get_event_field(event, str(condition.get("field", "")))
+                operator = str(condition.get("operator", "eq"))
+                if self._evaluate_condition(actual, operator, condition.get("value")):
+                    return condition.get("result")
+            return mapping.default_value
+        return None
+
+    def _apply_template(self, event: IntegrationEvent, template: str) -> str:
+        def replace_placeholder(match: re.Match) -> str:
+            value = self._get_event_field(event, match.group(1))
+            return str(value) if value is not None else ""
+
+        return self.TEMPLATE_PATTERN.sub(replace_placeholder, template)
+
+    def _get_event_field(self, event: IntegrationEvent, field_path: str) -> JSONValue:
+        value: Union[IntegrationEvent, JSONValue] = event
+        for part in field_path.split("."):
+            if hasattr(value, part):
+                value = getattr(value, part)
+            elif isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                return None
+        if isinstance(value, (str, int, float, bool, dict, list, type(None))):
+            return value
+        return str(value)
+
+    def _evaluate_condition(self, actual: JSONValue, operator: str, expected: JSONValue) -> bool:
+        if actual is None:
+            return operator == "eq" and expected is None
+        if operator == "eq":
+            return actual == expected
+        elif operator == "ne":
+            return actual != expected
+        elif operator == "gt":
+            return actual > expected
+        elif operator == "gte":
+            return actual >= expected
+        elif operator == "lt":
+            return actual < expected
+        elif operator == "lte":
+            return actual <= expected
+        elif operator == "in":
+            return actual in (expected if isinstance(expected, list) else [])
+        elif operator == "contains":
+            return str(expected) in str(actual)
+        elif operator == "regex":
+            return bool(re.match(str(expected), str(actual)))
+        return False
+
+
+ROUTING_CONDITIONS: List[JSONDict] = [
+    {"field": "details.region", "operator": "eq", "value": "eu-west-1", "result": "EMEA-SecOps"},
+    {"field": "resource_type", "operator": "in", "value": ["database", "bucket"], "result": "DBA"},
+    {"field": "policy_id", "operator": "regex", "value": r"^POL-1\d$", "result": "Compliance"},
+    {"field": "details.account.tier", "operator": "eq", "value": "prod", "result": "SRE"},
+]
+
+
+def rich_mappings(summary_field: str) -> List[FieldMapping]:
+    """Field mappings added to the default configurations for the rich variant."""
+    return [
+        FieldMapping(
+            target_field=summary_field,
+            mapping_type=FieldMappingType.TEMPLATE,
+            template=(
+                "[ACGS-2][{severity}] {title} on {resource_type}/{resource_id} "
+                "({details.region}, account {details.account.id}) - policy {policy_id}"
+            ),
+            required=True,
+        ),
+        FieldMapping(
+            target_field="assignment_team",
+            mapping_type=FieldMappingType.CONDITIONAL,
+            conditions=ROUTING_CONDITIONS,
+            default_value="Governance",
+        ),
+        FieldMapping(
+            target_field="environment",
+            mapping_type=FieldMappingType.EVENT_FIELD,
+            source_field="details.account.tier",
+        ),
+        FieldMapping(
+            target_field="correlation",
+            mapping_type=FieldMappingType.TEMPLATE,
+            template="{correlation_id}/{event_id} by {user_id} in {tenant_id}",
+        ),
+    ]
+
+
+def make_configs() -> Dict[str, TicketMappingConfig]:
+    configs = {
+        "jira": create_jira_mapping_config(custom_fields={"customfield_10010": "ACGS"}),
+        "servicenow": create_servicenow_mapping_config(
+            subcategory="Policy", assignment_group="Governance"
+        ),
+        "pagerduty": create_pagerduty_mapping_config(routing_key="R0UT1NG", client="ACGS-2"),
+    }
+    summary_fields = {"jira": "summary", "servicenow": "short_description", "pagerduty": "summary"}
+    for provider, base in list(configs.items()):
+        rich = base.model_copy(deep=True)
+        rich.field_mappings = [
+            m for m in rich.field_mappings if m.target_field != summary_fields[provider]
+        ] + rich_mappings(summary_fields[provider])
+        configs[f"{provider} rich"] = rich
+    return configs
+
+
+def make_events(count: int, seed: int = 11) -> List[IntegrationEvent]:
+    rng = random.Random(seed)
+    severities = list(EventSeverity)
+    return [
+        IntegrationEvent(
+            event_type=rng.choice(["policy_violation", "access_denied", "drift_detected"]),
+            severity=rng.choice(severities),
+            title=f"Unauthorized change to {rng.choice(['bucket', 'role', 'cluster'])} #{n}",
+            policy_id=f"POL-{rng.randrange(30)}",
+            resource_id=f"res-{n}",
+            resource_type=rng.choice(["database", "bucket", "vm", "namespace"]),
+            details={
+                "region": rng.choice(["us-east-1", "eu-west-1", "ap-south-1"]),
+                "account": {"id": str(100000 + n % 50), "tier": rng.choice(["prod", "dev"])},
+            },
+            user_id=f"user-{n % 20}",
+            tenant_id="tenant-1",
+            correlation_id=f"corr-{n // 10}",
+            tags=["incident", "burst"],
+        )
+        for n in range(count)
+    ]
+
+
+def best_rate(func: Callable[[], object], events: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return events / best
+
+
+def run(args: argparse.Namespace) -> None:
+    events = make_events(args.events)
+    logger.info(f"{args.events} events, best of {args.rounds} rounds (events/s)")
+    logger.info(
+        f"{'config':<16} {'previous':>10} {'map_event':>10} {'map_events':>11} {'speedup':>8}"
+    )
+    count = len(events)
+    for name, config in make_configs().items():
+        legacy = LegacyTicketFieldMapper(config)
+        mapper = TicketFieldMapper(config)
+
+        expected = [legacy.map_event(event).model_dump() for event in events[:200]]
+        actual = [result.model_dump() for result in mapper.map_events(events[:200])]
+        assert actual == expected, f"{name}: compiled plan results differ"
+
+        legacy_rate = best_rate(
+            lambda legacy=legacy: [legacy.map_event(e) for e in events], count, args.rounds
+        )
+        single_rate = best_rate(
+            lambda mapper=mapper: [mapper.map_event(e) for e in events], count, args.rounds
+        )
+        batch_rate = best_rate(lambda mapper=mapper: mapper.map_events(events), count, args.rounds)
+        logger.info(
+            f"{name:<16} {legacy_rate:>10.0f} {single_rate:>10.0f} {batch_rate:>11.0f} "
+            f"{batch_rate / legacy_rate:>7.2f}x"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+ACGS-2 Webhook Delivery Lanes Benchmark
+Constitutional Hash: cdd01ef066bc6cf2
+
+Delivers a batch of events to each of several subscriptions at once, one of
+them pointing at a slow local HTTP stub that degrades under load (latency
+grows with concurrent requests and it answers 503 above a concurrency cap)
+and the rest at fast stubs. Compares the previous engine (one coroutine per
+event, all sharing the global delivery semaphore and one HTTP client) with
+per-subscription lanes (bounded queues, AIMD concurrency, per-host pools).
+Reports per-subscription completion time and success count, peak concurrent
+requests seen by each stub and the final lane concurrency limits.
+
+Usage (from src/integration-service/integration-service):
+    python benchmarks/bench_webhook_delivery.py [--events N] [--fast N]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from aiohttp import web  # noqa: E402
+
+from src.webhooks.config import WebhookFrameworkConfig  # noqa: E402
+from src.webhooks.delivery import WebhookDeliveryEngine  # noqa: E402
+from src.webhooks.models import (  # noqa: E402
+    WebhookConfig,
+    WebhookDeliveryResult,
+    WebhookEvent,
+    WebhookEventType,
+    WebhookState,
+    WebhookSubscription,
+)
+
+logging.getLogger("src.webhooks").setLevel(logging.CRITICAL)
+logging.getLogger("aiohttp").setLevel(logging.ERROR)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+class StubEndpoint:
+    """Local HTTP endpoint whose latency grows with concurrent requests."""
+
+    def __init__(self, base_ms: float, per_request_ms: float, overload_at: int):
+        self.base_ms = base_ms
+        self.per_request_ms = per_request_ms
+        self.overload_at = overload_at
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        await request.read()
+        self.active += 1
+        self.requests += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if self.active > self.overload_at:
+                return web.Response(status=503)
+            await asyncio.sleep((self.base_ms + self.per_request_ms * self.active) / 1000)
+            return web.Response(text="OK")
+        finally:
+            self.active -= 1
+
+
+class LegacyDeliveryEngine(WebhookDeliveryEngine):
+    """WebhookDeliveryEngine batch delivery as implemented before: gather over deliver()."""
+
+    async def _get_http_client(self, url=None):
+        return await super()._get_http_client(None)
+
+    async def deliver_batch(self, subscription, events):
+        return await asyncio.gather(*(self.deliver(subscription, event) for event in events))
+
+
+async def start_stub(stub: StubEndpoint) -> Tuple[web.AppRunner, int]:
+    app = web.Application()
+    app.router.add_post("/hook", stub.handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0, backlog=1024)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+def make_subscription(name: str, port: int) -> WebhookSubscription:
+    return WebhookSubscription(
+        id=name,
+        name=name,
+        state=WebhookState.ACTIVE,
+        config=WebhookConfig(url=f"http://127.0.0.1:{port}/hook", timeout_seconds=30.0),
+        max_retries=1,
+        retry_delay_seconds=0.5,
+    )
+
+
+async def measure(label: str, cls: type, args: argparse.Namespace) -> None:
+    slow = StubEndpoint(base_ms=args.slow_ms, per_request_ms=args.slow_ms / 4, overload_at=16)
+    fast = [StubEndpoint(base_ms=args.fast_ms, per_request_ms=0.0, overload_at=10**6)]
+    fast += [StubEndpoint(args.fast_ms, 0.0, 10**6) for _ in range(args.fast - 1)]
+    stubs = {"slow": slow, **{f"fast-{i}": stub for i, stub in enumerate(fast)}}
+    runners = []
+    subscriptions: List[WebhookSubscription] = []
+    for name, stub in stubs.items():
+        runner, port = await start_stub(stub)
+        runners.append(runner)
+        subscriptions.append(make_subscription(name, port))
+
+    config = WebhookFrameworkConfig.development()
+    config.max_concurrent_deliveries = args.global_limit
+    config.lane_latency_threshold_seconds = args.latency_threshold
+    engine = cls(config=config)
+    events = [
+        WebhookEvent(event_type=WebhookEventType.POLICY_VIOLATION, title=f"event {n}")
+        for n in range(args.events)
+    ]
+
+    finished: Dict[str, Tuple[float, int]] = {}
+    start = time.perf_counter()
+
+    async def run(subscription: WebhookSubscription) -> None:
+        results: List[WebhookDeliveryResult] = await engine.deliver_batch(subscription, events)
+        finished[subscription.id] = (
+            time.perf_counter() - start,
+            sum(1 for r in results if r.success),
+        )
+
+    await asyncio.gather(*(run(subscription) for subscription in subscriptions))
+    elapsed = time.perf_counter() - start
+    limits = {k: v["concurrency_limit"] for k, v in engine.get_lane_metrics().items()}
+    await engine.close()
+    for runner in runners:
+        await runner.cleanup()
+
+    fast_done = max(finished[name][0] for name in stubs if name != "slow")
+    total_ok = sum(ok for _, ok in finished.values())
+    logger.info(
+        f"{label:<9} all done {elapsed:6.2f} s ({total_ok / elapsed:6.0f} deliveries/s) | "
+        f"fast subscriptions done {fast_done:6.2f} s | "
+        f"slow done {finished['slow'][0]:6.2f} s, {finished['slow'][1]:>4}/{args.events} ok, "
+        f"{slow.requests:>4} requests, peak {slow.peak:>3} concurrent"
+    )
+    if limits:
+        logger.info(f"          final lane limits: {limits}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    logger.info(
+        f"{args.events} events to each of 1 slow + {args.fast} fast subscriptions, "
+        f"global limit {args.global_limit}, lane latency threshold {args.latency_threshold} s"
+    )
+    await measure("previous", LegacyDeliveryEngine, args)
+    await measure("lanes", WebhookDeliveryEngine, args)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=300)
+    parser.add_argument("--fast", type=int, default=3)
+    parser.add_argument("--fast-ms", type=float, default=5.0)
+    parser.add_argument("--slow-ms", type=float, default=100.0)
+    parser.add_argument("--global-limit", type=int, default=50)
+    parser.add_argument("--latency-threshold", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,15 +5,18 @@ Provides policy validation endpoints that can be called by CI/CD pipelines
 (GitHub Actions, GitLab CI) to validate resources against governance policies.
 """
 
+import asyncio
+import json
 import logging
 import os
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .auth import UserClaims, get_current_user
@@ -27,6 +30,18 @@ router = APIRouter(prefix="/api/policy", tags=["Policy Validation"])
 # OPA URL from environment
 OPA_URL = os.getenv("OPA_URL", "http://localhost:8181")
 
+# OPA evaluation tuning: resources per request, parallel requests and pooled connections
+OPA_EVALUATION_CHUNK_SIZE = int(os.getenv("OPA_EVALUATION_CHUNK_SIZE", "500"))
+OPA_MAX_PARALLEL_EVALUATIONS = int(os.getenv("OPA_MAX_PARALLEL_EVALUATIONS", "4"))
+OPA_MAX_CONNECTIONS = int(os.getenv("OPA_MAX_CONNECTIONS", "20"))
+
+# Resources the streaming endpoint scans between yields to the event loop
+BUILTIN_CHECK_YIELD_INTERVAL = int(os.getenv("BUILTIN_CHECK_YIELD_INTERVAL", "50"))
+
+# Shared OPA client, created on first use and bound to the event loop that created it
+_opa_client: Optional[httpx.AsyncClient] = None
+_opa_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
 
 # Enums
 class ResourceType(str, Enum):
@@ -288,17 +303,114 @@ DEMO_POLICIES = [
 ]
 
 
+# Built-in hardcoded secret patterns (lowercase, matched case-insensitively)
+SECRET_PATTERNS: List[Tuple[str, str]] = [
+    ("password", "Potential hardcoded password found"),
+    ("secret_key", "Potential hardcoded secret key found"),
+    ("api_key", "Potential hardcoded API key found"),
+    ("aws_secret", "Potential AWS secret found"),
+    ("private_key", "Potential private key found"),
+]
+
+
+async def get_opa_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared OPA HTTP client.
+
+    Keeps a pool of connections to OPA across requests. A new client is
+    created if the previous one was closed or belongs to another event loop.
+    """
+    global _opa_client, _opa_client_loop
+    loop = asyncio.get_running_loop()
+    if _opa_client is None or _opa_client.is_closed or _opa_client_loop is not loop:
+        _opa_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=OPA_MAX_CONNECTIONS,
+                max_keepalive_connections=OPA_MAX_CONNECTIONS,
+            ),
+        )
+        _opa_client_loop = loop
+    return _opa_client
+
+
+async def close_opa_client() -> None:
+    """Close the shared OPA HTTP client."""
+    global _opa_client, _opa_client_loop
+    if _opa_client is not None and not _opa_client.is_closed:
+        await _opa_client.aclose()
+    _opa_client = None
+    _opa_client_loop = None
+
+
 async def check_opa_health() -> bool:
     """Check if OPA is available and healthy."""
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{OPA_URL}/health")
-            return response.status_code == 200
+        client = await get_opa_client()
+        response = await client.get(f"{OPA_URL}/health", timeout=5.0)
+        return response.status_code == 200
     except Exception as e:
         logger.warning(f"OPA health check failed: {e}")
         return False
 
 
+def _parse_opa_violations(opa_result: Dict[str, Any]) -> List[PolicyViolation]:
+    """Parse the violations of an OPA validation result."""
+    return [
+        PolicyViolation(
+            severity=ViolationSeverity(v.get("severity", "info")),
+            policy_id=v.get("policy_id"),
+            policy_name=v.get("policy_name"),
+            rule_id=v.get("rule_id"),
+            message=v.get("message", "Policy violation"),
+            description=v.get("description"),
+            file=v.get("file"),
+            resource_path=v.get("resource_path"),
+            line=v.get("line"),
+            column=v.get("column"),
+            details=v.get("details"),
+            remediation=v.get("remediation"),
+        )
+        for v in opa_result.get("violations", [])
+    ]
+
+
+async def _evaluate_chunk_with_opa(
+    client: httpx.AsyncClient,
+    opa_path: str,
+    input_data: Dict[str, Any],
+) -> Optional[List[PolicyViolation]]:
+    """
+    Evaluate one chunk of resources with OPA.
+
+    Returns:
+        Violations found, or None if OPA is unavailable
+    """
+    try:
+        response = await client.post(f"{OPA_URL}{opa_path}", json={"input": input_data})
+
+        if response.status_code == 200:
+            result = response.json()
+            return _parse_opa_violations(result.get("result", {}))
+        elif response.status_code == 404:
+            # Policy or path not found - OPA is available but no policies loaded
+            logger.info(f"OPA path not found: {opa_path}")
+            return []
+        else:
+            logger.warning(f"OPA returned status {response.status_code}")
+            return None
+
+    except httpx.TimeoutException:
+        logger.warning("OPA request timed out")
+        return None
+    except httpx.ConnectError:
+        logger.warning("Could not connect to OPA")
+        return None
+    except Exception as e:
+        logger.exception(f"Error querying OPA: {e}")
+        return None
+
+
 async def evaluate_policies_with_opa(
     resources: List[ResourceInfo],
     resource_type: Optional[str],
@@ -308,197 +420,209 @@ async def evaluate_policies_with_opa(
     """
     Evaluate policies using OPA.
 
+    Resource sets larger than OPA_EVALUATION_CHUNK_SIZE are split into chunks
+    evaluated in parallel (at most OPA_MAX_PARALLEL_EVALUATIONS at a time), so
+    each policy query sees one chunk of resources. OPA is treated as
+    unavailable if any chunk fails.
+
     Returns:
         Tuple of (opa_available, violations)
     """
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Build OPA input
+    # Query OPA for policy evaluation
+    # The path depends on how policies are organized in OPA
+    opa_path = "/v1/data/acgs2/policy/validate"
+    if policy_id:
+        # Query specific policy
+        opa_path = f"/v1/data/acgs2/policies/{policy_id}/validate"
+
+    context_data = context.model_dump() if context else {}
+    chunk_size = max(1, OPA_EVALUATION_CHUNK_SIZE)
+    chunks = [resources[i : i + chunk_size] for i in range(0, len(resources), chunk_size)]
+
+    client = await get_opa_client()
+    semaphore = asyncio.Semaphore(max(1, OPA_MAX_PARALLEL_EVALUATIONS))
+    unavailable = asyncio.Event()
+
+    async def evaluate_chunk(chunk: List[ResourceInfo]) -> Optional[List[PolicyViolation]]:
+        async with semaphore:
+            # Skip chunks still waiting once the outcome is known to be a fallback
+            if unavailable.is_set():
+                return None
             input_data = {
-                "resources": [r.model_dump() for r in resources],
+                "resources": [r.model_dump() for r in chunk],
                 "resource_type": resource_type,
                 "policy_id": policy_id,
-                "context": context.model_dump() if context else {},
+                "context": context_data,
             }
+            violations = await _evaluate_chunk_with_opa(client, opa_path, input_data)
+            if violations is None:
+                unavailable.set()
+            return violations
 
-            # Query OPA for policy evaluation
-            # The path depends on how policies are organized in OPA
-            opa_path = "/v1/data/acgs2/policy/validate"
-            if policy_id:
-                # Query specific policy
-                opa_path = f"/v1/data/acgs2/policies/{policy_id}/validate"
+    results = await asyncio.gather(*(evaluate_chunk(chunk) for chunk in chunks))
+    if unavailable.is_set():
+        return False, []
+    return True, [v for chunk_violations in results for v in chunk_violations]
 
-            response = await client.post(
-                f"{OPA_URL}{opa_path}",
-                json={"input": input_data},
-            )
 
-            if response.status_code == 200:
-                result = response.json()
-                opa_result = result.get("result", {})
-
-                # Parse OPA response into violations
-                violations = []
-                for v in opa_result.get("violations", []):
-                    violations.append(
-                        PolicyViolation(
-                            severity=ViolationSeverity(v.get("severity", "info")),
-                            policy_id=v.get("policy_id"),
-                            policy_name=v.get("policy_name"),
-                            rule_id=v.get("rule_id"),
-                            message=v.get("message", "Policy violation"),
-                            description=v.get("description"),
-                            file=v.get("file"),
-                            resource_path=v.get("resource_path"),
-                            line=v.get("line"),
-                            column=v.get("column"),
-                            details=v.get("details"),
-                            remediation=v.get("remediation"),
-                        )
-                    )
+def _first_line_with(text: str, token: str, predicate: Callable[[str], bool]) -> Optional[int]:
+    """
+    Find the first line of ``text`` containing ``token`` that satisfies ``predicate``.
 
-                return True, violations
-            elif response.status_code == 404:
-                # Policy or path not found - OPA is available but no policies loaded
-                logger.info(f"OPA path not found: {opa_path}")
-                return True, []
-            else:
-                logger.warning(f"OPA returned status {response.status_code}")
-                return False, []
+    Jumps between occurrences of the token with str.find rather than looping
+    over every line, so lines without the token are never split out.
 
-    except httpx.TimeoutException:
-        logger.warning("OPA request timed out")
-        return False, []
-    except httpx.ConnectError:
-        logger.warning("Could not connect to OPA")
-        return False, []
-    except Exception as e:
-        logger.exception(f"Error querying OPA: {e}")
-        return False, []
+    Returns:
+        1-based line number, or None if no line matches
+    """
+    pos = text.find(token)
+    while pos != -1:
+        start = text.rfind("\n", 0, pos) + 1
+        end = text.find("\n", pos)
+        if end == -1:
+            end = len(text)
+        if predicate(text[start:end]):
+            return text.count("\n", 0, start) + 1
+        pos = text.find(token, end)
+    return None
 
 
-def run_builtin_checks(
-    resources: List[ResourceInfo],
-    resource_type: Optional[str],
-) -> List[PolicyViolation]:
-    """
-    Run built-in policy checks when OPA is unavailable.
+def _is_assignment(line: str) -> bool:
+    """Check whether a line looks like an assignment (not just a variable reference)."""
+    return "=" in line
 
-    These are simple pattern-based checks for demonstration purposes.
-    """
-    violations = []
 
-    for resource in resources:
-        content = resource.content or ""
-        file_path = resource.path
-        res_type = resource.type or resource_type or "unknown"
-
-        # Check for hardcoded secrets (simple pattern matching)
-        secret_patterns = [
-            ("password", "Potential hardcoded password found"),
-            ("secret_key", "Potential hardcoded secret key found"),
-            ("api_key", "Potential hardcoded API key found"),
-            ("AWS_SECRET", "Potential AWS secret found"),
-            ("private_key", "Potential private key found"),
-        ]
-
-        for pattern, message in secret_patterns:
-            if pattern.lower() in content.lower():
-                # Check if it looks like an assignment (not just a variable reference)
-                lines = content.lower().split("\n")
-                for line_num, line in enumerate(lines, 1):
-                    if pattern.lower() in line and "=" in line:
-                        violations.append(
-                            PolicyViolation(
-                                severity=ViolationSeverity.HIGH,
-                                policy_id="acgs2-security-001",
-                                policy_name="No hardcoded secrets",
-                                message=message,
-                                description=(
-                                    "Hardcoded secrets should be moved to "
-                                    "environment variables or a secrets manager"
-                                ),
-                                file=file_path,
-                                line=line_num,
-                                remediation="Use environment variables or secrets manager",
-                            )
-                        )
-                        break
-
-        # Check for HTTP URLs (should use HTTPS)
-        if "http://" in content and "localhost" not in content and "127.0.0.1" not in content:
-            lines = content.split("\n")
-            for line_num, line in enumerate(lines, 1):
-                if "http://" in line and "localhost" not in line and "127.0.0.1" not in line:
-                    violations.append(
-                        PolicyViolation(
-                            severity=ViolationSeverity.MEDIUM,
-                            policy_id="acgs2-security-002",
-                            policy_name="Require HTTPS",
-                            message="HTTP URL found, should use HTTPS",
-                            description="External URLs should use HTTPS for security",
-                            file=file_path,
-                            line=line_num,
-                            remediation="Change http:// to https://",
-                        )
-                    )
-                    break
+def _is_external_url(line: str) -> bool:
+    """Check whether a line's URL is not a local one."""
+    return "localhost" not in line and "127.0.0.1" not in line
 
-        # Kubernetes-specific checks
-        if res_type == "kubernetes" or file_path.endswith((".yaml", ".yml")):
-            # Check for privileged containers
-            if "privileged: true" in content:
+
+def _check_resource(
+    resource: ResourceInfo,
+    resource_type: Optional[str],
+) -> List[PolicyViolation]:
+    """Run the built-in policy checks against a single resource."""
+    violations = []
+    content = resource.content or ""
+    file_path = resource.path
+    res_type = resource.type or resource_type or "unknown"
+
+    # Check for hardcoded secrets (simple pattern matching on assignment lines)
+    if "=" in content:
+        lowered = content.lower()
+        for pattern, message in SECRET_PATTERNS:
+            line_num = _first_line_with(lowered, pattern, _is_assignment)
+            if line_num is not None:
                 violations.append(
                     PolicyViolation(
                         severity=ViolationSeverity.HIGH,
-                        policy_id="acgs2-k8s-001",
-                        policy_name="No privileged containers",
-                        message="Privileged container detected",
-                        description="Running containers as privileged is a security risk",
+                        policy_id="acgs2-security-001",
+                        policy_name="No hardcoded secrets",
+                        message=message,
+                        description=(
+                            "Hardcoded secrets should be moved to "
+                            "environment variables or a secrets manager"
+                        ),
                         file=file_path,
-                        remediation="Set privileged: false or remove the setting",
+                        line=line_num,
+                        remediation="Use environment variables or secrets manager",
                     )
                 )
 
-            # Check for missing resource limits
-            if "containers:" in content and "resources:" not in content:
-                violations.append(
-                    PolicyViolation(
-                        severity=ViolationSeverity.MEDIUM,
-                        policy_id="acgs2-k8s-002",
-                        policy_name="Resource limits required",
-                        message="Container missing resource limits",
-                        description="Containers should have CPU and memory limits defined",
-                        file=file_path,
-                        remediation="Add resources.limits section to container spec",
-                    )
+    # Check for HTTP URLs (should use HTTPS)
+    if "http://" in content and "localhost" not in content and "127.0.0.1" not in content:
+        line_num = _first_line_with(content, "http://", _is_external_url)
+        if line_num is not None:
+            violations.append(
+                PolicyViolation(
+                    severity=ViolationSeverity.MEDIUM,
+                    policy_id="acgs2-security-002",
+                    policy_name="Require HTTPS",
+                    message="HTTP URL found, should use HTTPS",
+                    description="External URLs should use HTTPS for security",
+                    file=file_path,
+                    line=line_num,
+                    remediation="Change http:// to https://",
                 )
+            )
 
-        # Docker-specific checks
-        if res_type == "docker" or "dockerfile" in file_path.lower():
-            # Check for latest tag
-            if ":latest" in content or (
-                "FROM " in content
-                and ":latest" not in content
-                and ":" not in content.split("FROM ")[1].split()[0]
-                if "FROM " in content
-                else False
-            ):
-                violations.append(
-                    PolicyViolation(
-                        severity=ViolationSeverity.MEDIUM,
-                        policy_id="acgs2-docker-001",
-                        policy_name="No latest tag",
-                        message="Docker image using 'latest' tag or no tag",
-                        description="Using 'latest' tag or no tag makes builds non-reproducible",
-                        file=file_path,
-                        remediation="Use a specific version tag for Docker images",
-                    )
+    # Kubernetes-specific checks
+    if res_type == "kubernetes" or file_path.endswith((".yaml", ".yml")):
+        # Check for privileged containers
+        if "privileged: true" in content:
+            violations.append(
+                PolicyViolation(
+                    severity=ViolationSeverity.HIGH,
+                    policy_id="acgs2-k8s-001",
+                    policy_name="No privileged containers",
+                    message="Privileged container detected",
+                    description="Running containers as privileged is a security risk",
+                    file=file_path,
+                    remediation="Set privileged: false or remove the setting",
                 )
+            )
+
+        # Check for missing resource limits
+        if "containers:" in content and "resources:" not in content:
+            violations.append(
+                PolicyViolation(
+                    severity=ViolationSeverity.MEDIUM,
+                    policy_id="acgs2-k8s-002",
+                    policy_name="Resource limits required",
+                    message="Container missing resource limits",
+                    description="Containers should have CPU and memory limits defined",
+                    file=file_path,
+                    remediation="Add resources.limits section to container spec",
+                )
+            )
+
+    # Docker-specific checks
+    if res_type == "docker" or "dockerfile" in file_path.lower():
+        # Check for latest tag, or no tag on the first base image
+        if ":latest" in content or (
+            "FROM " in content and ":" not in content.partition("FROM ")[2].split(None, 1)[0]
+        ):
+            violations.append(
+                PolicyViolation(
+                    severity=ViolationSeverity.MEDIUM,
+                    policy_id="acgs2-docker-001",
+                    policy_name="No latest tag",
+                    message="Docker image using 'latest' tag or no tag",
+                    description="Using 'latest' tag or no tag makes builds non-reproducible",
+                    file=file_path,
+                    remediation="Use a specific version tag for Docker images",
+                )
+            )
 
     return violations
 
 
+def iter_builtin_violations(
+    resources: List[ResourceInfo],
+    resource_type: Optional[str],
+) -> Iterator[PolicyViolation]:
+    """
+    Run built-in policy checks, yielding violations as each resource is scanned.
+
+    Each resource's content is lowercased once, and the line-based checks jump
+    between occurrences of their tokens instead of looping over every line.
+    """
+    for resource in resources:
+        yield from _check_resource(resource, resource_type)
+
+
+def run_builtin_checks(
+    resources: List[ResourceInfo],
+    resource_type: Optional[str],
+) -> List[PolicyViolation]:
+    """
+    Run built-in policy checks when OPA is unavailable.
+
+    These are simple pattern-based checks for demonstration purposes.
+    """
+    return list(iter_builtin_violations(resources, resource_type))
+
+
 def build_summary(
     resources: List[ResourceInfo],
     violations: List[PolicyViolation],
@@ -571,6 +695,94 @@ def generate_recommendations(
     return recommendations
 
 
+def needs_builtin_checks(
+    opa_available: bool,
+    opa_violations: List[PolicyViolation],
+    policy_id: Optional[str],
+) -> bool:
+    """Check whether built-in checks should run: OPA is unavailable or returned no results."""
+    return not opa_available or (not opa_violations and not policy_id)
+
+
+def log_validation_request(request: PolicyValidationRequest, current_user: UserClaims) -> None:
+    """Log a validation request with its CI platform and user/tenant context."""
+    ci_platform = "unknown"
+    if request.context:
+        if request.context.github_repository:
+            ci_platform = "github"
+        elif request.context.gitlab_project:
+            ci_platform = "gitlab"
+        elif request.context.ci_platform:
+            ci_platform = request.context.ci_platform
+
+    logger.info(
+        f"Policy validation request: {len(request.resources)} resources, "
+        f"type={request.resource_type}, policy={request.policy_id}, platform={ci_platform}, "
+        f"user={current_user.sub}, tenant={current_user.tenant_id}"
+    )
+
+
+def build_validation_response(
+    request: PolicyValidationRequest,
+    current_user: UserClaims,
+    start_time: datetime,
+    violations: List[PolicyViolation],
+    opa_available: bool,
+) -> PolicyValidationResponse:
+    """Build the validation response (summary, pass/fail, recommendations) from violations."""
+    # Calculate validation time
+    end_time = datetime.now(timezone.utc)
+    validation_time_ms = int((end_time - start_time).total_seconds() * 1000)
+
+    # Build summary
+    summary = build_summary(
+        resources=request.resources,
+        violations=violations,
+        validation_time_ms=validation_time_ms,
+        policies_evaluated=len(DEMO_POLICIES) if not opa_available else 0,
+    )
+
+    # Determine if validation passed
+    # By default, fail on critical or high severity violations
+    passed = not any(
+        v.severity in (ViolationSeverity.CRITICAL, ViolationSeverity.HIGH) for v in violations
+    )
+
+    # In strict mode, fail on any violation
+    if request.strict_mode and violations:
+        passed = False
+
+    # Generate recommendations
+    recommendations = []
+    if request.include_recommendations:
+        recommendations = generate_recommendations(violations, opa_available)
+
+    # Create audit context
+    audit_ctx = AuditContext(
+        user_id=current_user.sub,
+        tenant_id=current_user.tenant_id,
+        timestamp=start_time,
+    )
+
+    response = PolicyValidationResponse(
+        passed=passed,
+        violations=violations,
+        summary=summary,
+        recommendations=recommendations,
+        dry_run=not opa_available,
+        opa_available=opa_available,
+        audit_context=audit_ctx,
+    )
+
+    logger.info(
+        f"Policy validation complete: passed={passed}, "
+        f"violations={len(violations)}, time={validation_time_ms}ms, "
+        f"user={current_user.sub}, tenant={current_user.tenant_id}"
+    )
+
+    return response
+
+
 # API Endpoints
 @router.post(
     "/validate",
@@ -617,21 +829,7 @@ async def validate_policies(
     start_time = datetime.now(timezone.utc)
 
     try:
-        # Log the validation request
-        ci_platform = "unknown"
-        if request.context:
-            if request.context.github_repository:
-                ci_platform = "github"
-            elif request.context.gitlab_project:
-                ci_platform = "gitlab"
-            elif request.context.ci_platform:
-                ci_platform = request.context.ci_platform
-
-        logger.info(
-            f"Policy validation request: {len(request.resources)} resources, "
-            f"type={request.resource_type}, policy={request.policy_id}, platform={ci_platform}, "
-            f"user={current_user.sub}, tenant={current_user.tenant_id}"
-        )
+        log_validation_request(request, current_user)
 
         # Try to evaluate with OPA first
         opa_available, opa_violations = await evaluate_policies_with_opa(
@@ -642,7 +840,7 @@ async def validate_policies(
         )
 
         # If OPA is not available or returned no results, run built-in checks
-        if not opa_available or (opa_available and not opa_violations and not request.policy_id):
+        if needs_builtin_checks(opa_available, opa_violations, request.policy_id):
             builtin_violations = run_builtin_checks(
                 resources=request.resources,
                 resource_type=request.resource_type,
@@ -653,64 +851,88 @@ async def validate_policies(
         else:
             violations = opa_violations
 
-        # Calculate validation time
-        end_time = datetime.now(timezone.utc)
-        validation_time_ms = int((end_time - start_time).total_seconds() * 1000)
-
-        # Build summary
-        summary = build_summary(
-            resources=request.resources,
-            violations=violations,
-            validation_time_ms=validation_time_ms,
-            policies_evaluated=len(DEMO_POLICIES) if not opa_available else 0,
+        return build_validation_response(
+            request, current_user, start_time, violations, opa_available
         )
 
-        # Determine if validation passed
-        # By default, fail on critical or high severity violations
-        passed = not any(
-            v.severity in (ViolationSeverity.CRITICAL, ViolationSeverity.HIGH) for v in violations
-        )
+    except Exception as e:
+        logger.exception(f"Error during policy validation: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Policy validation failed: {str(e)}",
+        ) from None
 
-        # In strict mode, fail on any violation
-        if request.strict_mode and violations:
-            passed = False
 
-        # Generate recommendations
-        recommendations = []
-        if request.include_recommendations:
-            recommendations = generate_recommendations(violations, opa_available)
+@router.post(
+    "/validate/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Validate resources against policies, streaming violations",
+    description=(
+        "Same validation as `/validate`, returned as newline-delimited JSON: one "
+        '`{"type": "violation", ...}` line per violation as it is found, then a final '
+        '`{"type": "result", ...}` line with the pass/fail outcome, summary and '
+        "recommendations. **Requires JWT authentication.**"
+    ),
+    responses={
+        200: {"description": "Violations and result", "content": {"application/x-ndjson": {}}},
+        401: {
+            "description": "Unauthorized - Invalid or missing authentication token",
+            "content": {"application/json": {"example": {"detail": "Authentication required"}}},
+        },
+    },
+)
+async def validate_policies_stream(
+    request: PolicyValidationRequest,
+    current_user: UserClaims = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Validate resources against ACGS2 governance policies, streaming the results.
 
-        # Create audit context
-        audit_ctx = AuditContext(
-            user_id=current_user.sub,
-            tenant_id=current_user.tenant_id,
-            timestamp=start_time,
-        )
+    Built-in check violations are written as each resource is scanned, so large
+    CI requests start reporting before the whole resource set has been checked.
+    The scan yields to the event loop every ``BUILTIN_CHECK_YIELD_INTERVAL``
+    resources so one large request does not stall the others.
+    """
+    start_time = datetime.now(timezone.utc)
+    log_validation_request(request, current_user)
 
-        response = PolicyValidationResponse(
-            passed=passed,
-            violations=violations,
-            summary=summary,
-            recommendations=recommendations,
-            dry_run=not opa_available,
-            opa_available=opa_available,
-            audit_context=audit_ctx,
-        )
+    async def stream() -> AsyncIterator[str]:
+        try:
+            opa_available, violations = await evaluate_policies_with_opa(
+                resources=request.resources,
+                resource_type=request.resource_type,
+                policy_id=request.policy_id,
+                context=request.context,
+            )
+            for violation in violations:
+                yield _ndjson_line("violation", violation)
+
+            if needs_builtin_checks(opa_available, violations, request.policy_id):
+                if not opa_available:
+                    violations = []
+                for index, resource in enumerate(request.resources, 1):
+                    for violation in _check_resource(resource, request.resource_type):
+                        violations.append(violation)
+                        yield _ndjson_line("violation", violation)
+                    if index % max(1, BUILTIN_CHECK_YIELD_INTERVAL) == 0:
+                        # The checks are CPU-bound; let other requests run between slices
+                        await asyncio.sleep(0)
+
+            response = build_validation_response(
+                request, current_user, start_time, violations, opa_available
+            )
+            yield _ndjson_line("result", response, exclude={"violations"})
+        except Exception as e:
+            # Headers are already sent, so report the failure in the stream
+            logger.exception(f"Error during streaming policy validation: {e}")
+            yield json.dumps({"type": "error", "detail": f"Policy validation failed: {e}"}) + "\n"
 
-        logger.info(
-            f"Policy validation complete: passed={passed}, "
-            f"violations={len(violations)}, time={validation_time_ms}ms, "
-            f"user={current_user.sub}, tenant={current_user.tenant_id}"
-        )
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
-        return response
 
-    except Exception as e:
-        logger.exception(f"Error during policy validation: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Policy validation failed: {str(e)}",
-        ) from None
+def _ndjson_line(kind: str, model: BaseModel, exclude: Optional[set] = None) -> str:
+    """Serialize a model as one newline-delimited JSON record of the given type."""
+    return json.dumps({"type": kind, **model.model_dump(mode="json", exclude=exclude)}) + "\n"
 
 
 @router.get(
@@ -756,50 +978,48 @@ async def list_policies(
     if opa_available:
         try:
             # Try to get policies from OPA
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{OPA_URL}/v1/data/acgs2/policies")
-                if response.status_code == 200:
-                    result = response.json()
-                    opa_policies = result.get("result", {})
-
-                    policies = []
-                    for policy_id, policy_data in opa_policies.items():
-                        if isinstance(policy_data, dict):
-                            policies.append(
-                                PolicyInfo(
-                                    id=policy_id,
-                                    name=policy_data.get("name", policy_id),
-                                    description=policy_data.get("description"),
-                                    version=policy_data.get("version"),
-                                    resource_types=policy_data.get("resource_types", []),
-                                    severity=ViolationSeverity(
-                                        policy_data.get("severity", "medium")
-                                    ),
-                                    enabled=policy_data.get("enabled", True),
-                                )
+            client = await get_opa_client()
+            response = await client.get(f"{OPA_URL}/v1/data/acgs2/policies", timeout=10.0)
+            if response.status_code == 200:
+                result = response.json()
+                opa_policies = result.get("result", {})
+
+                policies = []
+                for policy_id, policy_data in opa_policies.items():
+                    if isinstance(policy_data, dict):
+                        policies.append(
+                            PolicyInfo(
+                                id=policy_id,
+                                name=policy_data.get("name", policy_id),
+                                description=policy_data.get("description"),
+                                version=policy_data.get("version"),
+                                resource_types=policy_data.get("resource_types", []),
+                                severity=ViolationSeverity(policy_data.get("severity", "medium")),
+                                enabled=policy_data.get("enabled", True),
                             )
+                        )
 
-                    # Filter by resource type
-                    if resource_type:
-                        policies = [p for p in policies if resource_type in p.resource_types]
+                # Filter by resource type
+                if resource_type:
+                    policies = [p for p in policies if resource_type in p.resource_types]
 
-                    # Filter by enabled status
-                    if enabled_only:
-                        policies = [p for p in policies if p.enabled]
+                # Filter by enabled status
+                if enabled_only:
+                    policies = [p for p in policies if p.enabled]
 
-                    logger.info(
-                        f"List policies complete: returned {len(policies)} policies from OPA, "
-                        f"user={current_user.sub}, tenant={current_user.tenant_id}"
-                    )
+                logger.info(
+                    f"List policies complete: returned {len(policies)} policies from OPA, "
+                    f"user={current_user.sub}, tenant={current_user.tenant_id}"
+                )
 
-                    audit_ctx = AuditContext(
-                        user_id=current_user.sub,
-                        tenant_id=current_user.tenant_id,
-                    )
+                audit_ctx = AuditContext(
+                    user_id=current_user.sub,
+                    tenant_id=current_user.tenant_id,
+                )
 
-                    return PoliciesListResponse(
-                        policies=policies, total=len(policies), audit_context=audit_ctx
-                    )
+                return PoliciesListResponse(
+                    policies=policies, total=len(policies), audit_context=audit_ctx
+                )
         except Exception as e:
             logger.warning(f"Failed to get policies from OPA: {e}")
 
@@ -881,31 +1101,33 @@ async def get_policy(
     opa_available = await check_opa_health()
     if opa_available:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{OPA_URL}/v1/data/acgs2/policies/{policy_id}")
-                if response.status_code == 200:
-                    result = response.json()
-                    policy_data = result.get("result", {})
-
-                    if policy_data:
-                        policy_info = PolicyInfo(
-                            id=policy_id,
-                            name=policy_data.get("name", policy_id),
-                            description=policy_data.get("description"),
-                            version=policy_data.get("version"),
-                            resource_types=policy_data.get("resource_types", []),
-                            severity=ViolationSeverity(policy_data.get("severity", "medium")),
-                            enabled=policy_data.get("enabled", True),
-                        )
-                        logger.info(
-                            f"Get policy complete: found OPA policy {policy_id}, "
-                            f"user={current_user.sub}, tenant={current_user.tenant_id}"
-                        )
-                        audit_ctx = AuditContext(
-                            user_id=current_user.sub,
-                            tenant_id=current_user.tenant_id,
-                        )
-                        return PolicyResponse(policy=policy_info, audit_context=audit_ctx)
+            client = await get_opa_client()
+            response = await client.get(
+                f"{OPA_URL}/v1/data/acgs2/policies/{policy_id}", timeout=10.0
+            )
+            if response.status_code == 200:
+                result = response.json()
+                policy_data = result.get("result", {})
+
+                if policy_data:
+                    policy_info = PolicyInfo(
+                        id=policy_id,
+                        name=policy_data.get("name", policy_id),
+                        description=policy_data.get("description"),
+                        version=policy_data.get("version"),
+                        resource_types=policy_data.get("resource_types", []),
+                        severity=ViolationSeverity(policy_data.get("severity", "medium")),
+                        enabled=policy_data.get("enabled", True),
+                    )
+                    logger.info(
+                        f"Get policy complete: found OPA policy {policy_id}, "
+                        f"user={current_user.sub}, tenant={current_user.tenant_id}"
+                    )
+                    audit_ctx = AuditContext(
+                        user_id=current_user.sub,
+                        tenant_id=current_user.tenant_id,
+                    )
+                    return PolicyResponse(policy=policy_info, audit_context=audit_ctx)
         except Exception as e:
             logger.warning(f"Failed to get policy from OPA: {e}")
 
@@ -12,6 +12,7 @@ from .event_consumer import (
     EventConsumerState,
     GovernanceEvent,
     GovernanceEventType,
+    ProcessingMode,
 )
 
 __all__ = [
@@ -21,4 +22,5 @@ __all__ = [
     "EventConsumerState",
     "GovernanceEvent",
     "GovernanceEventType",
+    "ProcessingMode",
 ]
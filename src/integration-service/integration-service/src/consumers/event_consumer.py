@@ -9,14 +9,27 @@ import asyncio
 import json
 import logging
 import os
+import time
+from collections import deque
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 from uuid import uuid4
 
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRebalanceListener
 from aiokafka.errors import KafkaConnectionError, KafkaError, OffsetOutOfRangeError
-from aiokafka.structs import ConsumerRecord
+from aiokafka.structs import ConsumerRecord, TopicPartition
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..integration_types import ConfigDict as ConfigDictType
@@ -72,6 +85,14 @@ class EventConsumerState(str, Enum):
     ERROR = "error"
 
 
+class ProcessingMode(str, Enum):
+    """How polled records are processed."""
+
+    SEQUENTIAL = "sequential"  # One record at a time, in poll order
+    PARTITION = "partition"  # Partitions run concurrently, in order within each
+    KEY = "key"  # Keys run concurrently, in order within each key of a partition
+
+
 class GovernanceEvent(BaseModel):
     """
     Governance event model from Agent Bus.
@@ -196,6 +217,17 @@ class EventConsumerMetrics(BaseModel):
     # Lag metrics
     current_lag: int = Field(default=0, description="Current consumer lag")
     max_lag_observed: int = Field(default=0, description="Maximum lag observed")
+    partition_lag: Dict[str, int] = Field(
+        default_factory=dict, description="Consumer lag per topic:partition"
+    )
+
+    # Concurrent processing metrics
+    events_in_flight: int = Field(default=0, description="Records dispatched but not finished")
+    max_in_flight_observed: int = Field(default=0, description="Maximum records in flight")
+    offsets_committed: int = Field(default=0, description="Number of offset commits")
+    throughput_events_per_second: float = Field(
+        default=0.0, description="Records finished per second over the last sample"
+    )
 
     # Processing metrics
     avg_processing_time_ms: float = Field(
@@ -247,11 +279,27 @@ class EventConsumerMetrics(BaseModel):
         """Record a successful reconnection."""
         self.reconnections += 1
 
-    def update_lag(self, lag: int) -> None:
+    def update_lag(self, lag: int, partition_lag: Optional[Dict[str, int]] = None) -> None:
         """Update current lag metrics."""
         self.current_lag = lag
         if lag > self.max_lag_observed:
             self.max_lag_observed = lag
+        if partition_lag is not None:
+            self.partition_lag = partition_lag
+
+    def update_in_flight(self, in_flight: int) -> None:
+        """Update the number of records in flight."""
+        self.events_in_flight = in_flight
+        if in_flight > self.max_in_flight_observed:
+            self.max_in_flight_observed = in_flight
+
+    def record_offsets_committed(self) -> None:
+        """Record an offset commit."""
+        self.offsets_committed += 1
+
+    def update_throughput(self, events_per_second: float) -> None:
+        """Update processing throughput."""
+        self.throughput_events_per_second = events_per_second
 
     def to_dict(self) -> JSONDict:
         """Convert metrics to dictionary."""
@@ -377,6 +425,20 @@ class EventConsumerConfig(BaseModel):
         description="Exponential backoff multiplier",
     )
 
+    processing_mode: ProcessingMode = Field(
+        default=ProcessingMode.SEQUENTIAL,
+        description=(
+            "sequential, partition (partitions run concurrently) or key (keys run "
+            "concurrently); concurrent modes commit offsets manually"
+        ),
+    )
+    max_in_flight: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Maximum records dispatched but not finished in concurrent modes",
+    )
+
     # Filtering settings
     event_type_filter: Optional[List[str]] = Field(
         None,
@@ -446,6 +508,8 @@ class EventConsumerConfig(BaseModel):
         - KAFKA_SSL_KEYFILE
         - KAFKA_AUTO_OFFSET_RESET
         - KAFKA_MAX_POLL_RECORDS
+        - KAFKA_PROCESSING_MODE
+        - KAFKA_MAX_IN_FLIGHT
         """
         topics_str = os.getenv("KAFKA_TOPICS", "governance-events")
         topics = [t.strip() for t in topics_str.split(",") if t.strip()]
@@ -472,6 +536,8 @@ class EventConsumerConfig(BaseModel):
             client_id=os.getenv("KAFKA_CLIENT_ID", "integration-service"),
             auto_offset_reset=os.getenv("KAFKA_AUTO_OFFSET_RESET", "latest"),
             max_poll_records=int(os.getenv("KAFKA_MAX_POLL_RECORDS", "100")),
+            processing_mode=os.getenv("KAFKA_PROCESSING_MODE", "sequential").lower(),
+            max_in_flight=int(os.getenv("KAFKA_MAX_IN_FLIGHT", "500")),
             security_protocol=os.getenv("KAFKA_SECURITY_PROTOCOL", "PLAINTEXT"),
             sasl_mechanism=os.getenv("KAFKA_SASL_MECHANISM"),
             sasl_username=os.getenv("KAFKA_SASL_USERNAME"),
@@ -489,6 +555,58 @@ class EventConsumerConfig(BaseModel):
 EventHandler = Callable[[GovernanceEvent], Coroutine[Any, Any, bool]]
 
 
+class _PartitionOffsets:
+    """
+    In-flight offsets of one partition.
+
+    Records finish out of order when keys run concurrently, so only the
+    contiguous prefix of finished offsets may be committed.
+    """
+
+    __slots__ = ("_pending", "_finished", "committable", "committed")
+
+    def __init__(self) -> None:
+        self._pending: Deque[int] = deque()
+        self._finished: Set[int] = set()
+        self.committable: Optional[int] = None
+        self.committed: Optional[int] = None
+
+    def add(self, offset: int) -> None:
+        """Track a dispatched offset; offsets arrive in increasing order."""
+        self._pending.append(offset)
+
+    def finish(self, offset: int) -> None:
+        """Mark an offset finished and advance the committable position."""
+        self._finished.add(offset)
+        while self._pending and self._pending[0] in self._finished:
+            head = self._pending.popleft()
+            self._finished.discard(head)
+            self.committable = head + 1
+
+    @property
+    def in_flight(self) -> int:
+        """Dispatched offsets not yet covered by the committable position."""
+        return len(self._pending)
+
+    @property
+    def low_watermark(self) -> Optional[int]:
+        """Lowest unfinished offset, or the committable position if none."""
+        return self._pending[0] if self._pending else self.committable
+
+
+class _RebalanceListener(ConsumerRebalanceListener):
+    """Forwards group rebalances to the EventConsumer."""
+
+    def __init__(self, consumer: "EventConsumer"):
+        self._consumer = consumer
+
+    async def on_partitions_revoked(self, revoked: Iterable[TopicPartition]) -> None:
+        await self._consumer._on_partitions_revoked(revoked)
+
+    async def on_partitions_assigned(self, assigned: Iterable[TopicPartition]) -> None:
+        await self._consumer._on_partitions_assigned(assigned)
+
+
 class EventConsumer:
     """
     Kafka consumer for governance events from Agent Bus.
@@ -496,9 +614,18 @@ class EventConsumer:
     Provides async consumption of governance events with support for:
     - Configurable event filtering
     - Batch processing
+    - Concurrent processing per partition or per key, with ordered lanes
     - Retry logic with exponential backoff
     - Metrics and health monitoring
     - Graceful shutdown
+
+    In the partition and key processing modes each partition (or key within a
+    partition) is a lane processed in order by its own task, so a slow
+    handler only holds up its own lane. At most ``max_in_flight`` records are
+    dispatched but unfinished, and offsets are committed manually up to the
+    contiguous prefix of finished records of each partition. When a rebalance
+    revokes a partition, its in-progress records are finished and committed
+    and its queued records are left for the partition's next owner.
     """
 
     def __init__(self, config: Optional[EventConsumerConfig] = None):
@@ -517,6 +644,21 @@ class EventConsumer:
         self._consecutive_errors = 0
         self._assigned_partitions: Set[str] = set()
 
+        # Concurrent processing state
+        self._lanes: Dict[Hashable, Deque[ConsumerRecord]] = {}
+        self._lane_tasks: Dict[Hashable, asyncio.Task] = {}
+        self._offsets: Dict[TopicPartition, _PartitionOffsets] = {}
+        self._revoking: Set[TopicPartition] = set()
+        self._in_flight = 0
+        self._window_open = asyncio.Event()
+        self._window_open.set()
+        self._finished_count = 0
+        self._throughput_sample = (time.monotonic(), 0)
+
+    @property
+    def _concurrent(self) -> bool:
+        return self.config.processing_mode != ProcessingMode.SEQUENTIAL
+
     @property
     def state(self) -> EventConsumerState:
         """Get current consumer state."""
@@ -587,9 +729,9 @@ class EventConsumer:
             consumer_config = self._build_consumer_config()
 
             # Create and start consumer
-            self._consumer = AIOKafkaConsumer(
-                *self.config.topics,
-                **consumer_config,
+            self._consumer = AIOKafkaConsumer(**consumer_config)
+            self._consumer.subscribe(
+                topics=list(self.config.topics), listener=_RebalanceListener(self)
             )
 
             await self._consumer.start()
@@ -628,8 +770,13 @@ class EventConsumer:
         self._state = EventConsumerState.STOPPING
         self._stop_event.set()
 
+        if self._lane_tasks:
+            await asyncio.gather(*self._lane_tasks.values(), return_exceptions=True)
+
         if self._consumer:
             try:
+                if self._concurrent:
+                    await self._commit_finished_offsets()
                 await self._consumer.stop()
                 logger.info("Kafka consumer stopped")
             except Exception as e:
@@ -639,6 +786,7 @@ class EventConsumer:
 
         self._state = EventConsumerState.STOPPED
         self._assigned_partitions.clear()
+        self._offsets.clear()
 
     async def pause(self) -> None:
         """Pause event consumption."""
@@ -678,6 +826,10 @@ class EventConsumer:
 
         while not self._stop_event.is_set():
             try:
+                if self._concurrent:
+                    await self._consume_window()
+                    continue
+
                 # Poll for messages
                 messages = await self._poll_messages()
 
@@ -726,10 +878,164 @@ class EventConsumer:
 
         logger.info("Consumption loop terminated")
 
-    async def _poll_messages(self) -> List[ConsumerRecord]:
+    async def _consume_window(self) -> None:
+        """Poll into the in-flight window, dispatch to lanes and commit finished offsets."""
+        while self._in_flight >= self.config.max_in_flight:
+            self._window_open.clear()
+            await self._window_open.wait()
+
+        messages = await self._poll_messages(
+            max_records=min(self.config.batch_size, self.config.max_in_flight - self._in_flight)
+        )
+        for message in messages:
+            self._dispatch_to_lane(message)
+
+        await self._commit_finished_offsets()
+        self._sample_throughput()
+
+    def _lane_key(self, message: ConsumerRecord) -> Hashable:
+        """Ordering key: the partition, or the record key within its partition."""
+        if self.config.processing_mode == ProcessingMode.KEY and message.key is not None:
+            return (message.topic, message.partition, message.key)
+        return (message.topic, message.partition)
+
+    def _dispatch_to_lane(self, message: ConsumerRecord) -> None:
+        """Queue a record on its lane, starting the lane task if the lane is idle."""
+        tp = TopicPartition(message.topic, message.partition)
+        if tp in self._revoking:
+            return
+        offsets = self._offsets.get(tp)
+        if offsets is None:
+            offsets = self._offsets[tp] = _PartitionOffsets()
+        offsets.add(message.offset)
+        self._in_flight += 1
+        self._metrics.update_in_flight(self._in_flight)
+
+        key = self._lane_key(message)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = deque()
+            self._lane_tasks[key] = asyncio.create_task(self._run_lane(key, lane))
+        lane.append(message)
+
+    async def _run_lane(self, key: Hashable, lane: Deque[ConsumerRecord]) -> None:
+        """Process one lane's records in order until it is empty."""
+        try:
+            while lane:
+                message = lane[0]
+                try:
+                    await self._process_message(message)
+                finally:
+                    lane.popleft()
+                    tracker = self._offsets.get(TopicPartition(message.topic, message.partition))
+                    if tracker is not None:
+                        tracker.finish(message.offset)
+                    self._in_flight -= 1
+                    self._finished_count += 1
+                    self._metrics.update_in_flight(self._in_flight)
+                    self._window_open.set()
+        finally:
+            del self._lanes[key]
+            self._lane_tasks.pop(key, None)
+
+    async def _commit_finished_offsets(
+        self, partitions: Optional[Set[TopicPartition]] = None
+    ) -> None:
+        """
+        Commit each partition's contiguous prefix of finished offsets.
+
+        Only partitions currently assigned to this consumer are committed;
+        committing any other partition fails the whole commit.
+
+        Args:
+            partitions: Restrict the commit to these partitions
+        """
+        if not self._consumer:
+            return
+
+        assignment = self._consumer.assignment()
+        offsets = {
+            tp: tracker.committable
+            for tp, tracker in self._offsets.items()
+            if tracker.committable is not None
+            and tracker.committable != tracker.committed
+            and tp in assignment
+            and (partitions is None or tp in partitions)
+        }
+        if not offsets:
+            return
+
+        await self._consumer.commit(offsets)
+        for tp, offset in offsets.items():
+            self._offsets[tp].committed = offset
+        self._metrics.record_offsets_committed()
+
+    async def _on_partitions_revoked(self, revoked: Iterable[TopicPartition]) -> None:
+        """
+        Hand revoked partitions back before a rebalance completes.
+
+        Records already being handled are finished and their offsets
+        committed; queued records are dropped without processing, since the
+        partition's next owner resumes from the committed offset. The offset
+        trackers of revoked partitions are then discarded.
+        """
+        revoked = set(revoked)
+        self._assigned_partitions -= {f"{tp.topic}:{tp.partition}" for tp in revoked}
+        if not revoked:
+            return
+        logger.info(f"Partitions revoked: {sorted(f'{tp.topic}:{tp.partition}' for tp in revoked)}")
+
+        self._revoking |= revoked
+        running = []
+        for key, lane in self._lanes.items():
+            if TopicPartition(key[0], key[1]) not in revoked:
+                continue
+            while len(lane) > 1:
+                lane.pop()
+                self._in_flight -= 1
+            if key in self._lane_tasks:
+                running.append(self._lane_tasks[key])
+        self._metrics.update_in_flight(self._in_flight)
+        self._window_open.set()
+
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        try:
+            await self._commit_finished_offsets(revoked)
+        except KafkaError as e:
+            logger.error(f"Failed to commit offsets of revoked partitions: {e}")
+        finally:
+            for tp in revoked:
+                self._offsets.pop(tp, None)
+            self._revoking -= revoked
+
+    async def _on_partitions_assigned(self, assigned: Iterable[TopicPartition]) -> None:
+        """Track a new assignment, starting fresh offset tracking for its partitions."""
+        assigned = set(assigned)
+        self._assigned_partitions |= {f"{tp.topic}:{tp.partition}" for tp in assigned}
+        logger.info(f"Assigned partitions: {self._assigned_partitions}")
+        for tp in assigned:
+            tracker = self._offsets.get(tp)
+            if tracker is not None and tracker.in_flight == 0:
+                # Offsets restart from the committed position after reassignment
+                del self._offsets[tp]
+
+    def _sample_throughput(self, min_interval_seconds: float = 1.0) -> None:
+        """Update the throughput metric at most once per interval."""
+        sampled_at, finished = self._throughput_sample
+        now = time.monotonic()
+        if now - sampled_at < min_interval_seconds:
+            return
+        self._metrics.update_throughput((self._finished_count - finished) / (now - sampled_at))
+        self._throughput_sample = (now, self._finished_count)
+
+    async def _poll_messages(self, max_records: Optional[int] = None) -> List[ConsumerRecord]:
         """
         Poll Kafka for messages.
 
+        Args:
+            max_records: Maximum records to return (defaults to batch_size)
+
         Returns:
             List of Kafka consumer records
         """
@@ -741,7 +1047,7 @@ class EventConsumer:
             batch = await asyncio.wait_for(
                 self._consumer.getmany(
                     timeout_ms=int(self.config.batch_timeout_seconds * 1000),
-                    max_records=self.config.batch_size,
+                    max_records=max_records or self.config.batch_size,
                 ),
                 timeout=self.config.batch_timeout_seconds + 5.0,
             )
@@ -953,7 +1259,8 @@ class EventConsumer:
             "group_id": self.config.group_id,
             "client_id": self.config.client_id,
             "auto_offset_reset": self.config.auto_offset_reset,
-            "enable_auto_commit": self.config.enable_auto_commit,
+            # Concurrent modes commit finished offsets themselves
+            "enable_auto_commit": self.config.enable_auto_commit and not self._concurrent,
             "auto_commit_interval_ms": self.config.auto_commit_interval_ms,
             "max_poll_records": self.config.max_poll_records,
             "max_poll_interval_ms": self.config.max_poll_interval_ms,
@@ -998,8 +1305,12 @@ class EventConsumer:
             assignment = self._consumer.assignment()
 
             for tp in assignment:
-                # Get current position
+                # Get current position; in concurrent modes polled records may
+                # still be in flight, so lag counts from the lowest unfinished one
                 position = await self._consumer.position(tp)
+                tracker = self._offsets.get(tp)
+                if self._concurrent and tracker is not None and tracker.in_flight:
+                    position = tracker.low_watermark
 
                 # Get end offset
                 end_offsets = await self._consumer.end_offsets([tp])
@@ -1011,7 +1322,7 @@ class EventConsumer:
 
             # Update metrics
             total_lag = sum(lag.values())
-            self._metrics.update_lag(total_lag)
+            self._metrics.update_lag(total_lag, lag)
 
         except Exception as e:
             logger.error(f"Error getting consumer lag: {e}")
@@ -1033,6 +1344,9 @@ class EventConsumer:
             "max_consecutive_errors": self.config.max_consecutive_errors,
             "assigned_partitions": list(self._assigned_partitions),
             "handlers_count": len(self._handlers),
+            "processing_mode": self.config.processing_mode.value,
+            "in_flight": self._in_flight,
+            "active_lanes": len(self._lanes),
             "topics": self.config.topics,
             "group_id": self.config.group_id,
             "metrics": self._metrics.to_dict(),
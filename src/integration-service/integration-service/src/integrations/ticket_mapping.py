@@ -14,10 +14,11 @@ Features:
 """
 
 import logging
+import operator
 import re
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -625,6 +626,314 @@ def map_value(event: IntegrationEvent, params: Dict[str, JSONValue]) -> JSONValu
     return default
 
 
+# ============================================================================
+# Compiled Mapping Plans
+# ============================================================================
+
+# Template placeholder pattern, e.g. {title} or {details.key}
+TEMPLATE_PATTERN = re.compile(r"\{(\w+(?:\.\w+)*)\}")
+
+# Type for compiled functions computing a field value from an event
+EventValueFunc = Callable[[IntegrationEvent], JSONValue]
+
+# Types event field values are returned as; other values are converted to str
+_JSON_VALUE_TYPES = (str, int, float, bool, dict, list, type(None))
+
+# Marker for a field path that does not resolve
+_MISSING = object()
+
+# Comparison operators for conditional mappings, called as op(actual, expected)
+_COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+def _compile_path_step(part: str) -> Callable[[Any], Any]:
+    """Compile one step of a field path: attribute first, then dict key."""
+    shadowed_by_dict = hasattr(dict, part)
+
+    def step(value: Any) -> Any:
+        if type(value) is dict and not shadowed_by_dict:
+            return value.get(part, _MISSING)
+        if hasattr(value, part):
+            return getattr(value, part)
+        if isinstance(value, dict) and part in value:
+            return value[part]
+        return _MISSING
+
+    return step
+
+
+def compile_field_path(field_path: str) -> EventValueFunc:
+    """
+    Compile an event field path into an accessor chain.
+
+    The path is split once, and the event attribute and each later step
+    (attribute, then dict key) are resolved by pre-built functions.
+
+    Args:
+        field_path: Field path (e.g., "title", "details.key")
+
+    Returns:
+        Function returning the field value of an event, or None if not found
+    """
+    root, *rest = field_path.split(".")
+    steps = [_compile_path_step(part) for part in rest]
+
+    def get_value(event: IntegrationEvent) -> JSONValue:
+        value = getattr(event, root, _MISSING)
+        for step in steps:
+            if value is _MISSING:
+                return None
+            value = step(value)
+        if value is _MISSING:
+            return None
+        # Ensure we return a JSONValue type
+        if isinstance(value, _JSON_VALUE_TYPES):
+            return value
+        return str(value)
+
+    return get_value
+
+
+def compile_template(template: str) -> Callable[[IntegrationEvent], str]:
+    """
+    Pre-parse a template into literal text and placeholder accessors.
+
+    Supports placeholders like {title}, {severity}, {details.key}, etc.
+    Placeholders that do not resolve render as an empty string.
+
+    Args:
+        template: Template string with {placeholders}
+
+    Returns:
+        Function rendering the template for an event
+    """
+    pieces = TEMPLATE_PATTERN.split(template)
+    head = pieces[0]
+    placeholders = [
+        (compile_field_path(path), literal)
+        for path, literal in zip(pieces[1::2], pieces[2::2], strict=True)
+    ]
+
+    if not placeholders:
+        return lambda event: template
+
+    def render(event: IntegrationEvent) -> str:
+        parts = [head]
+        for get_value, literal in placeholders:
+            value = get_value(event)
+            if value is not None:
+                parts.append(str(value))
+            parts.append(literal)
+        return "".join(parts)
+
+    return render
+
+
+def _compile_condition_test(operator_name: str, expected: JSONValue) -> Callable[[Any], bool]:
+    """Compile the test of a condition against a non-None actual value."""
+    if operator_name in _COMPARISON_OPERATORS:
+        compare = _COMPARISON_OPERATORS[operator_name]
+        return lambda actual: compare(actual, expected)
+    elif operator_name == "in":
+        expected_list = expected if isinstance(expected, list) else []
+        return lambda actual: actual in expected_list
+    elif operator_name == "contains":
+        substring = str(expected)
+        return lambda actual: substring in str(actual)
+    elif operator_name == "regex":
+        pattern = str(expected)
+        try:
+            match = re.compile(pattern).match
+        except re.error:
+            # Report the invalid pattern when the condition is evaluated
+            return lambda actual: bool(re.match(pattern, str(actual)))
+        return lambda actual: bool(match(str(actual)))
+    return lambda actual: False
+
+
+def compile_conditional(conditions: List[JSONDict], default: JSONValue) -> EventValueFunc:
+    """
+    Compile conditional mapping logic into a function of the event.
+
+    Each condition has: {field, operator, value, result}. Supported operators
+    are eq, ne, gt, gte, lt, lte, in, contains and regex; a missing field only
+    matches "eq" with an expected value of None.
+
+    Args:
+        conditions: List of condition dictionaries
+        default: Default value if no condition matches
+
+    Returns:
+        Function returning the result of the first matching condition or default
+    """
+    compiled = []
+    for condition in conditions:
+        operator_name = str(condition.get("operator", "eq"))
+        expected = condition.get("value")
+        compiled.append(
+            (
+                compile_field_path(str(condition.get("field", ""))),
+                _compile_condition_test(operator_name, expected),
+                operator_name == "eq" and expected is None,
+                condition.get("result"),
+            )
+        )
+
+    def evaluate(event: IntegrationEvent) -> JSONValue:
+        for get_actual, test, matches_none, result in compiled:
+            actual = get_actual(event)
+            if matches_none if actual is None else test(actual):
+                return result
+        return default
+
+    return evaluate
+
+
+def compile_transform(
+    transform_name: str,
+    params: Dict[str, JSONValue],
+    custom_transforms: Optional[Dict[str, TransformFunc]] = None,
+) -> EventValueFunc:
+    """
+    Look up a transform once and bind it to its parameters.
+
+    Custom transforms take precedence over built-in ones. An unknown
+    transform compiles to a function raising ValueError.
+
+    Args:
+        transform_name: Name of the transform function
+        params: Parameters for the transform
+        custom_transforms: Custom transforms registered on a mapper
+
+    Returns:
+        Function applying the transform to an event
+    """
+    custom_transforms = custom_transforms or {}
+    if transform_name in custom_transforms:
+        transform_func: Optional[TransformFunc] = custom_transforms[transform_name]
+    else:
+        transform_func = FieldTransformers.get(transform_name)
+
+    if transform_func is None:
+
+        def unknown(event: IntegrationEvent) -> JSONValue:
+            raise ValueError(f"Unknown transform: {transform_name}")
+
+        return unknown
+
+    bound_func = transform_func
+
+    def apply(event: IntegrationEvent) -> JSONValue:
+        return bound_func(event, params)
+
+    return apply
+
+
+class CompiledFieldMapping:
+    """A field mapping with its value computation compiled."""
+
+    __slots__ = ("mapping", "target_field", "required", "validation_rules", "compute")
+
+    def __init__(
+        self,
+        mapping: FieldMapping,
+        custom_transforms: Optional[Dict[str, TransformFunc]] = None,
+    ):
+        """
+        Compile a field mapping.
+
+        Args:
+            mapping: Field mapping configuration
+            custom_transforms: Custom transforms registered on a mapper
+        """
+        self.mapping = mapping
+        self.target_field = mapping.target_field
+        self.required = mapping.required
+        self.validation_rules = mapping.validation_rules
+        self.compute = self._compile(mapping, custom_transforms)
+
+    @staticmethod
+    def _compile(
+        mapping: FieldMapping,
+        custom_transforms: Optional[Dict[str, TransformFunc]],
+    ) -> EventValueFunc:
+        """Compile the value computation for the mapping type."""
+        if mapping.mapping_type == FieldMappingType.STATIC:
+            static_value = mapping.static_value
+            return lambda event: static_value
+
+        elif mapping.mapping_type == FieldMappingType.TEMPLATE:
+            return compile_template(mapping.template or "")
+
+        elif mapping.mapping_type == FieldMappingType.EVENT_FIELD:
+            return compile_field_path(mapping.source_field or "")
+
+        elif mapping.mapping_type == FieldMappingType.TRANSFORM:
+            return compile_transform(
+                mapping.transform_name or "", mapping.transform_params, custom_transforms
+            )
+
+        elif mapping.mapping_type == FieldMappingType.CONDITIONAL:
+            return compile_conditional(mapping.conditions, mapping.default_value)
+
+        return lambda event: None
+
+
+class TicketMappingPlan:
+    """
+    A ticket mapping configuration compiled for repeated use.
+
+    Templates are pre-parsed, event field paths resolved into accessor chains
+    and transforms bound to their parameters once, so mapping an event only
+    runs the compiled functions. A plan reflects the configuration when it was
+    compiled; see is_current().
+    """
+
+    def __init__(
+        self,
+        config: TicketMappingConfig,
+        custom_transforms: Optional[Dict[str, TransformFunc]] = None,
+    ):
+        """
+        Compile a mapping configuration.
+
+        Args:
+            config: Ticket mapping configuration
+            custom_transforms: Custom transforms registered on a mapper
+        """
+        self.config = config
+        self.provider = config.provider
+        self.fields = [
+            CompiledFieldMapping(mapping, custom_transforms) for mapping in config.field_mappings
+        ]
+        self.render_summary = compile_template(config.summary_template)
+        self._field_mappings = config.field_mappings
+        self._mapping_count = len(config.field_mappings)
+        self._summary_template = config.summary_template
+
+    def is_current(self, config: TicketMappingConfig) -> bool:
+        """
+        Check whether the plan was compiled from this configuration as it is now.
+
+        Detects a replaced configuration, a replaced or resized field_mappings
+        list and a changed summary template. Field mappings modified in place
+        are not detected.
+        """
+        return (
+            config is self.config
+            and config.field_mappings is self._field_mappings
+            and len(config.field_mappings) == self._mapping_count
+            and config.summary_template == self._summary_template
+        )
+
+
 # ============================================================================
 # Ticket Field Mapper
 # ============================================================================
@@ -635,7 +944,9 @@ class TicketFieldMapper:
     Maps governance events to ticket fields using configurable mappings.
 
     Supports template-based field generation, severity mapping, custom
-    transformations, and field validation.
+    transformations, and field validation. The configuration is compiled
+    into a TicketMappingPlan on first use and recompiled when it is
+    replaced or a transform is registered.
 
     Usage:
         mapper = TicketFieldMapper(config)
@@ -645,7 +956,7 @@ class TicketFieldMapper:
     """
 
     # Template placeholder pattern
-    TEMPLATE_PATTERN = re.compile(r"\{(\w+(?:\.\w+)*)\}")
+    TEMPLATE_PATTERN = TEMPLATE_PATTERN
 
     def __init__(self, config: TicketMappingConfig):
         """
@@ -656,12 +967,24 @@ class TicketFieldMapper:
         """
         self.config = config
         self._custom_transforms: Dict[str, TransformFunc] = {}
+        self._plan: Optional[TicketMappingPlan] = None
 
     @property
     def provider(self) -> TicketingProvider:
         """Get the ticketing provider for this mapper."""
         return self.config.provider
 
+    @property
+    def plan(self) -> TicketMappingPlan:
+        """Get the compiled mapping plan, compiling it if missing or stale."""
+        if self._plan is None or not self._plan.is_current(self.config):
+            self._plan = TicketMappingPlan(self.config, self._custom_transforms)
+        return self._plan
+
+    def invalidate_plan(self) -> None:
+        """Discard the compiled plan, e.g. after modifying a field mapping in place."""
+        self._plan = None
+
     def register_transform(self, name: str, func: TransformFunc) -> None:
         """
         Register a custom transform function.
@@ -671,6 +994,7 @@ class TicketFieldMapper:
             func: Transform function (event, params) -> value
         """
         self._custom_transforms[name] = func
+        self._plan = None
 
     def map_event(self, event: IntegrationEvent) -> TicketMappingResult:
         """
@@ -682,31 +1006,50 @@ class TicketFieldMapper:
         Returns:
             TicketMappingResult with mapped fields and any errors
         """
+        return self._map_with_plan(self.plan, event)
+
+    def map_events(self, events: Iterable[IntegrationEvent]) -> List[TicketMappingResult]:
+        """
+        Map a batch of events to ticket fields with the same compiled plan.
+
+        Args:
+            events: The governance events to map
+
+        Returns:
+            TicketMappingResult for each event, in order
+        """
+        plan = self.plan
+        return [self._map_with_plan(plan, event) for event in events]
+
+    def _map_with_plan(
+        self, plan: TicketMappingPlan, event: IntegrationEvent
+    ) -> TicketMappingResult:
+        """Map an event using a compiled plan."""
         result = TicketMappingResult()
         all_errors = []
 
         # Process each field mapping
-        for mapping in self.config.field_mappings:
-            field_result = self._map_field(event, mapping)
+        for field in plan.fields:
+            field_result = self._map_field(event, field)
             result.field_results.append(field_result)
 
             if field_result.success:
                 result.fields[field_result.field_name] = field_result.value
             else:
-                if mapping.required:
+                if field.required:
                     all_errors.append(
-                        f"Required field '{mapping.target_field}' mapping failed: "
+                        f"Required field '{field.target_field}' mapping failed: "
                         f"{field_result.error_message}"
                     )
                 else:
                     result.warnings.append(
-                        f"Optional field '{mapping.target_field}' mapping failed: "
+                        f"Optional field '{field.target_field}' mapping failed: "
                         f"{field_result.error_message}"
                     )
 
             # Add validation errors
             if field_result.validation_errors:
-                if mapping.required:
+                if field.required:
                     all_errors.extend(field_result.validation_errors)
                 else:
                     result.warnings.extend(field_result.validation_errors)
@@ -716,202 +1059,42 @@ class TicketFieldMapper:
 
         return result
 
-    def _map_field(self, event: IntegrationEvent, mapping: FieldMapping) -> FieldMappingResult:
+    def _map_field(
+        self, event: IntegrationEvent, field: CompiledFieldMapping
+    ) -> FieldMappingResult:
         """Map a single field."""
         try:
-            value = self._compute_value(event, mapping)
+            value = field.compute(event)
 
             # Validate the computed value
-            validation_errors = FieldValidator.validate(
-                value, mapping.validation_rules, mapping.target_field
+            validation_errors = (
+                FieldValidator.validate(value, field.validation_rules, field.target_field)
+                if field.validation_rules
+                else []
             )
 
             # Check required
-            if mapping.required and (value is None or value == ""):
+            if field.required and (value is None or value == ""):
                 validation_errors.append(
-                    f"Field '{mapping.target_field}' is required but has no value"
+                    f"Field '{field.target_field}' is required but has no value"
                 )
 
             return FieldMappingResult(
-                field_name=mapping.target_field,
+                field_name=field.target_field,
                 value=value,
                 success=len(validation_errors) == 0,
                 validation_errors=validation_errors,
             )
 
         except Exception as e:
-            logger.warning(f"Error mapping field '{mapping.target_field}': {str(e)}")
+            logger.warning(f"Error mapping field '{field.target_field}': {str(e)}")
             return FieldMappingResult(
-                field_name=mapping.target_field,
+                field_name=field.target_field,
                 value=None,
                 success=False,
                 error_message=str(e),
             )
 
-    def _compute_value(self, event: IntegrationEvent, mapping: FieldMapping) -> JSONValue:
-        """Compute the field value based on mapping type."""
-        if mapping.mapping_type == FieldMappingType.STATIC:
-            return mapping.static_value
-
-        elif mapping.mapping_type == FieldMappingType.TEMPLATE:
-            return self._apply_template(event, mapping.template or "")
-
-        elif mapping.mapping_type == FieldMappingType.EVENT_FIELD:
-            return self._get_event_field(event, mapping.source_field or "")
-
-        elif mapping.mapping_type == FieldMappingType.TRANSFORM:
-            return self._apply_transform(
-                event, mapping.transform_name or "", mapping.transform_params
-            )
-
-        elif mapping.mapping_type == FieldMappingType.CONDITIONAL:
-            return self._apply_conditional(event, mapping.conditions, mapping.default_value)
-
-        return None
-
-    def _apply_template(self, event: IntegrationEvent, template: str) -> str:
-        """
-        Apply a template with event field placeholders.
-
-        Supports placeholders like {title}, {severity}, {details.key}, etc.
-
-        Args:
-            event: The event to get values from
-            template: Template string with {placeholders}
-
-        Returns:
-            Rendered template string
-        """
-
-        def replace_placeholder(match: re.Match) -> str:
-            path = match.group(1)
-            value = self._get_event_field(event, path)
-            return str(value) if value is not None else ""
-
-        return self.TEMPLATE_PATTERN.sub(replace_placeholder, template)
-
-    def _get_event_field(self, event: IntegrationEvent, field_path: str) -> JSONValue:
-        """
-        Get a field value from an event, supporting nested paths.
-
-        Args:
-            event: The event to get value from
-            field_path: Field path (e.g., "title", "details.key")
-
-        Returns:
-            Field value or None if not found
-        """
-        parts = field_path.split(".")
-        value: Union[IntegrationEvent, JSONValue] = event
-
-        for part in parts:
-            if hasattr(value, part):
-                value = getattr(value, part)
-            elif isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                return None
-
-        # Ensure we return a JSONValue type
-        if isinstance(value, (str, int, float, bool, dict, list, type(None))):
-            return value  # type: ignore[return-value]
-        return str(value)
-
-    def _apply_transform(
-        self,
-        event: IntegrationEvent,
-        transform_name: str,
-        params: Dict[str, JSONValue],
-    ) -> JSONValue:
-        """
-        Apply a transform function to compute a field value.
-
-        Args:
-            event: The event to transform
-            transform_name: Name of the transform function
-            params: Parameters for the transform
-
-        Returns:
-            Transformed value
-        """
-        # Check custom transforms first
-        if transform_name in self._custom_transforms:
-            return self._custom_transforms[transform_name](event, params)
-
-        # Check built-in transforms
-        transform_func = FieldTransformers.get(transform_name)
-        if transform_func:
-            return transform_func(event, params)
-
-        raise ValueError(f"Unknown transform: {transform_name}")
-
-    def _apply_conditional(
-        self,
-        event: IntegrationEvent,
-        conditions: List[JSONDict],
-        default: JSONValue,
-    ) -> JSONValue:
-        """
-        Apply conditional logic to determine field value.
-
-        Each condition has: {field, operator, value, result}
-
-        Supported operators:
-        - eq: equals
-        - ne: not equals
-        - gt, gte, lt, lte: comparison
-        - in: value in list
-        - contains: string contains
-        - regex: regex match
-
-        Args:
-            event: The event to evaluate
-            conditions: List of condition dictionaries
-            default: Default value if no condition matches
-
-        Returns:
-            Result from matching condition or default
-        """
-        for condition in conditions:
-            field = str(condition.get("field", ""))
-            operator = str(condition.get("operator", "eq"))
-            expected = condition.get("value")
-            result = condition.get("result")
-
-            actual = self._get_event_field(event, field)
-
-            if self._evaluate_condition(actual, operator, expected):
-                return result
-
-        return default
-
-    def _evaluate_condition(self, actual: JSONValue, operator: str, expected: JSONValue) -> bool:
-        """Evaluate a single condition."""
-        if actual is None:
-            return operator == "eq" and expected is None
-
-        if operator == "eq":
-            return actual == expected
-        elif operator == "ne":
-            return actual != expected
-        elif operator == "gt":
-            return actual > expected  # type: ignore[operator]
-        elif operator == "gte":
-            return actual >= expected  # type: ignore[operator]
-        elif operator == "lt":
-            return actual < expected  # type: ignore[operator]
-        elif operator == "lte":
-            return actual <= expected  # type: ignore[operator]
-        elif operator == "in":
-            expected_list = expected if isinstance(expected, list) else []
-            return actual in expected_list
-        elif operator == "contains":
-            return str(expected) in str(actual)
-        elif operator == "regex":
-            return bool(re.match(str(expected), str(actual)))
-
-        return False
-
     def get_summary(self, event: IntegrationEvent) -> str:
         """
         Get the ticket summary using the configured template.
@@ -922,7 +1105,7 @@ class TicketFieldMapper:
         Returns:
             Formatted summary string
         """
-        return self._apply_template(event, self.config.summary_template)
+        return self.plan.render_summary(event)
 
     def get_priority(self, severity: EventSeverity) -> str:
         """
@@ -29,6 +29,7 @@ from .api.health import router as health_router  # noqa: E402
 from .api.import_router import router as import_router  # noqa: E402
 from .api.linear import router as linear_router  # noqa: E402
 from .api.linear_webhooks import router as linear_webhooks_router  # noqa: E402
+from .api.policy_check import close_opa_client  # noqa: E402
 from .api.policy_check import router as policy_check_router  # noqa: E402
 from .api.webhooks import router as webhooks_router  # noqa: E402
 
@@ -89,6 +90,7 @@ async def lifespan(app: FastAPI):
     if redis_client:
         await redis_client.close()
         logger.info("Redis connection closed")
+    await close_opa_client()
     logger.info(f"Shutting down {SERVICE_NAME}")
 
 
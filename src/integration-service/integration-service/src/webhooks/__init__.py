@@ -15,6 +15,7 @@ from .delivery import (
     WebhookTimeoutError,
     create_delivery_engine,
 )
+from .lanes import AIMDConcurrencyLimit, DeliveryLane
 from .models import (
     WebhookAuthType,
     WebhookConfig,
@@ -60,6 +61,8 @@ __all__ = [
     "WebhookDeliveryEngine",
     "DeadLetterQueue",
     "create_delivery_engine",
+    "DeliveryLane",
+    "AIMDConcurrencyLimit",
     # Delivery Exceptions
     "WebhookDeliveryError",
     "WebhookAuthenticationError",
@@ -264,6 +264,64 @@ class WebhookFrameworkConfig(BaseModel):
         description="Default rate limit per subscription per minute",
     )
 
+    # Per-subscription delivery lanes (batch and fan-out delivery)
+    lane_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        le=100_000,
+        description="Maximum events queued per subscription lane before callers wait",
+    )
+    lane_initial_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=1000,
+        description="Initial concurrent deliveries per subscription lane",
+    )
+    lane_max_concurrency: int = Field(
+        default=32,
+        ge=1,
+        le=1000,
+        description="Upper bound for the adaptive concurrency of a lane",
+    )
+    lane_latency_threshold_seconds: float = Field(
+        default=2.0,
+        gt=0.0,
+        le=120.0,
+        description="Delivery latency above which a lane reduces its concurrency",
+    )
+    lane_backoff_ratio: float = Field(
+        default=0.5,
+        gt=0.0,
+        lt=1.0,
+        description="Multiplier applied to lane concurrency on slow or overloaded endpoints",
+    )
+    lane_idle_timeout_seconds: float = Field(
+        default=300.0,
+        gt=0.0,
+        le=86400.0,
+        description="Seconds without events after which a subscription lane is dropped",
+    )
+
+    # Connection pooling (one pool per destination host)
+    max_connections_per_host: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="Maximum open connections per destination host",
+    )
+    max_keepalive_connections_per_host: int = Field(
+        default=20,
+        ge=0,
+        le=1000,
+        description="Maximum idle keep-alive connections per destination host",
+    )
+    http_client_idle_timeout_seconds: float = Field(
+        default=300.0,
+        gt=0.0,
+        le=86400.0,
+        description="Seconds without requests after which a destination host's pool is closed",
+    )
+
     # Subscription limits
     max_subscriptions_per_tenant: int = Field(
         default=50,
@@ -293,6 +351,16 @@ class WebhookFrameworkConfig(BaseModel):
         default=True,
         description="Store failed deliveries in dead letter queue",
     )
+    dead_letter_queue_max_size: int = Field(
+        default=10_000,
+        ge=1,
+        le=10_000_000,
+        description="Maximum dead-lettered deliveries kept; the oldest are evicted",
+    )
+    dead_letter_queue_path: Optional[str] = Field(
+        default=None,
+        description="Append-only file backing the dead letter queue (in memory only if unset)",
+    )
 
     # Security
     security: WebhookSecurityConfig = Field(
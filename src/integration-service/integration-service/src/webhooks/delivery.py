@@ -10,10 +10,13 @@ import hashlib
 import hmac
 import json
 import logging
+import os
 import time
 import warnings
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Set, TextIO, Tuple
 from uuid import uuid4
 
 import httpx
@@ -25,6 +28,7 @@ from ..exceptions.delivery import (
     DeliveryTimeoutError,
 )
 from .config import WebhookFrameworkConfig, WebhookRetryPolicy
+from .lanes import AIMDConcurrencyLimit, DeliveryLane, sleep_without_slot
 from .models import (
     WebhookAuthType,
     WebhookConfig,
@@ -133,16 +137,30 @@ __all__ = [
 
 class DeadLetterQueue:
     """
-    Simple in-memory dead letter queue for failed webhook deliveries.
+    Dead letter queue for failed webhook deliveries.
 
-    In production, this would be backed by Redis or a database.
+    Entries are kept in insertion order and indexed by delivery ID and by
+    subscription, so evicting the oldest entry, removing an entry and listing
+    one subscription's entries do not scan the whole queue.
+
+    With ``path`` set, every change is appended to a local JSON-lines log that
+    is replayed on startup, so dead letters survive restarts. The log is
+    rewritten with only the live entries once most of its records are stale.
     """
 
-    def __init__(self, max_size: int = 10000):
+    def __init__(self, max_size: int = 10000, path: Optional[str] = None):
         self.max_size = max_size
-        self._queue: List[Dict[str, Any]] = []
+        self.path = Path(path) if path else None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._by_subscription: Dict[str, Dict[str, None]] = {}
         self._lock = asyncio.Lock()
 
+        # Append-only log state
+        self._log: Optional[TextIO] = None
+        self._logged_entries = 0
+        if self.path is not None:
+            self._load()
+
     async def add(
         self,
         delivery: WebhookDelivery,
@@ -150,59 +168,174 @@ class DeadLetterQueue:
         error_message: str,
     ) -> None:
         """Add a failed delivery to the dead letter queue."""
+        entry = {
+            "delivery_id": delivery.id,
+            "subscription_id": delivery.subscription_id,
+            "event_id": event.id,
+            "event_type": event.event_type.value,
+            "error_message": error_message,
+            "attempt_count": delivery.attempt_number,
+            "dead_lettered_at": datetime.now(timezone.utc).isoformat(),
+            "payload": event.to_payload(),
+        }
         async with self._lock:
-            if len(self._queue) >= self.max_size:
-                # Remove oldest entry
-                self._queue.pop(0)
-
-            self._queue.append(
-                {
-                    "delivery_id": delivery.id,
-                    "subscription_id": delivery.subscription_id,
-                    "event_id": event.id,
-                    "event_type": event.event_type.value,
-                    "error_message": error_message,
-                    "attempt_count": delivery.attempt_number,
-                    "dead_lettered_at": datetime.now(timezone.utc).isoformat(),
-                    "payload": event.to_payload(),
-                }
-            )
+            self._insert(entry)
+            await self._log_record({"op": "add", "entry": entry})
+            self._logged_entries += 1
+            await self._maybe_compact()
 
-            logger.info(
-                f"Delivery {delivery.id} dead-lettered after {delivery.attempt_number} attempts: "
-                f"{error_message}"
-            )
+        logger.info(
+            f"Delivery {delivery.id} dead-lettered after {delivery.attempt_number} attempts: "
+            f"{error_message}"
+        )
 
     async def get_all(self) -> List[Dict[str, Any]]:
         """Get all dead-lettered deliveries."""
         async with self._lock:
-            return list(self._queue)
+            return list(self._entries.values())
 
     async def get_by_subscription(self, subscription_id: str) -> List[Dict[str, Any]]:
         """Get dead-lettered deliveries for a specific subscription."""
         async with self._lock:
-            return [d for d in self._queue if d["subscription_id"] == subscription_id]
+            ids = self._by_subscription.get(subscription_id, {})
+            return [self._entries[delivery_id] for delivery_id in ids]
+
+    async def get(self, delivery_id: str) -> Optional[Dict[str, Any]]:
+        """Get a dead-lettered delivery by ID."""
+        async with self._lock:
+            return self._entries.get(delivery_id)
 
     async def remove(self, delivery_id: str) -> bool:
         """Remove a delivery from the dead letter queue."""
+        return await self.remove_many([delivery_id]) == 1
+
+    async def remove_many(self, delivery_ids: Iterable[str]) -> int:
+        """Remove several deliveries with one log record. Returns count of removed items."""
         async with self._lock:
-            for i, item in enumerate(self._queue):
-                if item["delivery_id"] == delivery_id:
-                    self._queue.pop(i)
-                    return True
-            return False
+            removed = [d for d in delivery_ids if self._discard(d)]
+            if removed:
+                await self._log_record({"op": "remove", "ids": removed})
+                await self._maybe_compact()
+            return len(removed)
 
     async def clear(self) -> int:
         """Clear all dead-lettered deliveries. Returns count of removed items."""
         async with self._lock:
-            count = len(self._queue)
-            self._queue.clear()
+            count = len(self._entries)
+            self._entries.clear()
+            self._by_subscription.clear()
+            if self.path is not None:
+                await asyncio.to_thread(self._compact, [])
             return count
 
+    def close(self) -> None:
+        """Close the backing log file."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
     @property
     def size(self) -> int:
         """Get current queue size."""
-        return len(self._queue)
+        return len(self._entries)
+
+    def __contains__(self, delivery_id: str) -> bool:
+        """Check whether a delivery is dead-lettered."""
+        return delivery_id in self._entries
+
+    def _insert(self, entry: Dict[str, Any]) -> None:
+        """Index an entry, evicting the oldest ones beyond max_size."""
+        delivery_id = entry["delivery_id"]
+        self._discard(delivery_id)
+        self._entries[delivery_id] = entry
+        self._by_subscription.setdefault(entry["subscription_id"], {})[delivery_id] = None
+        while len(self._entries) > self.max_size:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, delivery_id: str) -> bool:
+        """Drop an entry from the indexes. Returns whether it was present."""
+        entry = self._entries.pop(delivery_id, None)
+        if entry is None:
+            return False
+        ids = self._by_subscription[entry["subscription_id"]]
+        del ids[delivery_id]
+        if not ids:
+            del self._by_subscription[entry["subscription_id"]]
+        return True
+
+    async def _log_record(self, record: Dict[str, Any]) -> None:
+        """Append a change record to the log off the event loop, if persistent."""
+        if self.path is not None:
+            await asyncio.to_thread(self._append, record)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append a change record to the log."""
+        if self._log is None:
+            self._log = self.path.open("a", encoding="utf-8")
+        self._log.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._log.flush()
+
+    def _load(self) -> None:
+        """Rebuild the queue from the log file.
+
+        A torn trailing record left by a crash mid-write is skipped and cut
+        from the file, so that later appends start on a clean line.
+        """
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            return
+
+        offset = 0
+        with self.path.open("rb") as log:
+            for line_number, line in enumerate(log, 1):
+                if not line.endswith(b"\n"):
+                    logger.warning(
+                        f"Truncating torn dead letter record at {self.path}:{line_number}"
+                    )
+                    os.truncate(self.path, offset)
+                    break
+                offset += len(line)
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        f"Skipping corrupt dead letter record at {self.path}:{line_number}"
+                    )
+                    continue
+                if record["op"] == "add":
+                    self._insert(record["entry"])
+                    self._logged_entries += 1
+                elif record["op"] == "remove":
+                    for delivery_id in record["ids"]:
+                        self._discard(delivery_id)
+
+        logger.info(f"Loaded {len(self._entries)} dead-lettered deliveries from {self.path}")
+        if self._needs_compaction():
+            self._compact(list(self._entries.values()))
+
+    def _needs_compaction(self) -> bool:
+        """Whether more than half of the logged entries are removed or evicted."""
+        if self.path is None:
+            return False
+        stale = self._logged_entries - len(self._entries)
+        return stale > max(len(self._entries), 1000)
+
+    async def _maybe_compact(self) -> None:
+        """Rewrite the log off the event loop once most of its entries are stale."""
+        if self._needs_compaction():
+            await asyncio.to_thread(self._compact, list(self._entries.values()))
+
+    def _compact(self, entries: List[Dict[str, Any]]) -> None:
+        """Atomically replace the log with one add record per live entry."""
+        self.close()
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as log:
+            for entry in entries:
+                log.write(json.dumps({"op": "add", "entry": entry}, separators=(",", ":")) + "\n")
+            log.flush()
+            os.fsync(log.fileno())
+        os.replace(tmp_path, self.path)
+        self._logged_entries = len(entries)
 
 
 class WebhookDeliveryEngine:
@@ -214,6 +347,9 @@ class WebhookDeliveryEngine:
     - HMAC signature generation for payload verification
     - Exponential backoff retry with jitter
     - Dead letter queue for failed deliveries
+    - Per-subscription delivery lanes with adaptive concurrency for batch
+      and fan-out delivery
+    - Per-host HTTP connection pools
     - Delivery tracking and metrics
     """
 
@@ -232,7 +368,14 @@ class WebhookDeliveryEngine:
         self.config = config or WebhookFrameworkConfig()
         self._http_client = http_client
         self._owns_client = http_client is None
-        self.dead_letter_queue = DeadLetterQueue()
+        self._host_clients: Dict[Tuple[str, str, Optional[int]], httpx.AsyncClient] = {}
+        self._host_requests: Dict[Tuple[str, str, Optional[int]], int] = {}
+        self._host_last_used: Dict[Tuple[str, str, Optional[int]], float] = {}
+        self._host_sweep_at = time.monotonic()
+        self.dead_letter_queue = DeadLetterQueue(
+            max_size=self.config.dead_letter_queue_max_size,
+            path=self.config.dead_letter_queue_path,
+        )
 
         # Metrics
         self._deliveries_attempted = 0
@@ -246,22 +389,120 @@ class WebhookDeliveryEngine:
         # Active deliveries tracking
         self._active_deliveries: Set[str] = set()
 
-    async def _get_http_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(
-                timeout=self.config.default_timeout_seconds,
-                follow_redirects=True,
-            )
-            self._owns_client = True
-        return self._http_client
+        # Delivery lanes by subscription ID
+        self._lanes: Dict[str, DeliveryLane] = {}
+
+    def _new_http_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client with the configured per-host pool limits."""
+        return httpx.AsyncClient(
+            timeout=self.config.default_timeout_seconds,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections_per_host,
+                max_keepalive_connections=self.config.max_keepalive_connections_per_host,
+            ),
+        )
+
+    async def _get_http_client(self, url: Optional[str] = None) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client for a destination.
+
+        A client passed to the constructor serves every destination. Otherwise
+        each scheme, host and port gets its own pooled client, so connections
+        are reused per endpoint host and one host cannot exhaust the others.
+        Host clients without requests for ``http_client_idle_timeout_seconds``
+        are closed.
+
+        Args:
+            url: Destination URL (None for the shared default client)
+
+        Returns:
+            HTTP client to use for the request
+        """
+        if url is None or not self._owns_client:
+            if self._http_client is None or self._http_client.is_closed:
+                self._http_client = self._new_http_client()
+                self._owns_client = True
+            return self._http_client
+
+        now = time.monotonic()
+        if now - self._host_sweep_at >= self.config.http_client_idle_timeout_seconds:
+            self._host_sweep_at = now
+            await self._close_idle_host_clients(now)
+
+        key = self._host_key(url)
+        client = self._host_clients.get(key)
+        if client is None or client.is_closed:
+            client = self._host_clients[key] = self._new_http_client()
+        self._host_last_used[key] = now
+        return client
+
+    @staticmethod
+    def _host_key(url: str) -> Tuple[str, str, Optional[int]]:
+        """Get the (scheme, host, port) a destination URL's connections are pooled by."""
+        parsed = httpx.URL(url)
+        return (parsed.scheme, parsed.host, parsed.port)
+
+    async def _close_idle_host_clients(self, now: float) -> None:
+        """Close host clients without requests in flight or within the idle timeout."""
+        idle_before = now - self.config.http_client_idle_timeout_seconds
+        idle = [
+            key
+            for key, last_used in self._host_last_used.items()
+            if last_used <= idle_before and not self._host_requests.get(key)
+        ]
+        for key in idle:
+            del self._host_last_used[key]
+            client = self._host_clients.pop(key, None)
+            if client is not None:
+                await client.aclose()
 
     async def close(self) -> None:
         """Close the delivery engine and cleanup resources."""
+        for lane in self._lanes.values():
+            await lane.close()
+        self._lanes.clear()
+
+        for client in self._host_clients.values():
+            await client.aclose()
+        self._host_clients.clear()
+        self._host_last_used.clear()
+
         if self._owns_client and self._http_client is not None:
             await self._http_client.aclose()
             self._http_client = None
 
+        self.dead_letter_queue.close()
+
+    def _get_lane(self, subscription: WebhookSubscription) -> DeliveryLane:
+        """Get or create the delivery lane for a subscription."""
+        lane = self._lanes.get(subscription.id)
+        if lane is None:
+            limit = AIMDConcurrencyLimit(
+                initial_limit=self.config.lane_initial_concurrency,
+                max_limit=self.config.lane_max_concurrency,
+                latency_threshold_seconds=self.config.lane_latency_threshold_seconds,
+                backoff_ratio=self.config.lane_backoff_ratio,
+            )
+            lane = self._lanes[subscription.id] = DeliveryLane(
+                subscription_id=subscription.id,
+                deliver=self.deliver,
+                limit=limit,
+                max_queue_size=self.config.lane_queue_size,
+                idle_timeout=self.config.lane_idle_timeout_seconds,
+                on_idle=self._drop_lane,
+            )
+        return lane
+
+    def _drop_lane(self, lane: DeliveryLane) -> None:
+        """Forget a lane whose dispatcher exited idle (its subscription may be gone)."""
+        if self._lanes.get(lane.subscription_id) is lane:
+            del self._lanes[lane.subscription_id]
+
+    def get_lane_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get queue depth, in-flight count and concurrency limit per subscription lane."""
+        return {subscription_id: lane.stats for subscription_id, lane in self._lanes.items()}
+
     @property
     def metrics(self) -> Dict[str, Any]:
         """Get delivery metrics."""
@@ -275,6 +516,8 @@ class WebhookDeliveryEngine:
             "failure_rate": self._deliveries_failed / total,
             "dead_letter_queue_size": self.dead_letter_queue.size,
             "active_deliveries": len(self._active_deliveries),
+            "delivery_lanes": len(self._lanes),
+            "lane_queued_events": sum(lane.stats["queued"] for lane in self._lanes.values()),
         }
 
     def _generate_hmac_signature(
@@ -389,9 +632,12 @@ class WebhookDeliveryEngine:
             RetryableError: For retryable failures
             NonRetryableError: For non-retryable failures
         """
-        client = await self._get_http_client()
+        client = await self._get_http_client(webhook_config.url)
         payload_bytes = json.dumps(payload).encode("utf-8")
         headers = self._build_headers(webhook_config, payload_bytes)
+        host_key = self._host_key(webhook_config.url) if client is not self._http_client else None
+        if host_key is not None:
+            self._host_requests[host_key] = self._host_requests.get(host_key, 0) + 1
 
         try:
             if webhook_config.method == "POST":
@@ -423,6 +669,13 @@ class WebhookDeliveryEngine:
         except Exception as e:
             raise NonRetryableError(f"Unexpected error: {e}") from e
 
+        finally:
+            if host_key is not None:
+                self._host_requests[host_key] -= 1
+                if not self._host_requests[host_key]:
+                    del self._host_requests[host_key]
+                self._host_last_used[host_key] = time.monotonic()
+
     async def deliver(
         self,
         subscription: WebhookSubscription,
@@ -550,7 +803,7 @@ class WebhookDeliveryEngine:
                             f"Delivery {delivery.id} attempt {retry_state.current_attempt} "
                             f"got HTTP {response.status_code}. Retrying in {delay:.2f}s"
                         )
-                        await asyncio.sleep(delay)
+                        await sleep_without_slot(delay)
                         continue
                     else:
                         # Exhausted retries
@@ -624,7 +877,7 @@ class WebhookDeliveryEngine:
                         f"{retry_state.current_attempt} failed: {e}. "
                         f"Retrying in {delay:.2f}s"
                     )
-                    await asyncio.sleep(delay)
+                    await sleep_without_slot(delay)
                     continue
                 else:
                     duration_ms = int((time.monotonic() - start_time) * 1000)
@@ -761,7 +1014,9 @@ class WebhookDeliveryEngine:
         """
         Deliver multiple events to a subscription.
 
-        Events are delivered concurrently up to the configured concurrency limit.
+        Events go through the subscription's delivery lane: at most
+        ``lane_queue_size`` are queued at a time and they are delivered with
+        the lane's adaptive concurrency.
 
         Args:
             subscription: The webhook subscription
@@ -770,8 +1025,9 @@ class WebhookDeliveryEngine:
         Returns:
             List of delivery results
         """
-        tasks = [self.deliver(subscription, event) for event in events]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        lane = self._get_lane(subscription)
+        futures = [await lane.submit(subscription, event) for event in events]
+        results = await asyncio.gather(*futures, return_exceptions=True)
 
         delivery_results = []
         for i, result in enumerate(results):
@@ -799,7 +1055,9 @@ class WebhookDeliveryEngine:
         """
         Deliver an event to multiple subscriptions.
 
-        Only delivers to subscriptions that match the event filters.
+        Only delivers to subscriptions that match the event filters. Each
+        subscription's delivery runs in its own lane, so a slow endpoint does
+        not delay delivery to the others.
 
         Args:
             subscriptions: List of webhook subscriptions
@@ -814,8 +1072,10 @@ class WebhookDeliveryEngine:
         if not matching:
             return []
 
-        tasks = [self.deliver(subscription, event) for subscription in matching]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        futures = await asyncio.gather(
+            *(self._get_lane(subscription).submit(subscription, event) for subscription in matching)
+        )
+        results = await asyncio.gather(*futures, return_exceptions=True)
 
         delivery_results = []
         for i, result in enumerate(results):
@@ -834,6 +1094,88 @@ class WebhookDeliveryEngine:
 
         return delivery_results
 
+    async def replay_dead_letters(
+        self,
+        subscriptions: Mapping[str, WebhookSubscription],
+        subscription_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        rate_per_second: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """
+        Redeliver dead-lettered events through the subscription delivery lanes.
+
+        Entries are replayed oldest first at no more than ``rate_per_second``
+        (defaults to ``global_rate_limit_per_second``; None means unpaced).
+        An entry is removed once its replay is delivered, or dead-lettered
+        again under a new delivery ID; entries whose subscription is unknown
+        or whose replay fails without being dead-lettered are kept.
+
+        Args:
+            subscriptions: Current subscriptions by ID
+            subscription_id: Only replay entries for this subscription
+            limit: Maximum number of entries to replay
+            rate_per_second: Maximum replays started per second
+
+        Returns:
+            Counts of replayed, delivered, dead_lettered, failed and skipped entries
+        """
+        if rate_per_second is None:
+            rate_per_second = self.config.global_rate_limit_per_second
+
+        if subscription_id is not None:
+            entries = await self.dead_letter_queue.get_by_subscription(subscription_id)
+        else:
+            entries = await self.dead_letter_queue.get_all()
+        if limit is not None:
+            entries = entries[:limit]
+
+        counts = {"replayed": 0, "delivered": 0, "dead_lettered": 0, "failed": 0, "skipped": 0}
+        pending: Deque[Tuple[str, asyncio.Future]] = deque()
+        resolved: List[str] = []
+
+        def settle(delivery_id: str, future: asyncio.Future) -> None:
+            result = None if future.cancelled() or future.exception() else future.result()
+            if result is not None and result.success:
+                counts["delivered"] += 1
+                resolved.append(delivery_id)
+            elif result is not None and result.delivery_id in self.dead_letter_queue:
+                counts["dead_lettered"] += 1
+                resolved.append(delivery_id)
+            else:
+                counts["failed"] += 1
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        for entry in entries:
+            subscription = subscriptions.get(entry["subscription_id"])
+            if subscription is None:
+                counts["skipped"] += 1
+                continue
+
+            if rate_per_second:
+                due = started_at + counts["replayed"] / rate_per_second
+                if due > loop.time():
+                    await asyncio.sleep(due - loop.time())
+
+            event = WebhookEvent.model_validate(entry["payload"])
+            future = await self._get_lane(subscription).submit(subscription, event)
+            pending.append((entry["delivery_id"], future))
+            counts["replayed"] += 1
+
+            while pending and pending[0][1].done():
+                settle(*pending.popleft())
+            if len(resolved) >= 1000:
+                await self.dead_letter_queue.remove_many(resolved)
+                resolved.clear()
+
+        for delivery_id, future in pending:
+            await asyncio.wait([future])
+            settle(delivery_id, future)
+        await self.dead_letter_queue.remove_many(resolved)
+
+        logger.info(f"Replayed {counts['replayed']} dead-lettered deliveries: {counts}")
+        return counts
+
 
 # Convenience function for creating a configured delivery engine
 def create_delivery_engine(
@@ -0,0 +1,301 @@
+"""
+Per-subscription delivery lanes with adaptive (AIMD) concurrency.
+
+Each webhook subscription gets its own bounded queue and concurrency limit,
+so a slow or failing endpoint backs up only its own lane instead of holding
+delivery slots needed by healthy endpoints.
+"""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from .models import WebhookDeliveryResult, WebhookEvent, WebhookSubscription
+
+logger = logging.getLogger(__name__)
+
+# Type alias for the delivery coroutine a lane runs for each event
+DeliverFunc = Callable[[WebhookSubscription, WebhookEvent], Awaitable[WebhookDeliveryResult]]
+
+
+class _LaneSlot:
+    """A lane delivery slot held by the delivery running in the current task."""
+
+    __slots__ = ("limit", "started_at", "held")
+
+    def __init__(self, limit: "AIMDConcurrencyLimit", started_at: float):
+        self.limit = limit
+        self.started_at = started_at
+        self.held = True
+
+
+_current_slot: ContextVar[Optional[_LaneSlot]] = ContextVar("webhook_lane_slot", default=None)
+
+
+async def sleep_without_slot(delay: float) -> None:
+    """
+    Sleep before a retry, giving up the caller's lane slot while waiting.
+
+    A delivery running in a lane holds one of the lane's slots; releasing it
+    for the backoff lets other events of the lane use it meanwhile. The
+    release counts as an overload signal, as retries follow overload-type
+    failures. Outside a lane delivery this is a plain sleep.
+
+    Args:
+        delay: Seconds to sleep
+    """
+    slot = _current_slot.get()
+    if slot is None:
+        await asyncio.sleep(delay)
+        return
+    slot.limit.release(slot.started_at, overloaded=True)
+    slot.held = False
+    await asyncio.sleep(delay)
+    slot.started_at = await slot.limit.acquire()
+    slot.held = True
+
+
+class AIMDConcurrencyLimit:
+    """
+    Concurrency limit with additive increase, multiplicative decrease.
+
+    The limit grows by about one per window of deliveries that complete
+    below the latency threshold while at least half the window is in use
+    (an underused lane has no evidence it could go faster), and is cut
+    by ``backoff_ratio`` when a delivery is slow or the endpoint is
+    overloaded. Only deliveries started after the last cut can cut again, so
+    a burst of concurrent failures counts as one congestion signal.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_threshold_seconds: float = 2.0,
+        backoff_ratio: float = 0.5,
+    ):
+        """
+        Initialize the concurrency limit.
+
+        Args:
+            initial_limit: Starting number of concurrent deliveries
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            latency_threshold_seconds: Delivery latency treated as congestion
+            backoff_ratio: Multiplier applied to the limit on congestion
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._decreased_at = 0.0
+        self._slot_released = asyncio.Event()
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent deliveries allowed."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of deliveries currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> float:
+        """
+        Wait for a free slot and take it.
+
+        Returns:
+            Monotonic start time to pass back to release()
+        """
+        while self._in_flight >= self.limit:
+            self._slot_released.clear()
+            await self._slot_released.wait()
+        self._in_flight += 1
+        return time.monotonic()
+
+    def release(self, started_at: float, overloaded: bool = False) -> None:
+        """
+        Release a slot and adapt the limit to the delivery outcome.
+
+        Args:
+            started_at: Value returned by the matching acquire()
+            overloaded: Whether the endpoint signalled overload (5xx, 429, timeout)
+        """
+        window_used = self._in_flight * 2 >= self.limit
+        self._in_flight -= 1
+        latency = time.monotonic() - started_at
+
+        if overloaded or latency > self.latency_threshold_seconds:
+            if started_at >= self._decreased_at:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+                self._decreased_at = time.monotonic()
+        elif window_used:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+        self._slot_released.set()
+
+
+class DeliveryLane:
+    """
+    Bounded delivery queue for one subscription.
+
+    Events are queued with submit() and delivered by a dispatcher task at
+    most ``limit.limit`` at a time. submit() waits while the queue is full,
+    applying backpressure to the caller rather than growing without bound.
+    The dispatcher exits once the lane has been idle for ``idle_timeout``
+    seconds and reports it through ``on_idle``, so the owner can drop the lane.
+    """
+
+    def __init__(
+        self,
+        subscription_id: str,
+        deliver: DeliverFunc,
+        limit: AIMDConcurrencyLimit,
+        max_queue_size: int = 1000,
+        idle_timeout: Optional[float] = None,
+        on_idle: Optional[Callable[["DeliveryLane"], None]] = None,
+    ):
+        """
+        Initialize the delivery lane.
+
+        Args:
+            subscription_id: ID of the subscription this lane serves
+            deliver: Coroutine function delivering one event
+            limit: Adaptive concurrency limit for the lane
+            max_queue_size: Maximum events waiting for a delivery slot
+            idle_timeout: Seconds without events after which the dispatcher exits
+                (None to keep it running)
+            on_idle: Called with the lane when its dispatcher exits idle
+        """
+        self.subscription_id = subscription_id
+        self.limit = limit
+        self.idle_timeout = idle_timeout
+        self._on_idle = on_idle
+        self._deliver = deliver
+        self._queue: "asyncio.Queue[Tuple[WebhookSubscription, WebhookEvent, asyncio.Future]]" = (
+            asyncio.Queue(maxsize=max_queue_size)
+        )
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        # Metrics
+        self._delivered = 0
+        self._failed = 0
+
+    async def submit(
+        self, subscription: WebhookSubscription, event: WebhookEvent
+    ) -> asyncio.Future:
+        """
+        Queue an event for delivery, waiting while the lane is full.
+
+        Args:
+            subscription: The subscription to deliver to (latest configuration)
+            event: The event to deliver
+
+        Returns:
+            Future resolving to the WebhookDeliveryResult
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((subscription, event, future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        return future
+
+    async def _dispatch(self) -> None:
+        """Start a delivery task for each queued event as slots become free."""
+        while True:
+            try:
+                subscription, event, future = await asyncio.wait_for(
+                    self._queue.get(), timeout=self.idle_timeout
+                )
+            except asyncio.TimeoutError:
+                if self._tasks or not self._queue.empty():
+                    continue
+                if self._on_idle is not None:
+                    self._on_idle(self)
+                return
+            try:
+                started_at = await self.limit.acquire()
+            except asyncio.CancelledError:
+                future.cancel()
+                self._queue.task_done()
+                raise
+            task = asyncio.create_task(self._run(subscription, event, future, started_at))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self,
+        subscription: WebhookSubscription,
+        event: WebhookEvent,
+        future: asyncio.Future,
+        started_at: float,
+    ) -> None:
+        """Deliver one event and feed the outcome back to the concurrency limit."""
+        overloaded = True
+        slot = _LaneSlot(self.limit, started_at)
+        _current_slot.set(slot)
+        try:
+            result = await self._deliver(subscription, event)
+            overloaded = is_overload_result(result)
+            if result.success:
+                self._delivered += 1
+            else:
+                self._failed += 1
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            self._failed += 1
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            if slot.held:
+                self.limit.release(slot.started_at, overloaded)
+            self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued event has been delivered."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop dispatching, wait for in-flight deliveries and cancel queued ones."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            future.cancel()
+            self._queue.task_done()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get lane metrics."""
+        return {
+            "queued": self._queue.qsize(),
+            "in_flight": self.limit.in_flight,
+            "concurrency_limit": self.limit.limit,
+            "delivered": self._delivered,
+            "failed": self._failed,
+        }
+
+
+def is_overload_result(result: WebhookDeliveryResult) -> bool:
+    """
+    Check whether a delivery result signals an overloaded endpoint.
+
+    Client errors (4xx other than 429) are the caller's fault and do not
+    reduce concurrency; server errors, throttling and network failures do.
+    """
+    if result.success:
+        return False
+    status = result.status_code
+    return status is None or status == 429 or status >= 500
@@ -0,0 +1,315 @@
+"""
+Tests for policy check evaluation helpers.
+
+Tests cover:
+- Built-in checks: first matching line per secret pattern, HTTP URL and
+  Docker tag checks, violation streaming
+- Chunked, parallel OPA evaluation and fallback when a chunk fails
+- Shared OPA client reuse and close
+- Streaming validation: violations as they are found, then the result
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import List
+
+import httpx
+import pytest
+
+from src.api import policy_check
+from src.api.auth import UserClaims
+from src.api.policy_check import (
+    PolicyValidationRequest,
+    ResourceInfo,
+    check_opa_health,
+    close_opa_client,
+    evaluate_policies_with_opa,
+    get_opa_client,
+    iter_builtin_violations,
+    run_builtin_checks,
+    validate_policies_stream,
+)
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+async def opa_requests(monkeypatch) -> List[int]:
+    """
+    Route the shared OPA client to a mock OPA.
+
+    The mock reports a violation for every resource and records the number of
+    resources in each evaluation request.
+    """
+    requests: List[int] = []
+    in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight
+        if request.url.path == "/health":
+            return httpx.Response(200)
+        in_flight += 1
+        requests.append(in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        resources = json.loads(request.content)["input"]["resources"]
+        if any(r["path"] == "broken.py" for r in resources):
+            return httpx.Response(500)
+        violations = [{"severity": "low", "file": r["path"]} for r in resources]
+        return httpx.Response(200, json={"result": {"violations": violations}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def get_client() -> httpx.AsyncClient:
+        return client
+
+    monkeypatch.setattr(policy_check, "get_opa_client", get_client)
+    yield requests
+    await client.aclose()
+
+
+@pytest.fixture
+def opa_unavailable(monkeypatch) -> None:
+    """Make OPA evaluation report OPA as unavailable."""
+
+    async def evaluate(*args, **kwargs):
+        return False, []
+
+    monkeypatch.setattr(policy_check, "evaluate_policies_with_opa", evaluate)
+
+
+def make_user() -> UserClaims:
+    """Create the claims of an authenticated CI user."""
+    return UserClaims(
+        sub="ci-bot", tenant_id="tenant-1", roles=[], permissions=[], exp=2**31, iat=0
+    )
+
+
+async def read_stream(request: PolicyValidationRequest) -> List[dict]:
+    """Call the streaming endpoint and decode its newline-delimited JSON records."""
+    response = await validate_policies_stream(request, current_user=make_user())
+    assert response.media_type == "application/x-ndjson"
+    return [json.loads(line) async for line in response.body_iterator]
+
+
+def make_resources(count: int) -> List[ResourceInfo]:
+    """Create resources with distinct paths."""
+    return [ResourceInfo(path=f"src/module_{n}.py", content="x = 1") for n in range(count)]
+
+
+# ============================================================================
+# Built-in Check Tests
+# ============================================================================
+
+
+class TestBuiltinChecks:
+    """Tests for the built-in pattern checks."""
+
+    def test_secret_reports_first_assignment_line(self):
+        """Test a secret pattern is reported at its first assignment line."""
+        content = "# set the Password below\nuser = 'svc'\nPASSWORD = 'hunter2'\npassword = 'x'"
+        violations = run_builtin_checks([ResourceInfo(path="app.py", content=content)], None)
+
+        assert [(v.policy_id, v.line) for v in violations] == [("acgs2-security-001", 3)]
+
+    def test_secret_patterns_reported_in_pattern_order(self):
+        """Test each secret pattern is reported once, in pattern order."""
+        content = "aws_secret = 'a'\napi_key = 'b'\npassword = 'c'\napi_key = 'd'"
+        violations = run_builtin_checks([ResourceInfo(path="app.py", content=content)], None)
+
+        assert [v.message for v in violations] == [
+            "Potential hardcoded password found",
+            "Potential hardcoded API key found",
+            "Potential AWS secret found",
+        ]
+        assert [v.line for v in violations] == [3, 2, 1]
+
+    def test_http_url_skips_local_lines(self):
+        """Test HTTP URLs on lines without a local host are reported."""
+        content = "a = 1\nsee http://docs.example.com/local\nb = http://api.example.com\n"
+        violations = run_builtin_checks([ResourceInfo(path="app.cfg", content=content)], None)
+
+        assert [(v.policy_id, v.line) for v in violations] == [("acgs2-security-002", 2)]
+
+    def test_http_url_ignored_when_content_is_local(self):
+        """Test no HTTP violation when the content references localhost."""
+        content = "a = http://api.example.com\nb = http://localhost:8080\n"
+        violations = run_builtin_checks([ResourceInfo(path="app.cfg", content=content)], None)
+
+        assert violations == []
+
+    def test_docker_untagged_base_image(self):
+        """Test an untagged base image is reported for Dockerfiles."""
+        resources = [
+            ResourceInfo(path="img/Dockerfile", content="FROM alpine\nRUN true"),
+            ResourceInfo(path="img2/Dockerfile", content="FROM python:3.11\nRUN true"),
+        ]
+        violations = run_builtin_checks(resources, None)
+
+        assert [(v.policy_id, v.file) for v in violations] == [
+            ("acgs2-docker-001", "img/Dockerfile")
+        ]
+
+    def test_iter_streams_violations_per_resource(self):
+        """Test violations are yielded before later resources are scanned."""
+        resources = [
+            ResourceInfo(path="a.py", content="api_key = 'x'"),
+            ResourceInfo(path="b.py", content=None),
+        ]
+        violations = iter_builtin_violations(resources, None)
+
+        first = next(violations)
+        resources[1].content = "password = 'y'"
+
+        assert first.file == "a.py"
+        assert [v.file for v in violations] == ["b.py"]
+
+
+# ============================================================================
+# OPA Evaluation Tests
+# ============================================================================
+
+
+class TestOPAEvaluation:
+    """Tests for chunked OPA evaluation."""
+
+    async def test_large_request_is_evaluated_in_parallel_chunks(self, opa_requests, monkeypatch):
+        """Test resources are split into chunks evaluated concurrently."""
+        monkeypatch.setattr(policy_check, "OPA_EVALUATION_CHUNK_SIZE", 10)
+        monkeypatch.setattr(policy_check, "OPA_MAX_PARALLEL_EVALUATIONS", 3)
+
+        available, violations = await evaluate_policies_with_opa(
+            make_resources(95), None, None, None
+        )
+
+        assert available is True
+        assert [v.file for v in violations] == [f"src/module_{n}.py" for n in range(95)]
+        assert len(opa_requests) == 10
+        assert max(opa_requests) == 3
+
+    async def test_failed_chunk_reports_opa_unavailable(self, opa_requests, monkeypatch):
+        """Test a failing chunk makes the whole evaluation fall back."""
+        monkeypatch.setattr(policy_check, "OPA_EVALUATION_CHUNK_SIZE", 10)
+        resources = make_resources(30)
+        resources[15].path = "broken.py"
+
+        available, violations = await evaluate_policies_with_opa(resources, None, None, None)
+
+        assert available is False
+        assert violations == []
+
+    async def test_small_request_is_a_single_evaluation(self, opa_requests):
+        """Test requests below the chunk size are sent in one evaluation."""
+        available, violations = await evaluate_policies_with_opa(
+            make_resources(5), None, None, None
+        )
+
+        assert available is True
+        assert len(violations) == 5
+        assert len(opa_requests) == 1
+
+
+# ============================================================================
+# Shared Client Tests
+# ============================================================================
+
+
+class TestSharedOPAClient:
+    """Tests for the pooled OPA client."""
+
+    async def test_client_is_reused_until_closed(self):
+        """Test the shared client is reused and recreated after close."""
+        client = await get_opa_client()
+        assert await get_opa_client() is client
+
+        await close_opa_client()
+        assert client.is_closed
+
+        new_client = await get_opa_client()
+        assert new_client is not client
+        await close_opa_client()
+
+    async def test_health_check_uses_shared_client(self, opa_requests):
+        """Test the OPA health check goes through the shared client."""
+        assert await check_opa_health() is True
+
+
+# ============================================================================
+# Streaming Validation Tests
+# ============================================================================
+
+
+class TestStreamingValidation:
+    """Tests for the newline-delimited JSON validation endpoint."""
+
+    async def test_builtin_violations_streamed_before_result(self, opa_unavailable):
+        """Test each built-in violation is a record, followed by the result."""
+        request = PolicyValidationRequest(
+            resources=[
+                ResourceInfo(path="a.py", content="api_key = 'x'"),
+                ResourceInfo(path="b.py", content="print('ok')"),
+                ResourceInfo(path="c.cfg", content="url = http://example.com"),
+            ]
+        )
+
+        records = await read_stream(request)
+
+        assert [(r["type"], r.get("file")) for r in records] == [
+            ("violation", "a.py"),
+            ("violation", "c.cfg"),
+            ("result", None),
+        ]
+        result = records[-1]
+        assert "violations" not in result
+        assert result["passed"] is False
+        assert result["opa_available"] is False
+        assert result["summary"]["total_resources"] == 3
+        assert result["summary"]["total_violations"] == 2
+        assert result["audit_context"]["user_id"] == "ci-bot"
+
+    async def test_builtin_scan_yields_to_event_loop(self, opa_unavailable, monkeypatch):
+        """Test a large built-in scan lets other tasks run while it streams."""
+        monkeypatch.setattr(policy_check, "BUILTIN_CHECK_YIELD_INTERVAL", 10)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        try:
+            records = await read_stream(PolicyValidationRequest(resources=make_resources(50)))
+        finally:
+            task.cancel()
+
+        assert records[-1]["type"] == "result"
+        assert ticks >= 5
+
+    async def test_opa_violations_streamed(self, opa_requests):
+        """Test OPA violations are streamed and skip the built-in checks."""
+        request = PolicyValidationRequest(resources=make_resources(3))
+
+        records = await read_stream(request)
+
+        assert [r["type"] for r in records] == ["violation"] * 3 + ["result"]
+        assert records[-1]["opa_available"] is True
+        assert records[-1]["passed"] is True
+
+    async def test_matches_validate_endpoint(self, opa_unavailable):
+        """Test the streamed records carry the same outcome as /validate."""
+        request = PolicyValidationRequest(
+            resources=[ResourceInfo(path="k8s.yaml", content="containers:\n  privileged: true")]
+        )
+
+        records = await read_stream(request)
+        response = await policy_check.validate_policies(request, current_user=make_user())
+
+        assert [r["policy_id"] for r in records[:-1]] == [v.policy_id for v in response.violations]
+        assert records[-1]["summary"]["high_count"] == response.summary.high_count
+        assert records[-1]["recommendations"] == response.recommendations
@@ -0,0 +1,408 @@
+"""
+Tests for the Kafka event consumer.
+
+Tests cover:
+- Sequential processing in poll order
+- Partition and key processing modes with ordered lanes
+- Bounded in-flight window
+- Offset commits limited to the contiguous prefix of finished records
+- Partition revocation and reassignment during a rebalance
+- Lag and throughput metrics
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from aiokafka.errors import IllegalStateError
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from src.consumers.event_consumer import (
+    EventConsumer,
+    EventConsumerConfig,
+    EventConsumerState,
+    GovernanceEvent,
+    ProcessingMode,
+    _PartitionOffsets,
+)
+
+TOPIC = "governance-events"
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+def make_record(partition: int, offset: int, key: Optional[bytes] = None) -> ConsumerRecord:
+    """Create a consumer record carrying a governance event."""
+    value = json.dumps(
+        {
+            "event_type": "policy_violation",
+            "title": f"p{partition}-o{offset}",
+            "details": {"key": key.decode() if key else None},
+        }
+    ).encode()
+    return ConsumerRecord(
+        topic=TOPIC,
+        partition=partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=key,
+        value=value,
+        checksum=None,
+        serialized_key_size=len(key) if key else -1,
+        serialized_value_size=len(value),
+        headers=[],
+    )
+
+
+class FakeKafkaConsumer:
+    """In-memory stand-in for AIOKafkaConsumer."""
+
+    def __init__(self, records: List[ConsumerRecord]):
+        self._pending = list(records)
+        self._positions: Dict[TopicPartition, int] = {}
+        self._end_offsets: Dict[TopicPartition, int] = defaultdict(int)
+        for record in records:
+            tp = TopicPartition(record.topic, record.partition)
+            self._end_offsets[tp] = max(self._end_offsets[tp], record.offset + 1)
+        self.commits: List[Dict[TopicPartition, int]] = []
+        self.poll_sizes: List[int] = []
+        self.assigned: Optional[Set[TopicPartition]] = None
+
+    async def getmany(self, timeout_ms: int = 0, max_records: Optional[int] = None):
+        await asyncio.sleep(0 if self._pending else timeout_ms / 1000)
+        taken, self._pending = self._pending[:max_records], self._pending[max_records:]
+        self.poll_sizes.append(len(taken))
+        batch: Dict[TopicPartition, List[ConsumerRecord]] = defaultdict(list)
+        for record in taken:
+            tp = TopicPartition(record.topic, record.partition)
+            batch[tp].append(record)
+            self._positions[tp] = record.offset + 1
+        return dict(batch)
+
+    async def commit(self, offsets: Dict[TopicPartition, int]) -> None:
+        unassigned = set(offsets) - self.assignment()
+        if unassigned:
+            raise IllegalStateError(f"Partitions {unassigned} are not assigned")
+        self.commits.append(dict(offsets))
+
+    def assignment(self):
+        return set(self._end_offsets) if self.assigned is None else set(self.assigned)
+
+    def deliver(self, records: List[ConsumerRecord]) -> None:
+        self._pending.extend(records)
+
+    async def position(self, tp: TopicPartition) -> int:
+        return self._positions.get(tp, 0)
+
+    async def end_offsets(self, partitions):
+        return {tp: self._end_offsets[tp] for tp in partitions}
+
+    async def stop(self) -> None:
+        pass
+
+
+def make_consumer(
+    records: List[ConsumerRecord], mode: ProcessingMode, max_in_flight: int = 500
+) -> Tuple[EventConsumer, FakeKafkaConsumer]:
+    """Create a running consumer backed by a fake Kafka consumer."""
+    consumer = EventConsumer(
+        EventConsumerConfig(
+            processing_mode=mode,
+            max_in_flight=max_in_flight,
+            batch_timeout_seconds=0.1,
+            max_retries=0,
+        )
+    )
+    fake = FakeKafkaConsumer(records)
+    consumer._consumer = fake
+    consumer._state = EventConsumerState.RUNNING
+    return consumer, fake
+
+
+async def consume_until(consumer: EventConsumer, done: asyncio.Event) -> None:
+    """Run the consumption loop until ``done`` is set, then stop."""
+    task = asyncio.create_task(consumer.consume())
+    await asyncio.wait_for(done.wait(), timeout=5)
+    await consumer.stop()
+    await asyncio.wait_for(task, timeout=5)
+
+
+# ============================================================================
+# Offset Tracking Tests
+# ============================================================================
+
+
+class TestPartitionOffsets:
+    """Tests for contiguous-prefix offset tracking."""
+
+    def test_commits_only_contiguous_prefix(self) -> None:
+        offsets = _PartitionOffsets()
+        for offset in (10, 11, 12, 13):
+            offsets.add(offset)
+
+        offsets.finish(12)
+        assert offsets.committable is None
+        assert offsets.low_watermark == 10
+
+        offsets.finish(10)
+        assert offsets.committable == 11
+
+        offsets.finish(11)
+        assert offsets.committable == 13
+        assert offsets.in_flight == 1
+
+        offsets.finish(13)
+        assert offsets.committable == 14
+        assert offsets.low_watermark == 14
+        assert offsets.in_flight == 0
+
+
+# ============================================================================
+# Processing Mode Tests
+# ============================================================================
+
+
+class TestProcessingModes:
+    """Tests for sequential and concurrent processing."""
+
+    def test_config_accepts_mode_strings(self) -> None:
+        config = EventConsumerConfig(processing_mode="key")
+        assert config.processing_mode == ProcessingMode.KEY
+
+    def test_concurrent_modes_disable_auto_commit(self) -> None:
+        sequential = EventConsumer(EventConsumerConfig())
+        concurrent = EventConsumer(EventConsumerConfig(processing_mode="partition"))
+        assert sequential._build_consumer_config()["enable_auto_commit"] is True
+        assert concurrent._build_consumer_config()["enable_auto_commit"] is False
+
+    async def test_sequential_mode_processes_in_poll_order(self) -> None:
+        records = [make_record(p, o) for o in range(3) for p in range(2)]
+        consumer, fake = make_consumer(records, ProcessingMode.SEQUENTIAL)
+        seen: List[str] = []
+        done = asyncio.Event()
+
+        async def handler(event: GovernanceEvent) -> bool:
+            seen.append(event.title)
+            if len(seen) == len(records):
+                done.set()
+            return True
+
+        consumer.add_handler(handler)
+        await consume_until(consumer, done)
+
+        # One poll returns the records grouped by partition
+        assert seen == [f"p{p}-o{o}" for p in range(2) for o in range(3)]
+        assert fake.commits == []
+
+    async def test_partition_mode_keeps_partition_order(self) -> None:
+        records = [make_record(p, o) for o in range(20) for p in range(4)]
+        consumer, fake = make_consumer(records, ProcessingMode.PARTITION)
+        seen: Dict[int, List[int]] = defaultdict(list)
+        done = asyncio.Event()
+
+        async def handler(event: GovernanceEvent) -> bool:
+            # Later partitions finish sooner, so lanes interleave
+            await asyncio.sleep(0.001 * (4 - event.kafka_partition))
+            seen[event.kafka_partition].append(event.kafka_offset)
+            if sum(len(v) for v in seen.values()) == len(records):
+                done.set()
+            return True
+
+        consumer.add_handler(handler)
+        await consume_until(consumer, done)
+
+        assert {p: offsets for p, offsets in seen.items()} == {p: list(range(20)) for p in range(4)}
+        assert consumer.metrics.events_processed == len(records)
+        final = {}
+        for commit in fake.commits:
+            final.update(commit)
+        assert final == {TopicPartition(TOPIC, p): 20 for p in range(4)}
+
+    async def test_slow_partition_does_not_block_others(self) -> None:
+        records = [make_record(p, o) for o in range(5) for p in range(2)]
+        consumer, _ = make_consumer(records, ProcessingMode.PARTITION)
+        release = asyncio.Event()
+        fast_done = asyncio.Event()
+        seen: Dict[int, int] = defaultdict(int)
+
+        async def handler(event: GovernanceEvent) -> bool:
+            if event.kafka_partition == 0:
+                await release.wait()
+            seen[event.kafka_partition] += 1
+            if seen[1] == 5:
+                fast_done.set()
+            return True
+
+        consumer.add_handler(handler)
+        task = asyncio.create_task(consumer.consume())
+        await asyncio.wait_for(fast_done.wait(), timeout=5)
+
+        assert seen[0] == 0
+        lag = await consumer.get_lag()
+        assert lag == {f"{TOPIC}:0": 5, f"{TOPIC}:1": 0}
+        assert consumer.metrics.partition_lag == lag
+
+        release.set()
+        await consumer.stop()
+        await asyncio.wait_for(task, timeout=5)
+        assert seen[0] == 5
+
+    async def test_key_mode_orders_within_key_only(self) -> None:
+        keys = [b"a", b"b", b"a", b"b", b"a", b"b"]
+        records = [make_record(0, o, key) for o, key in enumerate(keys)]
+        consumer, fake = make_consumer(records, ProcessingMode.KEY)
+        release_a = asyncio.Event()
+        seen: List[Tuple[str, int]] = []
+        done = asyncio.Event()
+
+        async def handler(event: GovernanceEvent) -> bool:
+            key = event.details["key"]
+            if key == "a":
+                await release_a.wait()
+            seen.append((key, event.kafka_offset))
+            if len(seen) == 3:
+                # All of key b finished while key a is blocked on offset 0
+                assert consumer._offsets[TopicPartition(TOPIC, 0)].committable is None
+                release_a.set()
+            if len(seen) == len(records):
+                done.set()
+            return True
+
+        consumer.add_handler(handler)
+        await consume_until(consumer, done)
+
+        assert seen[:3] == [("b", 1), ("b", 3), ("b", 5)]
+        assert seen[3:] == [("a", 0), ("a", 2), ("a", 4)]
+        assert fake.commits[-1] == {TopicPartition(TOPIC, 0): 6}
+
+    async def test_in_flight_window_is_bounded(self) -> None:
+        records = [make_record(p, o) for o in range(25) for p in range(8)]
+        consumer, fake = make_consumer(records, ProcessingMode.PARTITION, max_in_flight=10)
+        processed = 0
+        done = asyncio.Event()
+
+        async def handler(event: GovernanceEvent) -> bool:
+            nonlocal processed
+            assert consumer._in_flight <= 10
+            await asyncio.sleep(0.001)
+            processed += 1
+            if processed == len(records):
+                done.set()
+            return True
+
+        consumer.add_handler(handler)
+        await consume_until(consumer, done)
+
+        assert max(fake.poll_sizes) <= 10
+        assert consumer.metrics.max_in_flight_observed == 10
+        assert consumer.metrics.events_in_flight == 0
+        assert consumer.metrics.offsets_committed >= 1
+
+    async def test_failed_records_still_advance_offsets(self) -> None:
+        records = [make_record(0, o) for o in range(3)]
+        consumer, fake = make_consumer(records, ProcessingMode.PARTITION)
+        calls = 0
+        done = asyncio.Event()
+
+        async def handler(event: GovernanceEvent) -> bool:
+            nonlocal calls
+            calls += 1
+            if calls == len(records):
+                done.set()
+            if event.kafka_offset == 1:
+                raise RuntimeError("handler failure")
+            return True
+
+        consumer.add_handler(handler)
+        await consume_until(consumer, done)
+
+        assert consumer.metrics.events_failed == 1
+        assert fake.commits[-1] == {TopicPartition(TOPIC, 0): 3}
+
+    def test_throughput_sampling(self) -> None:
+        consumer, _ = make_consumer([], ProcessingMode.PARTITION)
+        sampled_at, _ = consumer._throughput_sample
+        consumer._throughput_sample = (sampled_at - 2.0, 0)
+        consumer._finished_count = 100
+
+        consumer._sample_throughput()
+
+        assert 40 <= consumer.metrics.throughput_events_per_second <= 50
+
+
+# ============================================================================
+# Rebalance Tests
+# ============================================================================
+
+
+class TestRebalance:
+    """Tests for partition revocation and reassignment."""
+
+    async def test_revoked_partition_is_committed_and_dropped(self) -> None:
+        records = [make_record(p, o) for o in range(5) for p in range(2)]
+        consumer, fake = make_consumer(records, ProcessingMode.PARTITION)
+        tp0, tp1 = TopicPartition(TOPIC, 0), TopicPartition(TOPIC, 1)
+        in_handler = asyncio.Event()
+        release = asyncio.Event()
+        seen: List[Tuple[int, int]] = []
+
+        async def handler(event: GovernanceEvent) -> bool:
+            if (event.kafka_partition, event.kafka_offset) == (0, 1):
+                in_handler.set()
+                await release.wait()
+            seen.append((event.kafka_partition, event.kafka_offset))
+            return True
+
+        consumer.add_handler(handler)
+        task = asyncio.create_task(consumer.consume())
+        await asyncio.wait_for(in_handler.wait(), timeout=5)
+
+        # The in-progress record finishes and is committed; queued ones are left
+        revoke = asyncio.create_task(consumer._on_partitions_revoked([tp0]))
+        await asyncio.sleep(0.01)
+        assert not revoke.done()
+        release.set()
+        await asyncio.wait_for(revoke, timeout=5)
+        fake.assigned = {tp1}
+
+        assert {tp0: 2} in fake.commits
+        assert tp0 not in consumer._offsets
+        assert [o for p, o in seen if p == 0] == [0, 1]
+
+        # Later commits only cover assigned partitions and keep succeeding
+        await asyncio.sleep(0.2)
+        assert consumer.metrics.events_in_flight == 0
+        assert fake.commits[-1] == {tp1: 5}
+        assert consumer._consecutive_errors == 0
+
+        # Reassigned, the partition is redelivered from the committed offset
+        fake.assigned = {tp0, tp1}
+        await consumer._on_partitions_assigned([tp0])
+        fake.deliver([make_record(0, o) for o in range(2, 5)])
+        await asyncio.sleep(0.2)
+        await consumer.stop()
+        await asyncio.wait_for(task, timeout=5)
+
+        assert [o for p, o in seen if p == 0] == list(range(5))
+        assert fake.commits[-1] == {tp0: 5}
+        assert consumer._consecutive_errors == 0
+
+    async def test_commit_skips_unassigned_partitions(self) -> None:
+        consumer, fake = make_consumer([make_record(0, 0)], ProcessingMode.PARTITION)
+        stale = TopicPartition(TOPIC, 7)
+        consumer._offsets[stale] = _PartitionOffsets()
+        consumer._offsets[stale].add(3)
+        consumer._offsets[stale].finish(3)
+        consumer._offsets[TopicPartition(TOPIC, 0)] = tracker = _PartitionOffsets()
+        tracker.add(0)
+        tracker.finish(0)
+
+        await consumer._commit_finished_offsets()
+
+        assert fake.commits == [{TopicPartition(TOPIC, 0): 1}]
@@ -0,0 +1,284 @@
+"""
+Tests for compiled ticket field-mapping plans.
+
+Tests cover:
+- Template compilation: literals, nested paths, unresolved placeholders
+- Field paths over event attributes and nested details
+- Conditional mappings and missing fields
+- Transform binding, custom transforms and unknown transforms
+- Plan reuse and recompilation when the configuration changes
+- Batch mapping with map_events
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+import pytest
+
+from src.integration_types import JSONValue
+from src.integrations.base import EventSeverity, IntegrationEvent
+from src.integrations.ticket_mapping import (
+    FieldMapping,
+    FieldMappingType,
+    TicketFieldMapper,
+    TicketingProvider,
+    TicketMappingConfig,
+    compile_conditional,
+    compile_field_path,
+    compile_template,
+    create_jira_mapping_config,
+    create_pagerduty_mapping_config,
+    create_servicenow_mapping_config,
+)
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def sample_event() -> IntegrationEvent:
+    """Create a governance event with nested details."""
+    return IntegrationEvent(
+        event_id="evt-1",
+        event_type="policy_violation",
+        severity=EventSeverity.HIGH,
+        title="Unauthorized bucket access",
+        policy_id="POL-12",
+        resource_id="bucket-7",
+        resource_type="bucket",
+        details={"region": "eu-west-1", "account": {"id": "1234"}, "items": [1, 2]},
+        tags=["security"],
+    )
+
+
+def make_config(mappings: List[FieldMapping]) -> TicketMappingConfig:
+    """Create a Jira mapping configuration with the given field mappings."""
+    return TicketMappingConfig(
+        name="Test Mapping", provider=TicketingProvider.JIRA, field_mappings=mappings
+    )
+
+
+def conditional(conditions: List[Dict[str, JSONValue]]) -> FieldMapping:
+    """Create a conditional field mapping with a default of "default"."""
+    return FieldMapping(
+        target_field="team",
+        mapping_type=FieldMappingType.CONDITIONAL,
+        conditions=conditions,
+        default_value="default",
+    )
+
+
+# ============================================================================
+# Compilation Tests
+# ============================================================================
+
+
+class TestCompiledTemplates:
+    """Tests for pre-parsed templates and field paths."""
+
+    def test_template_renders_attributes_and_nested_details(self, sample_event):
+        """Test placeholders resolve event attributes and nested detail keys."""
+        render = compile_template("[{event_type}] {title} ({details.account.id}) on {resource_id}")
+
+        assert render(sample_event) == (
+            "[policy_violation] Unauthorized bucket access (1234) on bucket-7"
+        )
+
+    def test_template_unresolved_placeholders_render_empty(self, sample_event):
+        """Test missing and None-valued placeholders render as empty strings."""
+        render = compile_template("{title}|{details.missing.key}|{user_id}|{unknown}")
+
+        assert render(sample_event) == "Unauthorized bucket access|||"
+
+    def test_template_without_placeholders(self, sample_event):
+        """Test a template without placeholders renders unchanged."""
+        assert compile_template("Static {not a placeholder}")(sample_event) == (
+            "Static {not a placeholder}"
+        )
+
+    def test_field_path_prefers_attributes_over_dict_keys(self, sample_event):
+        """Test dict attributes shadow same-named detail keys as before."""
+        get_items = compile_field_path("details.items")
+
+        assert get_items(sample_event) != [1, 2]
+        assert isinstance(get_items(sample_event), str)
+        assert compile_field_path("details.region")(sample_event) == "eu-west-1"
+        assert compile_field_path("details.region.name")(sample_event) is None
+
+    def test_field_path_stringifies_non_json_values(self, sample_event):
+        """Test non-JSON values such as timestamps are converted to strings."""
+        timestamp = compile_field_path("timestamp")(sample_event)
+
+        assert timestamp == str(sample_event.timestamp)
+
+
+class TestCompiledConditionals:
+    """Tests for compiled conditional mappings."""
+
+    @pytest.mark.parametrize(
+        ("operator", "value", "expected"),
+        [
+            ("eq", "bucket", "matched"),
+            ("ne", "bucket", "default"),
+            ("in", ["vm", "bucket"], "matched"),
+            ("in", "bucket", "default"),
+            ("contains", "uck", "matched"),
+            ("regex", r"^buc", "matched"),
+            ("gt", "a", "matched"),
+            ("lte", "a", "default"),
+            ("unknown", "bucket", "default"),
+        ],
+    )
+    def test_operators(self, sample_event, operator, value, expected):
+        """Test each operator against the resource type."""
+        evaluate = compile_conditional(
+            [{"field": "resource_type", "operator": operator, "value": value, "result": "matched"}],
+            "default",
+        )
+
+        assert evaluate(sample_event) == expected
+
+    def test_missing_field_only_matches_eq_none(self, sample_event):
+        """Test a missing field matches only an "eq" condition expecting None."""
+        evaluate = compile_conditional(
+            [
+                {"field": "user_id", "operator": "ne", "value": "x", "result": "ne"},
+                {"field": "user_id", "operator": "eq", "value": None, "result": "no user"},
+            ],
+            "default",
+        )
+
+        assert evaluate(sample_event) == "no user"
+
+    def test_first_matching_condition_wins(self, sample_event):
+        """Test conditions are evaluated in order."""
+        evaluate = compile_conditional(
+            [
+                {"field": "details.region", "operator": "eq", "value": "eu-west-1", "result": 1},
+                {"field": "resource_type", "operator": "eq", "value": "bucket", "result": 2},
+            ],
+            None,
+        )
+
+        assert evaluate(sample_event) == 1
+
+    def test_invalid_regex_fails_the_field(self, sample_event):
+        """Test an invalid regex fails mapping of the field, not compilation."""
+        mapper = TicketFieldMapper(
+            make_config(
+                [conditional([{"field": "title", "operator": "regex", "value": "(", "result": 1}])]
+            )
+        )
+
+        result = mapper.map_event(sample_event)
+
+        assert result.field_results[0].success is False
+        assert result.warnings
+
+
+# ============================================================================
+# Mapper Tests
+# ============================================================================
+
+
+class TestTicketFieldMapperPlan:
+    """Tests for plan use in TicketFieldMapper."""
+
+    @pytest.mark.parametrize(
+        "config_factory",
+        [
+            create_jira_mapping_config,
+            create_servicenow_mapping_config,
+            create_pagerduty_mapping_config,
+        ],
+    )
+    def test_default_configs_map_successfully(self, sample_event, config_factory):
+        """Test the default provider configurations map a high severity event."""
+        result = TicketFieldMapper(config_factory()).map_event(sample_event)
+
+        assert result.success is True
+        assert any(v == "[ACGS-2] Unauthorized bucket access" for v in result.fields.values())
+
+    def test_jira_fields(self, sample_event):
+        """Test the Jira configuration maps the expected field values."""
+        result = TicketFieldMapper(create_jira_mapping_config()).map_event(sample_event)
+
+        assert result.fields["summary"] == "[ACGS-2] Unauthorized bucket access"
+        assert result.fields["project"] == {"key": "GOV"}
+        assert result.fields["priority"] == "High"
+
+    def test_plan_is_reused(self):
+        """Test the plan is compiled once for an unchanged configuration."""
+        mapper = TicketFieldMapper(create_jira_mapping_config())
+
+        assert mapper.plan is mapper.plan
+
+    def test_plan_recompiled_when_mappings_change(self, sample_event):
+        """Test appending a field mapping or changing the summary recompiles."""
+        mapper = TicketFieldMapper(create_jira_mapping_config())
+        plan = mapper.plan
+
+        mapper.config.field_mappings.append(
+            FieldMapping(
+                target_field="region",
+                mapping_type=FieldMappingType.EVENT_FIELD,
+                source_field="details.region",
+            )
+        )
+        assert mapper.map_event(sample_event).fields["region"] == "eu-west-1"
+        assert mapper.plan is not plan
+
+        mapper.config.summary_template = "{policy_id}: {title}"
+        assert mapper.get_summary(sample_event) == "POL-12: Unauthorized bucket access"
+
+    def test_invalidate_plan_picks_up_in_place_changes(self, sample_event):
+        """Test invalidate_plan recompiles a field mapping modified in place."""
+        mapping = FieldMapping(
+            target_field="label", mapping_type=FieldMappingType.STATIC, static_value="a"
+        )
+        mapper = TicketFieldMapper(make_config([mapping]))
+        assert mapper.map_event(sample_event).fields["label"] == "a"
+
+        mapping.static_value = "b"
+        mapper.invalidate_plan()
+
+        assert mapper.map_event(sample_event).fields["label"] == "b"
+
+    def test_register_transform_recompiles_plan(self, sample_event):
+        """Test a registered transform is used by the next mapping."""
+        mapping = FieldMapping(
+            target_field="owner",
+            mapping_type=FieldMappingType.TRANSFORM,
+            transform_name="owner_lookup",
+            required=True,
+        )
+        mapper = TicketFieldMapper(make_config([mapping]))
+
+        failed = mapper.map_event(sample_event)
+        assert failed.success is False
+        assert "Unknown transform: owner_lookup" in failed.validation_errors[0]
+
+        mapper.register_transform("owner_lookup", lambda event, params: f"{event.policy_id}-team")
+        result = mapper.map_event(sample_event)
+
+        assert result.success is True
+        assert result.fields["owner"] == "POL-12-team"
+
+    def test_map_events_matches_map_event(self, sample_event):
+        """Test batch mapping returns one result per event, in order."""
+        mapper = TicketFieldMapper(create_servicenow_mapping_config())
+        events = [
+            sample_event.model_copy(update={"title": f"Event {n}", "severity": severity})
+            for n, severity in enumerate(EventSeverity)
+        ]
+
+        results = mapper.map_events(iter(events))
+
+        assert [r.model_dump() for r in results] == [
+            mapper.map_event(event).model_dump() for event in events
+        ]
+        assert [r.fields["short_description"] for r in results] == [
+            f"[ACGS-2] Event {n}" for n in range(len(events))
+        ]
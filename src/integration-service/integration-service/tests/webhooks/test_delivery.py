@@ -12,6 +12,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import time
@@ -31,13 +32,19 @@ from src.webhooks.delivery import (
 from src.webhooks.models import (
     WebhookAuthType,
     WebhookConfig,
+    WebhookDelivery,
     WebhookDeliveryStatus,
     WebhookEvent,
     WebhookEventType,
     WebhookState,
     WebhookSubscription,
 )
-from src.webhooks.retry import ExponentialBackoff, RetryState, should_retry_status_code
+from src.webhooks.retry import (
+    ExponentialBackoff,
+    NonRetryableError,
+    RetryState,
+    should_retry_status_code,
+)
 
 if TYPE_CHECKING:
     pass
@@ -85,6 +92,23 @@ def sample_subscription() -> WebhookSubscription:
     )
 
 
+def make_dead_letter(delivery_id: str, subscription_id: str) -> tuple:
+    """Create the delivery and event of a dead letter."""
+    delivery = WebhookDelivery(
+        id=delivery_id,
+        subscription_id=subscription_id,
+        event_id=f"evt-{delivery_id}",
+        attempt_number=3,
+    )
+    event = WebhookEvent(
+        id=f"evt-{delivery_id}",
+        event_type=WebhookEventType.POLICY_VIOLATION,
+        title="Test Event",
+        severity="high",
+    )
+    return delivery, event
+
+
 @pytest.fixture
 def dev_config() -> WebhookFrameworkConfig:
     """Create development configuration for testing."""
@@ -493,6 +517,138 @@ class TestWebhookDeliveryEngine:
         assert result.status == WebhookDeliveryStatus.DEAD_LETTERED
         assert delivery_engine.dead_letter_queue.size == 1
 
+    @pytest.mark.asyncio
+    async def test_deliver_batch_uses_subscription_lane(
+        self, delivery_engine, sample_subscription, sample_event
+    ):
+        """Test that batch delivery is bounded by the subscription lane's concurrency."""
+        delivery_engine.config.lane_initial_concurrency = 3
+        delivery_engine.config.lane_max_concurrency = 3
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = {}
+        active = 0
+        peak = 0
+
+        async def mock_request(*args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return mock_response
+
+        events = [sample_event.model_copy(update={"id": f"evt-{i}"}) for i in range(12)]
+        with patch.object(delivery_engine, "_make_request", side_effect=mock_request):
+            results = await delivery_engine.deliver_batch(sample_subscription, events)
+
+        assert [r.event_id for r in results] == [e.id for e in events]
+        assert all(r.success for r in results)
+        assert peak == 3
+        lane = delivery_engine.get_lane_metrics()[sample_subscription.id]
+        assert lane["delivered"] == 12
+        assert lane["queued"] == 0
+        await delivery_engine.close()
+
+    @pytest.mark.asyncio
+    async def test_deliver_to_all_isolates_slow_subscription(
+        self, delivery_engine, sample_subscription, sample_event
+    ):
+        """Test that a slow subscription does not delay delivery to the others."""
+        slow = sample_subscription.model_copy(update={"id": "sub-slow"})
+        fast = sample_subscription.model_copy(update={"id": "sub-fast"})
+        release = asyncio.Event()
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = {}
+
+        async def mock_request(*args, **kwargs):
+            return mock_response
+
+        async def deliver(subscription, event):
+            if subscription.id == "sub-slow":
+                await release.wait()
+            return await WebhookDeliveryEngine.deliver(delivery_engine, subscription, event)
+
+        with patch.object(delivery_engine, "_make_request", side_effect=mock_request):
+            delivery_engine.deliver = deliver
+            slow_lane = delivery_engine._get_lane(slow)
+            blocked = [await slow_lane.submit(slow, sample_event) for _ in range(4)]
+
+            results = await asyncio.wait_for(
+                delivery_engine.deliver_to_all([fast], sample_event), timeout=1
+            )
+            assert results[0].success is True
+            assert not any(f.done() for f in blocked)
+
+            release.set()
+            assert all(r.success for r in await asyncio.gather(*blocked))
+        await delivery_engine.close()
+
+    @pytest.mark.asyncio
+    async def test_http_clients_are_pooled_per_host(self, delivery_engine):
+        """Test that each destination host gets its own reused client."""
+        a1 = await delivery_engine._get_http_client("https://a.example.com/hook1")
+        a2 = await delivery_engine._get_http_client("https://a.example.com/hook2")
+        b = await delivery_engine._get_http_client("https://b.example.com/hook")
+
+        assert a1 is a2
+        assert a1 is not b
+        await delivery_engine.close()
+        assert a1.is_closed and b.is_closed
+
+    @pytest.mark.asyncio
+    async def test_idle_http_clients_are_closed(self, dev_config, monkeypatch):
+        """Test that host clients without recent requests are closed and replaced."""
+        dev_config.http_client_idle_timeout_seconds = 10.0
+        engine = WebhookDeliveryEngine(config=dev_config)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        a = await engine._get_http_client("https://a.example.com/hook")
+        busy = await engine._get_http_client("https://busy.example.com/hook")
+        engine._host_requests[engine._host_key("https://busy.example.com/hook")] = 1
+
+        now += 11.0
+        b = await engine._get_http_client("https://b.example.com/hook")
+
+        assert a.is_closed
+        assert not busy.is_closed and not b.is_closed
+        assert await engine._get_http_client("https://a.example.com/hook") is not a
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_lanes_are_dropped(self, delivery_engine, sample_subscription, sample_event):
+        """Test that a lane is dropped once idle and recreated on the next delivery."""
+        delivery_engine.config.lane_idle_timeout_seconds = 0.01
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = {}
+
+        with patch.object(delivery_engine, "_make_request", return_value=mock_response):
+            await delivery_engine.deliver_batch(sample_subscription, [sample_event])
+            lane = delivery_engine._lanes[sample_subscription.id]
+            await asyncio.sleep(0.05)
+            assert delivery_engine.get_lane_metrics() == {}
+
+            await delivery_engine.deliver_batch(sample_subscription, [sample_event])
+            assert delivery_engine._lanes[sample_subscription.id] is not lane
+        await delivery_engine.close()
+
+    @pytest.mark.asyncio
+    async def test_injected_http_client_serves_all_hosts(self, dev_config):
+        """Test that a client passed to the engine is used for every destination."""
+        client = httpx.AsyncClient()
+        engine = WebhookDeliveryEngine(config=dev_config, http_client=client)
+
+        assert await engine._get_http_client("https://a.example.com/hook") is client
+        assert await engine._get_http_client("https://b.example.com/hook") is client
+        await engine.close()
+        assert not client.is_closed
+        await client.aclose()
+
     @pytest.mark.asyncio
     async def test_hmac_signature_generation(self, delivery_engine):
         """Test HMAC signature generation."""
@@ -674,6 +830,204 @@ class TestDeadLetterQueue:
         removed = await dlq.remove("non-existent")
         assert removed is False
 
+    @pytest.mark.asyncio
+    async def test_persists_across_restarts(self, tmp_path):
+        """Test that a file-backed queue is rebuilt from its log."""
+        path = tmp_path / "dlq" / "dead_letters.jsonl"
+        dlq = DeadLetterQueue(path=str(path))
+        for i in range(3):
+            await dlq.add(*make_dead_letter(f"del-{i}", "sub-1"), f"Error {i}")
+        await dlq.remove("del-1")
+        dlq.close()
+
+        reloaded = DeadLetterQueue(path=str(path))
+
+        assert [item["delivery_id"] for item in await reloaded.get_all()] == ["del-0", "del-2"]
+        assert len(await reloaded.get_by_subscription("sub-1")) == 2
+        assert (await reloaded.get("del-2"))["error_message"] == "Error 2"
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_eviction_updates_subscription_index(self):
+        """Test that evicted entries disappear from the subscription index."""
+        dlq = DeadLetterQueue(max_size=2)
+        await dlq.add(*make_dead_letter("del-0", "sub-1"), "Error")
+        await dlq.add(*make_dead_letter("del-1", "sub-2"), "Error")
+        await dlq.add(*make_dead_letter("del-2", "sub-2"), "Error")
+
+        assert await dlq.get_by_subscription("sub-1") == []
+        assert len(await dlq.get_by_subscription("sub-2")) == 2
+        assert await dlq.get("del-0") is None
+
+    @pytest.mark.asyncio
+    async def test_remove_many(self):
+        """Test removing several entries at once."""
+        dlq = DeadLetterQueue()
+        for i in range(4):
+            await dlq.add(*make_dead_letter(f"del-{i}", "sub-1"), "Error")
+
+        assert await dlq.remove_many(["del-0", "del-2", "missing"]) == 2
+        assert [item["delivery_id"] for item in await dlq.get_all()] == ["del-1", "del-3"]
+
+    @pytest.mark.asyncio
+    async def test_log_is_compacted(self, tmp_path):
+        """Test that the log is rewritten once most of its entries are stale."""
+        path = tmp_path / "dead_letters.jsonl"
+        dlq = DeadLetterQueue(max_size=10, path=str(path))
+        for i in range(1500):
+            await dlq.add(*make_dead_letter(f"del-{i}", "sub-1"), "Error")
+        dlq.close()
+
+        lines = path.read_text().splitlines()
+        assert len(lines) < 1100
+        reloaded = DeadLetterQueue(max_size=10, path=str(path))
+        assert [item["delivery_id"] for item in await reloaded.get_all()] == [
+            f"del-{i}" for i in range(1490, 1500)
+        ]
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_truncated_record_is_skipped(self, tmp_path):
+        """Test that a partially written final record does not block loading."""
+        path = tmp_path / "dead_letters.jsonl"
+        dlq = DeadLetterQueue(path=str(path))
+        await dlq.add(*make_dead_letter("del-0", "sub-1"), "Error")
+        dlq.close()
+        with path.open("a") as log:
+            log.write('{"op": "add", "entry": {"deliv')
+
+        reloaded = DeadLetterQueue(path=str(path))
+
+        assert reloaded.size == 1
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_append_after_truncated_record_survives_reload(self, tmp_path):
+        """Test that the torn tail is cut so the next record is not appended to it."""
+        path = tmp_path / "dead_letters.jsonl"
+        dlq = DeadLetterQueue(path=str(path))
+        await dlq.add(*make_dead_letter("del-0", "sub-1"), "Error")
+        dlq.close()
+        with path.open("a") as log:
+            log.write('{"op": "add", "entry": {"deliv')
+
+        reloaded = DeadLetterQueue(path=str(path))
+        await reloaded.add(*make_dead_letter("del-1", "sub-1"), "Error")
+        reloaded.close()
+
+        again = DeadLetterQueue(path=str(path))
+        assert [item["delivery_id"] for item in await again.get_all()] == ["del-0", "del-1"]
+        again.close()
+
+    @pytest.mark.asyncio
+    async def test_clear_truncates_log(self, tmp_path):
+        """Test that clearing a persistent queue also clears its log."""
+        path = tmp_path / "dead_letters.jsonl"
+        dlq = DeadLetterQueue(path=str(path))
+        await dlq.add(*make_dead_letter("del-0", "sub-1"), "Error")
+
+        assert await dlq.clear() == 1
+        dlq.close()
+        assert DeadLetterQueue(path=str(path)).size == 0
+
+
+class TestDeadLetterReplay:
+    """Tests for WebhookDeliveryEngine.replay_dead_letters."""
+
+    @pytest.mark.asyncio
+    async def test_replay_removes_delivered_entries(
+        self, delivery_engine, sample_subscription, sample_event
+    ):
+        """Test that successfully replayed entries leave the queue."""
+        dlq = delivery_engine.dead_letter_queue
+        for i in range(3):
+            await dlq.add(*make_dead_letter(f"del-{i}", sample_subscription.id), "Error")
+        await dlq.add(*make_dead_letter("del-other", "sub-unknown"), "Error")
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = {}
+
+        with patch.object(delivery_engine, "_make_request", return_value=mock_response):
+            counts = await delivery_engine.replay_dead_letters(
+                {sample_subscription.id: sample_subscription}, rate_per_second=None
+            )
+
+        assert counts["replayed"] == 3
+        assert counts["delivered"] == 3
+        assert counts["skipped"] == 1
+        assert [item["delivery_id"] for item in await dlq.get_all()] == ["del-other"]
+        await delivery_engine.close()
+
+    @pytest.mark.asyncio
+    async def test_replay_keeps_failed_entries(
+        self, delivery_engine, sample_subscription, sample_event
+    ):
+        """Test that entries whose replay fails without dead-lettering are kept."""
+        dlq = delivery_engine.dead_letter_queue
+        await dlq.add(*make_dead_letter("del-0", sample_subscription.id), "Error")
+
+        with patch.object(
+            delivery_engine, "_make_request", side_effect=NonRetryableError("rejected")
+        ):
+            counts = await delivery_engine.replay_dead_letters(
+                {sample_subscription.id: sample_subscription}
+            )
+
+        assert counts["failed"] == 1
+        assert await dlq.get("del-0") is not None
+        await delivery_engine.close()
+
+    @pytest.mark.asyncio
+    async def test_replay_dead_lettered_again_replaces_entry(
+        self, delivery_engine, sample_subscription
+    ):
+        """Test that a replay failing for good leaves only the new dead letter."""
+        dlq = delivery_engine.dead_letter_queue
+        await dlq.add(*make_dead_letter("del-0", sample_subscription.id), "Error")
+        sample_subscription.max_retries = 0
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 503
+        mock_response.text = "Service Unavailable"
+        mock_response.headers = {}
+
+        with patch.object(delivery_engine, "_make_request", return_value=mock_response):
+            counts = await delivery_engine.replay_dead_letters(
+                {sample_subscription.id: sample_subscription}
+            )
+
+        assert counts["dead_lettered"] == 1
+        items = await dlq.get_all()
+        assert len(items) == 1
+        assert items[0]["delivery_id"] != "del-0"
+        assert items[0]["event_id"] == "evt-del-0"
+        await delivery_engine.close()
+
+    @pytest.mark.asyncio
+    async def test_replay_is_rate_limited(self, delivery_engine, sample_subscription):
+        """Test that replays start no faster than the requested rate."""
+        dlq = delivery_engine.dead_letter_queue
+        for i in range(6):
+            await dlq.add(*make_dead_letter(f"del-{i}", sample_subscription.id), "Error")
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = {}
+
+        start = time.monotonic()
+        with patch.object(delivery_engine, "_make_request", return_value=mock_response):
+            counts = await delivery_engine.replay_dead_letters(
+                {sample_subscription.id: sample_subscription},
+                subscription_id=sample_subscription.id,
+                limit=5,
+                rate_per_second=50,
+            )
+
+        assert counts["delivered"] == 5
+        assert time.monotonic() - start >= 4 / 50
+        assert dlq.size == 1
+        await delivery_engine.close()
+
 
 class TestCreateDeliveryEngine:
     """Tests for create_delivery_engine factory function."""
@@ -0,0 +1,358 @@
+"""
+Tests for per-subscription delivery lanes.
+
+Tests cover:
+- AIMD concurrency limit increase and decrease
+- One decrease per congestion window
+- Lane concurrency bound and queue backpressure
+- Idle lane shutdown and slot release during retry backoff
+- Overload classification of delivery results
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import List, Optional
+
+import pytest
+
+from src.webhooks.lanes import (
+    AIMDConcurrencyLimit,
+    DeliveryLane,
+    is_overload_result,
+    sleep_without_slot,
+)
+from src.webhooks.models import (
+    WebhookConfig,
+    WebhookDeliveryResult,
+    WebhookEvent,
+    WebhookEventType,
+    WebhookState,
+    WebhookSubscription,
+)
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def subscription() -> WebhookSubscription:
+    """Create a sample webhook subscription."""
+    return WebhookSubscription(
+        id="sub-lane-001",
+        name="Lane Subscription",
+        state=WebhookState.ACTIVE,
+        config=WebhookConfig(url="https://example.com/webhook"),
+    )
+
+
+def make_event(n: int) -> WebhookEvent:
+    """Create a webhook event with a numbered ID."""
+    return WebhookEvent(
+        id=f"evt-{n}",
+        event_type=WebhookEventType.POLICY_VIOLATION,
+        title=f"Event {n}",
+    )
+
+
+def make_result(event_id: str, success: bool, status_code: Optional[int]) -> WebhookDeliveryResult:
+    """Create a delivery result."""
+    if success:
+        return WebhookDeliveryResult.success_result(
+            delivery_id="d", subscription_id="s", event_id=event_id, status_code=200, duration_ms=1
+        )
+    return WebhookDeliveryResult.failure_result(
+        delivery_id="d",
+        subscription_id="s",
+        event_id=event_id,
+        error_code="ERR",
+        error_message="failed",
+        status_code=status_code,
+    )
+
+
+# ============================================================================
+# AIMD Concurrency Limit Tests
+# ============================================================================
+
+
+class TestAIMDConcurrencyLimit:
+    """Tests for AIMDConcurrencyLimit."""
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_when_window_is_full(self):
+        """Test that the limit grows by one per full window of fast deliveries."""
+        limit = AIMDConcurrencyLimit(initial_limit=2, max_limit=4)
+
+        for _ in range(2):
+            started = [await limit.acquire() for _ in range(limit.limit)]
+            for started_at in started:
+                limit.release(started_at)
+
+        assert limit.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_no_increase_when_underused(self):
+        """Test that the limit does not grow while the lane uses less than its window."""
+        limit = AIMDConcurrencyLimit(initial_limit=4)
+
+        for _ in range(20):
+            limit.release(await limit.acquire())
+
+        assert limit.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_increase_is_gradual(self):
+        """Test that one full window raises the limit by at most one."""
+        limit = AIMDConcurrencyLimit(initial_limit=4, max_limit=32)
+
+        started = [await limit.acquire() for _ in range(4)]
+        for started_at in started:
+            limit.release(started_at)
+
+        assert limit.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_multiplicative_decrease_once_per_window(self):
+        """Test that concurrent failures started before a cut count once."""
+        limit = AIMDConcurrencyLimit(initial_limit=8)
+        started = [await limit.acquire() for _ in range(8)]
+
+        for started_at in started:
+            limit.release(started_at, overloaded=True)
+        assert limit.limit == 4
+
+        limit.release(await limit.acquire(), overloaded=True)
+        assert limit.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_delivery_counts_as_congestion(self):
+        """Test that latency above the threshold reduces the limit."""
+        limit = AIMDConcurrencyLimit(initial_limit=4, latency_threshold_seconds=0.5)
+
+        limit.release(time.monotonic() - 1.0)
+
+        assert limit.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_limit_respects_bounds(self):
+        """Test that the limit stays within min and max."""
+        limit = AIMDConcurrencyLimit(initial_limit=1, min_limit=1, max_limit=1)
+
+        limit.release(await limit.acquire(), overloaded=True)
+        assert limit.limit == 1
+        limit.release(await limit.acquire())
+        assert limit.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_free_slot(self):
+        """Test that acquire blocks while the window is full."""
+        limit = AIMDConcurrencyLimit(initial_limit=1, max_limit=1)
+        started_at = await limit.acquire()
+
+        waiter = asyncio.create_task(limit.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        limit.release(started_at)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert limit.in_flight == 1
+
+
+# ============================================================================
+# Delivery Lane Tests
+# ============================================================================
+
+
+class TestDeliveryLane:
+    """Tests for DeliveryLane."""
+
+    @pytest.mark.asyncio
+    async def test_lane_bounds_concurrency(self, subscription):
+        """Test that a lane never runs more deliveries than its limit."""
+        active = 0
+        peak = 0
+
+        async def deliver(sub, event):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.005)
+            active -= 1
+            return make_result(event.id, True, 200)
+
+        lane = DeliveryLane(
+            subscription.id, deliver, AIMDConcurrencyLimit(initial_limit=2, max_limit=2)
+        )
+        futures = [await lane.submit(subscription, make_event(i)) for i in range(10)]
+        results = await asyncio.gather(*futures)
+
+        assert [r.event_id for r in results] == [f"evt-{i}" for i in range(10)]
+        assert peak == 2
+        assert lane.stats["delivered"] == 10
+        await lane.close()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self, subscription):
+        """Test that submit waits once the lane queue is full."""
+        release = asyncio.Event()
+
+        async def deliver(sub, event):
+            await release.wait()
+            return make_result(event.id, True, 200)
+
+        lane = DeliveryLane(
+            subscription.id,
+            deliver,
+            AIMDConcurrencyLimit(initial_limit=1, max_limit=1),
+            max_queue_size=2,
+        )
+        # One event in flight, one held by the dispatcher, two queued
+        futures: List[asyncio.Future] = []
+        for i in range(4):
+            futures.append(await lane.submit(subscription, make_event(i)))
+            await asyncio.sleep(0)
+
+        blocked = asyncio.create_task(lane.submit(subscription, make_event(4)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert lane.stats["queued"] == 2
+
+        release.set()
+        futures.append(await asyncio.wait_for(blocked, timeout=1))
+        await asyncio.gather(*futures)
+        await lane.close()
+
+    @pytest.mark.asyncio
+    async def test_failing_endpoint_shrinks_limit(self, subscription):
+        """Test that overload responses reduce the lane concurrency."""
+
+        async def deliver(sub, event):
+            await asyncio.sleep(0.001)
+            return make_result(event.id, False, 503)
+
+        lane = DeliveryLane(subscription.id, deliver, AIMDConcurrencyLimit(initial_limit=8))
+        for i in range(8):
+            await (await lane.submit(subscription, make_event(i)))
+
+        assert lane.limit.limit == 1
+        assert lane.stats["failed"] == 8
+        await lane.close()
+
+    @pytest.mark.asyncio
+    async def test_delivery_exception_is_propagated(self, subscription):
+        """Test that an exception from delivery fails the event's future."""
+
+        async def deliver(sub, event):
+            raise RuntimeError("boom")
+
+        lane = DeliveryLane(subscription.id, deliver, AIMDConcurrencyLimit())
+        future = await lane.submit(subscription, make_event(0))
+
+        with pytest.raises(RuntimeError):
+            await future
+        assert lane.limit.in_flight == 0
+        await lane.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_queued_events(self, subscription):
+        """Test that closing a lane cancels events still waiting in its queue."""
+        started = asyncio.Event()
+
+        async def deliver(sub, event):
+            started.set()
+            await asyncio.sleep(0.01)
+            return make_result(event.id, True, 200)
+
+        lane = DeliveryLane(
+            subscription.id, deliver, AIMDConcurrencyLimit(initial_limit=1, max_limit=1)
+        )
+        first = await lane.submit(subscription, make_event(0))
+        queued = [await lane.submit(subscription, make_event(i)) for i in range(1, 4)]
+        await started.wait()
+
+        await lane.close()
+
+        assert (await first).success is True
+        assert all(f.cancelled() for f in queued)
+
+    @pytest.mark.asyncio
+    async def test_idle_lane_dispatcher_exits(self, subscription):
+        """Test that an idle lane stops its dispatcher and reports itself idle."""
+        idle: List[DeliveryLane] = []
+
+        async def deliver(sub, event):
+            await asyncio.sleep(0.03)
+            return make_result(event.id, True, 200)
+
+        lane = DeliveryLane(
+            subscription.id,
+            deliver,
+            AIMDConcurrencyLimit(),
+            idle_timeout=0.01,
+            on_idle=idle.append,
+        )
+        future = await lane.submit(subscription, make_event(0))
+        await asyncio.sleep(0.02)
+        assert idle == []  # A delivery is still in flight
+
+        assert (await future).success is True
+        await asyncio.sleep(0.03)
+        assert idle == [lane]
+        assert lane._dispatcher.done()
+
+        assert (await (await lane.submit(subscription, make_event(1)))).success is True
+        await lane.close()
+
+    @pytest.mark.asyncio
+    async def test_slot_is_released_during_retry_backoff(self, subscription):
+        """Test that a delivery waiting to retry lets other events use its slot."""
+        order: List[str] = []
+
+        async def deliver(sub, event):
+            order.append(f"start {event.id}")
+            if event.id == "evt-0":
+                await sleep_without_slot(0.02)
+                order.append("retry evt-0")
+            return make_result(event.id, True, 200)
+
+        lane = DeliveryLane(
+            subscription.id, deliver, AIMDConcurrencyLimit(initial_limit=1, max_limit=1)
+        )
+        futures = [await lane.submit(subscription, make_event(i)) for i in range(2)]
+        await asyncio.gather(*futures)
+
+        assert order == ["start evt-0", "start evt-1", "retry evt-0"]
+        assert lane.limit.in_flight == 0
+        await lane.close()
+
+    @pytest.mark.asyncio
+    async def test_sleep_without_slot_outside_lane(self):
+        """Test that the backoff sleep works for deliveries outside a lane."""
+        await sleep_without_slot(0)
+
+
+# ============================================================================
+# Overload Classification Tests
+# ============================================================================
+
+
+class TestOverloadClassification:
+    """Tests for is_overload_result."""
+
+    @pytest.mark.parametrize(
+        "success,status_code,expected",
+        [
+            (True, 200, False),
+            (False, 400, False),
+            (False, 404, False),
+            (False, 429, True),
+            (False, 503, True),
+            (False, None, True),
+        ],
+    )
+    def test_overload_classification(self, success, status_code, expected):
+        """Test which results signal an overloaded endpoint."""
+        assert is_overload_result(make_result("e", success, status_code)) is expected